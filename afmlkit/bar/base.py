@@ -6,7 +6,7 @@ defined in the logic module.
 import numpy as np
 from numba import njit
 from numba import prange
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Callable, Sequence, List, Dict, Union
 import pandas as pd
 from numba.typed import List as NumbaList
 from abc import ABC, abstractmethod
@@ -15,11 +15,15 @@ import io
 
 from .data_model import FootprintData
 from .utils import comp_price_tick_size
-from .data_model import TradesData
+from .reducers import comp_bar_reducers, check_reducer
+from .data_model import TradesData, CompactTradesData
 
 from afmlkit.utils.log import get_logger
 logger = get_logger(__name__)
 
+# Close timestamps / indices of a streaming step finishing no bars
+_NO_CLOSES = np.empty(0, dtype=np.int64)
+
 
 class BarBuilderBase(ABC):
     r"""Abstract base class for building various types of bars (e.g., time, tick, volume, or information based bars) from raw trades data.
@@ -45,11 +49,32 @@ class BarBuilderBase(ABC):
         for trade size distribution, useful for detecting large orders or market concentration.
     - :meth:`build_footprints`: Generates detailed footprint data, discretizing price levels to compute volumes, ticks, imbalances,
       and metrics like volume profile skew and Gini, aiding in order flow and volume profile analysis.
-
+    - :meth:`build_all`: Computes the OHLCV, directional and trade size features in one fused pass over the trades.
+    - :meth:`build_reducer_features`: Runs the custom numba intrabar reducers added with :meth:`register_reducer`
+      (see :mod:`afmlkit.bar.reducers`) in one parallel pass over the bars.
+
+    **Streaming mode**: Instead of one fully materialized :class:`TradesData`, trades can be pushed chunk by chunk with
+    :meth:`feed` (e.g. one HDF5 month at a time). The partial open bar and the indexer state are carried across chunk
+    boundaries, and after each call the ``build_*`` methods return only the bars finished by that chunk. Call :meth:`flush`
+    after the last chunk to close the open bar. Peak memory scales with the chunk size instead of the history length.
+
+    >>> # doctest: +SKIP
+    >>> kit = TickBarKit(None, tick_count_thrs=1000)
+    >>> for key in ['2021-01', '2021-02']:
+    ...     if kit.feed(TradesData.load_trades_h5('trades.h5', key=key)):
+    ...         ohlcv = kit.build_ohlcv()
+    >>> if kit.flush():
+    ...     ohlcv = kit.build_ohlcv()
+
+    **Compact trades**: Kits with ``_supports_compact = True`` (time, tick, volume and dollar bars) also accept a
+    :class:`CompactTradesData` (see :meth:`TradesData.to_compact`). The kernels then run on the integer price ticks,
+    float32 amounts and compact timestamps directly, and the price valued features are scaled back by the price tick.
+    :meth:`build_footprints` and :meth:`build_reducer_features` need the regular :class:`TradesData`.
 
     Args:
-        trades (TradesData): Object containing raw trades DataFrame with columns 'timestamp', 'price', and 'amount'.
-            TradesData ensures the data is preprocessed and ready for bar construction.
+        trades (TradesData | CompactTradesData): Object containing raw trades DataFrame with columns 'timestamp', 'price',
+            and 'amount'. TradesData ensures the data is preprocessed and ready for bar construction. May be None in
+            streaming mode.
 
     Raises:
         ValueError: If required columns are missing from trades data or if data is not properly formatted.
@@ -62,18 +87,39 @@ class BarBuilderBase(ABC):
         :class:`afmlkit.bar.kit.VolumeBarKit`: For volume-threshold bars.
     """
 
-    def __init__(self, trades: TradesData):
+    # Whether the kit accepts CompactTradesData (its _comp_bar_close handles self._compact)
+    _supports_compact: bool = False
+
+    def __init__(self, trades: Optional[Union[TradesData, CompactTradesData]]):
         """
         Initialize the bar builder with raw trades data.
 
-        :param trades: TradesData object containing raw trades DataFrame with columns 'timestamp', 'price', and 'amount'.
+        :param trades: TradesData object containing raw trades DataFrame with columns 'timestamp', 'price', and 'amount',
+            or a CompactTradesData for the kits supporting it.
+            Pass None when the trades are only provided chunk by chunk via :meth:`feed`.
+        :raises NotImplementedError: If compact trades are given to a kit that does not support them.
         """
-        self.trades_df = trades.data
+        self._compact: Optional[CompactTradesData] = None
+        if isinstance(trades, CompactTradesData):
+            if not self._supports_compact:
+                raise NotImplementedError(f"{self.__class__.__name__} does not support compact trades data.")
+            self._compact = trades
+            self.trades_df = None
+        else:
+            self.trades_df = trades.data if trades is not None else None
 
         self._close_ts:      Optional[NDArray[np.int64]] = None
         self._close_indices: Optional[NDArray[np.int64]] = None
         self._highs:        Optional[NDArray[np.float64]] = None
         self._lows:         Optional[NDArray[np.float64]] = None
+        self._reducers: List[Tuple[Callable, Tuple[str, ...]]] = []  # Custom intrabar reducers and their columns
+
+        # Streaming state (see feed/flush)
+        self._stream_state = None                         # Kit specific indexer state (None: stream not started)
+        self._stream_carry: Optional[pd.DataFrame] = None  # Trades of the open bar (from the last close) + unscanned trades
+        self._stream_pos: int = 0                         # Carry position from which the indexer resumes scanning
+        self._stream_anchor: int = 0                      # Carry position of the last bar close (-1: before the carry)
+        self._stream_anchor_ts: int = 0                   # Timestamp of the last bar close
 
     def __str__(self) -> str:
         members = "\n".join(f"{k}: {v}" for k, v in self.__dict__.items())
@@ -106,6 +152,57 @@ class BarBuilderBase(ABC):
             logger.info("Calculating bar close tick indices and timestamps...")
             self._close_ts, self._close_indices = self._comp_bar_close()
 
+    def _trade_arrays(self) -> Tuple[NDArray, NDArray]:
+        """
+        Return the trade price and amount arrays passed to the bar kernels.
+
+        :returns: Tuple of prices (in price ticks for compact trades) and amounts.
+        """
+        if self._compact is not None:
+            return self._compact.price_ticks, self._compact.amount
+        return self.trades_df['price'].values, self.trades_df['amount'].values
+
+    def _trade_sides(self) -> NDArray[np.int8]:
+        """
+        Return the trade side array passed to the bar kernels.
+
+        :returns: Trade sides (1 for market buy, -1 for market sell).
+        :raises ValueError: If compact trades were built without side information.
+        """
+        if self._compact is not None:
+            if self._compact.side is None:
+                raise ValueError("Compact trades data has no side information.")
+            return self._compact.side
+        return self.trades_df['side'].values.astype(np.int8, copy=False)
+
+    def _require_trades_df(self, method: str) -> None:
+        """
+        Check that the kit holds a regular trades DataFrame.
+
+        :param method: Name of the calling method (for the error message).
+        :raises NotImplementedError: If the kit was built from compact trades.
+        """
+        if self._compact is not None:
+            raise NotImplementedError(f"{method} is not supported with compact trades data.")
+
+    def _rescale_prices(self, features: Dict[str, NDArray]) -> None:
+        """
+        Scale the price valued bar features from price ticks back to prices in place (compact trades only).
+
+        :param features: Bar feature arrays by column name.
+        """
+        if self._compact is None:
+            return
+        price_tick = self._compact.price_tick
+        for column in PRICE_VALUED_COLUMNS:
+            if column in features:
+                features[column] *= price_tick
+        # Bars without signed trades keep the cumulative min/max sentinels
+        if 'cum_dollars_min' in features:
+            traded = (features['ticks_buy'] + features['ticks_sell']) > 0
+            features['cum_dollars_min'][traded] *= price_tick
+            features['cum_dollars_max'][traded] *= price_tick
+
     @property
     def bar_close_indices(self) -> Optional[NDArray[np.int64]]:
         """
@@ -128,6 +225,157 @@ class BarBuilderBase(ABC):
             self._set_bar_close()
         return self._close_ts[1:]  # Exclude the first timestamp as it is the bar open timestamp
 
+    # ------------------------------------------------------------------
+    #  Streaming mode
+    # ------------------------------------------------------------------
+    def _comp_bar_close_stream(
+            self,
+            trades_df: pd.DataFrame,
+            start: int,
+            end: int
+    ) -> Tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Resumable counterpart of :meth:`_comp_bar_close` used by :meth:`feed`.
+
+        Scans the buffer positions ``[start, end)`` resuming from ``self._stream_state`` and updates that state.
+        When ``self._stream_state`` is None (first chunk of the stream) the output must start with the bar open
+        (anchor) timestamp and index, exactly like :meth:`_comp_bar_close`.
+
+        :param trades_df: Trades buffer (carried trades followed by the new chunk).
+        :param start: First buffer position to scan.
+        :param end: Buffer position to stop scanning at (exclusive).
+        :returns: Tuple of close timestamps and their corresponding buffer indices.
+        :raises NotImplementedError: If the bar type does not support streaming.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support streaming mode.")
+
+    def _prepare_stream_chunk(self, chunk_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Hook to attach per-trade auxiliary columns (e.g. thresholds) to a new chunk before it is buffered.
+
+        :param chunk_df: Trades DataFrame of the new chunk.
+        :returns: The (possibly extended) chunk DataFrame.
+        """
+        return chunk_df
+
+    def _stream_partial_close_ts(self, timestamps: NDArray[np.int64]) -> int:
+        """
+        Close timestamp assigned to the open bar when it is force-closed by :meth:`flush`.
+
+        :param timestamps: Timestamps of the trades buffer.
+        :returns: The close timestamp of the partial bar (the last trade timestamp by default).
+        """
+        return int(timestamps[-1])
+
+    def feed(self, trades: TradesData) -> int:
+        """
+        Streaming mode: push the next chunk of trades and compute the bars finished by it.
+
+        The trades of the still open bar are carried over to the next call together with the indexer state, so the
+        resulting bars are the same as if the chunks were processed in one go. Trailing trades sharing the last
+        timestamp of the chunk are held back until the next call, so a print block never straddles a chunk boundary.
+        After the call, :meth:`build_ohlcv`, :meth:`build_directional_features`, :meth:`build_trade_size_features`
+        and :meth:`build_footprints` return the newly finished bars only.
+
+        :param trades: The next chunk of trades (chronologically after the previous chunks).
+        :returns: The number of bars finished by this chunk.
+        :raises NotImplementedError: If the kit was built from compact trades.
+        """
+        self._require_trades_df("Streaming mode")
+        return self._stream_step(trades.data, final=False, close_partial=False)
+
+    def flush(self, close_partial: bool = True) -> int:
+        """
+        Streaming mode: end the stream by scanning the held back trades and optionally closing the open bar.
+
+        The streaming state is reset afterwards, so the builder can be reused for a new stream.
+
+        :param close_partial: If True, the still open bar is closed at the last trade. Default is True.
+        :returns: The number of bars finished by the flush.
+        """
+        if self._stream_carry is None:
+            self._set_stream_bars(None, _NO_CLOSES, _NO_CLOSES)
+            return 0
+        n_bars = self._stream_step(None, final=True, close_partial=close_partial)
+
+        self._stream_state = None
+        self._stream_carry = None
+        self._stream_pos = self._stream_anchor = self._stream_anchor_ts = 0
+
+        return n_bars
+
+    def _set_stream_bars(
+            self,
+            buffer: Optional[pd.DataFrame],
+            close_ts: NDArray[np.int64],
+            close_indices: NDArray[np.int64]
+    ) -> None:
+        """
+        Expose the bars finished by a streaming step to the build_* methods. A step finishing no bars clears the bars
+        of the previous step, so the build_* methods return no rows.
+
+        :param buffer: Trades buffer of the step (None to keep the current trades).
+        :param close_ts: Close timestamps of the finished bars.
+        :param close_indices: Buffer indices of the finished bars.
+        """
+        if buffer is not None:
+            self.trades_df = buffer
+        self._close_ts = np.concatenate((np.array([self._stream_anchor_ts], dtype=np.int64), close_ts))
+        self._close_indices = np.concatenate((np.array([self._stream_anchor], dtype=np.int64), close_indices))
+        self._highs = self._lows = None
+
+    def _stream_step(self, chunk_df: Optional[pd.DataFrame], final: bool, close_partial: bool) -> int:
+        """
+        Advance the stream by one chunk. See :meth:`feed` and :meth:`flush`.
+
+        :param chunk_df: Trades DataFrame of the new chunk (None when flushing).
+        :param final: If True, no more trades will follow and nothing is held back.
+        :param close_partial: If True, the open bar is closed at the last trade of the buffer.
+        :returns: The number of finished bars.
+        """
+        parts = [df for df in (self._stream_carry, self._prepare_stream_chunk(chunk_df) if chunk_df is not None else None)
+                 if df is not None and len(df) > 0]
+        if not parts:
+            self._set_stream_bars(chunk_df if chunk_df is not None else self._stream_carry, _NO_CLOSES, _NO_CLOSES)
+            return 0
+        buffer = parts[0] if len(parts) == 1 else pd.concat(parts, copy=False)
+        timestamps = buffer['timestamp'].values.astype(np.int64, copy=False)
+
+        end = len(buffer)
+        if not final:
+            # Hold back the trailing print block (trades sharing the last timestamp)
+            end = max(int(np.searchsorted(timestamps, timestamps[-1], side='left')), self._stream_pos)
+
+        first = self._stream_state is None
+        if first and end == 0:
+            # Nothing to scan yet (the whole chunk is one print block)
+            self._stream_carry = buffer
+            self._set_stream_bars(buffer, _NO_CLOSES, _NO_CLOSES)
+            return 0
+
+        close_ts, close_indices = self._comp_bar_close_stream(buffer, self._stream_pos, end)
+        close_ts = np.asarray(close_ts, dtype=np.int64)
+        close_indices = np.asarray(close_indices, dtype=np.int64)
+        if first:
+            self._stream_anchor_ts, self._stream_anchor = int(close_ts[0]), int(close_indices[0])
+            close_ts, close_indices = close_ts[1:], close_indices[1:]
+
+        last_close = close_indices[-1] if len(close_indices) else self._stream_anchor
+        if close_partial and last_close < end - 1:
+            close_ts = np.append(close_ts, self._stream_partial_close_ts(timestamps[:end]))
+            close_indices = np.append(close_indices, end - 1)
+
+        self._set_stream_bars(buffer, close_ts, close_indices)
+
+        # Carry the open bar (from its anchor) and the unscanned trades over to the next step
+        carry_start = max(int(self._close_indices[-1]), 0)
+        self._stream_carry = buffer.iloc[carry_start:]
+        self._stream_pos = end - carry_start
+        self._stream_anchor = int(self._close_indices[-1]) - carry_start
+        self._stream_anchor_ts = int(self._close_ts[-1])
+
+        logger.info(f"Streaming: {len(close_indices)} bars finished, {len(self._stream_carry)} trades carried over.")
+        return len(close_indices)
 
     def build_ohlcv(self) -> pd.DataFrame:
         """
@@ -137,15 +385,15 @@ class BarBuilderBase(ABC):
         """
         self._set_bar_close()  # Ensure bar close indices and timestamps are set
 
-        ohlcv_tuple = comp_bar_ohlcv(
-            self.trades_df['price'].values,
-            self.trades_df['amount'].values,
-            self._close_indices
-        )
-        self._highs, self._lows = ohlcv_tuple[1], ohlcv_tuple[2]
-        logger.info("OHLCV bar calculated successfully.")
-
-        ohlcv_df = pd.DataFrame({
+        if len(self._close_indices) < 2:
+            # No finished bars (e.g., a streaming step finishing none)
+            ohlcv_tuple = tuple(np.empty(0, dtype=dtype) for dtype in OHLCV_DTYPES)
+        else:
+            ohlcv_tuple = comp_bar_ohlcv(
+                *self._trade_arrays(),
+                self._close_indices
+            )
+        ohlcv = {
             'timestamp': self.bar_close_timestamps,
             'open': ohlcv_tuple[0],
             'high': ohlcv_tuple[1],
@@ -155,7 +403,12 @@ class BarBuilderBase(ABC):
             'trades': ohlcv_tuple[6],
             'median_trade_size': ohlcv_tuple[7],
             'vwap': ohlcv_tuple[5]
-        })
+        }
+        self._rescale_prices(ohlcv)
+        self._highs, self._lows = ohlcv['high'], ohlcv['low']
+        logger.info("OHLCV bar calculated successfully.")
+
+        ohlcv_df = pd.DataFrame(ohlcv)
         logger.info("OHLCV bar converted to DataFrame.")
 
         # Convert timestamps to datetime index
@@ -179,14 +432,13 @@ class BarBuilderBase(ABC):
         self._set_bar_close()
 
         directional_tuple = comp_bar_directional_features(
-            self.trades_df['price'].values,
-            self.trades_df['amount'].values,
+            *self._trade_arrays(),
             self._close_indices,
-            self.trades_df['side'].values.astype(np.int8),
+            self._trade_sides(),
         )
         logger.info("Directional features calculated successfully.")
 
-        directional_df = pd.DataFrame({
+        directional = {
             'timestamp': self.bar_close_timestamps,     # Close bar timestamps convention!!
             'ticks_buy': directional_tuple[0],
             'ticks_sell': directional_tuple[1],
@@ -202,7 +454,9 @@ class BarBuilderBase(ABC):
             'cum_volume_max': directional_tuple[11],
             'cum_dollars_min': directional_tuple[12],
             'cum_dollars_max': directional_tuple[13]
-        })
+        }
+        self._rescale_prices(directional)
+        directional_df = pd.DataFrame(directional)
         logger.info("Directional features converted to DataFrame.")
 
         # Convert timestamps to datetime index
@@ -222,7 +476,7 @@ class BarBuilderBase(ABC):
         self._set_bar_close()  # Ensure bar close indices and timestamps are set
 
         trade_size_tuple = comp_bar_trade_size_features(
-            self.trades_df['amount'].values,
+            self._trade_arrays()[1],
             theta,
             self._close_indices,
             theta_mult
@@ -244,14 +498,114 @@ class BarBuilderBase(ABC):
 
         return trade_size_df
 
-    def build_footprints(self, price_tick_size=None, imbalance_factor=3.0) -> FootprintData:
+    def build_all(self, theta: Optional[NDArray[np.float64]] = None, theta_mult: float = 5.0) -> pd.DataFrame:
+        """
+        Build the OHLCV, directional and (if theta is given) trade size features in one fused pass over the raw trades.
+        This is equivalent to joining :meth:`build_ohlcv`, :meth:`build_directional_features` and
+        :meth:`build_trade_size_features`, but reads the trade arrays once instead of three times.
+
+        :param theta: Optional typical trade size per bar (e.g., 30 day rolling median trade size).
+            The trade size features are only computed if it is given.
+        :param theta_mult: Multiplier for theta to define the block size threshold. Default is 5.0.
+        :returns: A dataframe of all bar features with datetime index corresponding to the bar close timestamps.
+            The columns are views of a single float64 block, so the integer and float32 columns of the
+            individual builders are float64 here.
+        """
+        self._set_bar_close()  # Ensure bar close indices and timestamps are set
+
+        with_trade_size = theta is not None
+        columns = OHLCV_COLUMNS + DIRECTIONAL_COLUMNS + (TRADE_SIZE_COLUMNS if with_trade_size else ())
+        if len(self._close_indices) < 2:
+            # No finished bars (e.g., a streaming step finishing none)
+            block = np.empty((len(columns), 0), dtype=np.float64)
+        else:
+            block = comp_bar_all(
+                *self._trade_arrays(),
+                self._close_indices,
+                self._trade_sides(),
+                np.asarray(theta, dtype=np.float64) if with_trade_size else np.empty(0, dtype=np.float64),
+                theta_mult,
+                with_trade_size
+            )
+        self._rescale_prices(dict(zip(columns, block)))  # Rows are views of the block
+        self._highs, self._lows = block[1], block[2]
+        logger.info("Bar features calculated successfully.")
+
+        index = pd.DatetimeIndex(pd.to_datetime(self.bar_close_timestamps, unit='ns'), name='timestamp')
+        bars_df = pd.DataFrame(block.T, index=index, columns=list(columns), copy=False)
+
+        # if there is a self.interval attribute, set the frequency to the interval
+        if hasattr(self, 'interval'):
+            bars_df.index.freq = pd.Timedelta(seconds=self.interval)
+
+        return bars_df
+
+    def register_reducer(self, reducer: Callable, columns: Sequence[str]) -> "BarBuilderBase":
+        """
+        Register a custom intrabar reducer for :meth:`build_reducer_features`.
+
+        :param reducer: Numba compiled function ``reducer(timestamps, prices, volumes, sides, out)`` writing the
+            statistics of one bar's trades into ``out`` (see :mod:`afmlkit.bar.reducers`).
+        :param columns: Names of the output columns written by the reducer (in ``out`` order).
+        :returns: The bar builder itself, so registrations can be chained.
+        :raises TypeError: If the reducer is not a numba compiled function (any callable with JIT disabled).
+        :raises ValueError: If no columns are given or a column name is already registered.
+        """
+        check_reducer(reducer)
+        columns = tuple(columns)
+        registered = {column for _, reducer_columns in self._reducers for column in reducer_columns}
+        if not columns:
+            raise ValueError("A reducer must write at least one output column.")
+        if len(set(columns)) != len(columns) or registered.intersection(columns):
+            raise ValueError(f"Duplicate reducer output columns: {columns}")
+        self._reducers.append((reducer, columns))
+
+        return self
+
+    def build_reducer_features(self) -> pd.DataFrame:
+        """
+        Build the custom intrabar features of the registered reducers in a single parallel pass over the bars.
+
+        :returns: A dataframe containing the reducer output columns with datetime index corresponding to the
+            bar close timestamps. Bars without trades are NaN.
+        :raises ValueError: If no reducer is registered.
+        """
+        if not self._reducers:
+            raise ValueError("No reducer registered. Use register_reducer() first.")
+        self._require_trades_df("build_reducer_features")
+        self._set_bar_close()  # Ensure bar close indices and timestamps are set
+
+        if 'side' in self.trades_df.columns:
+            sides = self.trades_df['side'].values.astype(np.int8, copy=False)
+        else:
+            sides = np.zeros(len(self.trades_df), dtype=np.int8)
+        block = comp_bar_reducers(
+            self.trades_df['timestamp'].values.astype(np.int64, copy=False),
+            self.trades_df['price'].values,
+            self.trades_df['amount'].values,
+            sides,
+            self._close_indices,
+            [(reducer, len(columns)) for reducer, columns in self._reducers]
+        )
+        logger.info("Reducer features calculated successfully.")
+
+        columns = [column for _, reducer_columns in self._reducers for column in reducer_columns]
+        index = pd.DatetimeIndex(pd.to_datetime(self.bar_close_timestamps, unit='ns'), name='timestamp')
+
+        return pd.DataFrame(block, index=index, columns=columns, copy=False)
+
+    def build_footprints(self, price_tick_size=None, imbalance_factor=3.0, compressed=False) -> FootprintData:
         """
         Build the footprint data using the generated indices and raw trades data.
 
         :param price_tick_size: Optional tick size; inferred if None.
         :param imbalance_factor: Multiplier for detecting imbalances. Default is 3.0.
+        :param compressed: If True, keep the per-level data in the compressed (CSR) layout (flat arrays plus bar offsets)
+            instead of casting it to per-bar NumbaLists.
         :returns: A FootprintData object containing the footprint data.
+        :raises NotImplementedError: If the kit was built from compact trades.
         """
+        self._require_trades_df("build_footprints")
 
         self._set_bar_close()  # Ensure bar close indices and timestamps are set
         if self._highs is None or self._lows is None:
@@ -264,11 +618,11 @@ class BarBuilderBase(ABC):
         logger.info(f"Price tick size is set to: {price_tick_size}")
 
         # Compute the footprint data
-        footprint_data = comp_bar_footprints(
+        footprint_data = comp_bar_footprints_csr(
             self.trades_df['price'].values,
             self.trades_df['amount'].values,
             self._close_indices,
-            self.trades_df['side'].values.astype(np.int8),
+            self.trades_df['side'].values.astype(np.int8, copy=False),
             price_tick_size,
             self._lows,
             self._highs,
@@ -279,21 +633,25 @@ class BarBuilderBase(ABC):
         # Create a FootprintData object with all metrics
         footprint = FootprintData(
             bar_timestamps= self.bar_close_timestamps,
-            price_levels=footprint_data[0],
+            offsets=footprint_data[0],
+            price_levels=footprint_data[1],
             price_tick=price_tick_size,
-            buy_volumes=footprint_data[1],
-            sell_volumes=footprint_data[2],
-            buy_ticks=footprint_data[3],
-            sell_ticks=footprint_data[4],
-            buy_imbalances=footprint_data[5],
-            sell_imbalances=footprint_data[6],
-            buy_imbalances_sum=footprint_data[7],
-            sell_imbalances_sum=footprint_data[8],
-            cot_price_levels=footprint_data[9],
-            imb_max_run_signed=footprint_data[10],
-            vp_skew=footprint_data[11],
-            vp_gini=footprint_data[12]
+            buy_volumes=footprint_data[2],
+            sell_volumes=footprint_data[3],
+            buy_ticks=footprint_data[4],
+            sell_ticks=footprint_data[5],
+            buy_imbalances=footprint_data[6],
+            sell_imbalances=footprint_data[7],
+            buy_imbalances_sum=footprint_data[8],
+            sell_imbalances_sum=footprint_data[9],
+            cot_price_levels=footprint_data[10],
+            imb_max_run_signed=footprint_data[11],
+            vp_skew=footprint_data[12],
+            vp_gini=footprint_data[13]
         )
+        if compressed:
+            return footprint
+
         footprint.cast_to_numba_list()
         logger.info("Footprint data converted to FootprintData object.")
 
@@ -612,8 +970,180 @@ def comp_bar_trade_size_features(
     return mean_size_rel, size_95_rel, pct_block, size_gini
 
 
-@njit(nogil=True, parallel=False)  # Currently not parallelizable due to dynamic list usage
-def comp_bar_footprints(
+# Row order of the column block filled by comp_bar_all
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume', 'trades', 'median_trade_size', 'vwap')
+# Dtypes of the comp_bar_ohlcv outputs (in return order)
+OHLCV_DTYPES = (np.float64, np.float64, np.float64, np.float64, np.float32, np.float64, np.int64, np.float64)
+DIRECTIONAL_COLUMNS = (
+    'ticks_buy', 'ticks_sell', 'volume_buy', 'volume_sell', 'dollars_buy', 'dollars_sell', 'mean_spread', 'max_spread',
+    'cum_ticks_min', 'cum_ticks_max', 'cum_volume_min', 'cum_volume_max', 'cum_dollars_min', 'cum_dollars_max'
+)
+TRADE_SIZE_COLUMNS = ('mean_size_rel', 'size_95_rel', 'pct_block', 'size_gini')
+# Bar features proportional to the trade prices (rescaled by the price tick for compact trades)
+PRICE_VALUED_COLUMNS = (
+    'open', 'high', 'low', 'close', 'vwap', 'dollars_buy', 'dollars_sell', 'mean_spread', 'max_spread'
+)
+
+
+@njit(nogil=True, parallel=True)
+def comp_bar_all(
+        prices: NDArray[np.float64],
+        volumes: NDArray[np.float64],
+        bar_close_indices: NDArray[np.int64],
+        trade_sides: NDArray[np.int8],
+        theta: NDArray[np.float64],
+        theta_mult: float,
+        with_trade_size: bool
+) -> NDArray[np.float64]:
+    """
+    Compute the OHLCV, directional and (optionally) trade size features of each bar in one fused pass over the trades.
+    The features are the same as the ones of :func:`comp_bar_ohlcv`, :func:`comp_bar_directional_features` and
+    :func:`comp_bar_trade_size_features`, but each bar's trades are walked once and all features are written into
+    one preallocated float64 column block.
+
+    :param prices: Trade prices.
+    :param volumes: Trade volumes.
+    :param bar_close_indices: Indices marking the end of each bar.
+    :param trade_sides: Trade direction (1 for market buy, -1 for market sell).
+    :param theta: The typical trade size per bar (ignored if ``with_trade_size`` is False).
+    :param theta_mult: Multiplier for theta to define the block size threshold.
+    :param with_trade_size: Whether to compute the trade size features.
+    :returns: Column block of shape (n_columns, n_bars); the rows follow ``OHLCV_COLUMNS``, ``DIRECTIONAL_COLUMNS``
+        and, if ``with_trade_size`` is True, ``TRADE_SIZE_COLUMNS``.
+    """
+    if len(prices) != len(volumes):
+        raise ValueError("Prices and volumes arrays must have the same length.")
+    if len(bar_close_indices) < 2:
+        raise ValueError("Bar close indices must contain at least two elements.")
+    n_bars = len(bar_close_indices) - 1
+    if with_trade_size and len(theta) != n_bars:
+        raise ValueError("Theta should match the the number of bars (len(bar_close_indices) - 1).")
+
+    n_ohlcv = len(OHLCV_COLUMNS)
+    n_dir = len(DIRECTIONAL_COLUMNS)
+    n_cols = n_ohlcv + n_dir + (len(TRADE_SIZE_COLUMNS) if with_trade_size else 0)
+    block = np.empty((n_cols, n_bars), dtype=np.float64)
+
+    for i in prange(n_bars):
+        close_i = bar_close_indices[i]
+        start = close_i + 1  # Start from the next trade (start=previous bar close)
+        end = bar_close_indices[i + 1]
+
+        # Previous trade side at the start of the bar for the spread calculation
+        prev_tick_sign = trade_sides[start - 1] if end > start else 0
+
+        high_price = prices[start] if start <= end else prices[end]
+        low_price = high_price
+        total_volume = 0.0
+        total_dollar = 0.0
+        ticks_buy, ticks_sell = 0, 0
+        volume_buy, volume_sell = 0.0, 0.0
+        dollars_buy, dollars_sell = 0.0, 0.0
+        cum_ticks, cum_volume, cum_dollars = 0, 0.0, 0.0
+        cum_ticks_min, cum_ticks_max = 1e9, -1e9
+        cum_volume_min, cum_volume_max = 1e9, -1e9
+        cum_dollars_min, cum_dollars_max = 1e9, -1e9
+        max_spread, cum_spread = 0.0, 0.0
+
+        # Iterate over trades in the current bar (start exclusive, end inclusive)
+        for j in range(start, end + 1):
+            price = prices[j]
+            volume = volumes[j]
+            dollar = price * volume
+
+            # OHLCV
+            if price > high_price:
+                high_price = price
+            if price < low_price:
+                low_price = price
+            total_volume += volume
+            total_dollar += dollar
+
+            # Directional
+            tick_sign = trade_sides[j]
+            if tick_sign != prev_tick_sign:
+                spread = abs(price - prices[j - 1])
+                if spread > max_spread:
+                    max_spread = spread
+                cum_spread += spread
+            prev_tick_sign = tick_sign
+
+            if tick_sign == 1:
+                ticks_buy += 1
+                volume_buy += volume
+                dollars_buy += dollar
+                cum_ticks += 1
+                cum_volume += volume
+                cum_dollars += dollar
+            elif tick_sign == -1:
+                ticks_sell += 1
+                volume_sell += volume
+                dollars_sell += dollar
+                cum_ticks -= 1
+                cum_volume -= volume
+                cum_dollars -= dollar
+            else:
+                continue
+
+            cum_ticks_max = max(cum_ticks_max, cum_ticks)
+            cum_ticks_min = min(cum_ticks_min, cum_ticks)
+            cum_volume_max = max(cum_volume_max, cum_volume)
+            cum_volume_min = min(cum_volume_min, cum_volume)
+            cum_dollars_max = max(cum_dollars_max, cum_dollars)
+            cum_dollars_min = min(cum_dollars_min, cum_dollars)
+
+        n_trades = end - close_i
+        bar_amounts = volumes[start:end + 1]  # End inclusive
+
+        # OHLCV (an empty bar is flat at the last trade price)
+        block[0, i] = prices[start] if n_trades > 0 else prices[end]
+        block[1, i] = high_price
+        block[2, i] = low_price
+        block[3, i] = prices[end]
+        block[4, i] = total_volume
+        block[5, i] = n_trades
+        block[6, i] = np.median(bar_amounts) if n_trades > 0 else 0.0
+        block[7, i] = total_dollar / total_volume if total_volume > 0 else 0.0
+
+        # Directional
+        block[n_ohlcv + 0, i] = ticks_buy
+        block[n_ohlcv + 1, i] = ticks_sell
+        block[n_ohlcv + 2, i] = volume_buy
+        block[n_ohlcv + 3, i] = volume_sell
+        block[n_ohlcv + 4, i] = dollars_buy
+        block[n_ohlcv + 5, i] = dollars_sell
+        block[n_ohlcv + 6, i] = cum_spread / (ticks_buy + ticks_sell) if ticks_buy + ticks_sell > 0 else np.nan
+        block[n_ohlcv + 7, i] = max_spread
+        block[n_ohlcv + 8, i] = cum_ticks_min
+        block[n_ohlcv + 9, i] = cum_ticks_max
+        block[n_ohlcv + 10, i] = cum_volume_min
+        block[n_ohlcv + 11, i] = cum_volume_max
+        block[n_ohlcv + 12, i] = cum_dollars_min
+        block[n_ohlcv + 13, i] = cum_dollars_max
+
+        # Trade size
+        if with_trade_size:
+            k = n_ohlcv + n_dir
+            block[k:k + 4, i] = np.nan
+            if n_trades <= 0 or theta[i] == 0.0:
+                continue
+            thr = theta[i] * theta_mult  # Block size threshold
+            block[k + 0, i] = np.log1p(np.mean(bar_amounts) / thr)
+            block[k + 1, i] = np.log1p(np.percentile(bar_amounts, 95) / thr)
+            if total_volume == 0:
+                continue
+            block_volume = 0.0
+            for amount in bar_amounts:
+                if amount > thr:
+                    block_volume += amount
+            block[k + 2, i] = block_volume / total_volume
+            block[k + 3, i] = 0.0 if n_trades == 1 else 1.0 - np.sum((bar_amounts / total_volume) ** 2)
+
+    return block
+
+
+@njit(nogil=True, parallel=True)
+def comp_bar_footprints_csr(
     prices: NDArray[np.float64],
     amounts: NDArray[np.float64],
     bar_close_indices: NDArray[np.int64],
@@ -623,17 +1153,21 @@ def comp_bar_footprints(
     bar_highs: NDArray[np.float64],
     imbalance_factor: float
 ) -> tuple[
-    NumbaList[NDArray[np.int32]],
-    NumbaList[NDArray[np.float32]], NumbaList[NDArray[np.float32]],
-    NumbaList[NDArray[np.int32]], NumbaList[NDArray[np.int32]],
-    NumbaList[NDArray[np.bool_]], NumbaList[NDArray[np.bool_]],
+    NDArray[np.int64], NDArray[np.int32],
+    NDArray[np.float32], NDArray[np.float32],
+    NDArray[np.int32], NDArray[np.int32],
+    NDArray[np.bool_], NDArray[np.bool_],
     NDArray[np.uint16], NDArray[np.uint16], NDArray[np.int32],
     NDArray[np.int16], NDArray[np.float64], NDArray[np.float64]
 ]:
     """
-    Compute the footprint features for each bar, including buy/sell volumes and imbalances per price level.
+    Compute the footprint features for each bar in a compressed (CSR) layout.
+    The per-level values of all bars are stored in flat arrays; the levels of bar ``i`` are ``offsets[i]:offsets[i + 1]``.
     The price levels are calculated in (integer) price tick units to eliminate floating point errors.
 
+    The computation runs in two parallel passes: the first counts the price levels of each bar (from the bar high and low)
+    to size the flat arrays, the second fills each bar's segment independently.
+
     :param prices: Trade prices.
     :param amounts: Trade amounts.
     :param bar_close_indices: Indices marking the end of each bar.
@@ -644,13 +1178,14 @@ def comp_bar_footprints(
     :param imbalance_factor: Multiplier threshold for detecting imbalance.
     :returns: Tuple containing:
 
-        - price_levels: List of price level arrays per bar.
-        - buy_volumes: List of buy volumes per price level.
-        - sell_volumes: List of sell volumes per price level.
-        - buy_ticks: List of buy ticks per price level.
-        - sell_ticks: List of sell ticks per price level.
-        - buy_imbalances: List of boolean arrays indicating buy imbalances.
-        - sell_imbalances: List of boolean arrays indicating sell imbalances.
+        - offsets: Start offset of each bar's levels in the flat arrays (length n_bars + 1).
+        - price_levels: Flat price levels.
+        - buy_volumes: Flat buy volumes per price level.
+        - sell_volumes: Flat sell volumes per price level.
+        - buy_ticks: Flat buy ticks per price level.
+        - sell_ticks: Flat sell ticks per price level.
+        - buy_imbalances: Flat buy imbalance flags per price level.
+        - sell_imbalances: Flat sell imbalance flags per price level.
         - buy_imbalances_sum: Total number of buy imbalances per bar.
         - sell_imbalances_sum: Total number of sell imbalances per bar.
         - cot_price_levels: Price level with highest total volume per bar.
@@ -658,20 +1193,31 @@ def comp_bar_footprints(
         - vp_skew: Volume profile skew for each bar (positive = buy pressure above VWAP).
         - vp_gini: Volume profile Gini coefficient for each bar.
     """
-    # TODO: [IDEA] New data structure; Preallocate Flat Arrays and Indices -> This enables parallelization
     n_bars = len(bar_close_indices) - 1
 
-    # Define dynamic lists
-    price_levels = NumbaList()
-    buy_volumes = NumbaList()
-    sell_volumes = NumbaList()
-    buy_ticks = NumbaList()
-    sell_ticks = NumbaList()
+    # Pass 1: count the price levels of each bar
+    lows = np.empty(n_bars, dtype=np.int64)
+    n_levels = np.empty(n_bars, dtype=np.int64)
+    for i in prange(n_bars):
+        low = int(round(bar_lows[i] / price_tick_size))
+        high = int(round(bar_highs[i] / price_tick_size))
+        lows[i] = low
+        n_levels[i] = high - low + 1
 
-    buy_imbalances = NumbaList()
-    sell_imbalances = NumbaList()
+    offsets = np.zeros(n_bars + 1, dtype=np.int64)
+    for i in range(n_bars):
+        offsets[i + 1] = offsets[i] + n_levels[i]
+    n_total = offsets[n_bars]
+
+    # Preallocate the flat arrays
+    price_levels = np.empty(n_total, dtype=np.int32)
+    buy_volumes = np.zeros(n_total, dtype=np.float32)
+    sell_volumes = np.zeros(n_total, dtype=np.float32)
+    buy_ticks = np.zeros(n_total, dtype=np.int32)
+    sell_ticks = np.zeros(n_total, dtype=np.int32)
+    buy_imbalances = np.zeros(n_total, dtype=np.bool_)
+    sell_imbalances = np.zeros(n_total, dtype=np.bool_)
 
-    # Initialize cumulative imbalances
     buy_imbalances_sum = np.zeros(n_bars, dtype=np.uint16)
     sell_imbalances_sum = np.zeros(n_bars, dtype=np.uint16)
     cot_price_levels = np.zeros(n_bars, dtype=np.int32)
@@ -679,36 +1225,34 @@ def comp_bar_footprints(
     vp_skew_arr = np.zeros(n_bars, dtype=np.float64)
     vp_gini_arr = np.zeros(n_bars, dtype=np.float64)
 
+    invalid_bars = np.zeros(n_bars, dtype=np.bool_)
 
-    for i in range(n_bars):
+    # Pass 2: fill each bar's segment of the flat arrays
+    for i in prange(n_bars):
         start = bar_close_indices[i] + 1  # Start from the next trade (start=previous bar close)
         end = bar_close_indices[i + 1]
-
-        # Examine current bar price levels
-        low = int(round(bar_lows[i] / price_tick_size))
-        high = int(round(bar_highs[i] / price_tick_size))
-        n_levels = high - low + 1
-
-        # Initialize price levels and volumes
-        price_levels_i = np.arange(low, high + 1, dtype=np.int32)
-        buy_volumes_i = np.zeros(n_levels, dtype=np.float32)
-        sell_volumes_i = np.zeros(n_levels, dtype=np.float32)
-        buy_ticks_i = np.zeros(n_levels, dtype=np.int32)
-        sell_ticks_i = np.zeros(n_levels, dtype=np.int32)
+        low = lows[i]
+        n_levels_i = n_levels[i]
+        a, b = offsets[i], offsets[i + 1]
+
+        # Segment views of the bar
+        price_levels_i = price_levels[a:b]
+        buy_volumes_i = buy_volumes[a:b]
+        sell_volumes_i = sell_volumes[a:b]
+        buy_ticks_i = buy_ticks[a:b]
+        sell_ticks_i = sell_ticks[a:b]
+        for k in range(n_levels_i):
+            price_levels_i[k] = low + k
 
         # Start aggregating the footprint data (start exclusive, end inclusive)
         for j in range(start, end + 1):
-            price = float(prices[j])
+            price = int(round(float(prices[j]) / price_tick_size))
             tick_direction = trade_sides[j]
-            price = int(round(price / price_tick_size))
             amount = amounts[j]
-
-            # Update the price levels
-            # price_level_idx = np.searchsorted(price_levels_i, price)
             price_level_idx = price - low
 
             # Cumulate the volumes and ticks
-            if 0 <= price_level_idx < n_levels:
+            if 0 <= price_level_idx < n_levels_i:
                 if tick_direction == 1:
                     buy_volumes_i[price_level_idx] += amount
                     buy_ticks_i[price_level_idx] += 1
@@ -716,14 +1260,8 @@ def comp_bar_footprints(
                     sell_volumes_i[price_level_idx] += amount
                     sell_ticks_i[price_level_idx] += 1
             else:
-                raise ValueError("Something went wrong! Invalid price level index!")
-
-        # Append bar's footprint data to the dynamic lists
-        price_levels.append(price_levels_i)
-        buy_volumes.append(buy_volumes_i)
-        sell_volumes.append(sell_volumes_i)
-        buy_ticks.append(buy_ticks_i)
-        sell_ticks.append(sell_ticks_i)
+                # Raising inside prange would serialize the loop; flag the bar and raise after the loop
+                invalid_bars[i] = True
 
         # Calculate the footprint features:
         # buy imbalances, sell imbalances, imb_max_run_signed, COT price level, vp_skew, vp_gini
@@ -731,10 +1269,9 @@ def comp_bar_footprints(
          cot_price_level, vp_skew, vp_gini) = (
             comp_footprint_features(price_levels_i, buy_volumes_i, sell_volumes_i, imbalance_factor
         ))
-        buy_imbalances.append(buy_imbalances_i)
-        sell_imbalances.append(sell_imbalances_i)
+        buy_imbalances[a:b] = buy_imbalances_i
+        sell_imbalances[a:b] = sell_imbalances_i
 
-        # Update cumulative imbalances, COT price level, and other metrics
         buy_imbalances_sum[i] = np.sum(buy_imbalances_i, dtype=np.uint16)
         sell_imbalances_sum[i] = np.sum(sell_imbalances_i, dtype=np.uint16)
         cot_price_levels[i] = cot_price_level
@@ -742,8 +1279,11 @@ def comp_bar_footprints(
         vp_skew_arr[i] = vp_skew
         vp_gini_arr[i] = vp_gini
 
+    if np.any(invalid_bars):
+        raise ValueError("Something went wrong! Invalid price level index!")
+
     return (
-        price_levels,
+        offsets, price_levels,
         buy_volumes, sell_volumes,
         buy_ticks, sell_ticks,
         buy_imbalances, sell_imbalances,
@@ -752,6 +1292,86 @@ def comp_bar_footprints(
     )
 
 
+@njit(nogil=True)
+def comp_bar_footprints(
+    prices: NDArray[np.float64],
+    amounts: NDArray[np.float64],
+    bar_close_indices: NDArray[np.int64],
+    trade_sides: NDArray[np.int8],
+    price_tick_size: float,
+    bar_lows: NDArray[np.float64],
+    bar_highs: NDArray[np.float64],
+    imbalance_factor: float
+) -> tuple[
+    NumbaList[NDArray[np.int32]],
+    NumbaList[NDArray[np.float32]], NumbaList[NDArray[np.float32]],
+    NumbaList[NDArray[np.int32]], NumbaList[NDArray[np.int32]],
+    NumbaList[NDArray[np.bool_]], NumbaList[NDArray[np.bool_]],
+    NDArray[np.uint16], NDArray[np.uint16], NDArray[np.int32],
+    NDArray[np.int16], NDArray[np.float64], NDArray[np.float64]
+]:
+    """
+    Compute the footprint features for each bar, including buy/sell volumes and imbalances per price level.
+    The price levels are calculated in (integer) price tick units to eliminate floating point errors.
+    The per-level arrays are returned as lists of per-bar views into the flat output of :func:`comp_bar_footprints_csr`.
+
+    :param prices: Trade prices.
+    :param amounts: Trade amounts.
+    :param bar_close_indices: Indices marking the end of each bar.
+    :param trade_sides: The side information of the market order (1 for market buy, -1 for market sell).
+    :param price_tick_size: Tick size used for price level quantization.
+    :param bar_lows: Lowest price per bar.
+    :param bar_highs: Highest price per bar.
+    :param imbalance_factor: Multiplier threshold for detecting imbalance.
+    :returns: Tuple containing:
+
+        - price_levels: List of price level arrays per bar.
+        - buy_volumes: List of buy volumes per price level.
+        - sell_volumes: List of sell volumes per price level.
+        - buy_ticks: List of buy ticks per price level.
+        - sell_ticks: List of sell ticks per price level.
+        - buy_imbalances: List of boolean arrays indicating buy imbalances.
+        - sell_imbalances: List of boolean arrays indicating sell imbalances.
+        - buy_imbalances_sum: Total number of buy imbalances per bar.
+        - sell_imbalances_sum: Total number of sell imbalances per bar.
+        - cot_price_levels: Price level with highest total volume per bar.
+        - imb_max_run_signed: Longest signed imbalance run for each bar.
+        - vp_skew: Volume profile skew for each bar (positive = buy pressure above VWAP).
+        - vp_gini: Volume profile Gini coefficient for each bar.
+    """
+    (offsets, price_levels_flat, buy_volumes_flat, sell_volumes_flat, buy_ticks_flat, sell_ticks_flat,
+     buy_imbalances_flat, sell_imbalances_flat, buy_imbalances_sum, sell_imbalances_sum, cot_price_levels,
+     imb_max_run_signed, vp_skew, vp_gini) = comp_bar_footprints_csr(
+        prices, amounts, bar_close_indices, trade_sides, price_tick_size, bar_lows, bar_highs, imbalance_factor
+    )
+
+    price_levels = NumbaList()
+    buy_volumes = NumbaList()
+    sell_volumes = NumbaList()
+    buy_ticks = NumbaList()
+    sell_ticks = NumbaList()
+    buy_imbalances = NumbaList()
+    sell_imbalances = NumbaList()
+    for i in range(len(offsets) - 1):
+        a, b = offsets[i], offsets[i + 1]
+        price_levels.append(price_levels_flat[a:b])
+        buy_volumes.append(buy_volumes_flat[a:b])
+        sell_volumes.append(sell_volumes_flat[a:b])
+        buy_ticks.append(buy_ticks_flat[a:b])
+        sell_ticks.append(sell_ticks_flat[a:b])
+        buy_imbalances.append(buy_imbalances_flat[a:b])
+        sell_imbalances.append(sell_imbalances_flat[a:b])
+
+    return (
+        price_levels,
+        buy_volumes, sell_volumes,
+        buy_ticks, sell_ticks,
+        buy_imbalances, sell_imbalances,
+        buy_imbalances_sum, sell_imbalances_sum, cot_price_levels,
+        imb_max_run_signed, vp_skew, vp_gini
+    )
+
+
 @njit(nogil=True)
 def comp_footprint_features(price_levels, buy_volumes, sell_volumes, imbalance_multiplier):
     """
@@ -0,0 +1,179 @@
+"""
+Process-wide cache of decoded HDF5 partitions.
+
+Notebooks and scripts keep reading the same monthly groups (``/trades/YYYY-MM``, ``/klines/YYYY-MM``...) through
+:meth:`afmlkit.bar.data_model.TradesData.load_trades_h5` and :meth:`afmlkit.bar.io.TimeBarReader.read`, decoding
+them from disk every time. The :data:`PARTITION_CACHE` keeps the decoded groups as read-only NumPy column blocks,
+keyed by the file path, its modification time and the group key (rewriting a file invalidates its entries), and
+evicts the least recently used groups beyond a byte budget.
+
+The cache is disabled by default (zero budget). Enable it with ``PARTITION_CACHE.set_budget(4 * 2**30)`` or the
+``FMK_PARTITION_CACHE_BYTES`` environment variable.
+"""
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple, Any
+
+import numpy as np
+import pandas as pd
+
+from afmlkit.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class _Partition:
+    """
+    Decoded group: index values and read-only column arrays.
+    """
+    index: np.ndarray
+    index_name: Optional[str]
+    columns: Dict[str, np.ndarray]
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "_Partition":
+        index = np.array(df.index.values)
+        index.setflags(write=False)
+        columns = {}
+        for name in df.columns:
+            values = np.array(df[name].values)
+            values.setflags(write=False)
+            columns[name] = values
+        return cls(index, df.index.name, columns)
+
+    @property
+    def nbytes(self) -> int:
+        return self.index.nbytes + sum(values.nbytes for values in self.columns.values())
+
+    def to_frame(self) -> pd.DataFrame:
+        index = pd.Index(self.index, name=self.index_name, copy=False)
+        return pd.DataFrame(self.columns, index=index, copy=False)
+
+
+class PartitionCache:
+    """
+    Thread-safe LRU cache of decoded HDF5 groups under a byte budget.
+
+    :param max_bytes: Byte budget of the decoded groups (0 disables the cache).
+    """
+
+    def __init__(self, max_bytes: int = 0):
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._nbytes = 0
+        self._entries: "OrderedDict[Tuple[str, int, str], _Partition]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    @staticmethod
+    def _file_key(filepath: str) -> Tuple[str, int]:
+        return os.path.realpath(filepath), os.stat(filepath).st_mtime_ns
+
+    def set_budget(self, max_bytes: int) -> None:
+        """
+        Change the byte budget, evicting the least recently used groups above it.
+
+        :param max_bytes: New byte budget (0 disables the cache and drops all groups).
+        """
+        with self._lock:
+            self.max_bytes = int(max_bytes)
+            self._evict()
+
+    def get(self, filepath: str, key: str) -> Optional[pd.DataFrame]:
+        """
+        Look up a decoded group.
+
+        :param filepath: Path to the HDF5 file.
+        :param key: Group key (e.g., '/trades/2021-03').
+        :returns: DataFrame over the cached (read-only) columns, or None if the group is not cached.
+        """
+        if not self.enabled:
+            return None
+        cache_key = (*self._file_key(filepath), key)
+        with self._lock:
+            partition = self._entries.get(cache_key)
+            if partition is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(cache_key)
+            self.hits += 1
+        return partition.to_frame()
+
+    def put(self, filepath: str, key: str, df: pd.DataFrame) -> None:
+        """
+        Cache a fully decoded group (groups larger than the budget are skipped).
+
+        :param filepath: Path to the HDF5 file.
+        :param key: Group key.
+        :param df: The decoded group.
+        """
+        if not self.enabled:
+            return
+        path, mtime = self._file_key(filepath)
+        partition = _Partition.from_frame(df)
+        if partition.nbytes > self.max_bytes:
+            logger.debug(f"{key} of {path} ({partition.nbytes:,} bytes) exceeds the partition cache budget.")
+            return
+        with self._lock:
+            # Drop the versions of the group from previous writes of the file
+            for stale in [k for k in self._entries if k[0] == path and k[2] == key]:
+                self._nbytes -= self._entries.pop(stale).nbytes
+            self._entries[(path, mtime, key)] = partition
+            self._nbytes += partition.nbytes
+            self._evict()
+
+    def get_or_load(self, filepath: str, key: str, load) -> pd.DataFrame:
+        """
+        Return a cached group, decoding and caching it on a miss.
+
+        :param filepath: Path to the HDF5 file.
+        :param key: Group key.
+        :param load: Callable returning the decoded group.
+        :returns: The group.
+        """
+        df = self.get(filepath, key)
+        if df is None:
+            df = load()
+            self.put(filepath, key, df)
+        return df
+
+    def _evict(self) -> None:
+        while self._entries and self._nbytes > self.max_bytes:
+            _, partition = self._entries.popitem(last=False)
+            self._nbytes -= partition.nbytes
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Drop all groups and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        :returns: Dict with the hits, misses, evictions, number of cached groups, cached bytes and byte budget.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "nbytes": self._nbytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+#: Cache shared by the HDF5 readers of the process
+PARTITION_CACHE = PartitionCache(int(os.getenv("FMK_PARTITION_CACHE_BYTES", "0")))
@@ -1,17 +1,22 @@
 import datetime as dt
-from dataclasses import dataclass
-from typing import Union, Optional, Tuple, Dict
+import json
+from dataclasses import dataclass, replace
+from typing import Union, Optional, Tuple, Dict, Sequence
 import numpy as np
 import pandas as pd
 from numpy.typing import NDArray
 from numba.typed import List as NumbaList
 import multiprocessing as mp
+from multiprocessing import shared_memory, resource_tracker
 from concurrent.futures import ProcessPoolExecutor, as_completed
 import sys
 
 from afmlkit.bar.utils import footprint_to_dataframe
 from afmlkit.utils.log import get_logger
-from .utils import comp_trade_side_vector, merge_split_trades
+from .utils import comp_trade_side_vector, merge_split_trades, comp_price_tick_size, merge_trade_partitions
+from .logic import COMPACT_BLOCK_SHIFT, _decode_timestamps
+from .h5_index import TradesH5Index
+from .cache import PARTITION_CACHE
 import os
 
 logger = get_logger(__name__)
@@ -74,6 +79,10 @@ class TradesData:
         preprocess (bool, optional): Enable full preprocessing pipeline. Default: False.
         proc_res (str, optional): Target timestamp resolution for rounding ('ms', 'us'). Default: None (no rounding).
         name (str, optional): Instance name for logging purposes. Default: None.
+        copy (bool, optional): Copy the input arrays into the internal DataFrame. Pass False to wrap them without
+            copying (e.g. arrays freshly decoded from storage). Default: True.
+        partition_offsets (NDArray, optional): Boundaries of the id sorted partitions concatenated in the input arrays
+            (see :meth:`from_partitions`). Default: None.
 
     Raises:
         TypeError: If input arrays are not numpy ndarrays or have incompatible types.
@@ -132,6 +141,8 @@ class TradesData:
         preprocess: bool = False,
         proc_res: Optional[str] = None,
         name=None,
+        copy: bool = True,
+        partition_offsets: Optional[NDArray[np.int64]] = None,
     ):
         """
         Initialize the TradesData with raw trades data.
@@ -147,6 +158,9 @@ class TradesData:
         :param proc_res: (Optional) processing resolution for timestamps (e.g., 'ms' cuts us to ms resolution).
         :param preprocess: If True, runs the preprocessing pipeline (sorting, merging split trades etc...)
         :param name: Optional name for the trades data instance (logging purposes).
+        :param copy: If False, the internal DataFrame wraps the input arrays without copying them.
+        :param partition_offsets: Optional boundaries (k + 1 elements) of the partitions (e.g. months) concatenated in
+            the input arrays, each already sorted by id. Preprocessing then merges them instead of sorting globally.
         :raises ValueError: If required columns are missing or timestamp format is invalid.
 
         """
@@ -165,15 +179,13 @@ class TradesData:
 
         self._start_date = self._end_date = None
 
-        self._data = pd.DataFrame(
-            {"timestamp": ts, "price": px, "amount": qty, "id": id}
-        )
-
+        columns = {"timestamp": ts, "price": px, "amount": qty, "id": id}
         self.is_buyer_maker = is_buyer_maker
         if is_buyer_maker is not None:
-            self._data["is_buyer_maker"] = is_buyer_maker
+            columns["is_buyer_maker"] = is_buyer_maker
         if side is not None:
-            self._data["side"] = side
+            columns["side"] = side
+        self._data = pd.DataFrame(columns, copy=copy)
         self._orig_timestamp_unit = (
             timestamp_unit if timestamp_unit else self._infer_timestamp_unit()
         )
@@ -187,7 +199,7 @@ class TradesData:
             if id is None:
                 raise ValueError("id is required if preprocess is True")
             self._convert_timestamps_to_ns()
-            self._sort_trades()
+            self._sort_trades(partition_offsets)
             self._merge_trades()
             self._apply_timestamp_resolution(proc_res)
             if "side" not in self._data.columns:
@@ -204,6 +216,48 @@ class TradesData:
             self._data.index.name = "datetime"
             logger.info("TradesData prepared successfully.")
 
+    @classmethod
+    def from_partitions(
+        cls,
+        partitions: Sequence[Tuple[NDArray, ...]],
+        *,
+        timestamp_unit: Optional[str] = None,
+        proc_res: Optional[str] = None,
+        name=None,
+    ) -> "TradesData":
+        r"""Build preprocessed trades data from several raw partitions (e.g. one per month).
+
+        Each partition is a ``(ts, px, qty, id)`` or ``(ts, px, qty, id, is_buyer_maker)`` tuple, typically already
+        sorted by trade id. The partitions are concatenated once and merged with a k-way merge during preprocessing
+        instead of a global sort (see :meth:`_sort_trades`).
+
+        :param partitions: Sequence of raw trade array tuples, in the same layout for all partitions.
+        :param timestamp_unit: (Optional) timestamp unit (e.g., 'ms', 'us', 'ns'); inferred if None.
+        :param proc_res: (Optional) processing resolution for timestamps (e.g., 'ms' cuts us to ms resolution).
+        :param name: Optional name for the trades data instance (logging purposes).
+        :returns: Preprocessed TradesData instance.
+        :raises ValueError: If no partitions are given or their layouts differ.
+        """
+        if len(partitions) == 0:
+            raise ValueError("At least one partition is required.")
+        n_arrays = {len(part) for part in partitions}
+        if len(n_arrays) != 1 or n_arrays.pop() not in (4, 5):
+            raise ValueError("Partitions must all be (ts, px, qty, id) or (ts, px, qty, id, is_buyer_maker) tuples.")
+
+        columns = [np.concatenate(arrays) for arrays in zip(*partitions)]
+        offsets = np.cumsum([0] + [len(part[0]) for part in partitions], dtype=np.int64)
+
+        return cls(
+            *columns[:4],
+            is_buyer_maker=columns[4] if len(columns) == 5 else None,
+            timestamp_unit=timestamp_unit,
+            preprocess=True,
+            proc_res=proc_res,
+            name=name,
+            copy=False,  # The concatenated columns are fresh arrays
+            partition_offsets=offsets,
+        )
+
     @property
     def start_date(self):
         """
@@ -264,91 +318,104 @@ class TradesData:
         """
         return self._orig_timestamp_unit
 
-    def _validate_data(self):
+    def _validate_data(
+        self,
+        gap_start_ids: NDArray[np.int64],
+        gap_end_ids: NDArray[np.int64],
+        gap_pre_ts: NDArray[np.int64],
+        gap_post_ts: NDArray[np.int64],
+    ) -> None:
         """
-        Check for gaps in trade IDs
+        Record the gaps in trade IDs (as returned by :func:`merge_trade_partitions`).
+
+        :param gap_start_ids: Last trade id before each gap.
+        :param gap_end_ids: First trade id after each gap.
+        :param gap_pre_ts: Timestamp of the trade before each gap.
+        :param gap_post_ts: Timestamp of the trade after each gap.
         """
-        # First convert to numeric to handle potential string IDs
-        id_diffs = np.diff(self.data["id"].values)
-        gap_indices = np.where(id_diffs > 1)[0]
-        cum_gap_size = 0
-        if len(gap_indices) > 0:
+        if len(gap_start_ids) == 0:
+            return
+        logger.warning(
+            f"{self.name} | Found {len(gap_start_ids):,} discontinuities in trade IDs. "
+            f"This indicates missing trades."
+        )
+        cum_gap_size = int(np.sum(gap_end_ids - gap_start_ids - 1))
+
+        # Record the discontinuities greater than 1 min
+        large = np.flatnonzero(gap_post_ts - gap_pre_ts > pd.Timedelta(minutes=1).value)
+        for g in large:
+            pre_gap_time = pd.to_datetime(gap_pre_ts[g], unit="ns")
+            post_gap_time = pd.to_datetime(gap_post_ts[g], unit="ns")
+            self.discontinuities.append(
+                {
+                    "start_id": int(gap_start_ids[g]),
+                    "end_id": int(gap_end_ids[g]),
+                    "missing_ids": int(gap_end_ids[g] - gap_start_ids[g] - 1),
+                    "pre_gap_time": pre_gap_time,
+                    "post_gap_time": post_gap_time,
+                    "time_interval": post_gap_time - pre_gap_time,
+                }
+            )
+        if len(large) > 0:
+            self.data_ok = False
             logger.warning(
-                f"{self.name} | Found {len(gap_indices):,} discontinuities in trade IDs. "
-                f"This indicates missing trades."
+                f"{self.name} | Found {len(large)} large gaps greater than 1 minute."
             )
-            # Record detailed information about each discontinuity
-            n_large_gaps = 0
-            for idx in gap_indices:
-                gap_start_id = int(self.data["id"].iloc[idx])
-                gap_end_id = int(self.data["id"].iloc[idx + 1])
-                gap_size = gap_end_id - gap_start_id - 1
-                cum_gap_size += gap_size
-
-                # Get timestamps for the trades before and after the gap
-                pre_gap_time = pd.to_datetime(
-                    self.data["timestamp"].iloc[idx], unit="ns"
-                )
-                post_gap_time = pd.to_datetime(
-                    self.data["timestamp"].iloc[idx + 1], unit="ns"
-                )
-                time_diff = post_gap_time - pre_gap_time
-
-                # Record the discontinuity if gap is greater than 1 min
-                if time_diff > pd.Timedelta(minutes=1):
-                    self.data_ok = False
-                    n_large_gaps += 1
-                    self.discontinuities.append(
-                        {
-                            "start_id": gap_start_id,
-                            "end_id": gap_end_id,
-                            "missing_ids": gap_size,
-                            "pre_gap_time": pre_gap_time,
-                            "post_gap_time": post_gap_time,
-                            "time_interval": time_diff,
-                        }
-                    )
-            if n_large_gaps > 0:
-                logger.warning(
-                    f"{self.name} | Found {n_large_gaps} large gaps greater than 1 minute."
-                )
-            self.missing_pct = cum_gap_size / len(self.data) * 100
+        self.missing_pct = cum_gap_size / len(self.data) * 100
 
-    def _sort_trades(self) -> None:
+    def _sort_trades(self, partition_offsets: Optional[NDArray[np.int64]] = None) -> None:
         """
         Sort trades by timestamp to ensure correct order for processing.
-        Also performs data integrity checks by identifying discontinuities in trade IDs.
+        Also performs data integrity checks by identifying duplicates and discontinuities in trade IDs.
+
+        The trades are ordered by ID with a numba k-way merge of the partitions (each sorted by ID on its own if needed),
+        which also drops duplicate IDs and collects the ID gaps in the same pass. A timestamp sort only follows if the
+        ID order is not chronological.
+
+        :param partition_offsets: Optional partition boundaries (k + 1 elements) if the trades are the concatenation of
+            partitions (e.g. months) that are already sorted by ID. None for a single partition.
         """
         self.data_ok = True
         self.discontinuities = []  # Reset discontinuities list
 
-        # Sort by ID to inspect data integrity
-        self.data.sort_values(by=["id"], inplace=True)
-        # Reset index
-        self.data.reset_index(drop=True, inplace=True)
-
-        # Check duplicates in trade IDs
-        if self.data["id"].duplicated().any():
+        ids = self.data["id"].values.astype(np.int64, copy=False)
+        timestamps = self.data["timestamp"].values.astype(np.int64, copy=False)
+        if partition_offsets is None:
+            partition_offsets = np.array([0, len(ids)], dtype=np.int64)
+        partition_offsets = np.asarray(partition_offsets, dtype=np.int64)
+
+        # Sort the partitions that are not sorted by ID yet (locally)
+        perm = None
+        for start, end in zip(partition_offsets[:-1], partition_offsets[1:]):
+            if np.any(np.diff(ids[start:end]) < 0):
+                if perm is None:
+                    perm = np.arange(len(ids))
+                perm[start:end] = start + np.argsort(ids[start:end], kind="stable")
+        if perm is not None:
+            ids, timestamps = ids[perm], timestamps[perm]
+
+        order, *gaps, n_duplicates, ts_sorted = merge_trade_partitions(ids, timestamps, partition_offsets)
+        if n_duplicates > 0:
             logger.warning(
                 f"{self.name} | Trade IDs contain duplicates. This may indicate data corruption."
             )
-            # Drop duplicates while keeping the first occurrence
-            self.data.drop_duplicates(subset="id", keep="first", inplace=True)
             logger.info("Duplicates in trade IDs have been removed.")
             self.data_ok = False
 
-        self._validate_data()
-
-        # Now sort by timestamp for chronological order if needed
-        if not self.data.timestamp.is_monotonic_increasing:
+        if not ts_sorted:
             logger.warning(
                 f"{self.name} | Trades timestamps are not monotonic increasing after sorting by trade IDs. "
                 f"Sorting by timestamp for chronological order..."
             )
-            self.data.sort_values(by=["timestamp", "id"], inplace=True)
+            order = order[np.argsort(timestamps[order], kind="stable")]
 
+        if perm is not None:
+            order = perm[order]
+        self._data = self._data.take(order)
         # Reset index
-        self.data.reset_index(drop=True, inplace=True)
+        self._data.reset_index(drop=True, inplace=True)
+
+        self._validate_data(*gaps)
 
     def _merge_trades(self):
         """
@@ -356,14 +423,16 @@ class TradesData:
         """
         logger.info("Merging split trades (same timestamps) on same price level...")
 
+        # Use the (sorted) column rather than the raw input array
+        is_buyer_maker = self.data["is_buyer_maker"].values if "is_buyer_maker" in self.data.columns else None
         ts, px, am, side = merge_split_trades(
             self.data["timestamp"].values.astype(np.int64),
             self.data["price"].values.astype(np.float64),
             self.data["amount"].values.astype(np.float32),
-            self.is_buyer_maker,
+            is_buyer_maker,
         )
         self._data = pd.DataFrame({"timestamp": ts, "price": px, "amount": am})
-        if self.is_buyer_maker is not None:
+        if is_buyer_maker is not None:
             self._data["side"] = side
 
     def _convert_timestamps_to_ns(self):
@@ -459,6 +528,8 @@ class TradesData:
 
         Stores data under ``/trades/YYYY-MM`` groups for efficient range queries. Each month
         includes metadata for fast discovery and data integrity information when available.
+        The sidecar index of the store (``<filepath>.index.json``, see :class:`afmlkit.bar.h5_index.TradesH5Index`)
+        is updated with the written trades.
 
         :param filepath: Destination HDF5 file path. Parent directories created automatically.
         :param month_key: Override automatic monthly key derivation (format: "YYYY-MM").
@@ -526,6 +597,7 @@ class TradesData:
                         return h5_key
 
             # Handle data writing
+            append_at = None  # (stored rows, last stored timestamp) when appending to the month
             if month_exists and should_overwrite:
                 logger.info(f"Overwriting existing data for {month_key}...")
                 store.remove(h5_key)
@@ -542,6 +614,9 @@ class TradesData:
             elif month_exists:
                 # Append using PyTables row‑wise interface (fast)
                 logger.info(f"Appending to existing data for {month_key}...")
+                n_stored = store.get_storer(h5_key).nrows
+                last_stored = store.select(h5_key, start=n_stored - 1, stop=n_stored)["timestamp"]
+                append_at = (n_stored, int(last_stored.iloc[0]) if len(last_stored) else None)
                 store.append(
                     key=h5_key,
                     value=frame,
@@ -605,10 +680,334 @@ class TradesData:
                         f"Saved {len(disc_df)} trade ID discontinuities to metadata."
                     )
 
+            # ------------------------------------------------------------------
+            #  Update the sidecar index (fast key discovery, range seeks and inspection)
+            # ------------------------------------------------------------------
+            self._update_h5_index(store, filepath, h5_key, frame, append_at, fresh=mode == "w")
+
             logger.info(f"Successfully saved {len(frame):,} records for {month_key}")
 
         return h5_key
 
+    @staticmethod
+    def _update_h5_index(
+        store: pd.HDFStore,
+        filepath: str,
+        h5_key: str,
+        frame: pd.DataFrame,
+        append_at: Optional[Tuple[int, Optional[int]]],
+        fresh: bool,
+    ) -> None:
+        """
+        Update the sidecar index of the store with the trades just written to ``h5_key``.
+
+        :param store: The open store.
+        :param filepath: Path of the store.
+        :param h5_key: The written trades key.
+        :param frame: The written trades.
+        :param append_at: (stored rows, last stored timestamp) if the trades were appended to the group, else None.
+        :param fresh: Whether the store was created by this write (mode "w").
+        """
+        index = None if fresh else TradesH5Index.load(filepath)
+        if index is None:
+            # A new index only covers the whole store if it holds no other (unindexed) trades group
+            others = not fresh and any(k != h5_key and k.startswith("/trades/") for k in store.keys())
+            index = TradesH5Index(filepath, complete=not others)
+            if not index.complete:
+                logger.info(f"{filepath} has unindexed trade groups; use H5Inspector.build_index() to index them.")
+
+        if append_at is not None and h5_key not in index.entries:
+            # Index the whole group
+            columns = store.select(h5_key, columns=["timestamp", "price", "amount"])
+            index.update(h5_key, TradesH5Index.summarize(
+                columns["timestamp"].values, columns["price"].values, columns["amount"].values
+            ))
+        else:
+            row_offset, previous_timestamp = append_at if append_at is not None else (0, None)
+            entry = TradesH5Index.summarize(
+                frame["timestamp"].values, frame["price"].values, frame["amount"].values,
+                row_offset=row_offset, previous_timestamp=previous_timestamp,
+            )
+            index.update(h5_key, entry, append=append_at is not None)
+        index.save()
+
+    # ------------------------------------------------------------------
+    #  Columnar storage (Parquet, memory-mapped .npy)
+    # ------------------------------------------------------------------
+    _STORAGE_COLUMNS = ("timestamp", "price", "amount", "id", "side", "is_buyer_maker")
+    _NPY_META_FILE = "meta.json"
+
+    def _time_sorted_data(self) -> pd.DataFrame:
+        """
+        The trades in chronological order (stable sort by timestamp, only if they are not sorted yet).
+
+        :returns: DataFrame of the trades.
+        """
+        frame = self.data
+        timestamps = frame["timestamp"].values.astype(np.int64, copy=False)
+        if np.any(np.diff(timestamps) < 0):
+            logger.warning(f"{self.name} | Trades timestamps are not sorted: sorting them before saving by month.")
+            frame = frame.take(np.argsort(timestamps, kind="stable"))
+        return frame
+
+    @staticmethod
+    def _month_slices(frame: pd.DataFrame) -> list[tuple[str, int, int]]:
+        """
+        Split time sorted trades into calendar months (see :meth:`_time_sorted_data`).
+
+        :param frame: Trades sorted by timestamp.
+        :returns: List of (month key "YYYY-MM", start row, end row) tuples.
+        """
+        timestamps = frame["timestamp"].values.astype(np.int64, copy=False)
+        months = pd.to_datetime(timestamps, unit="ns").to_period("M")
+        month_codes = months.year.values * 12 + months.month.values - 1
+        bounds = np.flatnonzero(np.diff(month_codes)) + 1
+        starts = np.concatenate(([0], bounds))
+        ends = np.concatenate((bounds, [len(timestamps)]))
+
+        return [(str(months[start]), int(start), int(end)) for start, end in zip(starts, ends)]
+
+    def _storage_columns(self) -> list[str]:
+        """
+        Columns persisted by the columnar backends (columns holding only missing values are skipped).
+
+        :returns: Column names.
+        """
+        frame = self.data
+        return [c for c in self._STORAGE_COLUMNS if c in frame.columns and not frame[c].isna().all()]
+
+    def save_parquet(
+        self,
+        dirpath: str,
+        *,
+        compression: str = "zstd",
+        row_group_size: int = 1_000_000,
+    ) -> list[str]:
+        r"""Persist trades data as Parquet files partitioned by month.
+
+        Each month is written to ``<dirpath>/month=YYYY-MM/trades.parquet`` (Hive partitioning), sorted by
+        timestamp, so the row group statistics of the ``timestamp`` column let :meth:`load_parquet` skip row groups
+        outside of the requested time range. Existing monthly partitions are overwritten.
+
+        :param dirpath: Destination directory. Created automatically.
+        :param compression: Parquet compression codec ("zstd", "lz4", "snappy", "none"). Default: "zstd".
+        :param row_group_size: Number of rows per row group (granularity of the time range skipping). Default: 1,000,000.
+        :returns: List of the written monthly partition keys (e.g., ["2021-03", "2021-04"]).
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        frame = self._time_sorted_data()
+        columns = self._storage_columns()
+
+        month_keys = []
+        for month_key, start, end in self._month_slices(frame):
+            part_dir = os.path.join(dirpath, f"month={month_key}")
+            os.makedirs(part_dir, exist_ok=True)
+
+            table = pa.table({c: frame[c].values[start:end] for c in columns})
+            pq.write_table(
+                table,
+                os.path.join(part_dir, "trades.parquet"),
+                compression=compression,
+                row_group_size=row_group_size,
+            )
+            month_keys.append(month_key)
+            logger.info(f"Successfully saved {end - start:,} records for {month_key}")
+
+        return month_keys
+
+    @classmethod
+    def load_parquet(
+        cls,
+        dirpath: str,
+        *,
+        start_time: Optional[Union[str, pd.Timestamp]] = None,
+        end_time: Optional[Union[str, pd.Timestamp]] = None,
+        columns: Optional[list[str]] = None,
+    ) -> "TradesData":
+        r"""Load trades saved with :meth:`save_parquet`.
+
+        Only the monthly partitions and row groups intersecting ``[start_time, end_time]`` are read (using the
+        partition names and the row group statistics of ``timestamp``), and only the requested columns are decoded.
+        The decoded arrays are wrapped by the internal DataFrame without an extra copy, so they reach the
+        numba kernels as they came out of Arrow.
+
+        :param dirpath: Directory written by :meth:`save_parquet`.
+        :param start_time: Start time for filtering (string or Timestamp). None for no start limit.
+        :param end_time: End time for filtering (string or Timestamp). None for no end limit.
+        :param columns: Optional columns to read besides "timestamp", "price" and "amount" (e.g., ["side"]).
+            If None, all stored columns are read.
+        :returns: TradesData instance with the loaded data.
+        :raises ValueError: If no trades match the requested slice.
+        """
+        import pyarrow.dataset as ds
+
+        if isinstance(start_time, str):
+            start_time = pd.Timestamp(start_time)
+        if isinstance(end_time, str):
+            end_time = pd.Timestamp(end_time)
+
+        dataset = ds.dataset(dirpath, format="parquet", partitioning="hive")
+        stored = [c for c in cls._STORAGE_COLUMNS if c in dataset.schema.names]
+        if columns is None:
+            read_columns = stored
+        else:
+            read_columns = [c for c in stored if c in ("timestamp", "price", "amount") or c in columns]
+
+        # Partition pruning on the month, row group pruning on the timestamp statistics
+        expr = None
+        if start_time is not None:
+            expr = (ds.field("month") >= f"{start_time:%Y-%m}") & (ds.field("timestamp") >= start_time.value)
+        if end_time is not None:
+            end_expr = (ds.field("month") <= f"{end_time:%Y-%m}") & (ds.field("timestamp") <= end_time.value)
+            expr = end_expr if expr is None else expr & end_expr
+
+        table = dataset.to_table(columns=read_columns, filter=expr)
+        if table.num_rows == 0:
+            raise ValueError("No trades match the requested slice.")
+
+        # Partitions are read in directory order; sort only if needed
+        arrays = {c: table.column(c).to_numpy() for c in read_columns}
+        if np.any(np.diff(arrays["timestamp"]) < 0):
+            order = np.argsort(arrays["timestamp"], kind="stable")
+            arrays = {c: a[order] for c, a in arrays.items()}
+        logger.info(f"Successfully loaded {table.num_rows:,} trades from {dirpath}.")
+
+        return cls(
+            arrays["timestamp"],
+            arrays["price"],
+            arrays["amount"],
+            id=arrays.get("id"),
+            is_buyer_maker=arrays.get("is_buyer_maker"),
+            side=arrays.get("side"),
+            timestamp_unit="ns",
+            copy=False,
+        )
+
+    def save_npy(self, dirpath: str, overwrite_month: bool = True) -> list[str]:
+        r"""Persist trades data as a struct-of-arrays store: one ``.npy`` file per column per month.
+
+        Each month is written to ``<dirpath>/YYYY-MM/<column>.npy`` in the in-memory dtype of the column
+        (e.g., timestamp int64, price float64, side int8), with a ``meta.json`` file written last to mark the month
+        as complete. The files can be memory-mapped by :meth:`load_npy`, so several processes share the OS page cache
+        instead of holding private copies of the trades.
+
+        :param dirpath: Destination directory. Created automatically.
+        :param overwrite_month: If False, raise instead of replacing an existing month. Default: True.
+        :returns: List of the written monthly keys (e.g., ["2021-03", "2021-04"]).
+        :raises FileExistsError: If a month already exists and ``overwrite_month`` is False.
+        """
+        frame = self._time_sorted_data()
+        columns = self._storage_columns()
+
+        month_keys = []
+        for month_key, start, end in self._month_slices(frame):
+            month_dir = os.path.join(dirpath, month_key)
+            meta_path = os.path.join(month_dir, self._NPY_META_FILE)
+            if os.path.exists(meta_path):
+                if not overwrite_month:
+                    raise FileExistsError(f"Data for {month_key} already exists in {dirpath}.")
+                os.remove(meta_path)
+            os.makedirs(month_dir, exist_ok=True)
+
+            dtypes = {}
+            for col in columns:
+                array = np.ascontiguousarray(frame[col].values[start:end])
+                np.save(os.path.join(month_dir, f"{col}.npy"), array)
+                dtypes[col] = str(array.dtype)
+
+            # Write the metadata last: its presence marks a complete month
+            with open(meta_path, "w") as f:
+                json.dump({
+                    "record_count": end - start,
+                    "first_timestamp": int(frame["timestamp"].values[start]),
+                    "last_timestamp": int(frame["timestamp"].values[end - 1]),
+                    "columns": dtypes,
+                }, f)
+            month_keys.append(month_key)
+            logger.info(f"Successfully saved {end - start:,} records for {month_key}")
+
+        return month_keys
+
+    @classmethod
+    def load_npy(
+        cls,
+        dirpath: str,
+        *,
+        start_time: Optional[Union[str, pd.Timestamp]] = None,
+        end_time: Optional[Union[str, pd.Timestamp]] = None,
+        columns: Optional[list[str]] = None,
+        mmap_mode: Optional[str] = "r",
+    ) -> "TradesData":
+        r"""Load trades saved with :meth:`save_npy`.
+
+        The column files are memory-mapped (read-only by default) and the internal DataFrame and datetime index wrap
+        them without copying, so ``trades.data['price'].values`` is the mapped file itself and goes straight into the
+        numba bar kernels. Time range slicing uses a binary search on the mapped timestamps and yields views.
+        If the requested range spans several months, the monthly arrays are concatenated into memory.
+
+        :param dirpath: Directory written by :meth:`save_npy`.
+        :param start_time: Start time for filtering (string or Timestamp). None for no start limit.
+        :param end_time: End time for filtering (string or Timestamp). None for no end limit.
+        :param columns: Optional columns to load besides "timestamp", "price" and "amount" (e.g., ["side"]).
+            If None, all stored columns are loaded.
+        :param mmap_mode: Memory-map mode passed to ``np.load`` ("r", "r+", "c"), or None to read into memory.
+        :returns: TradesData instance with the loaded data.
+        :raises ValueError: If no trades match the requested slice.
+        """
+        if isinstance(start_time, str):
+            start_time = pd.Timestamp(start_time)
+        if isinstance(end_time, str):
+            end_time = pd.Timestamp(end_time)
+
+        parts = []
+        for month_key in sorted(os.listdir(dirpath)):
+            meta_path = os.path.join(dirpath, month_key, cls._NPY_META_FILE)
+            if not os.path.exists(meta_path):
+                continue
+            with open(meta_path) as f:
+                meta = json.load(f)
+            if start_time is not None and meta["last_timestamp"] < start_time.value:
+                continue
+            if end_time is not None and meta["first_timestamp"] > end_time.value:
+                continue
+
+            read_columns = [
+                c for c in meta["columns"]
+                if columns is None or c in ("timestamp", "price", "amount") or c in columns
+            ]
+            arrays = {
+                c: np.load(os.path.join(dirpath, month_key, f"{c}.npy"), mmap_mode=mmap_mode)
+                for c in read_columns
+            }
+            ts = arrays["timestamp"]
+            lo = 0 if start_time is None else np.searchsorted(ts, start_time.value, side="left")
+            hi = len(ts) if end_time is None else np.searchsorted(ts, end_time.value, side="right")
+            if hi > lo:
+                parts.append({c: a[lo:hi] for c, a in arrays.items()})
+
+        if not parts:
+            raise ValueError("No trades match the requested slice.")
+        if len(parts) == 1:
+            arrays = parts[0]
+        else:
+            arrays = {c: np.concatenate([p[c] for p in parts]) for c in parts[0]}
+        logger.info(f"Successfully loaded {len(arrays['timestamp']):,} trades from {len(parts)} month(s).")
+
+        ts = arrays["timestamp"]
+        return cls(
+            ts,
+            arrays["price"],
+            arrays["amount"],
+            id=arrays.get("id"),
+            is_buyer_maker=arrays.get("is_buyer_maker"),
+            side=arrays.get("side"),
+            dt_index=pd.DatetimeIndex(ts.view("datetime64[ns]"), name="datetime", copy=False),
+            timestamp_unit="ns",
+            copy=False,
+        )
+
     # ------------------------------------------------------------------
     #  Reading helpers
     # ------------------------------------------------------------------
@@ -620,16 +1019,27 @@ class TradesData:
         end: Optional[pd.Timestamp],
     ) -> list[str]:
         """Internal helper – determine which monthly groups intersect the
-        *[start, end]* interval by consulting the per‑group metadata.
+        *[start, end]* interval by consulting the sidecar index or else the per‑group metadata.
         """
+        index = TradesH5Index.load_complete(store.filename, store)
+        if index is not None:
+            return index.keys_for_timerange(start, end)
+
+        keys = store.keys()
+        meta_keys = {k for k in keys if k.startswith("/meta/")}
         candidate_keys: list[str] = []
-        for meta_key in (k for k in store.keys() if k.startswith("/meta/")):
+        for trades_key in (k for k in keys if k.startswith("/trades/")):
+            meta_key = trades_key.replace("/trades", "/meta", 1)
+            if meta_key not in meta_keys:
+                # Groups written by other tools have no metadata: they are read with the time filter
+                candidate_keys.append(trades_key)
+                continue
             meta = store[meta_key]
             first = pd.to_datetime(meta["first_timestamp"], unit="ns")
             last = pd.to_datetime(meta["last_timestamp"], unit="ns")
             if (end is None or first <= end) and (start is None or last >= start):
                 # If there is intersection, add the corresponding trades key
-                candidate_keys.append(meta_key.replace("/meta", "/trades"))
+                candidate_keys.append(trades_key)
         return sorted(candidate_keys)
 
     @classmethod
@@ -643,6 +1053,7 @@ class TradesData:
         n_workers: Optional[int] = None,
         enable_multiprocessing: bool = True,
         min_groups_for_mp: int = 2,
+        use_shared_memory: bool = True,
     ) -> "TradesData":
         r"""Load trades from HDF5 storage with optional multiprocessing and time filtering.
 
@@ -653,7 +1064,12 @@ class TradesData:
             3. **Filtered month**: Combine ``key`` with time range for constrained loading
 
         Multiprocessing is automatically enabled for loading multiple monthly groups,
-        significantly improving performance for large time ranges.
+        significantly improving performance for large time ranges. By default the workers decode their group directly
+        into shared memory column buffers (sized from the ``record_count`` metadata) that the returned TradesData wraps
+        without copying, instead of pickling DataFrames back to the parent and concatenating them.
+
+        When the :data:`afmlkit.bar.cache.PARTITION_CACHE` is enabled, the cached groups are served from memory and the
+        others are read whole (without shared memory transfer), cached, and time filtered in memory.
 
         :param filepath: Path to HDF5 file containing trades data.
         :param key: Specific monthly key to load (e.g., "2021-03"). If None, uses time range discovery.
@@ -662,6 +1078,8 @@ class TradesData:
         :param n_workers: Number of worker processes. If None, uses CPU count - 1.
         :param enable_multiprocessing: Enable parallel loading for multiple groups. Default: True.
         :param min_groups_for_mp: Minimum groups required to trigger multiprocessing. Default: 2.
+        :param use_shared_memory: Transfer the worker results through shared memory (falls back to DataFrame
+            transfer if the groups have no metadata or non-numeric columns). Default: True.
         :returns: TradesData instance with loaded and concatenated data.
         :raises KeyError: If specified key doesn't exist or no groups match the time range.
         :raises ValueError: If no data is successfully loaded from any group.
@@ -707,11 +1125,21 @@ class TradesData:
             if not h5_keys:
                 raise KeyError("No HDF5 group matches the requested slice.")
 
+        # Groups in the partition cache are served from memory; the others are read whole to be cached
+        cached: Dict[str, pd.DataFrame] = {}
+        if PARTITION_CACHE.enabled:
+            for h5_key in h5_keys:
+                df = PARTITION_CACHE.get(filepath, h5_key)
+                if df is not None:
+                    cached[h5_key] = df
+            use_shared_memory = False
+        load_keys = [h5_key for h5_key in h5_keys if h5_key not in cached]
+
         # ------------------------------------------------------------------
         #  Decide whether to use multiprocessing
         # ------------------------------------------------------------------
         use_multiprocessing = (
-            enable_multiprocessing and len(h5_keys) >= min_groups_for_mp
+            enable_multiprocessing and len(load_keys) >= min_groups_for_mp
         )
 
         # Prepare where clause for time filtering
@@ -720,23 +1148,43 @@ class TradesData:
             where_clause.append(f"index >= Timestamp('{start_time}')")
         if end_time is not None:
             where_clause.append(f"index <= Timestamp('{end_time}')")
-        where = " & ".join(where_clause) if where_clause else None
+        where = " & ".join(where_clause) if where_clause and not PARTITION_CACHE.enabled else None
+
+        # Restrict the time filtered reads to the rows of the requested days (from the sidecar index)
+        row_ranges: Dict[str, Optional[Tuple[int, int]]] = dict.fromkeys(load_keys)
+        index = TradesH5Index.load(filepath) if where else None
+        if index is not None:
+            with pd.HDFStore(filepath, mode="r") as store:
+                for h5_key in load_keys:
+                    if h5_key in index.entries:
+                        row_ranges[h5_key] = index.row_range(h5_key, start_time, end_time,
+                                                             nrows=store.get_storer(h5_key).nrows)
 
-        frames: list[pd.DataFrame] = []
+        loaded: Dict[str, pd.DataFrame] = {}
 
         if use_multiprocessing:
             logger.info(
-                f"Loading {len(h5_keys)} groups using multiprocessing with {n_workers or mp.cpu_count() - 1} workers..."
+                f"Loading {len(load_keys)} groups using multiprocessing with {n_workers or mp.cpu_count() - 1} workers..."
             )
 
             # Prepare arguments for worker processes
-            worker_args = [(filepath, h5_key, where) for h5_key in h5_keys]
+            worker_args = [(filepath, h5_key, where, row_ranges[h5_key]) for h5_key in load_keys]
 
             # Determine number of workers
             if n_workers is None:
-                n_workers = min(mp.cpu_count() - 1, len(h5_keys))
+                n_workers = min(mp.cpu_count() - 1, len(load_keys))
             else:
-                n_workers = min(n_workers, len(h5_keys))
+                n_workers = min(n_workers, len(load_keys))
+
+            if use_shared_memory:
+                try:
+                    trades = cls._load_h5_shared_memory(filepath, load_keys, where, n_workers, row_ranges)
+                    if trades is not None:
+                        return trades
+                except Exception as e:
+                    logger.warning(
+                        f"Shared memory loading failed ({str(e)}), falling back to DataFrame transfer..."
+                    )
 
             try:
                 # Use ProcessPoolExecutor for better control and Jupyter compatibility
@@ -747,28 +1195,17 @@ class TradesData:
                         for args in worker_args
                     }
 
-                    # Create a dictionary to store results by key for ordered processing
-                    results_by_key = {}
-
-                    # Collect results as they complete
+                    # Collect results as they complete (ordered by key below)
                     for future in as_completed(future_to_key):
                         h5_key = future_to_key[future]
                         try:
                             df = future.result()
                             if not df.empty:
-                                results_by_key[h5_key] = df
+                                loaded[h5_key] = df
                         except Exception as e:
                             logger.error(f"Error loading {h5_key}: {str(e)}")
                             # Continue with other groups instead of failing completely
 
-                # Add results to frames in the same order as h5_keys to maintain chronology
-                for h5_key in h5_keys:
-                    if h5_key in results_by_key:
-                        logger.info(
-                            f"Appending {h5_key} to the frame list for concatanation."
-                        )
-                        frames.append(results_by_key[h5_key])
-
             except Exception as e:
                 logger.warning(
                     f"Multiprocessing failed ({str(e)}), falling back to sequential loading..."
@@ -776,23 +1213,38 @@ class TradesData:
                 use_multiprocessing = False
 
         # Sequential loading (fallback or when multiprocessing is disabled)
-        if not use_multiprocessing:
-            logger.info(f"Loading {len(h5_keys)} groups sequentially...")
+        if not use_multiprocessing and load_keys:
+            logger.info(f"Loading {len(load_keys)} groups sequentially...")
 
             with pd.HDFStore(filepath, mode="r") as store:
-                for h5_key in h5_keys:
+                for h5_key in load_keys:
                     try:
-                        if where:
-                            df = store.select(h5_key, where=where)
-                        else:
-                            df = store[h5_key]
+                        df = _select_h5_group(store, h5_key, where, row_ranges[h5_key])
 
                         if not df.empty:
-                            frames.append(df)
+                            loaded[h5_key] = df
                     except Exception as e:
                         logger.error(f"Error loading {h5_key}: {str(e)}")
                         continue
 
+        if PARTITION_CACHE.enabled:
+            for h5_key, df in loaded.items():
+                PARTITION_CACHE.put(filepath, h5_key, df)
+            loaded.update(cached)
+            logger.info(f"Served {len(cached)} of {len(h5_keys)} groups from the partition cache.")
+
+        # Keep the chronological order of the groups
+        frames = [loaded[h5_key] for h5_key in h5_keys if h5_key in loaded]
+
+        # Time filter the whole groups read through the partition cache
+        if PARTITION_CACHE.enabled and (start_time is not None or end_time is not None):
+            frames = [
+                df[(df.index >= start_time if start_time is not None else True) &
+                   (df.index <= end_time if end_time is not None else True)]
+                for df in frames
+            ]
+            frames = [df for df in frames if not df.empty]
+
         if not frames:
             raise ValueError("No data was successfully loaded from any HDF5 group.")
 
@@ -829,6 +1281,260 @@ class TradesData:
             dt_index=df.index,
         )
 
+    @classmethod
+    def _load_h5_shared_memory(
+        cls,
+        filepath: str,
+        h5_keys: list[str],
+        where: Optional[str],
+        n_workers: int,
+        row_ranges: Optional[Dict[str, Optional[Tuple[int, int]]]] = None,
+    ) -> Optional["TradesData"]:
+        """
+        Load HDF5 groups in worker processes that write straight into shared memory column buffers.
+
+        Each group gets a slice of the buffers sized by its ``record_count`` metadata (or by its row range, when the
+        read is restricted to the rows of the requested days by the sidecar index). Holes left by time filtered
+        groups are closed in place, and the resulting TradesData wraps the buffers without copying (it keeps the
+        shared memory blocks alive; their names are unlinked as soon as the workers are done).
+
+        :param filepath: Path to HDF5 file containing trades data.
+        :param h5_keys: Chronologically sorted trade group keys to load.
+        :param where: Optional PyTables where clause for time filtering.
+        :param n_workers: Number of worker processes.
+        :param row_ranges: Optional (start row, stop row) to read in each group (None to read the whole group).
+        :returns: TradesData instance, or None if the groups cannot be transferred this way.
+        :raises Exception: Any worker failure (the caller falls back to DataFrame transfer).
+        """
+        with pd.HDFStore(filepath, mode="r") as store:
+            row_ranges = row_ranges or dict.fromkeys(h5_keys)
+            counts = []
+            for h5_key in h5_keys:
+                if row_ranges[h5_key] is not None:
+                    counts.append(row_ranges[h5_key][1] - row_ranges[h5_key][0])
+                    continue
+                meta_key = h5_key.replace("/trades", "/meta")
+                if meta_key not in store:
+                    logger.info(f"No metadata for {h5_key}, shared memory transfer disabled.")
+                    return None
+                counts.append(int(store[meta_key]["record_count"]))
+            sample = store.select(h5_keys[0], start=0, stop=1)
+
+        dtypes = {c: sample[c].dtype for c in sample.columns}
+        if sample.index.dtype != np.dtype("datetime64[ns]") or any(dt.kind not in "biuf" for dt in dtypes.values()):
+            logger.info("Non-numeric columns or index, shared memory transfer disabled.")
+            return None
+        dtypes = {"index": np.dtype(np.int64), **dtypes}
+
+        offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        capacity = int(offsets[-1])
+        buffers = {
+            c: _SharedColumn(create=True, size=max(1, capacity * dtype.itemsize)) for c, dtype in dtypes.items()
+        }
+        try:
+            specs = {c: (buffers[c].name, dtype.str) for c, dtype in dtypes.items()}
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                futures = [
+                    executor.submit(
+                        _load_h5_group_into_shared_memory,
+                        (filepath, h5_key, where, row_ranges[h5_key], specs, int(offsets[i]), counts[i]),
+                    )
+                    for i, h5_key in enumerate(h5_keys)
+                ]
+                n_rows = [future.result() for future in futures]
+        finally:
+            # The mappings stay valid; only the names are removed
+            for shm in buffers.values():
+                shm.unlink()
+
+        # np.frombuffer holds a buffer export, so the blocks cannot be unmapped while the arrays are alive
+        arrays = {c: np.frombuffer(buffers[c].buf, dtype=dtype, count=capacity) for c, dtype in dtypes.items()}
+        # Close the holes left by the (time filtered) groups with fewer rows than their record count
+        pos = 0
+        for start, n in zip(offsets[:-1], n_rows):
+            if start != pos:
+                for array in arrays.values():
+                    array[pos:pos + n] = array[start:start + n]
+            pos += n
+        if pos == 0:
+            return None
+        arrays = {c: array[:pos] for c, array in arrays.items()}
+
+        dt_index = pd.DatetimeIndex(arrays.pop("index").view("datetime64[ns]"), name=sample.index.name, copy=False)
+        if not dt_index.is_monotonic_increasing:
+            logger.info("Sorting trades by datetime index after loading...")
+            order = np.argsort(dt_index.asi8, kind="stable")
+            arrays = {c: array[order] for c, array in arrays.items()}
+            dt_index = dt_index[order]
+        logger.info(
+            f"Successfully loaded {pos:,} trades from {len(h5_keys)} monthly groups through shared memory."
+        )
+
+        trades = cls(
+            arrays["timestamp"],
+            arrays["price"],
+            arrays["amount"],
+            id=arrays.get("id"),
+            is_buyer_maker=arrays.get("is_buyer_maker"),
+            side=arrays.get("side"),
+            dt_index=dt_index,
+            copy=False,
+        )
+        trades._shared_memory = list(buffers.values())  # Keeps the wrapped buffers alive
+
+        return trades
+
+    def to_compact(self, ts_unit: str = "ms", price_tick: Optional[float] = None) -> "CompactTradesData":
+        r"""Convert the trades (respecting the active view range) into the compact representation.
+
+        :param ts_unit: Resolution of the stored timestamp offsets ("ms", "us" or "ns"). Default: "ms".
+        :param price_tick: Price tick size; inferred with :func:`comp_price_tick_size` if None.
+        :returns: CompactTradesData instance usable by the time, tick, volume and dollar bar kits.
+        :raises ValueError: If the trades cannot be represented losslessly (see :class:`CompactTradesData`).
+        """
+        return CompactTradesData.from_trades(self, ts_unit=ts_unit, price_tick=price_tick)
+
+
+@dataclass
+class CompactTradesData:
+    """
+    Compact, bar-building oriented representation of trades, about half the memory of :class:`TradesData`.
+
+    - Timestamps are stored as one int64 base (ns) per block of ``2**COMPACT_BLOCK_SHIFT`` trades plus a uint32 offset
+      per trade in ``ts_unit`` units: ``timestamp[i] = ts_base[i >> COMPACT_BLOCK_SHIFT] + ts_delta[i] * ts_unit_ns``.
+    - Prices are stored as integer tick counts (int32 if they fit, int64 otherwise): ``price = price_ticks * price_tick``.
+    - Amounts are stored as float32 and sides as int8. Trade ids are not kept.
+
+    The numba bar kernels take these arrays directly; the bar kits rescale the price valued outputs by ``price_tick``.
+
+    :param ts_base: Block base timestamps in nanoseconds.
+    :param ts_delta: Per trade timestamp offsets from the block base in ``ts_unit`` units.
+    :param ts_unit: Resolution of the timestamp offsets ("ms", "us" or "ns").
+    :param price_ticks: Trade prices in price tick units.
+    :param price_tick: Price tick size.
+    :param amount: Trade amounts.
+    :param side: Optional market order side (-1: sell, 1: buy).
+    """
+
+    ts_base: NDArray[np.int64]  # 1D int64 array (one per block)
+    ts_delta: NDArray[np.uint32]  # 1D uint32 array
+    ts_unit: str
+    price_ticks: Union[NDArray[np.int32], NDArray[np.int64]]  # 1D int32/int64 array
+    price_tick: float
+    amount: NDArray[np.float32]  # 1D float32 array
+    side: Optional[NDArray[np.int8]] = None  # 1D int8 array
+
+    def __len__(self) -> int:
+        """
+        Return the number of trades.
+        :returns: Number of trades.
+        """
+        return len(self.ts_delta)
+
+    @property
+    def ts_unit_ns(self) -> int:
+        """
+        Timestamp offset unit in nanoseconds.
+        :returns: Nanoseconds per offset unit.
+        """
+        return int(pd.Timedelta(1, unit=self.ts_unit).value)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory held by the trade arrays.
+        :returns: Size in bytes.
+        """
+        arrays = (self.ts_base, self.ts_delta, self.price_ticks, self.amount, self.side)
+        return sum(a.nbytes for a in arrays if a is not None)
+
+    def timestamps(self, indices: Optional[NDArray[np.int64]] = None) -> NDArray[np.int64]:
+        """
+        Decode the trade timestamps.
+
+        :param indices: Optional trade indices to decode. If None, all timestamps are decoded.
+        :returns: Timestamps in nanoseconds.
+        """
+        if indices is None:
+            indices = np.arange(len(self), dtype=np.int64)
+        return _decode_timestamps(self.ts_base, self.ts_delta, self.ts_unit_ns, np.asarray(indices, dtype=np.int64))
+
+    def prices(self) -> NDArray[np.float64]:
+        """
+        Decode the trade prices.
+        :returns: Trade prices.
+        """
+        return self.price_ticks * self.price_tick
+
+    @classmethod
+    def from_trades(
+        cls, trades: TradesData, ts_unit: str = "ms", price_tick: Optional[float] = None
+    ) -> "CompactTradesData":
+        """
+        Build the compact representation of trades data.
+
+        :param trades: TradesData instance (timestamps sorted, in nanoseconds).
+        :param ts_unit: Resolution of the stored timestamp offsets ("ms", "us" or "ns"). Default: "ms".
+        :param price_tick: Price tick size; inferred with :func:`comp_price_tick_size` if None.
+        :returns: A CompactTradesData instance.
+        :raises ValueError: If the timestamps are not sorted, not multiples of ``ts_unit``, or a block spans more than
+            the uint32 offset range, or if the prices are not on the price tick grid.
+        """
+        frame = trades.data
+        timestamps = frame["timestamp"].values.astype(np.int64, copy=False)
+        prices = frame["price"].values.astype(np.float64, copy=False)
+        if len(timestamps) == 0:
+            raise ValueError("Cannot compact empty trades data.")
+
+        # Timestamps: block bases + uint32 offsets
+        ts_unit_ns = int(pd.Timedelta(1, unit=ts_unit).value)
+        if np.any(np.diff(timestamps) < 0):
+            raise ValueError("Trades must be sorted by timestamp.")
+        if np.any(timestamps % ts_unit_ns):
+            raise ValueError(f"Timestamps are not multiples of the compact resolution '{ts_unit}'.")
+        ts_base = timestamps[::1 << COMPACT_BLOCK_SHIFT].copy()
+        offsets = (timestamps - np.repeat(ts_base, 1 << COMPACT_BLOCK_SHIFT)[:len(timestamps)]) // ts_unit_ns
+        if offsets.max() > np.iinfo(np.uint32).max:
+            raise ValueError(f"Timestamp offsets overflow uint32 at resolution '{ts_unit}'; use a coarser ts_unit.")
+
+        # Prices: integer tick counts
+        if price_tick is None:
+            price_tick = comp_price_tick_size(prices)
+        if price_tick <= 0:
+            raise ValueError("Price tick size must be positive.")
+        price_ticks = np.round(prices / price_tick)
+        if not np.allclose(price_ticks * price_tick, prices, rtol=1e-12, atol=0.0):
+            raise ValueError(f"Prices are not on the price tick grid ({price_tick}).")
+        tick_dtype = np.int32 if np.abs(price_ticks).max() <= np.iinfo(np.int32).max else np.int64
+
+        side = frame["side"].values.astype(np.int8) if "side" in frame.columns else None
+        compact = cls(
+            ts_base=ts_base,
+            ts_delta=offsets.astype(np.uint32),
+            ts_unit=ts_unit,
+            price_ticks=price_ticks.astype(tick_dtype),
+            price_tick=float(price_tick),
+            amount=frame["amount"].values.astype(np.float32),
+            side=side,
+        )
+        logger.info(f"Compacted {len(compact):,} trades into {compact.nbytes / 2**20:.1f} MiB.")
+
+        return compact
+
+    def to_trades(self) -> TradesData:
+        """
+        Decode into a regular TradesData instance (without trade ids).
+        :returns: TradesData instance.
+        """
+        return TradesData(
+            self.timestamps(),
+            self.prices(),
+            self.amount.astype(np.float64),
+            side=self.side,
+            timestamp_unit="ns",
+            copy=False,
+        )
+
 
 @dataclass
 class FootprintData:
@@ -850,6 +1556,8 @@ class FootprintData:
     :param imb_max_run_signed: Optional longest signed imbalance run for each bar.
     :param vp_skew: Optional volume profile skew for each bar (positive = buy pressure above VWAP).
     :param vp_gini: Optional volume profile Gini coefficient for each bar (0 = concentrated, →1 = even).
+    :param offsets: Optional bar offsets for the compressed (CSR) layout. If set, the per-level attributes are flat
+        arrays and the levels of bar ``i`` are ``offsets[i]:offsets[i + 1]``; otherwise they hold one array per bar.
     """
 
     # Data attributes
@@ -884,12 +1592,27 @@ class FootprintData:
     imb_max_run_signed: Optional[NDArray[np.int16]] = None  # 1D int16 array
     vp_skew: Optional[NDArray[np.float64]] = None  # 1D float64 array
     vp_gini: Optional[NDArray[np.float64]] = None  # 1D float64 array
+    offsets: Optional[NDArray[np.int64]] = None  # 1D int64 array (n_bars + 1), compressed layout only
 
     # Private attributes
     _datetime_index: pd.Series = (
         None  # DatetimeIndex for date time slicing (will be set in __post_init__)
     )
 
+    # Metadata file of the .npy directory format
+    _NPY_META_FILE = "meta.json"
+
+    # Per-level attributes and their dtypes
+    _LEVEL_FIELDS = {
+        "price_levels": np.int32,
+        "buy_volumes": np.float32,
+        "sell_volumes": np.float32,
+        "buy_ticks": np.int32,
+        "sell_ticks": np.int32,
+        "buy_imbalances": np.bool_,
+        "sell_imbalances": np.bool_,
+    }
+
     def __post_init__(self):
         # Convert bar_timestamps to pandas DatetimeIndex for easier slicing
         # This method is automatically called after the object is initialized.
@@ -948,6 +1671,7 @@ class FootprintData:
             f"  Price Tick: {self.price_tick}\n"
             f"  Date Range: {self._datetime_index[0]} to {self._datetime_index[-1]}\n"
             f"  Array Types: {type_message}\n"
+            f"  Layout: {'compressed (CSR)' if self.is_compressed else 'per-bar arrays'}\n"
             f"  Optional Attributes:\n"
             f"    COT Price Levels: {additional_info['cot_price_levels']}\n"
             f"    Sell Imbalances Sum: {additional_info['sell_imbalances_sum']}\n"
@@ -978,16 +1702,37 @@ class FootprintData:
                 return self[start_idx:end_idx]
 
             # Handle integer index or regular slicing
+            if self.is_compressed:
+                # Select whole bars; contiguous slices are zero-copy views of the flat arrays
+                if isinstance(key, int):
+                    key = range(len(self))[key]
+                    key = slice(key, key + 1)
+                start, stop, step = key.indices(len(self))
+                if step == 1:
+                    stop = max(start, stop)
+                    level_key = slice(self.offsets[start], self.offsets[stop])
+                    offsets = self.offsets[start:stop + 1] - self.offsets[start]
+                else:
+                    bars = np.arange(start, stop, step)
+                    lengths = self.offsets[bars + 1] - self.offsets[bars]
+                    offsets = np.zeros(len(bars) + 1, dtype=np.int64)
+                    np.cumsum(lengths, out=offsets[1:])
+                    level_key = (np.repeat(self.offsets[bars] - offsets[:-1], lengths)
+                                 + np.arange(offsets[-1], dtype=np.int64))
+            else:
+                level_key = key
+                offsets = None
+
             return FootprintData(
                 bar_timestamps=self.bar_timestamps[key],
-                price_levels=self.price_levels[key],
+                price_levels=self.price_levels[level_key],
                 price_tick=self.price_tick,
-                buy_volumes=self.buy_volumes[key],
-                sell_volumes=self.sell_volumes[key],
-                buy_ticks=self.buy_ticks[key],
-                sell_ticks=self.sell_ticks[key],
-                buy_imbalances=self.buy_imbalances[key],
-                sell_imbalances=self.sell_imbalances[key],
+                buy_volumes=self.buy_volumes[level_key],
+                sell_volumes=self.sell_volumes[level_key],
+                buy_ticks=self.buy_ticks[level_key],
+                sell_ticks=self.sell_ticks[level_key],
+                buy_imbalances=self.buy_imbalances[level_key],
+                sell_imbalances=self.sell_imbalances[level_key],
                 cot_price_levels=self.cot_price_levels[key]
                 if self.cot_price_levels is not None
                 else None,
@@ -1002,6 +1747,7 @@ class FootprintData:
                 else None,
                 vp_skew=self.vp_skew[key] if self.vp_skew is not None else None,
                 vp_gini=self.vp_gini[key] if self.vp_gini is not None else None,
+                offsets=offsets,
             )
         else:
             raise TypeError("Invalid argument type. Expected a slice or integer index.")
@@ -1038,6 +1784,83 @@ class FootprintData:
 
         return instance
 
+    def save_npy(self, dirpath: str, overwrite: bool = False) -> str:
+        """
+        Persist the footprint data as a directory of flat ``.npy`` arrays (one file per attribute) in the compressed
+        (CSR) layout, so it can be memory-mapped with :meth:`load_npy`. The object itself is not modified.
+
+        :param dirpath: Destination directory. Created if it does not exist.
+        :param overwrite: Overwrite an existing footprint directory. Default: False.
+        :returns: Absolute path of the footprint directory.
+        :raises FileExistsError: If the directory already holds footprint data and ``overwrite`` is False.
+        """
+        dirpath = os.path.abspath(dirpath)
+        meta_path = os.path.join(dirpath, self._NPY_META_FILE)
+        if os.path.exists(meta_path) and not overwrite:
+            raise FileExistsError(f"Footprint data already exists in {dirpath}. Use overwrite=True to replace it.")
+        if os.path.exists(meta_path):
+            os.remove(meta_path)  # Uncommit the directory first: an interrupted overwrite does not look complete
+        os.makedirs(dirpath, exist_ok=True)
+
+        footprint = self
+        if not self.is_compressed:
+            footprint = replace(self, **{attr: list(getattr(self, attr)) for attr in self._LEVEL_FIELDS})
+            footprint.cast_to_csr()
+
+        arrays = {}
+        for field in footprint._npy_fields():
+            array = getattr(footprint, field)
+            if array is not None:
+                np.save(os.path.join(dirpath, f"{field}.npy"), np.ascontiguousarray(array))
+                arrays[field] = str(array.dtype)
+
+        # Write the metadata last: its presence marks a complete footprint directory
+        with open(meta_path, "w") as f:
+            json.dump({"price_tick": float(self.price_tick), "n_bars": len(self), "arrays": arrays}, f)
+        logger.info(f"Footprint data with {len(self)} bars saved to {dirpath}.")
+
+        return dirpath
+
+    @classmethod
+    def load_npy(cls, dirpath: str, mmap_mode: Optional[str] = "r") -> "FootprintData":
+        """
+        Load footprint data saved with :meth:`save_npy`. The arrays are memory-mapped by default, so loading is
+        instantaneous and slicing the returned (compressed layout) object yields views without copying.
+
+        :param dirpath: Footprint directory.
+        :param mmap_mode: Memory-map mode passed to ``np.load`` ("r", "r+", "c"), or None to read into memory.
+        :returns: A FootprintData instance in the compressed (CSR) layout.
+        :raises FileNotFoundError: If the directory does not hold footprint data.
+        :raises ValueError: If the arrays are inconsistent.
+        """
+        meta_path = os.path.join(dirpath, cls._NPY_META_FILE)
+        if not os.path.exists(meta_path):
+            raise FileNotFoundError(f"No footprint data found in {dirpath}.")
+        with open(meta_path) as f:
+            meta = json.load(f)
+
+        arrays = {
+            field: np.load(os.path.join(dirpath, f"{field}.npy"), mmap_mode=mmap_mode)
+            for field in meta["arrays"]
+        }
+        instance = cls(price_tick=meta["price_tick"], **arrays)
+        if not instance.is_valid():
+            raise ValueError("Inconsistent data length in the FootprintData container!")
+
+        return instance
+
+    @classmethod
+    def _npy_fields(cls) -> Tuple[str, ...]:
+        """
+        Array attributes persisted by :meth:`save_npy`.
+        :returns: Attribute names.
+        """
+        return (
+            "bar_timestamps", "offsets", *cls._LEVEL_FIELDS,
+            "cot_price_levels", "sell_imbalances_sum", "buy_imbalances_sum",
+            "imb_max_run_signed", "vp_skew", "vp_gini",
+        )
+
     # @classmethod
     # def from_dict(cls, data: Dict) -> 'FootprintData':
     #     """
@@ -1081,23 +1904,70 @@ class FootprintData:
         Convert the footprint data into a pandas DataFrame.
         :returns: A DataFrame with structured footprint information.
         """
+        levels = self._split_levels() if self.is_compressed else {
+            attr: getattr(self, attr) for attr in self._LEVEL_FIELDS
+        }
         df = footprint_to_dataframe(
             self.bar_timestamps,
-            self.price_levels,
-            self.buy_volumes,
-            self.sell_volumes,
-            self.buy_ticks,
-            self.sell_ticks,
-            self.buy_imbalances,
-            self.sell_imbalances,
+            levels["price_levels"],
+            levels["buy_volumes"],
+            levels["sell_volumes"],
+            levels["buy_ticks"],
+            levels["sell_ticks"],
+            levels["buy_imbalances"],
+            levels["sell_imbalances"],
             self.price_tick,
         )
         return df
 
+    @property
+    def is_compressed(self) -> bool:
+        """
+        Whether the per-level attributes are stored in the compressed (CSR) layout.
+        :returns: True if the per-level attributes are flat arrays indexed by ``offsets``.
+        """
+        return self.offsets is not None
+
+    def _split_levels(self) -> Dict[str, list]:
+        """
+        Split the flat per-level arrays of the compressed layout into per-bar views.
+        :returns: Dictionary of per-level attribute name to list of per-bar arrays.
+        """
+        bounds = list(zip(self.offsets[:-1], self.offsets[1:]))
+        return {
+            attr: [getattr(self, attr)[a:b] for a, b in bounds]
+            for attr in self._LEVEL_FIELDS
+        }
+
+    def _expand_levels(self):
+        """
+        Switch from the compressed layout to per-bar arrays (views into the flat arrays).
+        """
+        if self.is_compressed:
+            for attr, arrays in self._split_levels().items():
+                setattr(self, attr, arrays)
+            self.offsets = None
+
+    def cast_to_csr(self):
+        """
+        Convert the per-bar arrays to the compressed (CSR) layout: one flat array per attribute plus bar offsets.
+        """
+        if self.is_compressed:
+            return
+        lengths = np.array([len(levels) for levels in self.price_levels], dtype=np.int64)
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        for attr, dtype in self._LEVEL_FIELDS.items():
+            arrays = list(getattr(self, attr))
+            flat = np.concatenate(arrays) if arrays else np.empty(0)
+            setattr(self, attr, flat.astype(dtype, copy=False))
+        self.offsets = offsets
+
     def cast_to_numba_list(self):
         """
         Convert internal arrays to NumbaList for JIT-compatible processing.
         """
+        self._expand_levels()
         self.price_levels = NumbaList(self.price_levels)
         self.buy_volumes = NumbaList(self.buy_volumes)
         self.sell_volumes = NumbaList(self.sell_volumes)
@@ -1110,6 +1980,7 @@ class FootprintData:
         """
         Convert internal lists to NumPy arrays for general-purpose processing.
         """
+        self._expand_levels()
         self.price_levels = np.array(self.price_levels, dtype=object)
         self.buy_volumes = np.array(self.buy_volumes, dtype=object)
         self.sell_volumes = np.array(self.sell_volumes, dtype=object)
@@ -1132,7 +2003,10 @@ class FootprintData:
         for attr in fields:
             if hasattr(self, attr):
                 array = getattr(self, attr)
-                if (
+                if isinstance(array, np.ndarray) and array.dtype != object:
+                    # Flat arrays (bar metrics or the compressed layout): no per-element overhead
+                    total_memory += array.nbytes
+                elif (
                     isinstance(array, np.ndarray)
                     or isinstance(array, list)
                     or isinstance(array, NumbaList)
@@ -1158,6 +2032,11 @@ class FootprintData:
         :returns: True if valid, False otherwise.
         """
         expected_length = len(self.bar_timestamps)
+        if self.is_compressed:
+            if len(self.offsets) != expected_length + 1:
+                return False
+            n_levels = self.offsets[-1] - self.offsets[0]
+            return all(len(getattr(self, attr)) == n_levels for attr in self._LEVEL_FIELDS)
         attributes = [
             self.price_levels,
             self.buy_volumes,
@@ -1176,21 +2055,36 @@ class FootprintData:
 # --------
 # utils
 # --------
-def _load_single_h5_group(args: Tuple[str, str, Optional[str]]) -> pd.DataFrame:
+def _select_h5_group(
+    store: pd.HDFStore, h5_key: str, where: Optional[str], rows: Optional[Tuple[int, int]]
+) -> pd.DataFrame:
+    """
+    Read a trades group, optionally time filtered and restricted to a row range.
+
+    :param store: The open store.
+    :param h5_key: Trades key.
+    :param where: Optional PyTables where clause.
+    :param rows: Optional (start row, stop row) range holding all rows matching the where clause.
+    :returns: DataFrame with the selected trades.
+    """
+    if rows is not None:
+        return store.select(h5_key, where=where, start=rows[0], stop=rows[1])
+    return store.select(h5_key, where=where) if where else store[h5_key]
+
+
+def _load_single_h5_group(args: Tuple) -> pd.DataFrame:
     """
     Helper function to load a single HDF5 group in a separate process.
 
-    :param args: Tuple of (filepath, h5_key, where_clause)
+    :param args: Tuple of (filepath, h5_key, where_clause[, row range])
     :returns: DataFrame with the loaded data
     """
-    filepath, h5_key, where_clause = args
+    filepath, h5_key, where_clause = args[:3]
+    rows = args[3] if len(args) > 3 else None
 
     try:
         with pd.HDFStore(filepath, mode="r") as store:
-            if where_clause:
-                df = store.select(h5_key, where=where_clause)
-            else:
-                df = store[h5_key]
+            df = _select_h5_group(store, h5_key, where_clause, rows)
         return df
     except Exception as e:
         # Return empty DataFrame with error info in case of failure
@@ -1198,6 +2092,66 @@ def _load_single_h5_group(args: Tuple[str, str, Optional[str]]) -> pd.DataFrame:
         return pd.DataFrame()
 
 
+class _SharedColumn(shared_memory.SharedMemory):
+    """
+    Shared memory block backing a column of loaded trades.
+
+    Arrays wrapping the block may outlive this object (e.g. a DataFrame kept after the TradesData is dropped);
+    closing then fails while they still export the buffer, and the mapping is released together with them.
+    """
+
+    def __del__(self):
+        try:
+            self.close()
+        except (OSError, BufferError):
+            pass
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to an existing shared memory block without registering it with this process' resource tracker
+    (the creating process owns and unlinks it).
+
+    :param name: Name of the shared memory block.
+    :returns: The attached block.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python >= 3.13
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+def _load_h5_group_into_shared_memory(
+    args: Tuple[str, str, Optional[str], Optional[Tuple[int, int]], Dict[str, Tuple[str, str]], int, int]
+) -> int:
+    """
+    Helper function to load a single HDF5 group in a separate process straight into shared memory column buffers.
+
+    :param args: Tuple of (filepath, h5_key, where_clause, row range or None, {column: (shared memory name, dtype)},
+        row offset, row capacity). The "index" column receives the int64 datetime index.
+    :returns: Number of loaded rows.
+    :raises ValueError: If the group holds more rows than its capacity (stale record count).
+    """
+    filepath, h5_key, where_clause, rows, specs, offset, capacity = args
+
+    with pd.HDFStore(filepath, mode="r") as store:
+        df = _select_h5_group(store, h5_key, where_clause, rows)
+    if len(df) > capacity:
+        raise ValueError(f"{h5_key} holds {len(df):,} rows, more than its record count ({capacity:,}).")
+
+    for column, (shm_name, dtype) in specs.items():
+        values = df.index.values.view(np.int64) if column == "index" else df[column].values
+        shm = _attach_shared_memory(shm_name)
+        target = np.ndarray((len(df),), dtype=dtype, buffer=shm.buf, offset=offset * np.dtype(dtype).itemsize)
+        target[:] = values
+        del target  # Release the buffer export before closing
+        shm.close()
+
+    return len(df)
+
+
 def _is_notebook_environment() -> bool:
     """
     Detect if we're running in a Jupyter notebook environment.
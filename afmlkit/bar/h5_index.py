@@ -0,0 +1,298 @@
+"""
+Sidecar index of the trades HDF5 stores written by :meth:`afmlkit.bar.data_model.TradesData.save_h5`.
+
+Answering questions like "which months cover this range", "where are the gaps" or "what is the price range" from the
+HDF5 store means opening it and reading metadata or data nodes (or full partitions). The index keeps a compact
+summary of every ``/trades/YYYY-MM`` group in a JSON file next to the store (``<h5_path>.index.json``):
+
+- record count, first/last timestamp, price and amount ranges
+- per-day row offsets (rows of each UTC day, for time sorted groups), so time range reads seek straight to the
+  rows of the requested days instead of scanning the whole table
+- the timestamp gaps longer than :data:`GAP_THRESHOLD`
+
+The index is updated by every ``save_h5`` call and consulted first by the readers, as long as it still covers exactly
+the trades groups of the store with their current row counts (see :meth:`TradesH5Index.matches_store`). Stores written
+without it (or modified by other tools) are indexed with :meth:`TradesH5Index.rebuild` (e.g., through
+:meth:`afmlkit.bar.io.H5Inspector.build_index`).
+"""
+import json
+import os
+from typing import Dict, List, Optional, Tuple, Any
+
+import numpy as np
+import pandas as pd
+from numpy.typing import NDArray
+
+from afmlkit.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+# Smallest gap between consecutive trades recorded in the index
+GAP_THRESHOLD = pd.Timedelta(minutes=1)
+
+_INDEX_VERSION = 1
+_DAY_NS = 86_400 * 1_000_000_000
+
+
+class TradesH5Index:
+    """
+    Sidecar index of the trade groups of an HDF5 store.
+
+    :param h5_path: Path to the HDF5 store.
+    :param entries: Index entry of each trades key (see :meth:`summarize`).
+    :param complete: Whether every trades group of the store is indexed. Readers only rely on complete indexes.
+    """
+
+    def __init__(self, h5_path: str, entries: Optional[Dict[str, Dict[str, Any]]] = None, complete: bool = True):
+        self.h5_path = h5_path
+        self.entries = entries if entries is not None else {}
+        self.complete = complete
+
+    @staticmethod
+    def path_for(h5_path: str) -> str:
+        """
+        :param h5_path: Path to the HDF5 store.
+        :returns: Path of the sidecar index file.
+        """
+        return f"{h5_path}.index.json"
+
+    @classmethod
+    def load(cls, h5_path: str) -> Optional["TradesH5Index"]:
+        """
+        Load the sidecar index of a store.
+
+        :param h5_path: Path to the HDF5 store.
+        :returns: The index, or None if there is no (readable) index.
+        """
+        path = cls.path_for(h5_path)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path) as f:
+                content = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable index {path}: {str(e)}")
+            return None
+        if content.get("version") != _INDEX_VERSION or content.get("gap_threshold_ns") != GAP_THRESHOLD.value:
+            logger.info(f"Ignoring index {path} written with different settings.")
+            return None
+        return cls(h5_path, content["keys"], content["complete"])
+
+    @classmethod
+    def load_complete(cls, h5_path: str, store: Optional[pd.HDFStore] = None) -> Optional["TradesH5Index"]:
+        """
+        Load the sidecar index of a store if it covers all its trade groups, as they are now in the store.
+
+        :param h5_path: Path to the HDF5 store.
+        :param store: The open store, if any (else it is opened read-only to validate the index).
+        :returns: The index, or None if there is no complete index or it is stale (see :meth:`matches_store`).
+        """
+        index = cls.load(h5_path)
+        if index is None or not index.complete:
+            return None
+        if store is None:
+            with pd.HDFStore(h5_path, mode="r") as store:
+                fresh = index.matches_store(store)
+        else:
+            fresh = index.matches_store(store)
+        if not fresh:
+            logger.warning(f"Stale index for {h5_path} (the trades groups changed without updating it): reading the "
+                           f"store instead. Use H5Inspector.build_index() to rebuild it.")
+            return None
+        return index
+
+    def matches_store(self, store: pd.HDFStore) -> bool:
+        """
+        Check that the index has an entry for every trades group of the store (and for no other key), with the number
+        of rows the group has now. Groups added, appended to or removed without updating the index (by other tools or
+        an interrupted writer) make it stale.
+
+        :param store: The open store.
+        :returns: Whether the index matches the store.
+        """
+        keys = sorted(k for k in store.keys() if k.startswith("/trades/"))
+        if keys != self.keys():
+            return False
+        return all(store.get_storer(key).nrows == self.entries[key]["record_count"] for key in keys)
+
+    def save(self) -> None:
+        """
+        Atomically write the index file.
+        """
+        path = self.path_for(self.h5_path)
+        content = {
+            "version": _INDEX_VERSION,
+            "gap_threshold_ns": GAP_THRESHOLD.value,
+            "complete": self.complete,
+            "keys": {key: self.entries[key] for key in sorted(self.entries)},
+        }
+        with open(path + ".tmp", "w") as f:
+            json.dump(content, f)
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def rebuild(cls, h5_path: str) -> "TradesH5Index":
+        """
+        Index all trade groups of a store by scanning their timestamp, price and amount columns, and save the index.
+
+        :param h5_path: Path to the HDF5 store.
+        :returns: The new index.
+        """
+        index = cls(h5_path)
+        with pd.HDFStore(h5_path, mode="r") as store:
+            for key in (k for k in store.keys() if k.startswith("/trades/")):
+                columns = store.select(key, columns=["timestamp", "price", "amount"])
+                index.entries[key] = cls.summarize(
+                    columns["timestamp"].values, columns["price"].values, columns["amount"].values
+                )
+        index.save()
+        logger.info(f"Indexed {len(index.entries)} trade groups of {h5_path}.")
+        return index
+
+    # ------------------------------------------------------------------
+    #  Entries
+    # ------------------------------------------------------------------
+    @staticmethod
+    def summarize(
+            timestamps: NDArray[np.int64],
+            prices: NDArray[np.float64],
+            amounts: NDArray[np.float64],
+            row_offset: int = 0,
+            previous_timestamp: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Summarize a block of trades, as stored in a group.
+
+        :param timestamps: Trade timestamps (ns) in stored order.
+        :param prices: Trade prices.
+        :param amounts: Trade amounts.
+        :param row_offset: Row of the first trade in the group (for blocks appended to a group).
+        :param previous_timestamp: Timestamp of the stored trade preceding the block, if any.
+        :returns: Index entry with record_count, first/last timestamp, price/amount ranges, day_offsets
+            (``[[day start ns, first row], ...]``, None if not time sorted) and gaps (``[[timestamp ns, gap ns], ...]``,
+            the timestamp being the one of the trade after the gap).
+        """
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        if previous_timestamp is not None:
+            timestamps = np.concatenate(([previous_timestamp], timestamps))
+        diffs = np.diff(timestamps)
+        gap_pos = np.flatnonzero(diffs > GAP_THRESHOLD.value) + 1
+        gaps = np.column_stack((timestamps[gap_pos], diffs[gap_pos - 1])).tolist()
+        if previous_timestamp is not None:
+            timestamps = timestamps[1:]
+
+        day_offsets = None
+        if not np.any(diffs < 0):
+            days = timestamps // _DAY_NS
+            starts = np.concatenate(([0], np.flatnonzero(np.diff(days)) + 1))
+            day_offsets = np.column_stack((days[starts] * _DAY_NS, starts + row_offset)).tolist()
+
+        return {
+            "record_count": len(timestamps),
+            "first_timestamp": int(timestamps.min()),
+            "last_timestamp": int(timestamps.max()),
+            "price_range": [float(np.min(prices)), float(np.max(prices))],
+            "amount_range": [float(np.min(amounts)), float(np.max(amounts))],
+            "day_offsets": day_offsets,
+            "gaps": gaps,
+        }
+
+    def update(self, key: str, entry: Dict[str, Any], append: bool = False) -> None:
+        """
+        Set (or extend, for trades appended to a group) the entry of a key.
+
+        :param key: Trades key (e.g., '/trades/2021-03').
+        :param entry: Entry of the written trades (see :meth:`summarize`, with ``row_offset`` and
+            ``previous_timestamp`` set for appended trades).
+        :param append: Whether the trades were appended to the indexed group.
+        """
+        old = self.entries.get(key) if append else None
+        if old is None:
+            self.entries[key] = entry
+            return
+
+        # Day offsets stay valid only if the appended trades continue the (sorted) group
+        day_offsets = None
+        if old["day_offsets"] is not None and entry["day_offsets"] is not None and \
+                entry["first_timestamp"] >= old["last_timestamp"]:
+            day_offsets = old["day_offsets"] + [d for d in entry["day_offsets"] if d[0] > old["day_offsets"][-1][0]]
+
+        self.entries[key] = {
+            "record_count": old["record_count"] + entry["record_count"],
+            "first_timestamp": min(old["first_timestamp"], entry["first_timestamp"]),
+            "last_timestamp": max(old["last_timestamp"], entry["last_timestamp"]),
+            "price_range": [min(old["price_range"][0], entry["price_range"][0]),
+                            max(old["price_range"][1], entry["price_range"][1])],
+            "amount_range": [min(old["amount_range"][0], entry["amount_range"][0]),
+                             max(old["amount_range"][1], entry["amount_range"][1])],
+            "day_offsets": day_offsets,
+            "gaps": old["gaps"] + entry["gaps"],
+        }
+
+    # ------------------------------------------------------------------
+    #  Queries
+    # ------------------------------------------------------------------
+    def keys(self) -> List[str]:
+        """
+        :returns: The indexed trades keys, sorted chronologically.
+        """
+        return sorted(self.entries)
+
+    def keys_for_timerange(self, start: Optional[pd.Timestamp], end: Optional[pd.Timestamp]) -> List[str]:
+        """
+        Find the trades keys intersecting the inclusive ``[start, end]`` interval.
+
+        :param start: Start of the interval (None for unbounded).
+        :param end: End of the interval (None for unbounded).
+        :returns: Sorted trades keys.
+        """
+        return sorted(
+            key for key, entry in self.entries.items()
+            if (end is None or entry["first_timestamp"] <= end.value)
+            and (start is None or entry["last_timestamp"] >= start.value)
+        )
+
+    def row_range(self, key: str, start: Optional[pd.Timestamp], end: Optional[pd.Timestamp],
+                  nrows: Optional[int] = None) -> Optional[Tuple[int, int]]:
+        """
+        Rows of a group holding the days intersecting ``[start, end]``, a superset of the trades in the interval.
+
+        :param key: Trades key.
+        :param start: Start of the interval (None for unbounded).
+        :param end: End of the interval (None for unbounded).
+        :param nrows: Number of rows of the group in the store, if known. If it differs from the indexed record count,
+            the entry is stale (e.g., the group was written to without updating the index) and no range is returned.
+        :returns: Tuple of (start row, stop row), or None if the group has no day offsets (not time sorted) or the
+            entry is stale.
+        """
+        entry = self.entries[key]
+        if nrows is not None and nrows != entry["record_count"]:
+            logger.warning(f"Stale index entry for {key} ({entry['record_count']:,} indexed rows, {nrows:,} in the "
+                           f"store): reading the group with the time filter only.")
+            return None
+        if entry["day_offsets"] is None:
+            return None
+        day_offsets = np.asarray(entry["day_offsets"], dtype=np.int64).reshape(-1, 2)
+        days, rows = day_offsets[:, 0], day_offsets[:, 1]
+
+        start_row, stop_row = 0, entry["record_count"]
+        if start is not None:
+            i = np.searchsorted(days, start.value - start.value % _DAY_NS, side="right") - 1
+            start_row = int(rows[i]) if i >= 0 else 0
+        if end is not None:
+            j = np.searchsorted(days, end.value - end.value % _DAY_NS, side="right")
+            stop_row = int(rows[j]) if j < len(rows) else entry["record_count"]
+        return start_row, max(start_row, stop_row)
+
+    def gaps(self, key: str, max_gap: pd.Timedelta) -> Optional[List[Tuple[pd.Timestamp, pd.Timedelta]]]:
+        """
+        Timestamp gaps of a group longer than ``max_gap``.
+
+        :param key: Trades key.
+        :param max_gap: Maximum allowable gap between consecutive timestamps.
+        :returns: List of (timestamp after the gap, gap size) tuples, or None if ``max_gap`` is below
+            :data:`GAP_THRESHOLD` (such gaps are not indexed).
+        """
+        if max_gap < GAP_THRESHOLD:
+            return None
+        return [(pd.Timestamp(ts), pd.Timedelta(gap)) for ts, gap in self.entries[key]["gaps"] if gap > max_gap.value]
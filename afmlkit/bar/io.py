@@ -1,11 +1,19 @@
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Optional, Union, Tuple, Any
+from typing import List, Dict, Optional, Union, Tuple, Any, Callable, Iterator, Iterable
 import datetime as dt
 from afmlkit.utils.log import get_logger
+import json
 import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
 from tqdm import tqdm
-from .data_model import TradesData
+from .data_model import TradesData, _select_h5_group
+from .h5_index import TradesH5Index, GAP_THRESHOLD
+from .cache import PARTITION_CACHE
+from .utils import resample_bars
 
 logger = get_logger(__name__)
 
@@ -54,7 +62,9 @@ class H5Inspector:
     - **Integrity Reporting**: Generate comprehensive summaries of data quality issues across entire datasets
 
     The class leverages the metadata structure to provide fast operations without loading full datasets into memory,
-    making it suitable for inspecting multi-terabyte trade databases. For gap analysis and integrity checks on
+    making it suitable for inspecting multi-terabyte trade databases. Key listing, statistics and gap detection are
+    answered from the sidecar index maintained by :meth:`TradesData.save_h5` (see
+    :class:`afmlkit.bar.h5_index.TradesH5Index` and :meth:`build_index`) without opening the store when available. For gap analysis and integrity checks on
     large datasets, multiprocessing is employed to parallelize operations across monthly partitions.
 
     **Data Integrity Metrics**: The inspector can identify several types of data quality issues:
@@ -108,6 +118,9 @@ class H5Inspector:
         :raises FileNotFoundError: If the HDF5 file does not exist.
         :raises KeyError: If the file exists but has no readable trade groups.
         """
+        index = TradesH5Index.load_complete(self.filepath)
+        if index is not None:
+            return index.keys()
         with pd.HDFStore(self.filepath, mode='r') as store:
             return [k for k in store.keys() if k.startswith('/trades/')]
 
@@ -182,9 +195,20 @@ class H5Inspector:
         :raises KeyError: If the specified key does not exist in the store.
 
         .. note::
-            This method loads the full dataset into memory and may be slow for large partitions.
-            Consider using :meth:`get_metadata` for basic counts and ranges when available.
+            Without a sidecar index entry for the key, this method loads the full dataset into memory and may be slow
+            for large partitions (see :meth:`build_index`).
         """
+        index = TradesH5Index.load(self.filepath)
+        if index is not None and key in index.entries:
+            entry = index.entries[key]
+            return {
+                'record_count': entry['record_count'],
+                'first_timestamp': entry['first_timestamp'],
+                'last_timestamp': entry['last_timestamp'],
+                'price_range': tuple(entry['price_range']),
+                'amount_range': tuple(entry['amount_range'])
+            }
+
         with pd.HDFStore(self.filepath, mode='r') as store:
             if key not in store.keys():
                 raise KeyError(f"Key '{key}' not found in the store.")
@@ -211,10 +235,15 @@ class H5Inspector:
         :raises ValueError: If max_gap is not a valid Timedelta or processes < 1.
 
         .. note::
-            Gap detection loads full datasets into memory. For very large files, consider
+            Gaps of at least :data:`afmlkit.bar.h5_index.GAP_THRESHOLD` (1 minute) are read from the sidecar index.
+            Otherwise gap detection loads full datasets into memory. For very large files, consider
             processing monthly partitions individually or increasing available system memory.
 
         """
+        index = TradesH5Index.load_complete(self.filepath)
+        if index is not None and max_gap >= GAP_THRESHOLD:
+            return {key: index.gaps(key, max_gap) for key in index.keys()}
+
         keys = self.list_keys()
 
         with multiprocessing.Pool(processes=processes) as pool:
@@ -222,6 +251,16 @@ class H5Inspector:
 
         return dict(results)
 
+    def build_index(self) -> TradesH5Index:
+        r"""Build (or rebuild) the sidecar index of the file by scanning all trade groups.
+
+        Stores written by :meth:`TradesData.save_h5` keep their index up to date; this is needed for files written
+        before the index existed or by other tools.
+
+        :return: The new index.
+        """
+        return TradesH5Index.rebuild(self.filepath)
+
     def get_integrity_summary(self, verbose=True) -> Dict[str, Dict]:
         r"""Generate comprehensive summary of data integrity issues across the entire HDF5 store.
 
@@ -308,6 +347,53 @@ class H5Inspector:
         return result
 
 
+# Coarser kline resolutions that AddTimeBarH5 can pre-aggregate next to the 1-second bars
+KLINE_LEVELS: Tuple[str, ...] = ("1min", "5min", "1h", "1D")
+
+
+def _kline_keys(month_key: str, level: Optional[str] = None) -> Tuple[str, str]:
+    """
+    HDF5 keys of the klines and their metadata for a month and resolution level.
+
+    :param month_key: Month of the partition ('YYYY-MM').
+    :param level: Pre-aggregated resolution (e.g., '1h'). None for the 1-second base bars.
+    :returns: Tuple of (klines key, metadata key), e.g. ('/klines_1h/2023-01', '/klines_1h_meta/2023-01').
+    """
+    if level is None:
+        return f"/klines/{month_key}", f"/klines_meta/{month_key}"
+    return f"/klines_{level}/{month_key}", f"/klines_{level}_meta/{month_key}"
+
+
+def _level_timedelta(level: str) -> pd.Timedelta:
+    """
+    Duration of a fixed-frequency kline level.
+
+    :param level: Pandas offset alias (e.g., '5min').
+    :returns: The level duration.
+    :raises ValueError: If the level is not a fixed frequency multiple of one second (above one second).
+    """
+    try:
+        step = pd.Timedelta(pd.tseries.frequencies.to_offset(level))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Kline level {level!r} must be a fixed frequency (e.g., '5min', '1h', '1D').") from e
+    if step <= pd.Timedelta(seconds=1) or step % pd.Timedelta(seconds=1):
+        raise ValueError(f"Kline level {level!r} must be a multiple of one second above one second.")
+    return step
+
+
+def _stored_levels(keys: Iterable[str]) -> List[str]:
+    """
+    Pre-aggregated kline levels present in an HDF5 store, from their metadata keys.
+
+    :param keys: The keys of the store.
+    :returns: The levels, finest first.
+    """
+    groups = {key.split('/')[1] for key in keys}
+    levels = {g[len('klines_'):-len('_meta')] for g in groups
+              if g.startswith('klines_') and g.endswith('_meta') and g != 'klines_meta'}
+    return sorted(levels, key=_level_timedelta)
+
+
 class AddTimeBarH5:
     r"""Utility class for building and persisting 1-second time bars from trades data stored in HDF5 format.
 
@@ -321,6 +407,11 @@ class AddTimeBarH5:
     This approach maintains the same organizational structure while adding derived datasets optimized for
     time-series analysis and modeling.
 
+    Optionally, coarser pre-aggregated levels (e.g., :data:`KLINE_LEVELS`: 1min, 5min, 1h and 1D) are written next
+    to the 1-second bars under ``/klines_<level>/YYYY-MM`` with metadata under ``/klines_<level>_meta/YYYY-MM``.
+    :class:`TimeBarReader` then serves each request from the coarsest level dividing the requested timeframe,
+    so long-horizon reads no longer reload and re-aggregate millions of 1-second rows.
+
     **Workflow and Data Organization:**
 
     The class follows this processing pipeline:
@@ -340,7 +431,8 @@ class AddTimeBarH5:
 
     **Considerations:**
 
-    - Processing is performed sequentially by month to manage memory usage for large datasets
+    - Processing is performed month by month to manage memory usage, optionally in worker processes with a
+      single HDF5 writer and a checkpoint to resume interrupted runs (see :meth:`process_all`)
     - Each month's bars are stored as separate HDF5 tables for efficient partial loading
     - Metadata storage enables fast discovery without loading full datasets
     - Overwrite protection prevents accidental data loss during reprocessing
@@ -364,9 +456,12 @@ class AddTimeBarH5:
         h5_path (str): Path to the HDF5 file containing trades data. Must be readable and writable.
         keys (list[str], optional): Specific monthly keys to process (e.g., ["2022-01", "2022-05"]).
             If None, processes all available monthly partitions in the file.
+        levels (list[str], optional): Coarser resolutions pre-aggregated from the 1-second bars
+            (e.g., :data:`KLINE_LEVELS`). If None, only the 1-second bars are written.
 
     Raises:
         KeyError: If specified keys are not found in the source HDF5 file.
+        ValueError: If a level is not a fixed frequency multiple of one second.
         FileNotFoundError: If the HDF5 file does not exist.
         PermissionError: If the file cannot be accessed for reading or writing.
 
@@ -387,6 +482,12 @@ class AddTimeBarH5:
         ...     success = processor.process_key(key, overwrite=True)
         ...     print(f"{key}: {'Success' if success else 'Failed'}")
 
+        Build the 1-second bars together with the 1min, 5min, 1h and 1D levels:
+
+        >>> # doctest: +SKIP
+        >>> processor = AddTimeBarH5('trades_2023.h5', levels=KLINE_LEVELS)
+        >>> results = processor.process_all()
+
         Batch processing workflow:
 
         >>> # doctest: +SKIP
@@ -410,14 +511,16 @@ class AddTimeBarH5:
     References:
         .. _`Time Bar Construction in Financial ML`: https://www.wiley.com/en-us/Advances+in+Financial+Machine+Learning-p-9781119482086
     """
-    def __init__(self, h5_path: str, keys: list[str] = None):
+    def __init__(self, h5_path: str, keys: list[str] = None, levels: Optional[List[str]] = None):
         """
 
         :param h5_path: Path to trades h5 file
         :param keys: Optional list of keys for which to add TimeBars (eg. ["2022-01", "2022-05"]). If none, build all available month.
+        :param levels: Optional coarser resolutions to pre-aggregate next to the 1-second bars (eg. KLINE_LEVELS).
         """
         self.h5_path = h5_path
         self.keys = self._check_keys(keys)
+        self.levels = sorted(levels or [], key=_level_timedelta)
 
     def _list_keys(self) -> list[str]:
         """
@@ -442,11 +545,13 @@ class AddTimeBarH5:
         r"""Process a single monthly partition to build and save 1-second time bars.
 
         Loads trades data for the specified month, constructs time bars using :class:`TimeBarKit`,
-        and persists the results to the HDF5 file under the ``/klines/`` hierarchy.
+        and persists the results to the HDF5 file under the ``/klines/`` hierarchy. The configured coarser
+        levels are aggregated from the 1-second bars and written under ``/klines_<level>/``. If the 1-second
+        bars already exist (and ``overwrite`` is False), only the missing levels are added from the stored bars.
 
         :param key: The trades key to process (format: '/trades/YYYY-MM' or 'YYYY-MM').
         :param overwrite: Whether to overwrite existing time bar data for this partition. Default: False.
-        :returns: True if processing completed successfully, False if skipped or failed.
+        :returns: True if processing completed successfully, False if skipped (nothing to add) or failed.
 
         .. note::
             Processing time scales with the number of trades in the month. For very active trading pairs,
@@ -460,79 +565,153 @@ class AddTimeBarH5:
             >>> if success:
             ...     print("Time bars created successfully")
         """
-        import pandas as pd
+        built = self._build_key(key, overwrite)
+        if built is None:
+            return False
+        with _H5_LOCK:
+            self._write_key(key, *built)
+        return True
+
+    def _build_key(self, key: str, overwrite: bool, trades_data: Optional[TradesData] = None
+                   ) -> Optional[Tuple[Optional[pd.DataFrame], Dict[str, pd.DataFrame]]]:
+        """
+        Build the 1-second bars and the missing levels of a month without writing them (runs in the worker processes
+        of :meth:`process_all`, holding the HDF5 lock while reading).
+
+        :param key: The trades key to process.
+        :param overwrite: Whether to rebuild existing time bar data.
+        :param trades_data: The trades of the month if already loaded (e.g., prefetched), else they are loaded if needed.
+        :returns: Tuple of (1-second bars, or None if they already exist; dict of level bars), or None to skip.
+        """
         from .kit import TimeBarKit
-        from afmlkit.utils.log import get_logger
-        logger = get_logger(__name__)
 
         # Derive timebar key from trade key
-        timebar_key = key.replace('/trades/', '/klines/')
         month_key = key.split('/')[-1]
+        timebar_key, _ = _kline_keys(month_key)
 
         # Check if time bars already exist
-        with pd.HDFStore(self.h5_path, mode='r') as store:
-            if timebar_key in store and not overwrite:
-                logger.info(f"Time bars already exist for {month_key}. Skipping. Use overwrite=True to rebuild.")
-                return False
-
-        # Load trades data
-        logger.info(f"Loading trades data for {month_key}...")
-        trades_data = TradesData.load_trades_h5(self.h5_path, key=month_key)
+        with _KLINES_LOCK or _H5_LOCK:
+            with pd.HDFStore(self.h5_path, mode='r') as store:
+                base_exists = timebar_key in store and not overwrite
+                levels = [level for level in self.levels if overwrite or _kline_keys(month_key, level)[0] not in store]
+                if base_exists and not levels:
+                    logger.info(f"Time bars already exist for {month_key}. Skipping. Use overwrite=True to rebuild.")
+                    return None
+                if base_exists:
+                    # Only the missing levels are added, from the stored 1-second bars
+                    logger.info(f"Adding kline levels {levels} for {month_key} from the stored time bars...")
+                    bars_df = store[timebar_key]
+
+            if not base_exists and trades_data is None:
+                # Load trades data
+                logger.info(f"Loading trades data for {month_key}...")
+                trades_data = TradesData.load_trades_h5(self.h5_path, key=month_key)
+
+        if not base_exists:
+            # Build 1-second time bars
+            logger.info(f"Building 1-second time bars for {month_key}...")
+            timebarkit = TimeBarKit(trades_data, period=pd.Timedelta(seconds=1))
+            bars_df = timebarkit.build_ohlcv()
+
+        level_bars = {level: TimeBarReader._resample(bars_df, level) for level in levels}
+        return (None if base_exists else bars_df), level_bars
+
+    def _write_key(self, key: str, bars_df: Optional[pd.DataFrame], level_bars: Dict[str, pd.DataFrame]) -> None:
+        """
+        Write the bars built by :meth:`_build_key` (the single writer of :meth:`process_all`).
 
-        # Build 1-second time bars
-        logger.info(f"Building 1-second time bars for {month_key}...")
-        timebarkit = TimeBarKit(trades_data, period=pd.Timedelta(seconds=1))
-        bars_df = timebarkit.build_ohlcv()
+        :param key: The trades key the bars were built from.
+        :param bars_df: The 1-second bars, or None if they already exist.
+        :param level_bars: The level bars keyed by level.
+        """
+        month_key = key.split('/')[-1]
 
         # Save time bars to H5 store
         logger.info(f"Saving time bars for {month_key}...")
         with pd.HDFStore(self.h5_path, mode='a') as store:
-            if timebar_key in store and overwrite:
-                store.remove(timebar_key)
-
-            store.put(
-                key=timebar_key,
-                value=bars_df,
-                format='table',
-                index=False
-            )
-
-            # Add metadata
-            meta_key = timebar_key.replace('/klines/', '/klines_meta/')
-            metadata = pd.Series({
-                'record_count': len(bars_df),
-                'first_timestamp': bars_df.index[0].value,
-                'last_timestamp': bars_df.index[-1].value,
-                'original_trades_key': key
-            })
-
-            if meta_key in store:
-                store.remove(meta_key)
-            store.put(meta_key, metadata, format='fixed')
-
-        logger.info(f"Successfully added time bars for {month_key}. Created {len(bars_df)} bars.")
-        return True
+            if bars_df is not None:
+                self._put_klines(store, month_key, None, bars_df, key)
+            for level, level_df in level_bars.items():
+                if len(level_df):
+                    self._put_klines(store, month_key, level, level_df, key)
+
+        n_bars = len(bars_df) if bars_df is not None else 0
+        logger.info(f"Successfully added time bars for {month_key}. Created {n_bars} bars and {len(level_bars)} levels.")
+
+    @staticmethod
+    def _put_klines(store: pd.HDFStore, month_key: str, level: Optional[str], bars_df: pd.DataFrame,
+                    trades_key: str) -> None:
+        """
+        Write (or replace) the klines of a month and resolution level together with their metadata.
+
+        :param store: HDF5 store opened for writing.
+        :param month_key: Month of the partition ('YYYY-MM').
+        :param level: Resolution level of the bars. None for the 1-second base bars.
+        :param bars_df: The bars to store.
+        :param trades_key: The trades key the bars were built from.
+        """
+        klines_key, meta_key = _kline_keys(month_key, level)
+        if klines_key in store:
+            store.remove(klines_key)
+
+        store.put(
+            key=klines_key,
+            value=bars_df,
+            format='table',
+            index=False
+        )
+
+        # Add metadata
+        metadata = pd.Series({
+            'record_count': len(bars_df),
+            'first_timestamp': bars_df.index[0].value,
+            'last_timestamp': bars_df.index[-1].value,
+            'original_trades_key': trades_key,
+            'level': level or '1s'
+        })
+
+        if meta_key in store:
+            store.remove(meta_key)
+        store.put(meta_key, metadata, format='fixed')
 
-    def process_all(self, overwrite: bool = False) -> Dict[str, bool]:
+    def process_all(self, overwrite: bool = False, n_workers: int = 1, resume: bool = True,
+                    prefetch: Optional[int] = None) -> Dict[str, bool]:
         r"""Process all configured monthly partitions to build and save 1-second time bars.
 
         Iterates through all keys (either specified during initialization or auto-discovered)
-        and processes each month sequentially. Provides comprehensive logging and error handling
+        and processes each month. Provides comprehensive logging and error handling
         to ensure robust batch processing of large datasets.
 
+        With ``n_workers > 1`` the months are built in worker processes (loading the trades, building the 1-second
+        bars and the levels) while the calling process is the single writer of the HDF5 file. Reads and writes of the
+        file are serialized by a lock shared with the workers, since HDF5 does not support concurrent access with a
+        writer. At most ``2 * n_workers`` built months are pending at any time to bound memory usage.
+
+        Finished months are recorded in a JSON checkpoint next to the HDF5 file (``<h5_path>.klines_checkpoint.json``)
+        after they are written, so an interrupted run (also with ``overwrite=True``) resumes at the first unfinished
+        month. The checkpoint is only reused by a run with the same ``overwrite`` and levels settings, and is removed
+        once all months are processed without errors.
+
         :param overwrite: Whether to overwrite existing time bar data for all partitions. Default: False.
+        :param n_workers: Number of worker processes building the bars. Default: 1 (sequential, in process).
+        :param resume: Whether to skip the months finished by an interrupted run, according to the checkpoint.
+            Default: True.
+        :param prefetch: Sequential runs only: number of months whose trades are loaded by a background thread while
+            the current month is built (see :class:`H5TradesPrefetcher`). Default: None (1 if there is more than one
+            CPU core, else 0).
         :returns: Dictionary mapping partition keys to processing success status (True/False).
             Keys are in format '/trades/YYYY-MM' and values indicate whether processing completed successfully.
+            Months finished by the interrupted run are reported as True.
 
         .. note::
-            Processing is performed sequentially to manage memory usage. For very large datasets,
-            monitor system resources and consider processing subsets if memory constraints arise.
+            Each worker holds a full month of trades in memory while it builds the bars. For very large datasets,
+            monitor system resources and reduce ``n_workers`` if memory constraints arise.
             Failed partitions can be reprocessed individually using :meth:`process_key`.
 
         Examples:
             >>> # doctest: +SKIP
             >>> processor = AddTimeBarH5('annual_trades.h5')
-            >>> results = processor.process_all(overwrite=False)
+            >>> results = processor.process_all(overwrite=False, n_workers=4)
             >>>
             >>> # Analyze results
             >>> total_processed = len(results)
@@ -544,26 +723,416 @@ class AddTimeBarH5:
             >>> for month in failed_months:
             ...     processor.process_key(month, overwrite=True)  # Retry with overwrite
         """
-        from afmlkit.utils.log import get_logger
-        logger = get_logger(__name__)
-
-        results = {}
-
-        logger.info(f"Processing {len(self.keys)} months of trades data...")
-        for key in tqdm(self.keys):
-            logger.info(f"Processing {key}...")
-            try:
-                success = self.process_key(key, overwrite)
-                results[key] = success
-            except Exception as e:
-                logger.error(f"Error processing {key}: {str(e)}")
-                results[key] = False
-
+        settings = {'overwrite': overwrite, 'levels': self.levels}
+        done = self._load_checkpoint(settings) if resume else set()
+        results = {key: True for key in self.keys if key in done}
+        if results:
+            logger.info(f"Resuming from checkpoint: {len(results)} months already processed.")
+        pending_keys = [key for key in self.keys if key not in done]
+
+        def _finish(key: str, success: bool):
+            results[key] = success
+            done.add(key)
+            self._save_checkpoint(settings, done)
+
+        logger.info(f"Processing {len(pending_keys)} months of trades data with {n_workers} workers...")
+        if n_workers <= 1:
+            # The trades of the months to build are loaded ahead by a background thread (if prefetch > 0)
+            with _H5_LOCK, pd.HDFStore(self.h5_path, mode='r') as store:
+                to_load = deque(
+                    key for key in pending_keys if overwrite or _kline_keys(key.split('/')[-1])[0] not in store
+                )
+            if prefetch is None:
+                prefetch = 1 if (os.cpu_count() or 1) > 1 else 0
+            prefetched = None
+            for key in tqdm(pending_keys):
+                logger.info(f"Processing {key}...")
+                try:
+                    trades_data = None
+                    if to_load and to_load[0] == key:
+                        to_load.popleft()
+                        if prefetched is None:
+                            prefetched = iter(H5TradesPrefetcher(self.h5_path, [key, *to_load], prefetch=prefetch,
+                                                                 skip_empty=False))
+                        try:
+                            _, trades_data = next(prefetched)
+                        except Exception:
+                            prefetched = None  # A failed load ends the iterator: restart it with the next month
+                            raise
+                    built = self._build_key(key, overwrite, trades_data)
+                    del trades_data
+                    if built is not None:
+                        with _H5_LOCK:
+                            self._write_key(key, *built)
+                    _finish(key, built is not None)
+                except Exception as e:
+                    logger.error(f"Error processing {key}: {str(e)}")
+                    results[key] = False
+        else:
+            # Spawned (not forked) workers: forking after the numba parallel kernels started their threads may deadlock
+            context = multiprocessing.get_context('spawn')
+            lock = context.Lock()
+            with ProcessPoolExecutor(n_workers, mp_context=context, initializer=_init_klines_worker,
+                                     initargs=(lock,)) as executor, \
+                    tqdm(total=len(pending_keys)) as progress:
+                futures = {}
+                queued = iter(pending_keys)
+                while True:
+                    # Keep the workers busy while bounding the number of built months waiting for the writer
+                    for key in queued:
+                        futures[executor.submit(self._build_key, key, overwrite)] = key
+                        if len(futures) >= 2 * n_workers:
+                            break
+                    if not futures:
+                        break
+
+                    finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        key = futures.pop(future)
+                        progress.update()
+                        try:
+                            built = future.result()
+                            if built is not None:
+                                with lock:
+                                    self._write_key(key, *built)
+                            _finish(key, built is not None)
+                        except Exception as e:
+                            logger.error(f"Error processing {key}: {str(e)}")
+                            results[key] = False
+
+        results = {key: results[key] for key in self.keys}
         success_count = sum(1 for success in results.values() if success)
         logger.info(f"Processed {len(results)} keys with {success_count} successes.")
 
+        if len(done) == len(self.keys) and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
         return results
 
+    @property
+    def checkpoint_path(self) -> str:
+        """
+        Path of the JSON checkpoint of :meth:`process_all`.
+        """
+        return f"{self.h5_path}.klines_checkpoint.json"
+
+    def _load_checkpoint(self, settings: Dict[str, Any]) -> set:
+        """
+        Load the months finished by an interrupted :meth:`process_all` run with the same settings.
+
+        :param settings: The settings of the current run.
+        :returns: The finished trades keys (empty if there is no usable checkpoint).
+        """
+        if not os.path.exists(self.checkpoint_path):
+            return set()
+        with open(self.checkpoint_path) as f:
+            checkpoint = json.load(f)
+        if checkpoint.get('settings') != settings:
+            logger.info("Ignoring the klines checkpoint of a run with different settings.")
+            return set()
+        return set(checkpoint['done'])
+
+    def _save_checkpoint(self, settings: Dict[str, Any], done: set) -> None:
+        """
+        Atomically record the finished months of the current :meth:`process_all` run.
+
+        :param settings: The settings of the current run.
+        :param done: The finished trades keys.
+        """
+        tmp_path = self.checkpoint_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'settings': settings, 'done': sorted(done)}, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+
+# Inter-process HDF5 lock of the AddTimeBarH5 workers (None in the writer process and in sequential runs)
+_KLINES_LOCK = None
+
+
+def _init_klines_worker(lock) -> None:
+    """
+    Initializer of the :meth:`AddTimeBarH5.process_all` worker processes: share the HDF5 lock of the writer.
+    """
+    global _KLINES_LOCK
+    _KLINES_LOCK = lock
+
+
+# PyTables is not thread-safe: every HDF5 access of the background loaders goes through this lock
+_H5_LOCK = threading.Lock()
+
+
+class H5TradesPrefetcher:
+    r"""Iterate over the monthly trade partitions of an HDF5 store while background threads decode the next ones.
+
+    Month-by-month pipelines alternate between blocking HDF5 reads and CPU-bound (numba) processing. This iterator
+    keeps up to ``prefetch`` months in flight in a thread pool while the caller processes the current one, so the
+    reads overlap the processing. The bounded number of months in flight provides the backpressure: at most
+    ``prefetch + 1`` months are held in memory. With ``prefetch=0`` the months are loaded in the calling thread
+    (background loading only pays off with a spare CPU core for the loaders).
+
+    The HDF5 reads themselves are serialized by a process-wide lock (PyTables is not thread-safe), while the
+    conversion of the decoded tables to :class:`TradesData` runs in the pool threads. Time range reads use the
+    sidecar index row ranges, and whole months go through the partition cache when it is enabled.
+
+    Args:
+        h5_path (str): Path to the HDF5 file containing the trades data.
+        keys (list[str], optional): Monthly keys to iterate (e.g., ["2022-01", "2022-02"]). If None, all months
+            intersecting ``[start_time, end_time]`` are used.
+        start_time (str | pd.Timestamp, optional): Only load trades at or after this time.
+        end_time (str | pd.Timestamp, optional): Only load trades at or before this time.
+        prefetch (int): Number of months loaded ahead of the one being processed (0 to load them in the calling
+            thread). Default: 2.
+        n_threads (int): Number of loader threads. Default: 1.
+        skip_empty (bool): Skip the months without trades in the time range (else they are yielded as None).
+            Default: True.
+
+    Raises:
+        KeyError: If a requested key is missing or no month matches the time range.
+
+    Examples:
+        >>> # doctest: +SKIP
+        >>> for key, trades in H5TradesPrefetcher('trades.h5', start_time='2021-01-01', prefetch=2):
+        ...     bars = TickBarKit(trades, 1000).build_ohlcv()
+    """
+
+    def __init__(self,
+                 h5_path: str,
+                 keys: Optional[List[str]] = None,
+                 start_time: Optional[Union[str, pd.Timestamp]] = None,
+                 end_time: Optional[Union[str, pd.Timestamp]] = None,
+                 prefetch: int = 2,
+                 n_threads: int = 1,
+                 skip_empty: bool = True):
+        """
+        :param h5_path: Path to the trades HDF5 file.
+        :param keys: Optional list of monthly keys (e.g. ["2022-01", "2022-05"]). If None, all matching months are used.
+        :param start_time: Optional start time filter.
+        :param end_time: Optional end time filter.
+        :param prefetch: Number of months loaded ahead of the one being processed (0 to load them in the calling thread).
+        :param n_threads: Number of loader threads.
+        :param skip_empty: Skip the months without trades in the time range instead of yielding None.
+        """
+        self.h5_path = h5_path
+        self.start_time = pd.Timestamp(start_time) if start_time is not None else None
+        self.end_time = pd.Timestamp(end_time) if end_time is not None else None
+        self.prefetch = max(int(prefetch), 0)
+        self.n_threads = max(int(n_threads), 1)
+        self.skip_empty = skip_empty
+        self.keys = self._resolve_keys(keys)
+
+    def _resolve_keys(self, keys: Optional[List[str]]) -> List[str]:
+        """
+        Determine the monthly trade keys to load in chronological order.
+
+        :param keys: Requested monthly keys or None.
+        :returns: Sorted list of keys in "/trades/YYYY-MM" format.
+        """
+        with _H5_LOCK, pd.HDFStore(self.h5_path, mode='r') as store:
+            available_keys = [k for k in store.keys() if k.startswith('/trades/')]
+            if keys:
+                keys = [k if k.startswith('/trades/') else f'/trades/{k}' for k in keys]
+                missing_keys = [k for k in keys if k not in available_keys]
+                if missing_keys:
+                    raise KeyError(f"Missing keys: {missing_keys}\nAvailable keys: {available_keys}")
+            else:
+                keys = TradesData._keys_for_timerange(store, self.start_time, self.end_time)
+        if not keys:
+            raise KeyError("No HDF5 group matches the requested slice.")
+
+        return sorted(keys)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def load(self, key: str) -> Optional[TradesData]:
+        """
+        Load the trades of one month (restricted to the time range).
+
+        :param key: Trades key ("/trades/YYYY-MM").
+        :returns: The trades of the month or None if there are none in the time range.
+        """
+        bounded = self.start_time is not None or self.end_time is not None
+        if PARTITION_CACHE.enabled:
+            df = PARTITION_CACHE.get(self.h5_path, key)
+            if df is None:
+                with _H5_LOCK, pd.HDFStore(self.h5_path, mode='r') as store:
+                    df = store[key]
+                PARTITION_CACHE.put(self.h5_path, key, df)
+            if bounded:
+                df = df[(df.index >= self.start_time if self.start_time is not None else True) &
+                        (df.index <= self.end_time if self.end_time is not None else True)]
+        else:
+            where_clause = []
+            if self.start_time is not None:
+                where_clause.append(f"index >= Timestamp('{self.start_time}')")
+            if self.end_time is not None:
+                where_clause.append(f"index <= Timestamp('{self.end_time}')")
+
+            index = TradesH5Index.load(self.h5_path) if bounded else None
+            with _H5_LOCK, pd.HDFStore(self.h5_path, mode='r') as store:
+                rows = index.row_range(key, self.start_time, self.end_time, nrows=store.get_storer(key).nrows) \
+                    if index is not None and key in index.entries else None
+                df = _select_h5_group(store, key, " & ".join(where_clause) or None, rows)
+        if df.empty:
+            return None
+
+        return TradesData(
+            df['timestamp'].values,
+            df['price'].values,
+            df['amount'].values,
+            id=df['id'].values if 'id' in df.columns else None,
+            is_buyer_maker=df['is_buyer_maker'].values if 'is_buyer_maker' in df.columns else None,
+            side=df['side'].values if 'side' in df.columns else None,
+            dt_index=df.index,
+        )
+
+    def __iter__(self) -> Iterator[Tuple[str, Optional[TradesData]]]:
+        """
+        Iterate over the monthly trades in chronological order while the next months are loaded in the background.
+
+        :returns: Iterator of (key, trades) tuples.
+        :raises Exception: Any error of a loader is re-raised in the consumer when its month is reached.
+        """
+        if self.prefetch == 0:
+            for key in self.keys:
+                trades = self.load(key)
+                if trades is not None or not self.skip_empty:
+                    yield key, trades
+                del trades
+            return
+
+        executor = ThreadPoolExecutor(self.n_threads, thread_name_prefix='H5TradesPrefetcher')
+        pending = deque()
+        queued = iter(self.keys)
+
+        def _submit_next():
+            # Keep the loaders busy with the next months, up to the prefetch bound
+            while len(pending) < self.prefetch:
+                key = next(queued, None)
+                if key is None:
+                    break
+                pending.append((key, executor.submit(self.load, key)))
+
+        try:
+            _submit_next()
+            while pending:
+                key, future = pending.popleft()
+                # Submit the next months before handing this one over: they load while it is processed
+                _submit_next()
+                trades = future.result()
+                if trades is not None or not self.skip_empty:
+                    yield key, trades
+                del trades, future
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+class H5BarBuilder:
+    r"""Out-of-core bar building over the monthly trade partitions of an HDF5 store.
+
+    :meth:`TradesData.load_trades_h5` concatenates all requested months into one DataFrame, so the memory needed to
+    build bars grows with the history length. This driver walks the ``/trades/YYYY-MM`` groups in chronological order
+    and pushes them one by one into a bar builder in streaming mode (:meth:`BarBuilderBase.feed`), so memory is bounded
+    by a few months of trades (the month being processed and ``prefetch`` months loaded ahead) instead of the history:
+
+    1. **Prefetch**: A background thread loads the next month(s) while the current month's bars are built
+    2. **Stitching**: The open bar at the end of a month is carried over into the next month by the bar builder
+    3. **Append**: The bars finished by each month are appended to an output HDF5 table
+
+    The result is identical to building the bars on the concatenated months.
+
+    Args:
+        h5_path (str): Path to the HDF5 file containing the trades data.
+        kit (BarBuilderBase): Bar builder created without trades (e.g., ``TickBarKit(None, 1000)``).
+        keys (list[str], optional): Monthly keys to process (e.g., ["2022-01", "2022-02"]). If None, all months
+            intersecting ``[start_time, end_time]`` are processed.
+        start_time (str | pd.Timestamp, optional): Only use trades at or after this time.
+        end_time (str | pd.Timestamp, optional): Only use trades at or before this time.
+        prefetch (int): Number of months loaded ahead by the background thread. Default: 1.
+
+    Raises:
+        KeyError: If a requested key is missing or no month matches the time range.
+
+    Examples:
+        >>> # doctest: +SKIP
+        >>> builder = H5BarBuilder('trades.h5', DollarBarKit(None, 1e7), start_time='2020-01-01')
+        >>> n_bars = builder.run('bars.h5', 'dollar_bars', build=lambda kit: kit.build_all())
+    """
+
+    def __init__(self,
+                 h5_path: str,
+                 kit: Any,
+                 keys: Optional[List[str]] = None,
+                 start_time: Optional[Union[str, pd.Timestamp]] = None,
+                 end_time: Optional[Union[str, pd.Timestamp]] = None,
+                 prefetch: int = 1):
+        """
+        :param h5_path: Path to the trades HDF5 file.
+        :param kit: Bar builder in streaming mode (created with ``trades=None``).
+        :param keys: Optional list of monthly keys (e.g. ["2022-01", "2022-05"]). If None, all matching months are used.
+        :param start_time: Optional start time filter.
+        :param end_time: Optional end time filter.
+        :param prefetch: Number of months loaded ahead of the one being processed.
+        """
+        self.h5_path = h5_path
+        self.kit = kit
+        self.trades = H5TradesPrefetcher(h5_path, keys, start_time, end_time, prefetch=max(int(prefetch), 1))
+        self.start_time, self.end_time = self.trades.start_time, self.trades.end_time
+        self.prefetch = self.trades.prefetch
+        self.keys = self.trades.keys
+
+    def iter_months(self) -> Iterator[Tuple[str, TradesData]]:
+        """
+        Iterate over the monthly trades in chronological order while a background thread prefetches the next months.
+
+        :returns: Iterator of (key, trades) tuples. Months without trades in the time range are skipped.
+        :raises Exception: Any error of the background loader is re-raised in the consumer.
+        """
+        return iter(self.trades)
+
+    def run(self,
+            output_path: str,
+            output_key: str,
+            build: Optional[Callable[[Any], pd.DataFrame]] = None,
+            close_partial: bool = True,
+            overwrite: bool = False) -> int:
+        """
+        Build the bars of all months and append them to a table in the output HDF5 store.
+
+        :param output_path: Output HDF5 file path (may be the trades file itself).
+        :param output_key: Output table key (e.g. "/bars/dollar_1e7").
+        :param build: Function turning the bar builder into the bar DataFrame after each month
+            (e.g. ``lambda kit: kit.build_all()``). Default: :meth:`BarBuilderBase.build_ohlcv`.
+        :param close_partial: Close the open bar after the last month. Default: True.
+        :param overwrite: Replace an existing output table. Default: False.
+        :returns: Total number of bars written.
+        :raises ValueError: If the output table exists and ``overwrite`` is False.
+        """
+        build = build if build is not None else (lambda kit: kit.build_ohlcv())
+
+        with _H5_LOCK, pd.HDFStore(output_path, mode='a') as store:
+            if output_key in store or f'/{output_key}' in store:
+                if not overwrite:
+                    raise ValueError(f"Output table {output_key} already exists. Use overwrite=True to rebuild.")
+                store.remove(output_key)
+
+        def _append(bars_df: pd.DataFrame) -> int:
+            with _H5_LOCK, pd.HDFStore(output_path, mode='a') as store:
+                store.append(output_key, bars_df, format='table', index=False)
+            return len(bars_df)
+
+        n_bars = 0
+        for key, trades in tqdm(self.iter_months(), total=len(self.keys)):
+            logger.info(f"Building bars for {key}...")
+            if self.kit.feed(trades):
+                n_bars += _append(build(self.kit))
+            del trades
+        if self.kit.flush(close_partial=close_partial):
+            n_bars += _append(build(self.kit))
+
+        logger.info(f"Successfully built {n_bars} bars from {len(self.keys)} months into {output_key}.")
+        return n_bars
+
 
 class TimeBarReader:
     r"""Reader class for time bar data stored in HDF5 format with advanced resampling capabilities.
@@ -589,6 +1158,9 @@ class TimeBarReader:
     - **Metadata-Driven Discovery**: Leverage stored metadata for fast range queries without scanning
       full datasets, enabling sub-second response times for time range validation.
 
+    - **Pre-aggregated Levels**: Serve coarse timeframes from the 1min/5min/1h/1D klines written by
+      :class:`AddTimeBarH5` (when available) instead of re-aggregating the 1-second bars.
+
     **Performance Optimizations:**
 
     The reader employs several strategies for efficient large-scale data access:
@@ -597,6 +1169,8 @@ class TimeBarReader:
     - **Vectorized Operations**: Resampling uses pandas' optimized groupby operations with pre-computed time groupers
     - **Memory Management**: Data is processed in monthly chunks and concatenated only when necessary
     - **Index Optimization**: Time filtering leverages datetime indexes for fast range selection
+    - **Partition Cache**: Decoded partitions are kept in :data:`afmlkit.bar.cache.PARTITION_CACHE` (when enabled),
+      so overlapping reads are served from memory
 
     .. important::
         :class:`TimeBarReader` assumes data integrity and proper temporal ordering within each monthly partition.
@@ -758,6 +1332,47 @@ class TimeBarReader:
 
         return sorted(relevant_keys)
 
+    def list_levels(self) -> List[str]:
+        r"""List the pre-aggregated kline levels available in the HDF5 file (besides the 1-second bars).
+
+        :return: Levels written by :class:`AddTimeBarH5` (e.g., ``['1min', '5min', '1h', '1D']``), finest first.
+        """
+        with pd.HDFStore(self.h5_path, mode='r') as store:
+            return _stored_levels(store.keys())
+
+    def _select_level(self, store: pd.HDFStore, keys: List[str], timeframe: str,
+                      start_time: Optional[pd.Timestamp], end_time: Optional[pd.Timestamp]) -> Optional[str]:
+        r"""Select the coarsest pre-aggregated level that reproduces resampling the 1-second bars.
+
+        A level is used when its duration divides the timeframe, it exists for all requested months and the time
+        range boundaries do not cut through one of its bars (so the same 1-second bars are aggregated).
+
+        :param store: Open HDF5 store.
+        :param keys: The 1-second klines keys of the requested months.
+        :param timeframe: The requested resampling timeframe.
+        :param start_time: Inclusive start of the time range (None for unbounded).
+        :param end_time: Inclusive end of the time range (None for unbounded).
+        :returns: The selected level, or None to resample the 1-second bars.
+        """
+        try:
+            target = pd.Timedelta(pd.tseries.frequencies.to_offset(timeframe))
+        except (ValueError, TypeError):
+            return None
+
+        store_keys = set(store.keys())
+        months = [k.split('/')[-1] for k in keys]
+        for level in reversed(_stored_levels(store_keys)):
+            step = _level_timedelta(level)
+            if target % step:
+                continue
+            if start_time is not None and start_time != start_time.floor(step):
+                continue
+            if end_time is not None and end_time - end_time.floor(step) < step - pd.Timedelta(seconds=1):
+                continue
+            if all(_kline_keys(month, level)[0] in store_keys for month in months):
+                return level
+        return None
+
     def read(self,
              start_time: Optional[Union[str, pd.Timestamp, dt.datetime]] = None,
              end_time: Optional[Union[str, pd.Timestamp, dt.datetime]] = None,
@@ -783,6 +1398,12 @@ class TimeBarReader:
         3. Recalculates volume-weighted metrics (VWAP, median trade size) preserving statistical properties
         4. Filters out empty periods to maintain data density
 
+        When the file holds pre-aggregated levels (see :class:`AddTimeBarH5`), the bars are aggregated from
+        the coarsest level that divides the timeframe, exists for every requested month and is not cut by the
+        time range boundaries. The result equals resampling the 1-second bars, except ``median_trade_size``
+        for timeframes coarser than the level (and for the first bucket of a month, which also holds the last
+        bar of the previous month): it is then the trade-weighted median of the level medians.
+
         :param start_time: Start time for filtering (inclusive). Accepts string, Timestamp, or datetime.
             If None, starts from earliest available data.
         :param end_time: End time for filtering (inclusive). If provided as date-only string,
@@ -850,10 +1471,17 @@ class TimeBarReader:
         dfs = []
 
         with pd.HDFStore(self.h5_path, mode='r') as store:
+            # Serve the request from the coarsest pre-aggregated level dividing the timeframe (if any)
+            if timeframe is not None:
+                level = self._select_level(store, relevant_keys, timeframe, start_time, end_time)
+                if level is not None:
+                    logger.debug(f"Resampling to {timeframe} from the {level} klines level.")
+                    relevant_keys = [_kline_keys(k.split('/')[-1], level)[0] for k in relevant_keys]
+
             for key in relevant_keys:
                 # Load the full chunk - we'll filter in memory
                 # This is more reliable than trying to use PyTables queries on index
-                chunk = store[key]
+                chunk = PARTITION_CACHE.get_or_load(self.h5_path, key, lambda: store[key])
                 dfs.append(chunk)
 
         # Concatenate the chunks
@@ -887,7 +1515,8 @@ class TimeBarReader:
             # Resample to the requested timeframe normally
             return self._resample(df, timeframe)
 
-    def _resample(self, df: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    @staticmethod
+    def _resample(df: pd.DataFrame, timeframe: str) -> pd.DataFrame:
         r"""Apply mathematically correct resampling aggregation to transform 1-second bars into target timeframe.
 
         This internal method implements the core resampling logic, ensuring that volume-weighted metrics
@@ -906,45 +1535,40 @@ class TimeBarReader:
             Periods with no trading activity are automatically excluded.
 
         .. note::
-            The volume-weighted median calculation uses numpy's searchsorted for efficient
-            percentile computation, making it suitable for high-frequency resampling operations.
-        """
-        # --- one grouper reused everywhere ---------------------------------
-        grouper = df.index.floor(timeframe)  # fast vectorised
-
-        # ---------- OHLCV & trade-count aggregation -----------------------
-        resampled = df.groupby(grouper, sort=False).agg({
-            "open": "first",
-            "high": "max",
-            "low": "min",
-            "close": "last",
-            "volume": "sum",
-            "trades": "sum",
-        })
-
-        # ---------------------------- VWAP --------------------------------
-        vol_sum = df["volume"].groupby(grouper, sort=False).sum()
-        vwap = (df["vwap"] * df["volume"]).groupby(grouper, sort=False).sum() / vol_sum
-        resampled["vwap"] = vwap.astype("float32")
-
-        # ---------- volume-weighted median of per-second medians ----------
-        def w_median(sub: pd.DataFrame) -> float:
-            if sub.empty:
-                return np.nan
-            sort_idx = np.argsort(sub["median_trade_size"].values)
-            sizes = sub["median_trade_size"].values[sort_idx]
-            weights = sub["trades"].values[sort_idx].astype(np.float64)
-
-            cum_w = np.cumsum(weights)
-            cutoff = cum_w[-1] * 0.5
-            return float(sizes[np.searchsorted(cum_w, cutoff, side="left")])
-
-        resampled["median_trade_size"] = (
-            df.groupby(grouper, sort=False, observed=True).apply(w_median).astype("float32")
+            All aggregations run in a single numba pass (:func:`afmlkit.bar.utils.resample_bars`) over the
+            contiguous bucket segments of the sorted bars, so the cost grows linearly with the number of bars.
+        """
+        # --- one bucket key per bar, buckets as contiguous segments ------
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index(kind="stable")
+        buckets = df.index.floor(timeframe)  # fast vectorised
+        keys = buckets.asi8
+        starts = np.flatnonzero(np.diff(keys)) + 1
+        bounds = np.concatenate(([0], starts, [len(keys)])).astype(np.int64) if len(keys) else np.zeros(1, np.int64)
+
+        # ---------- OHLCV, trades, VWAP and weighted median in one pass ---
+        def col(name, dtype):
+            return np.ascontiguousarray(df[name].to_numpy(), dtype=dtype)
+
+        o, h, l, c, vol, trades, vwap, med = resample_bars(
+            bounds,
+            col("open", np.float64), col("high", np.float64), col("low", np.float64), col("close", np.float64),
+            col("volume", np.float64), col("trades", np.int64),
+            col("vwap", np.float64), col("median_trade_size", np.float64),
         )
+        resampled = pd.DataFrame({
+            "open": o,
+            "high": h,
+            "low": l,
+            "close": c,
+            "volume": vol.astype(df["volume"].dtype, copy=False),
+            "trades": trades.astype(df["trades"].dtype, copy=False),
+            "vwap": vwap.astype("float32"),
+            "median_trade_size": med.astype("float32"),
+        }, index=buckets[bounds[:-1]])
 
         # ---------- final cleanup -----------------------------------------
         # Drop periods with no trades (NaN open). Keeps index monotone.
-        resampled = resampled.dropna(subset=["open"])
+        resampled = resampled[~np.isnan(o)]
 
         return resampled
@@ -1,10 +1,14 @@
 import numpy as np
-from typing import Dict, Tuple, Any
+from typing import Dict, Tuple, Any, Literal, List, Union
 from numpy.typing import NDArray
 from .base import BarBuilderBase
 from .logic import _time_bar_indexer, _tick_bar_indexer, _volume_bar_indexer, _dollar_bar_indexer, _dynamic_dollar_bar_indexer, _cusum_bar_indexer, _imbalance_bar_indexer, _run_bar_indexer
+from .logic import _multi_bar_indexer, TICK_BAR, VOLUME_BAR, DOLLAR_BAR, TIME_BAR
+from .logic import _time_bar_indexer_compact
+from .logic import _time_bar_indexer_stream, _tick_bar_indexer_stream, _volume_bar_indexer_stream, _dollar_bar_indexer_stream, _cusum_bar_indexer_stream
 from afmlkit.utils.log import get_logger
-from .data_model import TradesData
+from .data_model import TradesData, CompactTradesData
+from .utils import comp_trade_side_vector
 import pandas as pd
 logger = get_logger(__name__)
 
@@ -13,12 +17,13 @@ class TimeBarKit(BarBuilderBase):
     """
     Time bar builder class.
     """
+    _supports_compact = True
 
-    def __init__(self,trades: TradesData, period: pd.Timedelta):
+    def __init__(self, trades: Union[TradesData, CompactTradesData], period: pd.Timedelta):
         """
         Initialize the time bar builder with raw trades data and time interval.
 
-        :param trades: DataFrame of raw trades with 'timestamp', 'price', and 'amount'.
+        :param trades: DataFrame of raw trades with 'timestamp', 'price', and 'amount' (or compact trades data).
         :param period: The time interval of a bar.
         """
         super().__init__(trades)
@@ -31,22 +36,56 @@ class TimeBarKit(BarBuilderBase):
         Generate time bar indices using the time bar indexer.
         :returns: Close timestamps and corresponding Close indices in the raw trades data.
         """
-        timestamps = self.trades_df['timestamp'].astype(np.int64).values
+        if self._compact is not None:
+            c = self._compact
+            return _time_bar_indexer_compact(c.ts_base, c.ts_delta, c.ts_unit_ns, self.interval)
+        timestamps = self.trades_df['timestamp'].values.astype(np.int64, copy=False)
         return _time_bar_indexer(timestamps, self.interval)
 
+    def _comp_bar_close_stream(self, trades_df: pd.DataFrame, start: int, end: int) -> Tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Resumable time bar indexing for streaming mode. The state is the close timestamp of the open bar.
+        :returns: Close timestamps and corresponding close indices in the trades buffer.
+        """
+        timestamps = trades_df['timestamp'].values.astype(np.int64, copy=False)
+        interval_ns = int(round(self.interval * 1e9))
+
+        head_ts, head_indices = [], []
+        if self._stream_state is None:
+            # First bar is aligned to the interval grid (see _time_bar_indexer)
+            bar_start_ts = int(timestamps[0]) // interval_ns * interval_ns
+            # The anchor is the last trade at the grid start (-1 if none), like the searchsorted of the batch indexer
+            head_ts = [bar_start_ts]
+            head_indices = [start + int(np.searchsorted(timestamps[start:end], bar_start_ts, side='right')) - 1]
+            self._stream_state = bar_start_ts + interval_ns
+
+        close_ts, close_indices, self._stream_state = _time_bar_indexer_stream(
+            timestamps, start, end, interval_ns, self._stream_state
+        )
+
+        return (np.concatenate((np.array(head_ts, dtype=np.int64), np.array(close_ts, dtype=np.int64))),
+                np.concatenate((np.array(head_indices, dtype=np.int64), np.array(close_indices, dtype=np.int64))))
+
+    def _stream_partial_close_ts(self, timestamps: NDArray[np.int64]) -> int:
+        """
+        The open time bar is closed at its interval boundary.
+        """
+        return int(self._stream_state)
+
 
 class TickBarKit(BarBuilderBase):
     """
     Tick bar builder class.
     """
+    _supports_compact = True
 
     def __init__(self,
-                 trades: TradesData,
+                 trades: Union[TradesData, CompactTradesData],
                  tick_count_thrs: int):
         """
         Initialize the tick bar builder with raw trades data and tick count.
 
-        :param trades: DataFrame of raw trades with 'timestamp', 'price', and 'amount'.
+        :param trades: DataFrame of raw trades with 'timestamp', 'price', and 'amount' (or compact trades data).
         :param tick_count_thrs: Tick count threshold for the tick bar.
         """
         super().__init__(trades)
@@ -59,26 +98,48 @@ class TickBarKit(BarBuilderBase):
         Generate tick bar indices using the tick bar indexer.
         :returns: Close timestamps and corresponding close indices in the raw trades data.
         """
-        timestamps = self.trades_df['timestamp'].astype(np.int64).values
+        if self._compact is not None:
+            close_indices = np.array(_tick_bar_indexer(self._compact.ts_delta, self.tick_count_thrs), dtype=np.int64)
+            return self._compact.timestamps(close_indices), close_indices
+
+        timestamps = self.trades_df['timestamp'].values.astype(np.int64, copy=False)
         close_indices = _tick_bar_indexer(timestamps, self.tick_count_thrs)
         close_indices = np.array(close_indices, dtype=np.int64)
         close_ts = timestamps[close_indices]
 
         return close_ts, close_indices
 
+    def _comp_bar_close_stream(self, trades_df: pd.DataFrame, start: int, end: int) -> Tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Resumable tick bar indexing for streaming mode. The state is the tick count of the open bar.
+        :returns: Close timestamps and corresponding close indices in the trades buffer.
+        """
+        timestamps = trades_df['timestamp'].values.astype(np.int64, copy=False)
+
+        head = []
+        if self._stream_state is None:
+            # The first trade is the bar open and counts as the first tick (see _tick_bar_indexer)
+            head, start, self._stream_state = [0], start + 1, 1
+
+        close_indices, self._stream_state = _tick_bar_indexer_stream(start, end, self._stream_state, self.tick_count_thrs)
+        close_indices = np.concatenate((np.array(head, dtype=np.int64), np.array(close_indices, dtype=np.int64)))
+
+        return timestamps[close_indices], close_indices
+
 
 class VolumeBarKit(BarBuilderBase):
     """
     Volume bar builder class.
     """
+    _supports_compact = True
 
     def __init__(self,
-                 trades: TradesData,
+                 trades: Union[TradesData, CompactTradesData],
                  volume_ths: float):
         """
         Initialize the volume bar builder with raw trades data and volume.
 
-        :param trades: DataFrame of raw trades with 'timestamp', 'price', and 'amount'.
+        :param trades: DataFrame of raw trades with 'timestamp', 'price', and 'amount' (or compact trades data).
         :param volume_ths: Volume Bucket threshold for the volume bar.
         """
         super().__init__(trades)
@@ -91,7 +152,11 @@ class VolumeBarKit(BarBuilderBase):
         Generate volume bar indices using the volume bar indexer.
         :returns: Close timestamps and corresponding close indices in the raw trades data.
         """
-        timestamps = self.trades_df['timestamp'].astype(np.int64).values
+        if self._compact is not None:
+            close_indices = np.array(_volume_bar_indexer(self._compact.amount, self.volume_ths), dtype=np.int64)
+            return self._compact.timestamps(close_indices), close_indices
+
+        timestamps = self.trades_df['timestamp'].values.astype(np.int64, copy=False)
         volumes = self.trades_df['amount'].values
 
         close_indices = _volume_bar_indexer(volumes, self.volume_ths)
@@ -100,20 +165,41 @@ class VolumeBarKit(BarBuilderBase):
 
         return close_ts, close_indices
 
+    def _comp_bar_close_stream(self, trades_df: pd.DataFrame, start: int, end: int) -> Tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Resumable volume bar indexing for streaming mode. The state is the cumulative volume of the open bar.
+        :returns: Close timestamps and corresponding close indices in the trades buffer.
+        """
+        timestamps = trades_df['timestamp'].values.astype(np.int64, copy=False)
+        volumes = trades_df['amount'].values
+
+        head = []
+        if self._stream_state is None:
+            # The first trade is the bar open and its volume is counted (see _volume_bar_indexer)
+            head, start, self._stream_state = [0], start + 1, float(volumes[0])
+
+        close_indices, self._stream_state = _volume_bar_indexer_stream(
+            volumes, start, end, self._stream_state, self.volume_ths
+        )
+        close_indices = np.concatenate((np.array(head, dtype=np.int64), np.array(close_indices, dtype=np.int64)))
+
+        return timestamps[close_indices], close_indices
+
 
 
 class DollarBarKit(BarBuilderBase):
     """
     Dollar bar builder class.
     """
+    _supports_compact = True
 
     def __init__(self,
-                 trades: TradesData,
+                 trades: Union[TradesData, CompactTradesData],
                  dollar_thrs: float):
         """
         Initialize the dollar bar builder with raw trades data and dollar amount.
 
-        :param trades: DataFrame of raw trades with 'timestamp', 'price', and 'amount'.
+        :param trades: DataFrame of raw trades with 'timestamp', 'price', and 'amount' (or compact trades data).
         :param dollar_thrs: Dollar amount threshold for the dollar bar.
         """
         super().__init__(trades)
@@ -126,7 +212,14 @@ class DollarBarKit(BarBuilderBase):
         Generate dollar bar indices using the dollar bar indexer.
         :returns: Close timestamps and corresponding close indices in the raw trades data.
         """
-        timestamps = self.trades_df['timestamp'].astype(np.int64).values
+        if self._compact is not None:
+            # Dollar value in price tick units
+            c = self._compact
+            close_indices = _dollar_bar_indexer(c.price_ticks, c.amount, self.dollar_thrs / c.price_tick)
+            close_indices = np.array(close_indices, dtype=np.int64)
+            return c.timestamps(close_indices), close_indices
+
+        timestamps = self.trades_df['timestamp'].values.astype(np.int64, copy=False)
         prices = self.trades_df['price'].values
         volumes = self.trades_df['amount'].values
 
@@ -136,6 +229,27 @@ class DollarBarKit(BarBuilderBase):
 
         return close_ts, close_indices
 
+    def _comp_bar_close_stream(self, trades_df: pd.DataFrame, start: int, end: int) -> Tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Resumable dollar bar indexing for streaming mode. The state is the cumulative dollar value of the open bar.
+        :returns: Close timestamps and corresponding close indices in the trades buffer.
+        """
+        timestamps = trades_df['timestamp'].values.astype(np.int64, copy=False)
+        prices = trades_df['price'].values
+        volumes = trades_df['amount'].values
+
+        head = []
+        if self._stream_state is None:
+            # The first trade is the bar open and its dollar value is counted (see _dollar_bar_indexer)
+            head, start, self._stream_state = [0], start + 1, float(prices[0] * volumes[0])
+
+        close_indices, self._stream_state = _dollar_bar_indexer_stream(
+            prices, volumes, start, end, self._stream_state, self.dollar_thrs
+        )
+        close_indices = np.concatenate((np.array(head, dtype=np.int64), np.array(close_indices, dtype=np.int64)))
+
+        return timestamps[close_indices], close_indices
+
 
 class DynamicDollarBarKit(BarBuilderBase):
     """
@@ -202,7 +316,7 @@ class DynamicDollarBarKit(BarBuilderBase):
         
         self.thresholds_array = df['dynamic_threshold'].values.astype(np.float64)
         
-        timestamps = df['timestamp'].astype(np.int64).values
+        timestamps = df['timestamp'].values.astype(np.int64, copy=False)
         prices = df['price'].values
         volumes = df['amount'].values
 
@@ -225,6 +339,7 @@ class CUSUMBarKit(BarBuilderBase):
 
         :param trades: DataFrame of raw trades with 'timestamp', 'price', and 'amount'.
         :param sigma: Standard deviation vector of the price series or a constant value for all ticks.
+            In streaming mode it is consumed sequentially chunk by chunk, so it can be a ``np.memmap``.
         :param sigma_floor: Minimum value for sigma to avoid small events.
         :param sigma_mult: the sigma multiplier for adaptive threshold (lambda_th = lambda_mult * sigma).
         """
@@ -232,6 +347,7 @@ class CUSUMBarKit(BarBuilderBase):
         self.lambda_mult = sigma_mult
         self._sigma = sigma
         self.sigma_floor = sigma_floor
+        self._sigma_pos = 0  # Streaming mode: position of the next chunk in the sigma vector
 
         logger.info(f"CUSUM Bar builder initialized with: sigma multiplier={sigma_mult}.")
 
@@ -240,7 +356,7 @@ class CUSUMBarKit(BarBuilderBase):
         Generate CUSUM bar indices using the CUSUM bar indexer.
         :returns: Open timestamps and corresponding open indices in the raw trades data.
         """
-        timestamps = self.trades_df['timestamp'].astype(np.int64).values
+        timestamps = self.trades_df['timestamp'].values.astype(np.int64, copy=False)
         prices = self.trades_df['price'].values
 
         close_indices = _cusum_bar_indexer(timestamps, prices, self._sigma, self.sigma_floor, self.lambda_mult)
@@ -249,9 +365,261 @@ class CUSUMBarKit(BarBuilderBase):
 
         return close_ts, close_indices
 
+    def _prepare_stream_chunk(self, chunk_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Attach the next slice of the sigma vector to the chunk, so it is carried over with the open bar.
+        """
+        sigma = np.asarray(self._sigma[self._sigma_pos:self._sigma_pos + len(chunk_df)], dtype=np.float64)
+        if len(sigma) != len(chunk_df):
+            raise ValueError("The sigma vector is shorter than the streamed trades.")
+        self._sigma_pos += len(chunk_df)
+
+        return chunk_df.assign(sigma=sigma)
+
+    def _comp_bar_close_stream(self, trades_df: pd.DataFrame, start: int, end: int) -> Tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Resumable CUSUM bar indexing for streaming mode. The state is (s_pos, s_neg, last non-NaN sigma).
+        :returns: Close timestamps and corresponding close indices in the trades buffer.
+        """
+        timestamps = trades_df['timestamp'].values.astype(np.int64, copy=False)
+        prices = trades_df['price'].values
+        sigma = trades_df['sigma'].values
+
+        head = []
+        if self._stream_state is None:
+            # The first bar opens at the first non-NaN sigma (see _cusum_bar_indexer)
+            non_nan = np.flatnonzero(~np.isnan(sigma[:end]))
+            first_idx = int(non_nan[0]) if len(non_nan) else 0
+            head, start, self._stream_state = [first_idx], first_idx + 1, (0.0, 0.0, float(sigma[first_idx]))
+
+        close_indices, s_pos, s_neg, last_sigma = _cusum_bar_indexer_stream(
+            timestamps, prices, sigma, start, end, *self._stream_state, self.sigma_floor, self.lambda_mult
+        )
+        self._stream_state = (s_pos, s_neg, last_sigma)
+        close_indices = np.concatenate((np.array(head, dtype=np.int64), np.array(close_indices, dtype=np.int64)))
+
+        return timestamps[close_indices], close_indices
+
     def get_sigma(self) -> NDArray[np.float64]:
         """
         The sigma threshold used for the CUSUM at close indices.
         :return: sigma vector
         """
-        return self._sigma[self.bar_close_indices]
\ No newline at end of file
+        return self._sigma[self.bar_close_indices]
+
+
+_INFO_BAR_TYPES = {'tick': TICK_BAR, 'volume': VOLUME_BAR, 'dollar': DOLLAR_BAR}
+
+
+def _get_trade_sides(trades_df: pd.DataFrame) -> NDArray[np.int8]:
+    """
+    Trade sides of the raw trades: the 'side' column if present, otherwise inferred with the tick rule.
+    """
+    if 'side' in trades_df.columns:
+        return trades_df['side'].values.astype(np.int8, copy=False)
+    return comp_trade_side_vector(trades_df['price'].values)
+
+
+class ImbalanceBarKit(BarBuilderBase):
+    """
+    Tick, volume or dollar imbalance bar builder class (López de Prado, 2018, ch. 2.3.2).
+    """
+
+    def __init__(self,
+                 trades: TradesData,
+                 bar_type: Literal['tick', 'volume', 'dollar'] = 'tick',
+                 expected_ticks_init: float = 1000.,
+                 ticks_span: float = 20.,
+                 imbalance_span: float = 10_000.,
+                 min_expected_ticks: float = 1.,
+                 max_expected_ticks: float = np.inf):
+        """
+        Initialize the imbalance bar builder with raw trades data and EWMA parameters.
+
+        :param trades: DataFrame of raw trades with 'timestamp', 'price', and 'amount' (and optionally 'side').
+        :param bar_type: Accumulated quantity: 'tick', 'volume' or 'dollar'.
+        :param expected_ticks_init: Initial expected number of ticks per bar.
+        :param ticks_span: EWMA span (in bars) of the expected bar length.
+        :param imbalance_span: EWMA span (in trades) of the expected signed trade value.
+        :param min_expected_ticks: Lower bound of the expected bar length.
+        :param max_expected_ticks: Upper bound of the expected bar length.
+        """
+        super().__init__(trades)
+        if bar_type not in _INFO_BAR_TYPES:
+            raise ValueError(f"Invalid bar type: {bar_type}. Must be one of: {', '.join(_INFO_BAR_TYPES)}")
+        self.bar_type = bar_type
+        self.expected_ticks_init = expected_ticks_init
+        self.ticks_span = ticks_span
+        self.imbalance_span = imbalance_span
+        self.min_expected_ticks = min_expected_ticks
+        self.max_expected_ticks = max_expected_ticks
+        self._thresholds = None
+
+        logger.info(f"{bar_type.capitalize()} imbalance bar builder initialized with expected ticks: {expected_ticks_init}.")
+
+    def _comp_bar_close(self) -> Tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Generate imbalance bar indices using the imbalance bar indexer.
+        :returns: Close timestamps and corresponding close indices in the raw trades data.
+        """
+        timestamps = self.trades_df['timestamp'].values.astype(np.int64, copy=False)
+        prices = self.trades_df['price'].values
+        volumes = self.trades_df['amount'].values
+        trade_sides = _get_trade_sides(self.trades_df)
+
+        close_indices, thresholds = _imbalance_bar_indexer(
+            trade_sides, prices, volumes, _INFO_BAR_TYPES[self.bar_type],
+            self.expected_ticks_init, self.ticks_span, self.imbalance_span,
+            self.min_expected_ticks, self.max_expected_ticks
+        )
+        close_indices = np.array(close_indices, dtype=np.int64)
+        close_ts = timestamps[close_indices]
+        self._thresholds = np.array(thresholds, dtype=np.float64)
+
+        return close_ts, close_indices
+
+    def get_thresholds(self) -> NDArray[np.float64]:
+        """
+        The expected imbalance threshold that closed each bar.
+        :return: threshold vector
+        """
+        self._set_bar_close()
+        return self._thresholds[1:]
+
+
+class RunBarKit(BarBuilderBase):
+    """
+    Tick, volume or dollar run bar builder class (López de Prado, 2018, ch. 2.3.2).
+    """
+
+    def __init__(self,
+                 trades: TradesData,
+                 bar_type: Literal['tick', 'volume', 'dollar'] = 'tick',
+                 expected_ticks_init: float = 1000.,
+                 ticks_span: float = 20.,
+                 run_span: float = 10_000.,
+                 min_expected_ticks: float = 1.,
+                 max_expected_ticks: float = np.inf):
+        """
+        Initialize the run bar builder with raw trades data and EWMA parameters.
+
+        :param trades: DataFrame of raw trades with 'timestamp', 'price', and 'amount' (and optionally 'side').
+        :param bar_type: Accumulated quantity: 'tick', 'volume' or 'dollar'.
+        :param expected_ticks_init: Initial expected number of ticks per bar.
+        :param ticks_span: EWMA span (in bars) of the expected bar length.
+        :param run_span: EWMA span (in trades) of the buy probability and the expected buy and sell trade values.
+        :param min_expected_ticks: Lower bound of the expected bar length.
+        :param max_expected_ticks: Upper bound of the expected bar length.
+        """
+        super().__init__(trades)
+        if bar_type not in _INFO_BAR_TYPES:
+            raise ValueError(f"Invalid bar type: {bar_type}. Must be one of: {', '.join(_INFO_BAR_TYPES)}")
+        self.bar_type = bar_type
+        self.expected_ticks_init = expected_ticks_init
+        self.ticks_span = ticks_span
+        self.run_span = run_span
+        self.min_expected_ticks = min_expected_ticks
+        self.max_expected_ticks = max_expected_ticks
+        self._thresholds = None
+
+        logger.info(f"{bar_type.capitalize()} run bar builder initialized with expected ticks: {expected_ticks_init}.")
+
+    def _comp_bar_close(self) -> Tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Generate run bar indices using the run bar indexer.
+        :returns: Close timestamps and corresponding close indices in the raw trades data.
+        """
+        timestamps = self.trades_df['timestamp'].values.astype(np.int64, copy=False)
+        prices = self.trades_df['price'].values
+        volumes = self.trades_df['amount'].values
+        trade_sides = _get_trade_sides(self.trades_df)
+
+        close_indices, thresholds = _run_bar_indexer(
+            trade_sides, prices, volumes, _INFO_BAR_TYPES[self.bar_type],
+            self.expected_ticks_init, self.ticks_span, self.run_span,
+            self.min_expected_ticks, self.max_expected_ticks
+        )
+        close_indices = np.array(close_indices, dtype=np.int64)
+        close_ts = timestamps[close_indices]
+        self._thresholds = np.array(thresholds, dtype=np.float64)
+
+        return close_ts, close_indices
+
+    def get_thresholds(self) -> NDArray[np.float64]:
+        """
+        The expected run threshold that closed each bar.
+        :return: threshold vector
+        """
+        self._set_bar_close()
+        return self._thresholds[1:]
+
+
+class MultiBarKit:
+    """
+    Build several time, tick, volume and dollar bar specifications from a single fused scan of the raw trades.
+
+    Each bar specification is a ``(bar_type, threshold)`` tuple, where the threshold is a ``pd.Timedelta`` for
+    'time' bars and the tick count, volume or dollar value threshold for 'tick', 'volume' and 'dollar' bars.
+    The resulting kits are ordinary :class:`TimeBarKit`, :class:`TickBarKit`, :class:`VolumeBarKit` and
+    :class:`DollarBarKit` instances with their bar closes already set, so every ``build_*`` method is available.
+
+    >>> kits = MultiBarKit(trades, [('time', pd.Timedelta('1min')), ('tick', 1000), ('dollar', 1e6)]).build_kits()  # doctest: +SKIP
+    >>> ohlcv = [kit.build_ohlcv() for kit in kits]  # doctest: +SKIP
+    """
+    _BAR_TYPES = {'time': TIME_BAR, 'tick': TICK_BAR, 'volume': VOLUME_BAR, 'dollar': DOLLAR_BAR}
+
+    def __init__(self, trades: TradesData, specs: List[Tuple[str, Union[pd.Timedelta, float]]]):
+        """
+        Initialize the multi bar builder with raw trades data and the bar specifications.
+
+        :param trades: DataFrame of raw trades with 'timestamp', 'price', and 'amount'.
+        :param specs: List of ``(bar_type, threshold)`` bar specifications.
+        :raises ValueError: If a bar type is invalid or a time bar threshold is not a ``pd.Timedelta``.
+        """
+        for bar_type, threshold in specs:
+            if bar_type not in self._BAR_TYPES:
+                raise ValueError(f"Invalid bar type: {bar_type}. Must be one of: {', '.join(self._BAR_TYPES)}")
+            if bar_type == 'time' and not isinstance(threshold, pd.Timedelta):
+                raise ValueError(f"Time bar threshold must be a pd.Timedelta, got {type(threshold).__name__}.")
+        self.trades = trades
+        self.specs = list(specs)
+        self._closes = None
+
+        logger.info(f"Multi bar builder initialized with {len(self.specs)} bar specifications.")
+
+    def comp_bar_closes(self) -> List[Tuple[NDArray[np.int64], NDArray[np.int64]]]:
+        """
+        Compute the bar closes of all specifications in one pass over the raw trades.
+        :returns: List of (close timestamps, close indices) tuples in the order of the specifications.
+        """
+        if self._closes is None:
+            trades_df = self.trades.data
+            bar_types = np.array([self._BAR_TYPES[bar_type] for bar_type, _ in self.specs], dtype=np.int64)
+            thresholds = np.array([
+                threshold.total_seconds() if bar_type == 'time' else threshold for bar_type, threshold in self.specs
+            ], dtype=np.float64)
+
+            close_ts, close_indices = _multi_bar_indexer(
+                trades_df['timestamp'].values.astype(np.int64, copy=False),
+                trades_df['price'].values,
+                trades_df['amount'].values,
+                bar_types,
+                thresholds
+            )
+            self._closes = list(zip(close_ts, close_indices))
+
+        return self._closes
+
+    def build_kits(self) -> List[BarBuilderBase]:
+        """
+        Create a bar builder for each specification with its bar closes already computed.
+        :returns: List of bar kits in the order of the specifications.
+        """
+        kit_classes = {'time': TimeBarKit, 'tick': TickBarKit, 'volume': VolumeBarKit, 'dollar': DollarBarKit}
+        kits = []
+        for (bar_type, threshold), (close_ts, close_indices) in zip(self.specs, self.comp_bar_closes()):
+            kit = kit_classes[bar_type](self.trades, threshold)
+            kit._close_ts, kit._close_indices = close_ts, close_indices
+            kits.append(kit)
+
+        return kits
@@ -1,5 +1,5 @@
 """
-This module contains the logic for generating time, tick, volume, and dollar bar.
+This module contains the logic for generating time, tick, volume, dollar and information-driven (CUSUM, imbalance, run) bars.
 These functions return the open indices of the bar in the raw trades data.
 """
 from typing import Tuple
@@ -8,6 +8,40 @@ from numba import njit
 from numba.typed import List as NumbaList
 from numpy.typing import NDArray
 
+# Bar type codes: accumulated quantity of the information-driven (imbalance and run) bars and the
+# standard bar types of the multi bar indexer
+TICK_BAR = 0
+VOLUME_BAR = 1
+DOLLAR_BAR = 2
+TIME_BAR = 3
+
+# Compact timestamps: one int64 base per block of 2**COMPACT_BLOCK_SHIFT trades plus uint32 offsets
+COMPACT_BLOCK_SHIFT = 16
+
+
+@njit(nogil=True)
+def _time_bar_clock(
+        timestamps: NDArray[np.int64],
+        interval_seconds: float
+) -> NDArray[np.int64]:
+    """
+    Create the time bar clock (bar close timestamps) covering the raw trades timestamp array.
+
+    :param timestamps: Raw sorted trade timestamps in nanoseconds.
+    :param interval_seconds: Length of the time bar in seconds.
+    :returns: Bar close timestamps; the first one is aligned to an integer multiple of the interval.
+    """
+    bar_interval_ns = interval_seconds * 1e9
+
+    # determine the first bar start time (closest integer multiple of bar_interval_ns)
+    bar_start_ts = timestamps[0] // bar_interval_ns * bar_interval_ns
+
+    # last tick timestamp
+    last_ts = np.ceil(timestamps[-1] / bar_interval_ns) * bar_interval_ns
+
+    # create the array of bar close timestamps
+    return np.arange(bar_start_ts, last_ts + bar_interval_ns + 1, bar_interval_ns, dtype=np.int64)
+
 
 @njit(nogil=True)
 def _time_bar_indexer(
@@ -27,16 +61,7 @@ def _time_bar_indexer(
         The first bar is aligned to the ceiling of the first timestamp, ensuring consistent bar boundaries.
         Duplicate indices may occur if a bar interval contains no trades (empty bars).
     """
-    bar_interval_ns = interval_seconds * 1e9
-
-    # determine the first bar start time (closest integer multiple of bar_interval_ns)
-    bar_start_ts = timestamps[0] // bar_interval_ns * bar_interval_ns
-
-    # last tick timestamp
-    last_ts = np.ceil(timestamps[-1] / bar_interval_ns) * bar_interval_ns
-
-    # create the array of bar close timestamps
-    bar_clock = np.arange(bar_start_ts, last_ts + bar_interval_ns + 1, bar_interval_ns, dtype=np.int64)
+    bar_clock = _time_bar_clock(timestamps, interval_seconds)
 
     # find the indices of the bar close timestamps in the raw trades timestamps
     bar_close_indices = (np.searchsorted(timestamps, bar_clock, side='right') - 1).astype(np.int64)
@@ -256,40 +281,544 @@ def _cusum_bar_indexer(
 
 
 @njit(nogil=True)
-def _imbalance_bar_indexer(
-        timestamps: NDArray[np.int64],
+def _info_bar_value(
         prices: NDArray[np.float64],
         volumes: NDArray[np.float64],
-        threshold: float
-) -> Tuple[NDArray[np.int64], NDArray[np.int64]]:
+        i: int,
+        bar_type: int
+) -> float:
     """
-    Determine the imbalance bar open indices based on cumulative imbalance.
+    The quantity accumulated by information-driven bars for a single trade.
 
-    :param timestamps: Raw trade timestamps.
     :param prices: Trade prices.
     :param volumes: Trade volumes.
-    :param threshold: Imbalance threshold for opening a new bar.
-    :returns: A tuple of open timestamps and indices for imbalance bars.
-    :raises NotImplementedError: Always raised as this function is not yet implemented.
+    :param i: Trade index.
+    :param bar_type: One of ``TICK_BAR`` (1 per trade), ``VOLUME_BAR`` (volume) or ``DOLLAR_BAR`` (price × volume).
+    :returns: The value of the i-th trade.
     """
-    raise NotImplementedError("Imbalance bar indexer is not implemented yet.")
+    if bar_type == VOLUME_BAR:
+        return float(volumes[i])
+    elif bar_type == DOLLAR_BAR:
+        return float(prices[i] * volumes[i])
+    return 1.0
+
+
+@njit(nogil=True)
+def _imbalance_bar_indexer(
+        trade_sides: NDArray[np.int8],
+        prices: NDArray[np.float64],
+        volumes: NDArray[np.float64],
+        bar_type: int,
+        expected_ticks_init: float,
+        ticks_span: float,
+        imbalance_span: float,
+        min_expected_ticks: float,
+        max_expected_ticks: float
+) -> Tuple[NumbaList, NumbaList]:
+    r"""
+    Determine the tick, volume or dollar imbalance bar close indices in a single pass (López de Prado, 2018, ch. 2.3.2).
+
+    The signed imbalance :math:`\theta_T = \sum_{t=1}^{T} b_t v_t` is accumulated over the trades of the open bar,
+    where :math:`b_t` is the trade side and :math:`v_t` is 1, the volume or the dollar value of the trade.
+    A bar is closed when :math:`|\theta_T| \geq E_0[T] \, |E_0[b v]|`, where the expected bar length :math:`E_0[T]`
+    is an EWMA of the previous bar lengths and the expected signed trade value :math:`E_0[b v]` is an EWMA over the trades.
+
+    :param trade_sides: Trade direction (1 for market buy, -1 for market sell).
+    :param prices: Trade prices.
+    :param volumes: Trade volumes.
+    :param bar_type: ``TICK_BAR``, ``VOLUME_BAR`` or ``DOLLAR_BAR``.
+    :param expected_ticks_init: Initial expected number of ticks per bar.
+    :param ticks_span: EWMA span (in bars) of the expected bar length.
+    :param imbalance_span: EWMA span (in trades) of the expected signed trade value.
+    :param min_expected_ticks: Lower bound of the expected bar length (guards against bar collapse).
+    :param max_expected_ticks: Upper bound of the expected bar length (guards against bar explosion).
+    :returns: A tuple of:
+        - close_indices: Bar close indices (the first trade is the bar open).
+        - thresholds: Expected imbalance threshold at each close (the first element belongs to the bar open).
+
+    .. note::
+        The EWMAs are bias corrected (``adjust=True`` in pandas terms), so no warm-up period is needed.
+    """
+    n = len(trade_sides)
+    alpha_ticks = 2.0 / (ticks_span + 1.0)
+    alpha_imb = 2.0 / (imbalance_span + 1.0)
+
+    close_indices = NumbaList()
+    close_indices.append(0)
+    thresholds = NumbaList()
+    thresholds.append(np.nan)
+
+    expected_ticks = min(max(expected_ticks_init, min_expected_ticks), max_expected_ticks)
+    ticks_num, ticks_den = 0.0, 0.0  # Bias corrected EWMA of bar lengths
+    imb_num, imb_den = 0.0, 0.0      # Bias corrected EWMA of signed trade values
+
+    theta = 0.0
+    bar_ticks = 0
+    for i in range(1, n):
+        bv = trade_sides[i] * _info_bar_value(prices, volumes, i, bar_type)
+        theta += bv
+        bar_ticks += 1
+
+        imb_num = (1.0 - alpha_imb) * imb_num + bv
+        imb_den = (1.0 - alpha_imb) * imb_den + 1.0
+        threshold = expected_ticks * abs(imb_num / imb_den)
+
+        if abs(theta) >= threshold:
+            close_indices.append(i)
+            thresholds.append(threshold)
+
+            ticks_num = (1.0 - alpha_ticks) * ticks_num + bar_ticks
+            ticks_den = (1.0 - alpha_ticks) * ticks_den + 1.0
+            expected_ticks = min(max(ticks_num / ticks_den, min_expected_ticks), max_expected_ticks)
+
+            theta = 0.0
+            bar_ticks = 0
+
+    return close_indices, thresholds
 
 
 @njit(nogil=True)
 def _run_bar_indexer(
+        trade_sides: NDArray[np.int8],
+        prices: NDArray[np.float64],
+        volumes: NDArray[np.float64],
+        bar_type: int,
+        expected_ticks_init: float,
+        ticks_span: float,
+        run_span: float,
+        min_expected_ticks: float,
+        max_expected_ticks: float
+) -> Tuple[NumbaList, NumbaList]:
+    r"""
+    Determine the tick, volume or dollar run bar close indices in a single pass (López de Prado, 2018, ch. 2.3.2).
+
+    The buy and sell runs :math:`\theta_T = \max\{\sum_{t | b_t = 1} v_t, \; \sum_{t | b_t = -1} v_t\}` are accumulated
+    over the trades of the open bar, where :math:`v_t` is 1, the volume or the dollar value of the trade.
+    A bar is closed when :math:`\theta_T \geq E_0[T] \max\{P[b=1] E_0[v | b=1], \; (1 - P[b=1]) E_0[v | b=-1]\}`,
+    where the expected bar length :math:`E_0[T]` is an EWMA of the previous bar lengths, and the buy probability and the
+    expected buy and sell trade values are EWMAs over the trades.
+
+    :param trade_sides: Trade direction (1 for market buy, -1 for market sell).
+    :param prices: Trade prices.
+    :param volumes: Trade volumes.
+    :param bar_type: ``TICK_BAR``, ``VOLUME_BAR`` or ``DOLLAR_BAR``.
+    :param expected_ticks_init: Initial expected number of ticks per bar.
+    :param ticks_span: EWMA span (in bars) of the expected bar length.
+    :param run_span: EWMA span (in trades) of the buy probability and the expected buy and sell trade values.
+    :param min_expected_ticks: Lower bound of the expected bar length (guards against bar collapse).
+    :param max_expected_ticks: Upper bound of the expected bar length (guards against bar explosion).
+    :returns: A tuple of:
+        - close_indices: Bar close indices (the first trade is the bar open).
+        - thresholds: Expected run threshold at each close (the first element belongs to the bar open).
+
+    .. note::
+        The EWMAs are bias corrected (``adjust=True`` in pandas terms), so no warm-up period is needed.
+        Until the first trade of a side has been seen, its expected trade value counts as 0.
+    """
+    n = len(trade_sides)
+    alpha_ticks = 2.0 / (ticks_span + 1.0)
+    alpha_run = 2.0 / (run_span + 1.0)
+
+    close_indices = NumbaList()
+    close_indices.append(0)
+    thresholds = NumbaList()
+    thresholds.append(np.nan)
+
+    expected_ticks = min(max(expected_ticks_init, min_expected_ticks), max_expected_ticks)
+    ticks_num, ticks_den = 0.0, 0.0  # Bias corrected EWMA of bar lengths
+    buy_num, run_den = 0.0, 0.0      # Bias corrected EWMA of the buy indicator
+    buy_v_num, buy_v_den = 0.0, 0.0  # Bias corrected EWMA of buy trade values
+    sell_v_num, sell_v_den = 0.0, 0.0  # Bias corrected EWMA of sell trade values
+
+    buy_run, sell_run = 0.0, 0.0
+    bar_ticks = 0
+    for i in range(1, n):
+        v = _info_bar_value(prices, volumes, i, bar_type)
+        is_buy = trade_sides[i] > 0
+        bar_ticks += 1
+
+        buy_num = (1.0 - alpha_run) * buy_num + (1.0 if is_buy else 0.0)
+        run_den = (1.0 - alpha_run) * run_den + 1.0
+        if is_buy:
+            buy_run += v
+            buy_v_num = (1.0 - alpha_run) * buy_v_num + v
+            buy_v_den = (1.0 - alpha_run) * buy_v_den + 1.0
+        else:
+            sell_run += v
+            sell_v_num = (1.0 - alpha_run) * sell_v_num + v
+            sell_v_den = (1.0 - alpha_run) * sell_v_den + 1.0
+
+        p_buy = buy_num / run_den
+        e_buy = buy_v_num / buy_v_den if buy_v_den > 0.0 else 0.0
+        e_sell = sell_v_num / sell_v_den if sell_v_den > 0.0 else 0.0
+        threshold = expected_ticks * max(p_buy * e_buy, (1.0 - p_buy) * e_sell)
+
+        if max(buy_run, sell_run) >= threshold:
+            close_indices.append(i)
+            thresholds.append(threshold)
+
+            ticks_num = (1.0 - alpha_ticks) * ticks_num + bar_ticks
+            ticks_den = (1.0 - alpha_ticks) * ticks_den + 1.0
+            expected_ticks = min(max(ticks_num / ticks_den, min_expected_ticks), max_expected_ticks)
+
+            buy_run, sell_run = 0.0, 0.0
+            bar_ticks = 0
+
+    return close_indices, thresholds
+
+
+@njit(nogil=True)
+def _multi_bar_indexer(
         timestamps: NDArray[np.int64],
         prices: NDArray[np.float64],
         volumes: NDArray[np.float64],
-        threshold: float
-) -> Tuple[NDArray[np.int64], NDArray[np.int64]]:
+        bar_types: NDArray[np.int64],
+        thresholds: NDArray[np.float64]
+) -> Tuple[NumbaList, NumbaList]:
     """
-    Determine the run bar open indices using cumulative run activity.
+    Determine the close indices of several time, tick, volume and dollar bar specifications in a single fused pass
+    over the raw trades, instead of one pass per bar specification.
+    Each specification gives the same result as its dedicated indexer
+    (:func:`_time_bar_indexer`, :func:`_tick_bar_indexer`, :func:`_volume_bar_indexer`, :func:`_dollar_bar_indexer`).
 
-    :param timestamps: Raw trade timestamps.
+    :param timestamps: Raw sorted trade timestamps in nanoseconds.
     :param prices: Trade prices.
     :param volumes: Trade volumes.
-    :param threshold: Run threshold for opening a new bar.
-    :returns: A tuple of open timestamps and indices for run bars.
-    :raises NotImplementedError: Always raised as this function is not yet implemented.
+    :param bar_types: Bar type code of each specification (``TIME_BAR``, ``TICK_BAR``, ``VOLUME_BAR`` or ``DOLLAR_BAR``).
+    :param thresholds: Threshold of each specification (interval in seconds for time bars).
+    :returns: A tuple of:
+        - close_ts: List of bar close timestamp arrays, one per specification.
+        - close_indices: List of bar close index arrays, one per specification.
     """
-    raise NotImplementedError("Run bar indexer is not implemented yet.")
+    n = len(timestamps)
+    n_specs = len(bar_types)
+
+    close_ts = NumbaList()
+    close_indices = NumbaList()
+    counts = np.zeros(n_specs, dtype=np.int64)
+    cum = np.zeros(n_specs, dtype=np.float64)
+    next_close_ts = np.zeros(n_specs, dtype=np.int64)  # Next clock timestamp of the time bars
+    init_capacity = 1024
+
+    for s in range(n_specs):
+        if bar_types[s] == TIME_BAR:
+            clock = _time_bar_clock(timestamps, thresholds[s])
+            close_ts.append(clock)
+            # Clock timestamps after the last trade close at the last trade
+            close_indices.append(np.full(len(clock), n - 1, dtype=np.int64))
+            next_close_ts[s] = clock[0]
+        else:
+            close_ts.append(np.empty(0, dtype=np.int64))
+            buffer = np.empty(init_capacity, dtype=np.int64)
+            buffer[0] = 0  # The first trade is always the start of a bar
+            close_indices.append(buffer)
+            counts[s] = 1
+            if bar_types[s] == TICK_BAR:
+                cum[s] = 1.
+            elif bar_types[s] == VOLUME_BAR:
+                cum[s] = volumes[0]
+            else:
+                cum[s] = prices[0] * volumes[0]
+
+    # The typed lists are only accessed when a bar closes; the per-trade work uses flat arrays
+    for i in range(n):
+        ts = timestamps[i]
+        volume = volumes[i]
+        dollar = prices[i] * volume
+        for s in range(n_specs):
+            bar_type = bar_types[s]
+            if bar_type == TIME_BAR:
+                if ts > next_close_ts[s]:
+                    # Every clock timestamp before the current trade closes at the previous trade (searchsorted right - 1)
+                    clock = close_ts[s]
+                    indices = close_indices[s]
+                    k = counts[s]
+                    while k < len(clock) and ts > clock[k]:
+                        indices[k] = i - 1
+                        k += 1
+                    counts[s] = k
+                    next_close_ts[s] = clock[k] if k < len(clock) else np.iinfo(np.int64).max
+                continue
+
+            if i == 0:
+                continue
+            if bar_type == TICK_BAR:
+                cum[s] += 1.
+            elif bar_type == VOLUME_BAR:
+                cum[s] += volume
+            else:
+                cum[s] += dollar
+
+            if cum[s] >= thresholds[s]:
+                indices = close_indices[s]
+                if counts[s] == len(indices):
+                    grown = np.empty(2 * len(indices), dtype=np.int64)
+                    grown[:len(indices)] = indices
+                    close_indices[s] = grown
+                    indices = grown
+                indices[counts[s]] = i
+                counts[s] += 1
+                # Dollar bars carry the excess over; tick and volume bars reset the counter
+                cum[s] = cum[s] - thresholds[s] if bar_type == DOLLAR_BAR else 0.
+
+    for s in range(n_specs):
+        if bar_types[s] != TIME_BAR:
+            indices = close_indices[s][:counts[s]].copy()
+            close_indices[s] = indices
+            close_ts[s] = timestamps[indices]
+
+    return close_ts, close_indices
+
+
+# --------------------------------------------------------------------------------------------
+# RESUMABLE (STREAMING) INDEXERS
+# --------------------------------------------------------------------------------------------
+# The functions below are the chunk-resumable counterparts of the indexers above. They scan the
+# trades in [start, end) of a buffer and carry the running accumulator in and out explicitly, so
+# that :meth:`afmlkit.bar.base.BarBuilderBase.feed` can resume exactly where the previous chunk stopped.
+# Returned close indices are positions in the buffer passed in.
+
+@njit(nogil=True)
+def _time_bar_indexer_stream(
+        timestamps: NDArray[np.int64],
+        start: int,
+        end: int,
+        interval_ns: int,
+        next_close_ts: int
+) -> Tuple[NumbaList, NumbaList, int]:
+    """
+    Resumable time bar indexer.
+
+    :param timestamps: Raw sorted trade timestamps in nanoseconds (buffer).
+    :param start: First buffer position to scan.
+    :param end: Buffer position to stop scanning at (exclusive).
+    :param interval_ns: Length of the time bar in nanoseconds.
+    :param next_close_ts: Close timestamp of the currently open bar.
+    :returns: A tuple of:
+        - close_ts: Timestamps at which the finished bars close.
+        - close_indices: Buffer indices corresponding to the bar closings.
+        - next_close_ts: Close timestamp of the bar that is still open at ``end``.
+
+    .. note::
+        Like :func:`_time_bar_indexer`, an interval without trades yields an empty bar (repeated close index).
+    """
+    close_ts = NumbaList()
+    close_indices = NumbaList()
+
+    for i in range(start, end):
+        while timestamps[i] > next_close_ts:
+            close_ts.append(next_close_ts)
+            close_indices.append(i - 1)
+            next_close_ts += interval_ns
+
+    return close_ts, close_indices, next_close_ts
+
+
+@njit(nogil=True)
+def _tick_bar_indexer_stream(
+        start: int,
+        end: int,
+        cum_ticks: int,
+        threshold: int
+) -> Tuple[NumbaList, int]:
+    """
+    Resumable tick bar indexer.
+
+    :param start: First buffer position to scan.
+    :param end: Buffer position to stop scanning at (exclusive).
+    :param cum_ticks: Tick count of the currently open bar.
+    :param threshold: The tick count threshold for closing a bar.
+    :returns: Buffer close indices and the tick count of the bar still open at ``end``.
+    """
+    close_indices = NumbaList()
+
+    for i in range(start, end):
+        cum_ticks += 1
+        if cum_ticks >= threshold:
+            close_indices.append(i)
+            cum_ticks = 0
+
+    return close_indices, cum_ticks
+
+
+@njit(nogil=True)
+def _volume_bar_indexer_stream(
+        volumes: NDArray[np.float64],
+        start: int,
+        end: int,
+        cum_volume: float,
+        threshold: float
+) -> Tuple[NumbaList, float]:
+    """
+    Resumable volume bar indexer.
+
+    :param volumes: Trade volumes (buffer).
+    :param start: First buffer position to scan.
+    :param end: Buffer position to stop scanning at (exclusive).
+    :param cum_volume: Cumulative volume of the currently open bar.
+    :param threshold: Volume bucket threshold for closing a bar.
+    :returns: Buffer close indices and the cumulative volume of the bar still open at ``end``.
+    """
+    close_indices = NumbaList()
+
+    for i in range(start, end):
+        cum_volume += volumes[i]
+        if cum_volume >= threshold:
+            close_indices.append(i)
+            cum_volume = 0.
+
+    return close_indices, cum_volume
+
+
+@njit(nogil=True)
+def _dollar_bar_indexer_stream(
+        prices: NDArray[np.float64],
+        volumes: NDArray[np.float64],
+        start: int,
+        end: int,
+        cum_dollar: float,
+        threshold: float
+) -> Tuple[NumbaList, float]:
+    """
+    Resumable dollar bar indexer.
+
+    :param prices: Trade prices (buffer).
+    :param volumes: Trade volumes (buffer).
+    :param start: First buffer position to scan.
+    :param end: Buffer position to stop scanning at (exclusive).
+    :param cum_dollar: Cumulative dollar value of the currently open bar (including carry-over).
+    :param threshold: Dollar value threshold for closing a bar.
+    :returns: Buffer close indices and the cumulative dollar value carried into the bar still open at ``end``.
+    """
+    close_indices = NumbaList()
+
+    for i in range(start, end):
+        cum_dollar += prices[i] * volumes[i]
+        if cum_dollar >= threshold:
+            close_indices.append(i)
+            cum_dollar = cum_dollar - threshold
+
+    return close_indices, cum_dollar
+
+
+@njit(nogil=True)
+def _cusum_bar_indexer_stream(
+        timestamps: NDArray[np.int64],
+        prices: NDArray[np.float64],
+        sigma: NDArray[np.float64],
+        start: int,
+        end: int,
+        s_pos: float,
+        s_neg: float,
+        last_sigma: float,
+        sigma_floor: float,
+        sigma_mult: float
+) -> Tuple[NumbaList, float, float, float]:
+    """
+    Resumable CUSUM bar indexer.
+
+    :param timestamps: Timestamps of the trades (buffer).
+    :param prices: Trade prices (buffer).
+    :param sigma: Threshold vector for CUSUM aligned with the buffer (NaNs are forward filled).
+    :param start: First buffer position to scan (``start - 1`` must be a valid buffer position).
+    :param end: Buffer position to stop scanning at (exclusive).
+    :param s_pos: Positive cum-sum of the currently open bar.
+    :param s_neg: Negative cum-sum of the currently open bar.
+    :param last_sigma: Last non-NaN sigma value seen so far.
+    :param sigma_floor: Minimum value for sigma to avoid division by zero.
+    :param sigma_mult: sigma multiplier for the CUSUM filter.
+    :returns: Buffer close indices and the updated (s_pos, s_neg, last_sigma) state.
+
+    .. note::
+        A bar cannot close inside a block of trades sharing a timestamp. The look-ahead may read past ``end``,
+        so the caller should never end a scan inside such a block unless the buffer is final.
+    """
+    n = len(prices)
+    close_indices = NumbaList()
+
+    for i in range(start, end):
+        if not np.isnan(sigma[i]):
+            last_sigma = sigma[i]
+
+        ret = np.log(prices[i] / prices[i - 1])
+        s_pos = max(0.0, s_pos + ret)
+        s_neg = min(0.0, s_neg + ret)
+
+        if i + 1 < n and timestamps[i] == timestamps[i + 1]:
+            continue
+
+        lam = max(float(sigma_mult * last_sigma), sigma_floor)
+        if s_pos >= lam:
+            close_indices.append(i)
+            s_pos = 0.0
+        elif s_neg <= -lam:
+            close_indices.append(i)
+            s_neg = 0.0
+
+    return close_indices, s_pos, s_neg, last_sigma
+
+
+# --------------------------------------------------------------------------------------------
+# COMPACT TIMESTAMP INDEXERS
+# --------------------------------------------------------------------------------------------
+# Timestamps of :class:`afmlkit.bar.data_model.CompactTradesData` are stored as one int64 base (ns) per block of
+# 2**COMPACT_BLOCK_SHIFT trades and a uint32 offset per trade (in units of ts_unit_ns):
+#     timestamp[i] = ts_base[i >> COMPACT_BLOCK_SHIFT] + ts_delta[i] * ts_unit_ns
+# The threshold indexers above only read prices and volumes, so they take the compact columns as they are.
+
+@njit(nogil=True)
+def _decode_timestamps(
+        ts_base: NDArray[np.int64],
+        ts_delta: NDArray[np.uint32],
+        ts_unit_ns: int,
+        indices: NDArray[np.int64]
+) -> NDArray[np.int64]:
+    """
+    Decode the compact timestamps at the given trade indices.
+
+    :param ts_base: Block base timestamps in nanoseconds.
+    :param ts_delta: Per trade offsets from the block base in ts_unit_ns units.
+    :param ts_unit_ns: Offset unit in nanoseconds.
+    :param indices: Trade indices to decode.
+    :returns: Timestamps in nanoseconds.
+    """
+    out = np.empty(len(indices), dtype=np.int64)
+    for k in range(len(indices)):
+        i = indices[k]
+        out[k] = ts_base[i >> COMPACT_BLOCK_SHIFT] + np.int64(ts_delta[i]) * ts_unit_ns
+
+    return out
+
+
+@njit(nogil=True)
+def _time_bar_indexer_compact(
+        ts_base: NDArray[np.int64],
+        ts_delta: NDArray[np.uint32],
+        ts_unit_ns: int,
+        interval_seconds: float
+) -> Tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """
+    Time bar indexer on compact timestamps, equivalent to :func:`_time_bar_indexer` on the decoded timestamps.
+    The bar clock is merged with the trades in a single scan without decoding the timestamp array.
+
+    :param ts_base: Block base timestamps in nanoseconds.
+    :param ts_delta: Per trade offsets from the block base in ts_unit_ns units.
+    :param ts_unit_ns: Offset unit in nanoseconds.
+    :param interval_seconds: Length of the time bar in seconds.
+    :returns: A tuple of:
+        - bar_close_ts: Timestamps at which each bar closes.
+        - bar_close_indices: Indices in the trade data corresponding to bar closings.
+    """
+    n = len(ts_delta)
+    ends = np.array([0, n - 1], dtype=np.int64)
+    bar_clock = _time_bar_clock(_decode_timestamps(ts_base, ts_delta, ts_unit_ns, ends), interval_seconds)
+
+    # Index of the last trade at or before each clock tick (searchsorted right - 1)
+    bar_close_indices = np.empty(len(bar_clock), dtype=np.int64)
+    j = 0
+    for k in range(len(bar_clock)):
+        while j < n and ts_base[j >> COMPACT_BLOCK_SHIFT] + np.int64(ts_delta[j]) * ts_unit_ns <= bar_clock[k]:
+            j += 1
+        bar_close_indices[k] = j - 1
+
+    return bar_clock, bar_close_indices
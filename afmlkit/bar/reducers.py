@@ -0,0 +1,192 @@
+"""
+This module contains the machinery to run user-defined intrabar reducers (custom per-bar statistics) in one parallel
+pass over the bars, and a few built-in reducers.
+
+A reducer is a numba compiled function with the signature::
+
+    reducer(timestamps, prices, volumes, sides, out) -> None
+
+It receives the trades of one bar (1D array slices, bar open exclusive, bar close inclusive) and writes its
+statistics into ``out``, a float64 array with one element per output column (pre-filled with NaN).
+Reducers are only called for bars with at least one trade.
+With JIT disabled (``NUMBA_DISABLE_JIT=1``) reducers may be plain Python functions, applied bar by bar in Python.
+"""
+from functools import lru_cache
+from typing import Callable, Sequence, Tuple
+import numpy as np
+from numba import config, njit, prange
+from numba.core.dispatcher import Dispatcher
+from numpy.typing import NDArray
+
+# Number of compiled bar kernels (one per reducer combination) kept alive
+KERNEL_CACHE_SIZE = 32
+
+
+def check_reducer(reducer: Callable) -> None:
+    """
+    Check that a reducer can be run by :func:`comp_bar_reducers`.
+
+    :param reducer: The reducer.
+    :raises TypeError: If the reducer is not a numba compiled function (or not callable, with JIT disabled).
+    """
+    if config.DISABLE_JIT:
+        if not callable(reducer):
+            raise TypeError(f"Reducer {reducer!r} must be callable.")
+    elif not isinstance(reducer, Dispatcher):
+        raise TypeError(f"Reducer {reducer!r} must be a numba compiled (@njit) function.")
+
+
+@njit(nogil=True)
+def _apply_none(timestamps, prices, volumes, sides, out):
+    pass
+
+
+def _link_reducer(reducer: Callable, rest: Callable, offset: int, width: int) -> Callable:
+    """
+    Compile a function that applies ``reducer`` to its ``out`` columns, then the ``rest`` of the reducer chain.
+    """
+    @njit(nogil=True)
+    def apply(timestamps, prices, volumes, sides, out):
+        reducer(timestamps, prices, volumes, sides, out[offset:offset + width])
+        rest(timestamps, prices, volumes, sides, out)
+
+    return apply
+
+
+@lru_cache(maxsize=KERNEL_CACHE_SIZE)
+def _make_bar_kernel(reducers: Tuple[Tuple[Callable, int], ...]) -> Callable:
+    """
+    Compile the parallel bar kernel applying all reducers to each bar.
+
+    :param reducers: Tuple of (reducer, number of output columns) pairs.
+    :returns: The compiled kernel.
+    """
+    apply = _apply_none
+    offset = sum(width for _, width in reducers)
+    for reducer, width in reversed(reducers):
+        offset -= width
+        apply = _link_reducer(reducer, apply, offset, width)
+
+    @njit(nogil=True, parallel=True)
+    def kernel(timestamps, prices, volumes, sides, bar_close_indices, n_cols):
+        n_bars = len(bar_close_indices) - 1
+        block = np.full((n_bars, n_cols), np.nan)
+        for i in prange(n_bars):
+            start = bar_close_indices[i] + 1  # Start from the next trade (start=previous bar close)
+            end = bar_close_indices[i + 1] + 1  # End inclusive
+            if end > start:
+                apply(timestamps[start:end], prices[start:end], volumes[start:end], sides[start:end], block[i])
+        return block
+
+    return kernel
+
+
+def _apply_reducers_py(
+        timestamps: NDArray[np.int64],
+        prices: NDArray[np.float64],
+        volumes: NDArray[np.float64],
+        sides: NDArray[np.int8],
+        bar_close_indices: NDArray[np.int64],
+        reducers: Tuple[Tuple[Callable, int], ...],
+        n_cols: int
+) -> NDArray[np.float64]:
+    """
+    Python counterpart of the compiled bar kernel (see :func:`_make_bar_kernel`), used with JIT disabled.
+    """
+    n_bars = len(bar_close_indices) - 1
+    block = np.full((n_bars, n_cols), np.nan)
+    for i in range(n_bars):
+        start = bar_close_indices[i] + 1  # Start from the next trade (start=previous bar close)
+        end = bar_close_indices[i + 1] + 1  # End inclusive
+        if end > start:
+            offset = 0
+            for reducer, width in reducers:
+                reducer(timestamps[start:end], prices[start:end], volumes[start:end], sides[start:end],
+                        block[i, offset:offset + width])
+                offset += width
+    return block
+
+
+def comp_bar_reducers(
+        timestamps: NDArray[np.int64],
+        prices: NDArray[np.float64],
+        volumes: NDArray[np.float64],
+        sides: NDArray[np.int8],
+        bar_close_indices: NDArray[np.int64],
+        reducers: Sequence[Tuple[Callable, int]]
+) -> NDArray[np.float64]:
+    """
+    Apply intrabar reducers to the trades of each bar in a single parallel pass.
+    The kernel is compiled once per reducer combination and cached (for the last :data:`KERNEL_CACHE_SIZE`
+    combinations).
+
+    :param timestamps: Raw trade timestamps.
+    :param prices: Trade prices.
+    :param volumes: Trade volumes.
+    :param sides: Trade direction (1 for market buy, -1 for market sell).
+    :param bar_close_indices: Indices marking the end of each bar.
+    :param reducers: Sequence of (reducer, number of output columns) pairs.
+    :returns: Array of shape (n_bars, total number of output columns), the reducer outputs side by side.
+    :raises TypeError: If a reducer is not a numba compiled function (see :func:`check_reducer`).
+    """
+    reducers = tuple((reducer, int(width)) for reducer, width in reducers)
+    for reducer, _ in reducers:
+        check_reducer(reducer)
+
+    n_cols = sum(width for _, width in reducers)
+    if config.DISABLE_JIT:
+        return _apply_reducers_py(timestamps, prices, volumes, sides, bar_close_indices, reducers, n_cols)
+    return _make_bar_kernel(reducers)(timestamps, prices, volumes, sides, bar_close_indices, n_cols)
+
+
+# --------------------------------------------------------------------------------------------
+# BUILT-IN REDUCERS
+# --------------------------------------------------------------------------------------------
+
+@njit(nogil=True)
+def kyle_lambda(timestamps, prices, volumes, sides, out):
+    """
+    Kyle's lambda of the bar: OLS slope of the trade-to-trade price changes on the signed trade volumes.
+    Output columns: ``[kyle_lambda]``. NaN if the bar has fewer than 3 trades or no signed volume variation.
+    """
+    n = len(prices) - 1
+    if n < 2:
+        return
+    mean_x, mean_y = 0.0, 0.0
+    for j in range(1, n + 1):
+        mean_x += sides[j] * volumes[j]
+        mean_y += prices[j] - prices[j - 1]
+    mean_x /= n
+    mean_y /= n
+
+    cov, var = 0.0, 0.0
+    for j in range(1, n + 1):
+        dx = sides[j] * volumes[j] - mean_x
+        cov += dx * (prices[j] - prices[j - 1] - mean_y)
+        var += dx * dx
+    if var > 0:
+        out[0] = cov / var
+
+
+@njit(nogil=True)
+def vwap_dispersion(timestamps, prices, volumes, sides, out):
+    """
+    Volume weighted standard deviation of the trade prices around the bar VWAP.
+    Output columns: ``[vwap_std]``. NaN if the bar has no volume.
+    """
+    total_volume = volumes.sum()
+    if total_volume <= 0:
+        return
+    vwap = np.sum(prices * volumes) / total_volume
+    out[0] = np.sqrt(np.sum(volumes * (prices - vwap) ** 2) / total_volume)
+
+
+@njit(nogil=True)
+def trade_size_quartiles(timestamps, prices, volumes, sides, out):
+    """
+    Quartiles of the trade sizes in the bar.
+    Output columns: ``[size_q25, size_q50, size_q75]``.
+    """
+    out[0] = np.percentile(volumes, 25)
+    out[1] = np.percentile(volumes, 50)
+    out[2] = np.percentile(volumes, 75)
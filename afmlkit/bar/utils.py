@@ -1,5 +1,6 @@
 from typing import Literal
-from numba import njit, prange
+from numba import njit, prange, types
+from numba.typed import List as NumbaList
 from numpy.typing import NDArray
 import numpy as np
 import pandas as pd
@@ -327,3 +328,192 @@ def merge_split_trades(
             merged_prices,
             merged_amounts,
             merged_side if with_side else np.empty(0, dtype=np.int8))
+
+
+@njit(nogil=True)
+def _heap_less(heap_ids, heap_parts, a, b) -> bool:
+    """
+    Order of the k-way merge heap entries: by trade id, then by partition (keeps the first partition's duplicate).
+    """
+    return heap_ids[a] < heap_ids[b] or (heap_ids[a] == heap_ids[b] and heap_parts[a] < heap_parts[b])
+
+
+@njit(nogil=True)
+def _heap_sift_down(heap_ids, heap_parts, size, pos):
+    """
+    Restore the min-heap property from ``pos`` downwards.
+    """
+    while True:
+        smallest = pos
+        left, right = 2 * pos + 1, 2 * pos + 2
+        if left < size and _heap_less(heap_ids, heap_parts, left, smallest):
+            smallest = left
+        if right < size and _heap_less(heap_ids, heap_parts, right, smallest):
+            smallest = right
+        if smallest == pos:
+            return
+        heap_ids[pos], heap_ids[smallest] = heap_ids[smallest], heap_ids[pos]
+        heap_parts[pos], heap_parts[smallest] = heap_parts[smallest], heap_parts[pos]
+        pos = smallest
+
+
+@njit(nogil=True)
+def merge_trade_partitions(
+        ids: NDArray[np.int64],
+        timestamps: NDArray[np.int64],
+        offsets: NDArray[np.int64]
+) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64], NDArray[np.int64], NDArray[np.int64], int, bool]:
+    """
+    K-way merge of trade partitions pre-sorted by trade id, removing duplicate ids and collecting the id gaps in the
+    same pass.
+
+    :param ids: Trade ids of the concatenated partitions, each partition sorted by id.
+    :param timestamps: Trade timestamps (ns) aligned with ids.
+    :param offsets: Partition boundaries (k + 1 elements): partition p is ``offsets[p]:offsets[p + 1]``.
+    :return: a tuple of:
+        1. order: indices of the merged, deduplicated trades in the input arrays (id order, first occurrence kept)
+        2. gap_start_ids: last trade id before each gap
+        3. gap_end_ids: first trade id after each gap
+        4. gap_pre_ts: timestamp of the trade before each gap
+        5. gap_post_ts: timestamp of the trade after each gap
+        6. n_duplicates: number of removed duplicate trades
+        7. ts_sorted: whether the merged trades are also sorted by timestamp
+    """
+    k = len(offsets) - 1
+    heap_ids = np.empty(k, dtype=np.int64)
+    heap_parts = np.empty(k, dtype=np.int64)
+    heads = offsets[:-1].copy()
+
+    # Heapify the first trade of each non-empty partition
+    size = 0
+    for p in range(k):
+        if offsets[p] < offsets[p + 1]:
+            heap_ids[size] = ids[offsets[p]]
+            heap_parts[size] = p
+            size += 1
+    for pos in range(size // 2 - 1, -1, -1):
+        _heap_sift_down(heap_ids, heap_parts, size, pos)
+
+    order = np.empty(len(ids), dtype=np.int64)
+    gap_start_ids = NumbaList.empty_list(types.int64)
+    gap_end_ids = NumbaList.empty_list(types.int64)
+    gap_pre_ts = NumbaList.empty_list(types.int64)
+    gap_post_ts = NumbaList.empty_list(types.int64)
+
+    n_out = 0
+    n_duplicates = 0
+    ts_sorted = True
+    while size > 0:
+        p = heap_parts[0]
+        i = heads[p]
+        heads[p] += 1
+
+        # Advance the partition head (or drop the exhausted partition) and restore the heap
+        if heads[p] < offsets[p + 1]:
+            heap_ids[0] = ids[heads[p]]
+        else:
+            size -= 1
+            heap_ids[0] = heap_ids[size]
+            heap_parts[0] = heap_parts[size]
+        _heap_sift_down(heap_ids, heap_parts, size, 0)
+
+        if n_out > 0:
+            prev = order[n_out - 1]
+            if ids[i] == ids[prev]:
+                n_duplicates += 1
+                continue
+            if ids[i] - ids[prev] > 1:
+                gap_start_ids.append(ids[prev])
+                gap_end_ids.append(ids[i])
+                gap_pre_ts.append(timestamps[prev])
+                gap_post_ts.append(timestamps[i])
+            if timestamps[i] < timestamps[prev]:
+                ts_sorted = False
+        order[n_out] = i
+        n_out += 1
+
+    n_gaps = len(gap_start_ids)
+    gaps = np.empty((4, n_gaps), dtype=np.int64)
+    for g in range(n_gaps):
+        gaps[0, g] = gap_start_ids[g]
+        gaps[1, g] = gap_end_ids[g]
+        gaps[2, g] = gap_pre_ts[g]
+        gaps[3, g] = gap_post_ts[g]
+
+    return order[:n_out], gaps[0], gaps[1], gaps[2], gaps[3], n_duplicates, ts_sorted
+
+
+@njit(nogil=True, parallel=True)
+def resample_bars(
+        bounds: NDArray[np.int64],
+        open_: NDArray[np.float64],
+        high: NDArray[np.float64],
+        low: NDArray[np.float64],
+        close: NDArray[np.float64],
+        volume: NDArray[np.float64],
+        trades: NDArray[np.int64],
+        vwap: NDArray[np.float64],
+        median_trade_size: NDArray[np.float64]
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64], NDArray[np.float64],
+           NDArray[np.float64], NDArray[np.int64], NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Segmented reduction of consecutive time bars into coarser bars in one pass over the bucket boundaries.
+    NaN inputs are skipped like in the pandas groupby aggregations (first/max/min/last/sum).
+
+    :param bounds: Bucket boundaries (n_buckets + 1 elements): bucket b holds the bars ``bounds[b]:bounds[b + 1]``.
+    :param open_: Bar open prices.
+    :param high: Bar high prices.
+    :param low: Bar low prices.
+    :param close: Bar close prices.
+    :param volume: Bar volumes.
+    :param trades: Number of trades in each bar.
+    :param vwap: Bar volume-weighted average prices.
+    :param median_trade_size: Bar median trade sizes.
+    :return: a tuple of the bucket open, high, low, close, volume, trades, vwap (NaN without volume) and the
+        median of the bar median trade sizes weighted by their number of trades.
+    """
+    n = len(bounds) - 1
+    out_open = np.full(n, np.nan)
+    out_high = np.full(n, np.nan)
+    out_low = np.full(n, np.nan)
+    out_close = np.full(n, np.nan)
+    out_volume = np.zeros(n, dtype=np.float64)
+    out_trades = np.zeros(n, dtype=np.int64)
+    out_vwap = np.full(n, np.nan)
+    out_median = np.full(n, np.nan)
+
+    for b in prange(n):
+        start, end = bounds[b], bounds[b + 1]
+        total_volume, total_dollar, total_trades = 0.0, 0.0, 0
+        for j in range(start, end):
+            if np.isnan(out_open[b]):
+                out_open[b] = open_[j]
+            if not np.isnan(close[j]):
+                out_close[b] = close[j]
+            if not np.isnan(high[j]) and (np.isnan(out_high[b]) or high[j] > out_high[b]):
+                out_high[b] = high[j]
+            if not np.isnan(low[j]) and (np.isnan(out_low[b]) or low[j] < out_low[b]):
+                out_low[b] = low[j]
+            if not np.isnan(volume[j]):
+                total_volume += volume[j]
+                if not np.isnan(vwap[j]):
+                    total_dollar += vwap[j] * volume[j]
+            total_trades += trades[j]
+        out_volume[b] = total_volume
+        out_trades[b] = total_trades
+        if total_volume != 0:
+            out_vwap[b] = total_dollar / total_volume
+
+        if end > start:
+            # Volume-weighted median: first sorted size whose cumulative trade count reaches half of the total
+            order = np.argsort(median_trade_size[start:end]) + start
+            cutoff = total_trades * 0.5
+            cum_w = 0.0
+            out_median[b] = median_trade_size[order[-1]]
+            for j in order:
+                cum_w += trades[j]
+                if cum_w >= cutoff:
+                    out_median[b] = median_trade_size[j]
+                    break
+
+    return out_open, out_high, out_low, out_close, out_volume, out_trades, out_vwap, out_median
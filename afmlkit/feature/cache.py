@@ -0,0 +1,251 @@
+"""
+Content-addressed on-disk cache of computed feature columns.
+
+:meth:`afmlkit.feature.kit.FeatureKit.build` recomputes every feature on each run, even when only one transform
+changed. With a :class:`FeatureCache`, the output columns of each feature are saved to a local directory under a key
+hashing what determines them:
+
+- the canonical config of the feature's transform tree (:func:`afmlkit.feature.utils.transform_fingerprint`)
+- the afmlkit version and the sources of the feature package (:func:`code_version`), so that fixing a transform or a
+  kernel invalidates the columns it computed
+- the computational backend
+- the fingerprint of the input index (the time range)
+- the fingerprint of every column the feature reads (columns produced by earlier features of the build are
+  identified by the key of their producer, so a change propagates to all the features depending on it)
+
+Later builds load the columns of unchanged features instead of computing them. Each entry is a JSON metadata file
+and one ``.npy`` file per output column. Entries beyond the byte budget are evicted in least recently used order.
+"""
+import functools
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Any, Union
+
+import numpy as np
+import pandas as pd
+
+from afmlkit.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+_CACHE_VERSION = 1
+
+
+def column_fingerprint(values: Union[pd.Series, pd.Index]) -> str:
+    """
+    :param values: Column (or index) values.
+    :returns: Hex digest of the values and their dtype.
+    """
+    h = hashlib.blake2b(digest_size=20)
+    h.update(str(values.dtype).encode())
+    arr = values.to_numpy() if not isinstance(values, pd.DatetimeIndex) else values.asi8
+    if arr.dtype == object:
+        arr = pd.util.hash_array(arr)
+    h.update(np.ascontiguousarray(arr).view(np.uint8).ravel())
+    return h.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def code_version() -> str:
+    """
+    :returns: The afmlkit version and the hex digest of the sources of the feature package (transforms and kernels).
+    """
+    from afmlkit import __version__
+
+    h = hashlib.sha256()
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    for root, dirs, files in os.walk(package_dir):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        for name in sorted(files):
+            if name.endswith(".py"):
+                path = os.path.join(root, name)
+                h.update(os.path.relpath(path, package_dir).encode())
+                with open(path, "rb") as f:
+                    h.update(f.read())
+    return f"{__version__}-{h.hexdigest()}"
+
+
+def feature_key(transform_fp: str, backend: str, index_fp: str, input_fps: Dict[str, str]) -> str:
+    """
+    :param transform_fp: Fingerprint of the transform tree.
+    :param backend: Computational backend.
+    :param index_fp: Fingerprint of the input index.
+    :param input_fps: Fingerprint of each input column read by the feature.
+    :returns: Cache key of the feature outputs.
+    """
+    content = [_CACHE_VERSION, code_version(), transform_fp, backend, index_fp, sorted(input_fps.items())]
+    return hashlib.sha256(json.dumps(content).encode()).hexdigest()
+
+
+class FeatureCache:
+    """
+    Thread-safe on-disk cache of feature output columns, evicting the least recently used entries beyond a byte budget.
+
+    :param cache_dir: Cache directory (created if missing).
+    :param max_bytes: Byte budget of the cached columns. Default 4 GiB.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 4 * 2**30):
+        self.cache_dir = cache_dir
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self._entries: "OrderedDict[str, int]" = self._scan()
+        self._nbytes = sum(self._entries.values())
+
+    def _scan(self) -> "OrderedDict[str, int]":
+        """Entries of the directory (key -> bytes), from the least to the most recently used."""
+        entries = []
+        for item in os.scandir(self.cache_dir):
+            if not item.name.endswith(".json"):
+                continue
+            try:
+                with open(item.path) as f:
+                    meta = json.load(f)
+                entries.append((item.stat().st_mtime_ns, item.name[:-5], int(meta["nbytes"])))
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ignoring unreadable feature cache entry {item.path}: {str(e)}")
+        return OrderedDict((key, nbytes) for _, key, nbytes in sorted(entries))
+
+    def _meta_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _column_path(self, key: str, i: int) -> str:
+        return os.path.join(self.cache_dir, f"{key}.{i}.npy")
+
+    @staticmethod
+    def _tmp_path(path: str) -> str:
+        return f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+
+    def get(self, key: str, index: pd.Index) -> Optional[Union[pd.Series, tuple]]:
+        """
+        Load the outputs of a feature.
+
+        :param key: Cache key (see :func:`feature_key`).
+        :param index: Index of the input DataFrame.
+        :returns: The output Series (or tuple of Series for multi-output transforms), or None on a miss.
+        """
+        meta_path = self._meta_path(key)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            columns = [np.load(self._column_path(key, i)) for i in range(len(meta["names"]))]
+            if any(len(values) != len(index) for values in columns):
+                raise ValueError("Entry does not match the input index.")
+            os.utime(meta_path)
+        except (OSError, ValueError, KeyError):
+            with self._lock:
+                self.misses += 1
+                self._nbytes -= self._entries.pop(key, 0)
+            return None
+        with self._lock:
+            self.hits += 1
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        columns = [pd.Series(values, index=index, name=name) for values, name in zip(columns, meta["names"])]
+        return columns[0] if meta["kind"] == "series" else tuple(columns)
+
+    def put(self, key: str, res: Union[pd.Series, tuple], index: pd.Index) -> bool:
+        """
+        Save the outputs of a feature. Outputs that are not aligned with the input index or hold Python objects
+        are not cached.
+
+        :param key: Cache key (see :func:`feature_key`).
+        :param res: The output Series (or tuple of Series).
+        :param index: Index of the input DataFrame.
+        :returns: Whether the outputs were cached.
+        """
+        columns = [res] if isinstance(res, pd.Series) else list(res)
+        for column in columns:
+            if not isinstance(column.name, str) or column.dtype == object or not column.index.equals(index):
+                logger.debug(f"Not caching the outputs of {key}: not aligned, unnamed or not numeric.")
+                return False
+
+        nbytes = 0
+        for i, column in enumerate(columns):
+            path = self._column_path(key, i)
+            with open(self._tmp_path(path), "wb") as f:
+                np.save(f, column.to_numpy())
+            os.replace(self._tmp_path(path), path)
+            nbytes += os.path.getsize(path)
+        meta = {
+            "kind": "series" if isinstance(res, pd.Series) else "tuple",
+            "names": [column.name for column in columns],
+            "nbytes": nbytes,
+            "length": len(index),
+            "start": str(index[0]) if len(index) else None,
+            "end": str(index[-1]) if len(index) else None,
+        }
+        # The metadata file is written last: it commits the entry
+        meta_path = self._meta_path(key)
+        with open(self._tmp_path(meta_path), "w") as f:
+            json.dump(meta, f)
+        os.replace(self._tmp_path(meta_path), meta_path)
+
+        with self._lock:
+            self.writes += 1
+            self._nbytes += nbytes - self._entries.pop(key, 0)
+            self._entries[key] = nbytes
+            self._evict()
+        return True
+
+    def _evict(self) -> None:
+        while self._entries and self._nbytes > self.max_bytes:
+            key, nbytes = self._entries.popitem(last=False)
+            self._remove(key)
+            self._nbytes -= nbytes
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        paths = [self._meta_path(key)]  # Uncommit the entry first
+        paths += [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)
+                  if name.startswith(f"{key}.") and name.endswith(".npy")]
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def clear(self) -> None:
+        """
+        Delete all entries and reset the counters.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+            self._entries.clear()
+            self._nbytes = 0
+            self.hits = self.misses = self.writes = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        :returns: Dict with the hits, misses, writes, evictions, number of entries, cached bytes and byte budget.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "nbytes": self._nbytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def report(self) -> str:
+        """
+        :returns: One-line summary of :meth:`stats`.
+        """
+        s = self.stats()
+        lookups = s["hits"] + s["misses"]
+        hit_rate = f"{s['hits'] / lookups:.0%}" if lookups else "n/a"
+        return (f"Feature cache {self.cache_dir}: {s['hits']} hits, {s['misses']} misses ({hit_rate} hit rate), "
+                f"{s['writes']} writes, {s['evictions']} evictions, {s['entries']} entries, "
+                f"{s['nbytes'] / 2**20:.1f} / {s['max_bytes'] / 2**20:.1f} MiB")
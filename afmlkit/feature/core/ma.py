@@ -21,26 +21,44 @@ def ewma(y: NDArray, span: int) -> NDArray[np.float64]:
         This function adjusts for small sample sizes by dividing by the cumulative weight.
         For more information, see: https://terbe.dev/blog/posts/exponentially-weighted-moving-average
     """
-    n = y.shape[0]
-    ewma = np.empty(n, dtype=np.float64)  # Container for the EWMA values
+    return ewma_resume(y, span, np.zeros(3, dtype=np.float64))
+
+
+@njit(nogil=True)
+def ewma_resume(y: NDArray, span: int, state: NDArray[np.float64]) -> NDArray[np.float64]:
+    """
+    Continue :func:`ewma` over new values of the series. :func:`ewma` is this kernel started from a zero state, so the
+    outputs are bit-for-bit equal to running :func:`ewma` over the whole series.
 
-    # If span is less than 1, raise an error
+    :param y: The new values.
+    :param span: The decay window, or 'span'.
+    :param state: Array of (number of values seen, numerator, denominator), zeros for an empty series. Updated in place.
+    :returns: The EWMA of the new values.
+    """
+    n = y.shape[0]
+    out = np.empty(n, dtype=np.float64)
     if span < 1:
         raise ValueError("span size is less than or equal to 1. Please provide a span size greater than 1.")
 
     alpha = 2.0 / (span + 1.0)
-    u_t = y[0]  # Initial value for numerator
-    v_t = 1.0   # Initial value for denominator
-    ewma[0] = u_t / v_t
-
-    for t in range(1, n):
-        # Update the numerator and denominator
+    u_t = state[1]
+    v_t = state[2]
+    start = 0
+    if state[0] == 0 and n > 0:
+        u_t = y[0]
+        v_t = 1.0
+        out[0] = u_t / v_t
+        start = 1
+
+    for t in range(start, n):
         u_t = y[t] + (1.0 - alpha) * u_t
         v_t = 1.0 + (1.0 - alpha) * v_t
-        # Calculate the EWMA
-        ewma[t] = u_t / v_t
+        out[t] = u_t / v_t
 
-    return ewma
+    state[0] += n
+    state[1] = u_t
+    state[2] = v_t
+    return out
 
 
 @njit(nogil=True, parallel=True)
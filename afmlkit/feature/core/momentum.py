@@ -30,38 +30,56 @@ def rsi_wilder(close: NDArray[np.float64], window: int) -> NDArray[np.float64]:
     :param window: The number of periods to use for the RSI calculation, default is 14.
     :return: A one-dimensional numpy array of RSI values, same length as `close`.
     """
-    n = close.size
-    out = np.empty(n, np.float64)
-    out[:window] = np.nan
-
-    if n <= window:
-        return out                      # not enough data
-
-    # ----- first window (indices 1 … window) -----
-    sum_gain = 0.0
-    sum_loss = 0.0
-    for i in range(1, window + 1):
-        diff = close[i] - close[i - 1]
-        if diff > 0.0:
-            sum_gain += diff
-        else:
-            sum_loss += -diff
-
-    avg_gain = sum_gain / window
-    avg_loss = sum_loss / window
-    out[window] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss) if avg_loss > 0 else np.nan
-
-    # ----- Wilder smoothing -----
-    for i in range(window + 1, n):
-        diff = close[i] - close[i - 1]
-        gain = diff if diff > 0.0 else 0.0
-        loss = -diff if diff < 0.0 else 0.0
-
-        avg_gain = ((window - 1) * avg_gain + gain) / window
-        avg_loss = ((window - 1) * avg_loss + loss) / window
+    return rsi_wilder_resume(close, window, np.zeros(6, dtype=np.float64))
 
-        out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss) if avg_loss > 0 else np.nan
 
+@njit(nogil=True)
+def rsi_wilder_resume(close: NDArray[np.float64], window: int, state: NDArray[np.float64]) -> NDArray[np.float64]:
+    """
+    Continue :func:`rsi_wilder` over new closing prices. :func:`rsi_wilder` is this kernel started from a zero state,
+    so the outputs are bit-for-bit equal to running :func:`rsi_wilder` over the whole series.
+
+    :param close: The new closing prices.
+    :param window: The number of periods to use for the RSI calculation.
+    :param state: Array of (number of prices seen, previous close, gain sum, loss sum, average gain, average loss),
+        zeros for an empty series. Updated in place.
+    :return: The RSI values of the new prices.
+    """
+    n = close.size
+    out = np.empty(n, np.float64)
+    seen = int(state[0])
+    prev = state[1]
+    sum_gain, sum_loss, avg_gain, avg_loss = state[2], state[3], state[4], state[5]
+
+    for k in range(n):
+        i = seen + k
+        out[k] = np.nan
+        if i > 0:
+            diff = close[k] - prev
+            if i <= window:
+                # ----- first window (indices 1 … window) -----
+                if diff > 0.0:
+                    sum_gain += diff
+                else:
+                    sum_loss += -diff
+                if i == window:
+                    avg_gain = sum_gain / window
+                    avg_loss = sum_loss / window
+                    out[k] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss) if avg_loss > 0 else np.nan
+            else:
+                # ----- Wilder smoothing -----
+                gain = diff if diff > 0.0 else 0.0
+                loss = -diff if diff < 0.0 else 0.0
+
+                avg_gain = ((window - 1) * avg_gain + gain) / window
+                avg_loss = ((window - 1) * avg_loss + loss) / window
+
+                out[k] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss) if avg_loss > 0 else np.nan
+        prev = close[k]
+
+    state[0] = seen + n
+    state[1] = prev
+    state[2], state[3], state[4], state[5] = sum_gain, sum_loss, avg_gain, avg_loss
     return out
 
 
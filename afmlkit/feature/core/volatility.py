@@ -160,29 +160,51 @@ def ewmst(
       var_t    = var_raw * (V / denom)
       σ_t      = sqrt(max(var_t, 0))
     """
+    return ewmst_resume(timestamps, y, half_life, np.zeros(5, dtype=np.float64), np.zeros(1, dtype=np.int64),
+                        sigma_floor)
+
+
+@njit(nogil=True)
+def ewmst_resume(
+    timestamps: NDArray[np.int64],
+    y:          NDArray[np.float64],
+    half_life:  float,
+    state:      NDArray[np.float64],
+    last_ts:    NDArray[np.int64],
+    sigma_floor: float = 1e-12
+) -> NDArray[np.float64]:
+    """
+    Continue :func:`ewmst` over new observations. :func:`ewmst` is this kernel started from a zero state, so the
+    outputs are bit-for-bit equal to running :func:`ewmst` over the whole series.
+
+    :param timestamps: Timestamps of the new observations in nanoseconds.
+    :param y:          The new observations.
+    :param half_life:  Decay half-life in seconds.
+    :param state:      Array of (number of observations seen, V, V2, Sy, Syy), zeros for an empty series.
+        Updated in place.
+    :param last_ts:    One-element array with the last timestamp seen. Updated in place.
+    :param sigma_floor: Minimum σ to enforce stability.
+    :returns:          EWMA standard deviation of the new observations.
+    """
     n = y.shape[0]
     out = np.empty(n, np.float64)
-    if n == 0:
-        return out
+    V, V2, Sy, Syy = state[1], state[2], state[3], state[4]
 
-    # Initialize
-    V   = 0.0    # sum of weights
-    V2  = 0.0    # sum of squared weights
-    Sy  = 0.0    # EWMA sum of y
-    Syy = 0.0    # EWMA sum of y^2
-    last_ts = timestamps[0]
-    out[0] = np.nan
+    for k in range(n):
+        if state[0] + k == 0:
+            last_ts[0] = timestamps[0]
+            out[0] = np.nan
+            continue
 
-    for i in range(1, n):
         # time delta in seconds
-        dt = (timestamps[i] - last_ts) / 1e9
-        last_ts = timestamps[i]
+        dt = (timestamps[k] - last_ts[0]) / 1e9
+        last_ts[0] = timestamps[k]
 
         # decay factor
         alpha = 1.0 - np.exp(-dt / half_life)
         one_minus = 1.0 - alpha
 
-        yi = y[i]
+        yi = y[k]
 
         # update weight sums
         V  = alpha       + one_minus * V
@@ -190,19 +212,16 @@ def ewmst(
 
         # update EWMA sums
         if np.isnan(yi):
-            # decay only
             Sy  = one_minus * Sy
             Syy = one_minus * Syy
         else:
             Sy  = alpha * yi        + one_minus * Sy
             Syy = alpha * yi * yi   + one_minus * Syy
 
-        # compute mean & raw variance
         if V > 0.0:
             mean   = Sy  / V
             ewma_y2= Syy / V
             var_raw= ewma_y2 - mean*mean
-            # bias correction
             denom = V - (V2 / V) if V > 0.0 else 0.0
             if denom > 0.0 and var_raw > 0.0:
                 var = var_raw * (V / denom)
@@ -212,10 +231,12 @@ def ewmst(
             sigma = np.sqrt(var)
             if sigma < sigma_floor:
                 sigma = sigma_floor
-            out[i] = sigma
+            out[k] = sigma
         else:
-            out[i] = np.nan
+            out[k] = np.nan
 
+    state[0] += n
+    state[1], state[2], state[3], state[4] = V, V2, Sy, Syy
     return out
 
 
@@ -371,70 +392,94 @@ def atr(high: NDArray[np.float64],
     :param normalize: bool, if True normalizes ATR by mid price (avg of high and low)
     :return: np.array, ATR values
     """
-    n = len(high)
+    return atr_resume(high, low, close, window, ema_based, normalize, np.zeros(5, dtype=np.float64),
+                      np.full(window, np.nan, dtype=np.float64))
 
-    # Calculate true range
-    tr_values = true_range(high, low, close)
 
-    # Prepare output array
-    atr_values = np.empty_like(tr_values)
-    atr_values.fill(np.nan)
-
-    if n < window:
-        return atr_values
-
-    if ema_based:
-        # First ATR is simple average
-        valid_count = 0
-        tr_sum = 0.0
-
-        for i in range(window):
-            if not np.isnan(tr_values[i]):
-                tr_sum += tr_values[i]
-                valid_count += 1
-
-        if valid_count > 0:
-            atr_values[window-1] = tr_sum / valid_count
+@njit(nogil=True)
+def atr_resume(high: NDArray[np.float64],
+               low: NDArray[np.float64],
+               close: NDArray[np.float64],
+               window: int,
+               ema_based: bool,
+               normalize: bool,
+               state: NDArray[np.float64],
+               tr_buffer: NDArray[np.float64]) -> NDArray[np.float64]:
+    """
+    Continue :func:`atr` over new bars. :func:`atr` is this kernel started from a zero state, so the outputs are
+    bit-for-bit equal to running :func:`atr` over the whole series.
 
-        # EMA-based ATR calculation: ATR_t = ((window-1) * ATR_{t-1} + TR_t) / window
-        for i in range(window, n):
-            # Skip calculation if current TR or the previous ATR is NaN
-            if np.isnan(tr_values[i]) or np.isnan(atr_values[i-1]):
-                atr_values[i] = np.nan
+    :param high: np.array, high prices of the new bars
+    :param low: np.array, low prices of the new bars
+    :param close: np.array, close prices of the new bars
+    :param window: int, lookback period
+    :param ema_based: bool, if True uses EMA calculation, if False uses SMA calculation
+    :param normalize: bool, if True normalizes ATR by mid price (avg of high and low)
+    :param state: Array of (number of bars seen, previous close, previous ATR, first window TR sum, first window
+        valid TR count), zeros for an empty series. Updated in place.
+    :param tr_buffer: Ring buffer of the last ``window`` true ranges (indexed by bar number modulo ``window``).
+        Updated in place.
+    :return: np.array, ATR values of the new bars
+    """
+    n = len(high)
+    out = np.empty(n, dtype=np.float64)
+    seen = int(state[0])
+    prev_close = state[1]
+    prev_atr = state[2]
+    tr_sum = state[3]
+    valid_count = int(state[4])
+
+    for k in range(n):
+        i = seen + k
+        # True range
+        if i == 0:
+            if np.isnan(high[k]) or np.isnan(low[k]):
+                tr = np.nan
             else:
-                atr_values[i] = ((window - 1) * atr_values[i-1] + tr_values[i]) / window
-    else:
-        # SMA-based ATR calculation
-        for i in range(window-1, n):
-            # Handle the special case for index 2 (NaN in input)
-            if i == 2 and np.isnan(high[i]) and np.isnan(low[i]) and np.isnan(close[i]):
-                atr_values[i] = np.nan
-                continue
-
-            # Get window of TR values and calculate mean of valid values
-            window_tr = tr_values[i-window+1:i+1]
-            valid_count = 0
-            tr_sum = 0.0
-
-            for j in range(window):
-                if not np.isnan(window_tr[j]):
-                    tr_sum += window_tr[j]
+                tr = high[k] - low[k]
+        elif np.isnan(high[k]) or np.isnan(low[k]) or np.isnan(prev_close):
+            tr = np.nan
+        else:
+            tr = max(high[k] - low[k],
+                     abs(high[k] - prev_close),
+                     abs(low[k] - prev_close)
+                     )
+        tr_buffer[i % window] = tr
+        prev_close = close[k]
+
+        value = np.nan
+        if ema_based:
+            if i < window:
+                if not np.isnan(tr):
+                    tr_sum += tr
                     valid_count += 1
-
-            # Store result if we have at least one valid value
-            if valid_count > 0:
-                atr_values[i] = tr_sum / valid_count
-            else:
-                atr_values[i] = np.nan
-
-    # Normalize if requested
-    if normalize:
-        mid_price = (high + low) / 2.0
-        for i in range(n):
-            if not np.isnan(atr_values[i]) and not np.isnan(mid_price[i]) and mid_price[i] > 0:
-                atr_values[i] = atr_values[i] / mid_price[i]
-
-    return atr_values
+                if i == window - 1 and valid_count > 0:
+                    value = tr_sum / valid_count
+            elif not (np.isnan(tr) or np.isnan(prev_atr)):
+                value = ((window - 1) * prev_atr + tr) / window
+            prev_atr = value
+        elif i >= window - 1 and not (i == 2 and np.isnan(high[k]) and np.isnan(low[k]) and np.isnan(close[k])):
+            window_sum = 0.0
+            window_count = 0
+            for j in range(i - window + 1, i + 1):
+                if not np.isnan(tr_buffer[j % window]):
+                    window_sum += tr_buffer[j % window]
+                    window_count += 1
+            if window_count > 0:
+                value = window_sum / window_count
+
+        if normalize:
+            mid_price = (high[k] + low[k]) / 2.0
+            if not np.isnan(value) and not np.isnan(mid_price) and mid_price > 0:
+                value = value / mid_price
+        out[k] = value
+
+    state[0] = seen + n
+    state[1] = prev_close
+    state[2] = prev_atr
+    state[3] = tr_sum
+    state[4] = valid_count
+    return out
 
 
 @njit(nogil=True)
@@ -51,7 +51,9 @@ class VolumePro:
         Compute the volume profile parameters (POC, HVA, LVA) in a rolling window fashion.
 
         :param bars: DataFrame containing dynamic bars (must include `high` and `low` columns).
-        :param fp_data: FootprintData object with price levels and volume information.
+        :param fp_data: FootprintData object with price levels and volume information. Footprints in the compressed
+            (CSR) layout (e.g., memory-mapped by :meth:`FootprintData.load_npy`) are read in place; per-bar footprints
+            are cast to NumbaLists.
         :returns: Tuple of POC, HVA, and LVA prices, and volume percentage above POC, (as NumPy arrays)
         :raises AssertionError: If `bars` and `fp_data` have different lengths.
         :note:
@@ -63,15 +65,24 @@ class VolumePro:
         # assert that bar length and footprint data length are the same
         assert len(bars) == len(fp_data.bar_timestamps), "Bars and footprint data should have the same length."
 
-        # Cast the footprint data to a numba list for numba calculations
-        fp_data.cast_to_numba_list()
+        if fp_data.is_compressed:
+            # Read the flat level arrays in place (no copy of memory-mapped footprints)
+            poc_prices, hva_prices, lva_prices, vp_pct_above_poc = volume_profile_rolling_csr(
+                fp_data.bar_timestamps, bars.high.values, bars.low.values, fp_data.offsets,
+                fp_data.price_levels, fp_data.buy_volumes, fp_data.sell_volumes,
+                window_size_sec=self.window_size_sec, n_bins=self.n_bins, price_tick=fp_data.price_tick,
+                va_pct=self.va_pct
+            )
+        else:
+            # Cast the footprint data to a numba list for numba calculations
+            fp_data.cast_to_numba_list()
 
-        poc_prices, hva_prices, lva_prices, vp_pct_above_poc = volume_profile_rolling(
-            fp_data.bar_timestamps, bars.high.values, bars.low.values,
-            fp_data.price_levels, fp_data.buy_volumes, fp_data.sell_volumes,
-            window_size_sec=self.window_size_sec, n_bins=self.n_bins, price_tick=fp_data.price_tick,
-            va_pct=self.va_pct
-        )
+            poc_prices, hva_prices, lva_prices, vp_pct_above_poc = volume_profile_rolling(
+                fp_data.bar_timestamps, bars.high.values, bars.low.values,
+                fp_data.price_levels, fp_data.buy_volumes, fp_data.sell_volumes,
+                window_size_sec=self.window_size_sec, n_bins=self.n_bins, price_tick=fp_data.price_tick,
+                va_pct=self.va_pct
+            )
 
         # Convert the prices to actual price units
         poc_prices = poc_prices * fp_data.price_tick
@@ -158,6 +169,64 @@ def aggregate_footprint(ts: np.ndarray,
     #assert len(ts) == len(highs) == len(lows) == len(price_levels) == len(buy_volumes) == len(
     #    sell_volumes) > 0, "Input arrays should have the same length and be non-empty."
 
+    start_idx, end_idx, complete_price_levels = _footprint_window(ts, highs, lows, start_ts, end_ts, price_tick)
+
+    # Initialize aligned volumes with zeros
+    aligned_buy_volumes = np.zeros(len(complete_price_levels), dtype=np.float32)
+    aligned_sell_volumes = np.zeros(len(complete_price_levels), dtype=np.float32)
+
+    # Align the volumes with the unified price levels for each bar timestamp
+    for t in range(start_idx, end_idx):
+        # Find the indices to place the volumes into the aligned arrays
+        indices = np.searchsorted(complete_price_levels, price_levels[t])
+
+        # Cumulate the volumes in the aligned arrays
+        aligned_buy_volumes[indices] += buy_volumes[t]
+        aligned_sell_volumes[indices] += sell_volumes[t]
+
+    return complete_price_levels, aligned_buy_volumes, aligned_sell_volumes
+
+
+@njit(nogil=True)
+def aggregate_footprint_csr(ts: np.ndarray,
+                            highs: np.ndarray, lows: np.ndarray,
+                            offsets: np.ndarray,
+                            price_levels: np.ndarray,
+                            buy_volumes: np.ndarray, sell_volumes: np.ndarray,
+                            start_ts: int, end_ts: int,
+                            price_tick: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    :func:`aggregate_footprint` for footprints in the compressed (CSR) layout.
+
+    :param offsets: Bar offsets: the levels of bar ``i`` are ``offsets[i]:offsets[i + 1]`` of the flat arrays.
+    :param price_levels: Flat array of the price levels of all bars.
+    :param buy_volumes: Flat array of the buy volumes of all bars.
+    :param sell_volumes: Flat array of the sell volumes of all bars.
+    :returns: Tuple of complete_price_levels, aligned_buy_volumes and aligned_sell_volumes
+        (see :func:`aggregate_footprint`).
+    """
+    start_idx, end_idx, complete_price_levels = _footprint_window(ts, highs, lows, start_ts, end_ts, price_tick)
+
+    aligned_buy_volumes = np.zeros(len(complete_price_levels), dtype=np.float32)
+    aligned_sell_volumes = np.zeros(len(complete_price_levels), dtype=np.float32)
+
+    for t in range(start_idx, end_idx):
+        first, last = offsets[t], offsets[t + 1]
+        indices = np.searchsorted(complete_price_levels, price_levels[first:last])
+        aligned_buy_volumes[indices] += buy_volumes[first:last]
+        aligned_sell_volumes[indices] += sell_volumes[first:last]
+
+    return complete_price_levels, aligned_buy_volumes, aligned_sell_volumes
+
+
+@njit(nogil=True)
+def _footprint_window(ts: np.ndarray, highs: np.ndarray, lows: np.ndarray,
+                      start_ts: int, end_ts: int, price_tick: float) -> tuple[int, int, np.ndarray]:
+    """
+    Bars of an aggregation window and the complete price levels (in price ticks) spanned by them.
+
+    :returns: Tuple of the first bar, the bar after the last one and the complete price levels.
+    """
     # Find the indices for the start and end timestamps indices for the aggregation
     start_idx = np.searchsorted(ts, start_ts)
     end_idx = np.searchsorted(ts, end_ts, side='right')
@@ -166,41 +235,17 @@ def aggregate_footprint(ts: np.ndarray,
     if start_idx == end_idx:
         start_idx = max(0, start_idx - 1)
 
-    # Select current data windows
-    high_window = highs[start_idx:end_idx]
-    low_window = lows[start_idx:end_idx]
-
-    price_levels_window = price_levels[start_idx:end_idx]
-    buy_volumes_window = buy_volumes[start_idx:end_idx]
-    sell_volumes_window = sell_volumes[start_idx:end_idx]
-    n_bars_window = len(price_levels_window)
-
     # Get minimum and maximum price levels for the current window
-    min_price_level, max_price_level = np.min(low_window), np.max(high_window)
+    min_price_level, max_price_level = np.min(lows[start_idx:end_idx]), np.max(highs[start_idx:end_idx])
 
     # Convert price to price_tick units
     min_price_level = int(round(min_price_level / price_tick))
     max_price_level = int(round(max_price_level / price_tick))
 
-    # Generate complete price levels in steps and convert back to actual price levels
+    # Generate complete price levels in steps
     complete_price_levels = np.arange(min_price_level, max_price_level + 1, dtype=np.int32)
-    n_price_levels_window = len(complete_price_levels)
-    # -----------------------------------------------------------------------------------
-
-    # Initialize aligned volumes with zeros
-    aligned_buy_volumes = np.zeros(n_price_levels_window, dtype=np.float32)
-    aligned_sell_volumes = np.zeros(n_price_levels_window, dtype=np.float32)
-
-    # Align the volumes with the unified price levels for each bar timestamp
-    for t in range(n_bars_window):
-        # Find the indices to place the volumes into the aligned arrays
-        indices = np.searchsorted(complete_price_levels, price_levels_window[t])
 
-        # Cumulate the volumes in the aligned arrays
-        aligned_buy_volumes[indices] += buy_volumes_window[t]
-        aligned_sell_volumes[indices] += sell_volumes_window[t]
-
-    return complete_price_levels, aligned_buy_volumes, aligned_sell_volumes
+    return start_idx, end_idx, complete_price_levels
 
 
 @njit(nogil=True)
@@ -435,27 +480,73 @@ def volume_profile_rolling(ts: np.ndarray, highs: np.ndarray, lows: np.ndarray,
                                                                                       start_ts, end_ts,
                                                                                       price_tick)
 
-        total_volumes = total_buy_volumes + total_sell_volumes
+        poc_prices[i], hva_prices[i], lva_prices[i], vp_pct_abv_poc[i] = _window_profile(
+            all_price_levels, total_buy_volumes + total_sell_volumes, n_bins, va_pct
+        )
 
-        # TODO: Further volume profile calculations: 1.) Volume+Delta 2.) Ticks+Delta 3.) Min/max 4.) Imbalance
-        # Bucket price levels
-        if n_bins is not None:
-            # assert price_tick is not None, "Price tick should be provided for bucketing price levels correctly..."
-            all_price_levels, total_volumes = bucket_price_levels(all_price_levels, total_volumes, n_bins)
+    return poc_prices, hva_prices, lva_prices, vp_pct_abv_poc
+
+
+@njit(nogil=True, parallel=True)
+def volume_profile_rolling_csr(ts: np.ndarray, highs: np.ndarray, lows: np.ndarray, offsets: np.ndarray,
+                               price_levels: np.ndarray, buy_volumes: np.ndarray, sell_volumes: np.ndarray,
+                               window_size_sec: float, n_bins: int = None, price_tick: float = None,
+                               va_pct: float = 68.34) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    :func:`volume_profile_rolling` for footprints in the compressed (CSR) layout, read in place.
+
+    :param offsets: Bar offsets: the levels of bar ``i`` are ``offsets[i]:offsets[i + 1]`` of the flat arrays.
+    :param price_levels: Flat array of the price levels of all bars.
+    :param buy_volumes: Flat array of the buy volumes of all bars.
+    :param sell_volumes: Flat array of the sell volumes of all bars.
+    :returns: Tuple of POC, HVA, LVA, and vp_pct_abv_poc price series aligned to input bars.
+    """
+    n_bars = len(offsets) - 1
+    assert len(ts) == len(highs) == len(lows) == n_bars > 0, "Input arrays should have the same length and be non-empty."
+
+    poc_prices = np.zeros(n_bars, dtype=np.int32)
+    hva_prices = np.zeros(n_bars, dtype=np.int32)
+    lva_prices = np.zeros(n_bars, dtype=np.int32)
+    vp_pct_abv_poc = np.zeros(n_bars, dtype=np.float32)
 
-        # Calculate the POC, HVA, and LVA
-        poc_price, hva_price, lva_price = comp_poc_hva_lva(all_price_levels, total_volumes, va_pct)
+    window_interval_ns = int(window_size_sec * 1e9)
+    first_interval_idx = np.searchsorted(ts, ts[0] + window_interval_ns)
 
-        poc_prices[i] = poc_price
-        hva_prices[i] = hva_price
-        lva_prices[i] = lva_price
+    for i in prange(first_interval_idx, n_bars):
+        end_ts = int(ts[i])
+        start_ts = int(end_ts - window_interval_ns)
 
-        # Calculate volume percentage above POC using the dedicated function
-        vp_pct_abv_poc[i] = calc_volume_percentage_above_poc(all_price_levels, total_volumes, poc_price)
+        all_price_levels, total_buy_volumes, total_sell_volumes = aggregate_footprint_csr(
+            ts, highs, lows, offsets, price_levels, buy_volumes, sell_volumes, start_ts, end_ts, price_tick
+        )
+        poc_prices[i], hva_prices[i], lva_prices[i], vp_pct_abv_poc[i] = _window_profile(
+            all_price_levels, total_buy_volumes + total_sell_volumes, n_bins, va_pct
+        )
 
     return poc_prices, hva_prices, lva_prices, vp_pct_abv_poc
 
 
+@njit(nogil=True)
+def _window_profile(all_price_levels: np.ndarray, total_volumes: np.ndarray, n_bins: int,
+                    va_pct: float) -> tuple[int, int, int, float]:
+    """
+    Volume profile statistics of an aggregation window (see :func:`volume_profile_rolling`).
+
+    :returns: Tuple of POC, HVA, LVA (in price ticks) and the volume percentage above the POC.
+    """
+    # TODO: Further volume profile calculations: 1.) Volume+Delta 2.) Ticks+Delta 3.) Min/max 4.) Imbalance
+    # Bucket price levels
+    if n_bins is not None:
+        # assert price_tick is not None, "Price tick should be provided for bucketing price levels correctly..."
+        all_price_levels, total_volumes = bucket_price_levels(all_price_levels, total_volumes, n_bins)
+
+    # Calculate the POC, HVA, and LVA
+    poc_price, hva_price, lva_price = comp_poc_hva_lva(all_price_levels, total_volumes, va_pct)
+
+    # Calculate volume percentage above POC using the dedicated function
+    return poc_price, hva_price, lva_price, calc_volume_percentage_above_poc(all_price_levels, total_volumes, poc_price)
+
+
 # ---------------------------------------
 # Developing Volume Profile Calculations
 # ---------------------------------------
@@ -0,0 +1,267 @@
+"""
+Incremental computation of transforms over append-only bars (see :meth:`afmlkit.feature.kit.FeatureKit.update`).
+
+Each transform of a feature gets a state object computing the transform for new rows only:
+
+- EWMA, EWMST, RSIWilder and ATR keep the accumulators of their numba kernels and continue them with the
+  ``*_resume`` kernels (the batch kernels are the same kernels started from a zero state)
+- SMA, Lag and Return only look back a fixed number of rows: they keep a ring buffer of the last input rows and
+  compute the transform over the buffer followed by the new rows
+- element-wise operation transforms (``+ - * /``, min/max, abs, log, clip...) and Compose pipelines combine the
+  outputs of the states of their children
+- any other transform keeps the history of its input columns and is recomputed over it
+
+The outputs are bit-for-bit equal to computing the transforms over the whole history.
+"""
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from afmlkit.utils.log import get_logger
+from .base import BaseTransform, BinaryOpTransform, ConstantOpTransform, MinMaxOpTransform, UnaryOpTransform
+from .core.ma import ewma_resume
+from .core.momentum import rsi_wilder_resume
+from .core.volatility import ewmst_resume, atr_resume
+from .transforms import EWMA, EWMST, RSIWilder, ATR, SMA, Lag, Return
+from .utils import referenced_columns, output_columns
+
+logger = get_logger(__name__)
+
+Output = Union[pd.Series, tuple]
+
+# Unary operations applied element by element (Feature.abs, Feature.log, Feature.clip...)
+_ELEMENTWISE_UNARY = ("abs", "log", "log1p", "exp", "square", "sqrt")
+
+
+class TransformState(ABC):
+    """
+    State of a transform over the rows seen so far.
+
+    :param transform: The transform.
+    :param backend: Computational backend.
+    """
+
+    def __init__(self, transform: BaseTransform, backend: str):
+        self.transform = transform
+        self.backend = backend
+
+    @abstractmethod
+    def update(self, x: pd.DataFrame) -> Output:
+        """
+        Compute the transform for new rows.
+
+        :param x: The new rows, with the columns the transform reads.
+        :returns: The outputs of the transform for the new rows.
+        """
+
+
+class RecomputeState(TransformState):
+    """
+    Keeps the history of the columns read by the transform, and recomputes the transform over it.
+    """
+
+    def __init__(self, transform: BaseTransform, backend: str):
+        super().__init__(transform, backend)
+        self.columns = referenced_columns(transform) | set(output_columns(transform))
+        self.history: Optional[pd.DataFrame] = None
+
+    def update(self, x: pd.DataFrame) -> Output:
+        new = x[[col for col in x.columns if col in self.columns]]
+        self.history = new if self.history is None else pd.concat([self.history, new])
+        res = self.transform(self.history, backend=self.backend)
+        if isinstance(res, pd.Series):
+            return res.iloc[len(res) - len(x):]
+        return tuple(item.iloc[len(item) - len(x):] for item in res)
+
+
+class WindowState(TransformState):
+    """
+    Ring buffer of the last input rows of a transform looking back a fixed number of rows.
+
+    :param lookback: Number of rows (including the current one) determining an output.
+    """
+
+    def __init__(self, transform: BaseTransform, backend: str, lookback: int):
+        super().__init__(transform, backend)
+        self.lookback = lookback
+        self.buffer: Optional[pd.DataFrame] = None
+
+    def update(self, x: pd.DataFrame) -> Output:
+        new = x[self.transform.requires]
+        frame = new if self.buffer is None else pd.concat([self.buffer, new])
+        res = self.transform(frame, backend=self.backend)
+        self.buffer = frame.iloc[len(frame) - min(len(frame), self.lookback - 1):]
+        return res.iloc[len(res) - len(x):]
+
+
+class EWMAState(TransformState):
+    def __init__(self, transform: EWMA, backend: str):
+        super().__init__(transform, backend)
+        self.state = np.zeros(3, dtype=np.float64)
+
+    def update(self, x: pd.DataFrame) -> pd.Series:
+        result = ewma_resume(self.transform._prepare_input_nb(x), self.transform.span, self.state)
+        return self.transform._prepare_output_nb(x.index, result)
+
+
+class EWMSTState(TransformState):
+    def __init__(self, transform: EWMST, backend: str):
+        super().__init__(transform, backend)
+        self.state = np.zeros(5, dtype=np.float64)
+        self.last_ts = np.zeros(1, dtype=np.int64)
+
+    def update(self, x: pd.DataFrame) -> pd.Series:
+        ts = self.transform._get_timestamps(x)
+        result = ewmst_resume(ts, self.transform._prepare_input_nb(x), self.transform.half_life_sec, self.state,
+                              self.last_ts)
+        return self.transform._prepare_output_nb(x.index, result)
+
+
+class RSIWilderState(TransformState):
+    def __init__(self, transform: RSIWilder, backend: str):
+        super().__init__(transform, backend)
+        self.state = np.zeros(6, dtype=np.float64)
+
+    def update(self, x: pd.DataFrame) -> pd.Series:
+        result = rsi_wilder_resume(self.transform._prepare_input_nb(x), self.transform.window, self.state)
+        return self.transform._prepare_output_nb(x.index, result)
+
+
+class ATRState(TransformState):
+    def __init__(self, transform: ATR, backend: str):
+        super().__init__(transform, backend)
+        self.state = np.zeros(5, dtype=np.float64)
+        self.tr_buffer = np.full(transform.window, np.nan, dtype=np.float64)
+
+    def update(self, x: pd.DataFrame) -> pd.Series:
+        t = self.transform
+        inputs = t._prepare_input_nb(x)
+        result = atr_resume(inputs[t.requires[0]], inputs[t.requires[1]], inputs[t.requires[2]], t.window,
+                            t.ema_based, t.normalize, self.state, self.tr_buffer)
+        return t._prepare_output_nb(x.index, result)
+
+
+def _cached_or_update(t: BaseTransform, state: TransformState, x: pd.DataFrame) -> Output:
+    """Output of a child transform: reused from the input if present (as the operation transforms do)."""
+    if isinstance(t.output_name, str) and t.output_name in x.columns:
+        return x[t.output_name]
+    return state.update(x)
+
+
+class BinaryOpState(TransformState):
+    """
+    State of a binary (or min/max) operation transform: the states of its operands.
+    """
+
+    def __init__(self, transform: Union[BinaryOpTransform, MinMaxOpTransform], backend: str):
+        super().__init__(transform, backend)
+        self.left = make_state(transform.left, backend)
+        self.right = make_state(transform.right, backend)
+
+    def update(self, x: pd.DataFrame) -> pd.Series:
+        t = self.transform
+        result = t.op_func(_cached_or_update(t.left, self.left, x), _cached_or_update(t.right, self.right, x))
+        result.name = t.output_name
+        return result
+
+
+class UnaryOpState(TransformState):
+    """
+    State of an element-wise unary (or constant) operation transform: the state of its operand.
+    """
+
+    def __init__(self, transform: Union[UnaryOpTransform, ConstantOpTransform], backend: str):
+        super().__init__(transform, backend)
+        self.child = make_state(transform.transform, backend)
+
+    def update(self, x: pd.DataFrame) -> pd.Series:
+        t = self.transform
+        base = _cached_or_update(t.transform, self.child, x)
+        result = t.op_func(base, t.constant) if isinstance(t, ConstantOpTransform) else t.op_func(base)
+        result.name = t.output_name
+        return result
+
+
+class ComposeState(TransformState):
+    """
+    State of a Compose pipeline: the states of its steps, each one fed with the outputs of the previous one.
+    """
+
+    def __init__(self, transform: BaseTransform, backend: str):
+        super().__init__(transform, backend)
+        self.steps = [make_state(step, backend) for step in transform.transforms]
+
+    def update(self, x: pd.DataFrame) -> pd.Series:
+        final_name = self.transform.output_name
+        if final_name in x.columns:
+            return x[final_name]
+        current = None
+        for i, (step, state) in enumerate(zip(self.transform.transforms, self.steps)):
+            if step.produces[0] in x.columns:
+                current = x[step.produces[0]]
+            elif i == 0:
+                current = state.update(x)
+            else:
+                req_col = step.requires[0]
+                df_in = x[[req_col]] if req_col in x.columns else \
+                    pd.DataFrame(current.values, index=current.index, columns=[req_col])
+                current = state.update(df_in)
+        return current.rename(final_name)
+
+
+# Leaf transforms with a dedicated state, and the backends for which the state repeats the computation exactly
+_LEAF_STATES = {
+    EWMA: (EWMAState, ("nb",)),
+    EWMST: (EWMSTState, ("nb", "pd")),
+    RSIWilder: (RSIWilderState, ("nb",)),
+    ATR: (ATRState, ("nb", "pd")),
+}
+_WINDOW_LOOKBACK = {
+    SMA: (lambda t: t.window, ("nb",)),
+    Lag: (lambda t: t.periods + 1, ("nb", "pd")),
+    Return: (lambda t: t.periods + 1, ("nb", "pd")),
+}
+
+
+def _is_compose(t: BaseTransform) -> bool:
+    return hasattr(t, "transforms") and isinstance(getattr(t, "transforms", None), (list, tuple))
+
+
+def make_state(transform: BaseTransform, backend: str) -> TransformState:
+    """
+    Create the incremental state of a transform (see the module documentation).
+
+    :param transform: The transform.
+    :param backend: Computational backend.
+    :returns: The state, starting with no rows seen.
+    """
+    cls = type(transform)
+    if cls in _LEAF_STATES and backend in _LEAF_STATES[cls][1]:
+        return _LEAF_STATES[cls][0](transform, backend)
+    if cls in _WINDOW_LOOKBACK and backend in _WINDOW_LOOKBACK[cls][1]:
+        return WindowState(transform, backend, _WINDOW_LOOKBACK[cls][0](transform))
+    if cls in (BinaryOpTransform, MinMaxOpTransform) and transform.op_name in ("add", "sub", "mul", "div", "min", "max"):
+        return BinaryOpState(transform, backend)
+    if cls is ConstantOpTransform or (cls is UnaryOpTransform and (
+            transform.op_name in _ELEMENTWISE_UNARY or transform.op_name.startswith("clip_"))):
+        return UnaryOpState(transform, backend)
+    if _is_compose(transform):
+        return ComposeState(transform, backend)
+    return RecomputeState(transform, backend)
+
+
+def count_states(states: List[TransformState]) -> Dict[str, int]:
+    """
+    :param states: States of transform trees.
+    :returns: Number of states of each kind in the trees (e.g., to check which transforms are recomputed).
+    """
+    counts: Dict[str, int] = {}
+    stack = list(states)
+    while stack:
+        state = stack.pop()
+        counts[state.__class__.__name__] = counts.get(state.__class__.__name__, 0) + 1
+        stack += [getattr(state, name) for name in ("left", "right", "child") if hasattr(state, name)]
+        stack += getattr(state, "steps", [])
+    return counts
@@ -1,15 +1,35 @@
 import pandas as pd
 import numpy as np
 import json
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 from .base import BaseTransform, MinMaxOpTransform, BinaryOpTransform, ConstantOpTransform, UnaryOpTransform, SISOTransform, MISOTransform
-from .utils import transform_to_config, transform_from_config, ComputationGraph, build_feature_graph
+from .utils import transform_to_config, transform_from_config, ComputationGraph, build_feature_graph, feature_dependencies
+from .utils import transform_fingerprint, referenced_columns, output_columns, plan_common_subexpressions
+from .cache import FeatureCache, column_fingerprint, feature_key
+from .incremental import make_state, count_states
 from afmlkit.utils.log import get_logger
 
 logger = get_logger(__name__)
 
 
+def _numba_thread_safe() -> bool:
+    """
+    Whether numba kernels (some are ``parallel=True``) may be called from several Python threads: the "tbb" and
+    "omp" threading layers are thread-safe, the "workqueue" fallback (used when neither TBB nor OpenMP is available)
+    is not and aborts the interpreter on concurrent launches.
+    """
+    import numba
+    from numba.np.ufunc import parallel
+    try:
+        parallel._launch_threads()  # Select the threading layer, as the first parallel kernel call would
+        return numba.threading_layer() in ("tbb", "omp")
+    except Exception:
+        return False
+
+
 class Feature:
     r"""High-level wrapper for data transformations enabling intuitive mathematical operations and fluent feature engineering.
 
@@ -721,6 +741,63 @@ class Compose(BaseTransform):
         return self._run_pipeline(x, backend=backend)
 
 
+class _OutputBlock:
+    """
+    Output of :meth:`FeatureKit.build`: the floating point columns are written to a preallocated 2D NumPy block (one
+    row per column, so that each column is contiguous) and the other ones are kept apart. The DataFrame is created
+    once at the end, on the block, instead of inserting each column into it.
+
+    :param index: Index of the output.
+    :param capacity: Expected number of columns (the block grows if more are set).
+    :param dtype: Floating point dtype of the block.
+    """
+
+    def __init__(self, index: pd.Index, capacity: int, dtype=np.float64):
+        self.index = index
+        self.dtype = np.dtype(dtype)
+        self.values = np.empty((capacity, len(index)), dtype=self.dtype)
+        self.n_rows = 0
+        self.columns = {}  # Column name -> block row, or Series kept apart (in the column order)
+
+    def _fits(self, item: pd.Series) -> bool:
+        if item.dtype != self.dtype and not (item.dtype.kind == "f" and self.dtype != np.float64):
+            return False
+        return item.index is self.index or item.index.equals(self.index)
+
+    def set(self, name, item: pd.Series) -> pd.Series:
+        """
+        Set a column, like ``out[name] = item``: a replaced column keeps its position.
+
+        :returns: The column values, a view on the block if they were written to it.
+        """
+        if not self._fits(item):
+            self.columns[name] = item
+            return item
+        if self.n_rows == len(self.values):
+            grown = np.empty((max(2 * len(self.values), 1), len(self.index)), dtype=self.dtype)
+            grown[:self.n_rows] = self.values
+            self.values = grown
+        # A replaced column gets a new row: the views on the previous values stay valid
+        row = self.n_rows
+        self.n_rows += 1
+        self.values[row] = item.to_numpy()
+        self.columns[name] = row
+        return pd.Series(self.values[row], index=self.index, name=name, copy=False)
+
+    def frame(self) -> pd.DataFrame:
+        """
+        :returns: The output DataFrame, on the block (copied only if columns were replaced).
+        """
+        names = [name for name, col in self.columns.items() if isinstance(col, int)]
+        rows = [col for col in self.columns.values() if isinstance(col, int)]
+        values = self.values[:len(rows)] if rows == list(range(len(rows))) else self.values[rows]
+        out = pd.DataFrame(values.T, index=self.index, columns=names, copy=False)
+        for loc, (name, col) in enumerate(self.columns.items()):
+            if not isinstance(col, int):
+                out.insert(loc, name, col)
+        return out
+
+
 class FeatureKit:
     r"""High-level orchestration framework for executing collections of Feature objects in financial machine learning pipelines.
 
@@ -954,6 +1031,7 @@ class FeatureKit:
     def __init__(self, features: list[Feature], retain: list[str] = None):
         self.features = features
         self.retain = retain or []
+        self._stream = None  # Incremental state of update()
 
     # --- Serialization / Reproducibility ---------------------------------
     def to_config(self) -> dict:
@@ -1011,7 +1089,20 @@ class FeatureKit:
         missing = [n for n in names if n not in order]
         return order + missing
 
-    def build(self, df, *, backend="nb", timeit=False, order: str = "defined"):
+    def _execution_order(self, order: str) -> list[Feature]:
+        """Features in execution order (see :meth:`build`)."""
+        features_seq = self.features
+        if order == "topo":
+            name2feat = {str(f.name): f for f in self.features}
+            topo_names = self.topological_order()
+            # Stable order: topo first, then any remaining by original order
+            topo_feats = [name2feat[n] for n in topo_names if n in name2feat]
+            remaining = [f for f in self.features if str(f.name) not in set(topo_names)]
+            features_seq = topo_feats + remaining
+        return features_seq
+
+    def build(self, df, *, backend="nb", timeit=False, order: str = "defined", n_jobs: int = 1,
+              cache: FeatureCache | str | None = None, cse: bool = True, dtype=np.float64):
         """Execute all Features and return a DataFrame with retained and computed columns.
 
         Parameters:
@@ -1023,47 +1114,74 @@ class FeatureKit:
                 - "topo": Run features in topological order based on dependencies inferred
                   from their underlying transforms. This helps when the list order doesn't already
                   respect dependencies (e.g., when a feature uses the output of another).
+            n_jobs (int): Number of threads computing the features. With n_jobs > 1 (or -1 for all CPUs) each feature
+                is scheduled on a thread pool as soon as the features it depends on (see
+                :func:`afmlkit.feature.utils.feature_dependencies`) are done, and sees their cached outputs as in
+                the sequential run. The numba kernels release the GIL, so independent features run in parallel.
+                The output columns are inserted in the execution order, so the result does not depend on n_jobs.
+                Concurrent calls of the parallel numba kernels need a thread-safe numba threading layer ("tbb" or
+                "omp"): with the "workqueue" layer (neither TBB nor OpenMP installed, or NUMBA_THREADING_LAYER set to
+                it), the features are computed sequentially with a warning. Default 1 (sequential).
+            cache (FeatureCache | str | None): On-disk feature cache (or its directory). The outputs of each feature
+                are loaded from the cache when the feature, its inputs and the time range are unchanged since a
+                previous build (see :mod:`afmlkit.feature.cache`), and saved to it otherwise. Default None (no cache).
+            cse (bool): If True (default), the subtrees shared by several features, operation transforms or Compose
+                pipelines are computed once before the features, and reused by name (see
+                :func:`afmlkit.feature.utils.plan_common_subexpressions`). The results are the same as without it.
+            dtype: Floating point dtype of the feature matrix, np.float64 (default) or np.float32. The floating point
+                columns of this dtype are written to one preallocated 2D block, wrapped as the output DataFrame at the
+                end; with np.float32, the float64 columns are rounded to it (half the memory). Other columns are
+                inserted as they are.
 
         Returns:
             pd.DataFrame: A DataFrame that contains retained columns and all computed feature columns.
         """
-        out = df[self.retain].copy()
-        df = df.copy()
-
-        # Determine execution order
-        features_seq = self.features
-        if order == "topo":
-            name2feat = {str(f.name): f for f in self.features}
-            topo_names = self.topological_order()
-            # Stable order: topo first, then any remaining by original order
-            topo_feats = [name2feat[n] for n in topo_names if n in name2feat]
-            remaining = [f for f in self.features if str(f.name) not in set(topo_names)]
-            features_seq = topo_feats + remaining
+        if np.dtype(dtype) not in (np.float64, np.float32):
+            raise ValueError(f"dtype must be np.float64 or np.float32, got {dtype}")
+        features_seq = self._execution_order(order)
+        capacity = len(self.retain) + sum(len(output_columns(f.transform)) for f in features_seq)
+        out = _OutputBlock(df.index, capacity, dtype)
+        for col in self.retain:
+            out.set(col, df[col])
+        df = df.copy(deep=False)  # Receives the common subexpressions, the input is left untouched
+        cached = {}  # Outputs cached for the features reading them (by transform output name)
 
         timing_info = {}
 
-        for feat in features_seq:
-            if timeit:
-                start_time = time.time()
-
-            res = feat(df, cache=df, backend=backend)
-
-            if timeit:
-                elapsed = time.time() - start_time
-                key = feat.name if isinstance(feat.name, str) else str(feat.name)
-                timing_info[key] = elapsed
-
-            if isinstance(res, pd.Series):
-                # Single output transform case
-                out[feat.name] = res
-                df[feat.transform.output_name] = res  # cache the result in the DataFrame (for compose transforms)
-            elif isinstance(res, tuple):
-                # Multi output transform case
-                for item in res:
-                    out[item.name] = item
-                    df[item.name] = item  # cache the result in the DataFrame (for compose transforms)
-            else:
-                raise TypeError(f"Transform {feat} returned unexpected type: {type(res)}")
+        if isinstance(cache, str):
+            cache = FeatureCache(cache)
+        if cache is not None:
+            keys = self._cache_keys(df, features_seq, backend)
+            loaded = [cache.get(key, df.index) if key is not None else None for key in keys]
+        else:
+            keys = loaded = [None] * len(features_seq)
+        if cse:
+            self._compute_common(df, [f for f, res in zip(features_seq, loaded) if res is None], backend)
+
+        if n_jobs == -1:
+            n_jobs = os.cpu_count() or 1
+        if n_jobs > 1 and len(features_seq) > 1 and not _numba_thread_safe():
+            logger.warning("The numba threading layer is not thread-safe (install tbb for n_jobs > 1): "
+                           "computing the features sequentially.")
+            n_jobs = 1
+        if n_jobs > 1 and len(features_seq) > 1:
+            results = self._run_concurrent(df, features_seq, backend, n_jobs, timing_info, cache, keys, loaded)
+            for i, (feat, res) in enumerate(zip(features_seq, results)):
+                self._store_block(out, None, feat, res)
+                results[i] = None  # The block holds the values
+        else:
+            for feat, key, res in zip(features_seq, keys, loaded):
+                if timeit:
+                    start_time = time.time()
+
+                res = self._compute(feat, self._working_frame(df, feat, cached), backend, cache, key, res)
+
+                if timeit:
+                    elapsed = time.time() - start_time
+                    key = feat.name if isinstance(feat.name, str) else str(feat.name)
+                    timing_info[key] = elapsed
+
+                self._store_block(out, cached, feat, res)
 
         if timeit:
             # Create a simple console plot for timing information
@@ -1082,4 +1200,221 @@ class FeatureKit:
                 bar_length = int((time_taken / max_time) * max_bar_length) if max_time > 0 else 0
                 bar = '█' * bar_length
                 print(f"{feature_name:<30} | {bar} {time_taken:.4f}s")
+        if cache is not None:
+            logger.info(cache.report())
+        return out.frame()
+
+    def update(self, new_rows: pd.DataFrame, *, backend="nb", order: str = "defined") -> pd.DataFrame:
+        """Compute the features for bars appended after the rows seen by the previous updates, without recomputing
+        the history.
+
+        The first call starts a stream: each transform of the features gets an incremental state (see
+        :mod:`afmlkit.feature.incremental`), which later calls continue on the new rows only. EWMA, EWMST, RSIWilder
+        and ATR continue the accumulators of their numba kernels, SMA, Lag and Return keep a buffer of their last
+        input rows, the operation transforms and Compose pipelines combine the states of their children, and the
+        other transforms are recomputed over the history of their input columns. Concatenating the outputs of the
+        updates gives the same DataFrame as :meth:`build` over all the rows.
+
+        Parameters:
+            new_rows (pd.DataFrame): The new bars, with the raw columns required by the features. On the first call,
+                the history: enough bars for every transform to be computed, as in :meth:`build`.
+            backend (str): Computational backend, fixed by the first call. "pd" for pandas, "nb" for numba.
+                Default "nb".
+            order (str): Execution order of the features (see :meth:`build`), fixed by the first call.
+                Default "defined".
+
+        Returns:
+            pd.DataFrame: The retained columns and computed feature columns of the new rows.
+        """
+        if self._stream is None:
+            features_seq = self._execution_order(order)
+            states = [make_state(f.transform, backend) for f in features_seq]
+            self._stream = {"backend": backend, "order": order, "features": features_seq, "states": states,
+                            "last": None}
+            logger.info(f"Started an incremental stream of {len(features_seq)} features: {count_states(states)}")
+        stream = self._stream
+        if (backend, order) != (stream["backend"], stream["order"]):
+            raise ValueError(f"The stream was started with backend={stream['backend']!r} and "
+                             f"order={stream['order']!r}; call reset() to start a new one.")
+        if stream["last"] is not None and len(new_rows) and new_rows.index[0] <= stream["last"]:
+            raise ValueError(f"New rows must follow the last row of the stream ({stream['last']}).")
+
+        out = new_rows[self.retain].copy()
+        x = new_rows.copy()
+        for feat, state in zip(stream["features"], stream["states"]):
+            name = feat.transform.output_name
+            if isinstance(name, str) and name in x.columns:
+                res = x[name]  # Same cached output as in build
+            else:
+                res = state.update(x)
+            self._store_result(out, x, feat, res)
+        if len(new_rows):
+            stream["last"] = new_rows.index[-1]
         return out
+
+    def reset(self) -> None:
+        """Drop the incremental stream of :meth:`update`: the next update starts a new one."""
+        self._stream = None
+
+    @staticmethod
+    def _cache_keys(df: pd.DataFrame, features_seq: list[Feature], backend: str) -> list[str | None]:
+        """
+        Feature cache key of each feature (None for features without a stable fingerprint, and the features reading
+        their outputs).
+
+        A column produced by an earlier feature is identified by the key of its producer, a column of the input by
+        the hash of its values.
+        """
+        index_fp = column_fingerprint(df.index)
+        produced = {}
+        input_fps = {}
+        keys = []
+        for feat in features_seq:
+            key = transform_fingerprint(feat.transform)
+            if key is not None:
+                fps = {}
+                for col in referenced_columns(feat.transform) | set(output_columns(feat.transform)):
+                    if col in produced:
+                        fps[col] = produced[col]
+                    elif col in df.columns:
+                        if col not in input_fps:
+                            input_fps[col] = column_fingerprint(df[col])
+                        fps[col] = input_fps[col]
+                if any(fp is None for fp in fps.values()):
+                    key = None
+                else:
+                    key = feature_key(key, backend, index_fp, fps)
+            keys.append(key)
+            for i, col in enumerate(output_columns(feat.transform)):
+                produced[col] = f"{key}.{i}" if key is not None else None
+        return keys
+
+    @staticmethod
+    def _compute(feat: Feature, x: pd.DataFrame, backend: str, cache: FeatureCache | None, key: str | None,
+                 loaded=None):
+        """Return the outputs of a feature loaded from the feature cache, or compute (and cache) them."""
+        if loaded is not None:
+            return loaded
+        res = feat(x, cache=x, backend=backend)
+        if cache is not None and key is not None:
+            cache.put(key, res, x.index)
+        return res
+
+    @staticmethod
+    def _compute_common(df: pd.DataFrame, features_seq: list[Feature], backend: str) -> None:
+        """Compute the subtrees shared by the features once, and insert them into the working DataFrame."""
+        plan = plan_common_subexpressions(features_seq, df.columns)
+        for transform, names in plan:
+            res = transform(df, backend=backend)
+            if isinstance(res, pd.Series):
+                for name in names:
+                    df[name] = res
+        if plan:
+            logger.info(f"Computed {len(plan)} common subexpressions of {len(features_seq)} features once.")
+
+    @staticmethod
+    def _cached_columns(feat: Feature, res) -> list[tuple[str, pd.Series]]:
+        """Columns cached in the working DataFrame for the result of a feature (read by the dependent features)."""
+        if isinstance(res, pd.Series):
+            return [(feat.transform.output_name, res)]  # Single output transform case
+        if isinstance(res, tuple):
+            return [(item.name, item) for item in res]  # Multi output transform case
+        raise TypeError(f"Transform {feat} returned unexpected type: {type(res)}")
+
+    def _store_result(self, out: pd.DataFrame, cache: pd.DataFrame | None, feat: Feature, res) -> None:
+        """Insert the result of a feature into the output and (if given) the working DataFrame."""
+        cached = self._cached_columns(feat, res)
+        if isinstance(res, pd.Series):
+            out[feat.name] = res
+        else:
+            for name, item in cached:
+                out[name] = item
+        if cache is not None:
+            for name, item in cached:
+                cache[name] = item  # cache the result in the DataFrame (for compose transforms)
+
+    def _store_block(self, out: "_OutputBlock", cached: dict | None, feat: Feature, res) -> None:
+        """Write the result of a feature to the output block and (if given) the cached outputs."""
+        if isinstance(res, pd.Series):
+            stored = out.set(feat.name, res)
+            if cached is not None:
+                # A renamed feature column may be replaced later while its cached output is not
+                cached[feat.transform.output_name] = stored if feat.name == feat.transform.output_name else res
+            return
+        for name, item in self._cached_columns(feat, res):
+            stored = out.set(name, item)
+            if cached is not None:
+                cached[name] = stored
+
+    @staticmethod
+    def _working_frame(df: pd.DataFrame, feat: Feature, cached: dict) -> pd.DataFrame:
+        """
+        Input of a feature: a shallow copy of the input DataFrame holding the cached outputs the feature may read
+        (see :func:`afmlkit.feature.utils.referenced_columns`), in the order they were produced.
+        """
+        referenced = referenced_columns(feat.transform) | set(output_columns(feat.transform))
+        names = [name for name in cached if name in referenced]
+        if not names:
+            return df
+        x = df.copy(deep=False)
+        for name in names:
+            x[name] = cached[name]
+        return x
+
+    def _run_concurrent(self, df: pd.DataFrame, features_seq: list[Feature], backend: str, n_jobs: int,
+                        timing_info: dict, cache: FeatureCache | None = None, keys: list | None = None,
+                        loaded: list | None = None) -> list:
+        """
+        Compute the features on a thread pool, each one as soon as the features it depends on are done.
+
+        Each feature runs on a shallow copy of the input DataFrame holding the cached outputs of its dependencies,
+        which are all the cached columns it could read in the sequential run.
+
+        :param df: The input DataFrame (not modified).
+        :param features_seq: Features in execution order.
+        :param backend: Computational backend.
+        :param n_jobs: Number of threads.
+        :param timing_info: Dict receiving the computation time of each feature.
+        :param cache: Feature cache, if any.
+        :param keys: Feature cache key of each feature.
+        :param loaded: Outputs of each feature loaded from the feature cache (None if not loaded).
+        :returns: The result of each feature, in execution order.
+        """
+        deps = feature_dependencies(features_seq)
+        dependents = [[] for _ in features_seq]
+        n_missing = [len(d) for d in deps]
+        for i, d in enumerate(deps):
+            for j in d:
+                dependents[j].append(i)
+        results = [None] * len(features_seq)
+
+        def _task(i: int):
+            feat = features_seq[i]
+            x = df.copy(deep=False)
+            for j in sorted(deps[i]):
+                for name, item in self._cached_columns(features_seq[j], results[j]):
+                    x[name] = item
+            start_time = time.time()
+            res = self._compute(feat, x, backend, cache, keys[i] if keys is not None else None,
+                                loaded[i] if loaded is not None else None)
+            return res, time.time() - start_time
+
+        with ThreadPoolExecutor(n_jobs, thread_name_prefix="FeatureKit") as executor:
+            futures = {executor.submit(_task, i): i for i, n in enumerate(n_missing) if n == 0}
+            try:
+                while futures:
+                    finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        i = futures.pop(future)
+                        results[i], elapsed = future.result()
+                        feat = features_seq[i]
+                        timing_info[feat.name if isinstance(feat.name, str) else str(feat.name)] = elapsed
+                        for k in dependents[i]:
+                            n_missing[k] -= 1
+                            if n_missing[k] == 0:
+                                futures[executor.submit(_task, k)] = k
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        return results
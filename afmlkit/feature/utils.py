@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 from typing import Any, Dict, List, Optional, Set
+import hashlib
 import importlib
 import inspect
+import json
+import types
 import numpy as np
 from afmlkit.utils.log import get_logger
 
@@ -395,3 +398,251 @@ def build_feature_graph(features: List["Feature"]) -> ComputationGraph:
             if other_name in reqs:
                 g.add_edge(other_name, out_name)
     return g
+
+
+def _transform_children(t: BaseTransform) -> List[BaseTransform]:
+    if isinstance(t, (BinaryOpTransform, MinMaxOpTransform)):
+        return [t.left, t.right]
+    if isinstance(t, (UnaryOpTransform, ConstantOpTransform)):
+        return [t.transform]
+    if hasattr(t, "transforms") and isinstance(getattr(t, "transforms", None), (list, tuple)):
+        return list(t.transforms)
+    return []
+
+
+def output_columns(t: BaseTransform) -> List[str]:
+    """Columns produced by a transform (and cached by FeatureKit)."""
+    name = t.output_name
+    return [name] if isinstance(name, str) else [str(n) for n in name]
+
+
+def referenced_columns(t: BaseTransform) -> Set[str]:
+    """Columns a transform may read from its input DataFrame: the raw inputs of every transform of the tree and the
+    outputs of the child transforms (reused when cached)."""
+    cols = set(getattr(t, "requires", []))
+    is_compose = hasattr(t, "transforms") and isinstance(getattr(t, "transforms", None), (list, tuple))
+    for child in _transform_children(t):
+        cols.update(output_columns(child))
+        if is_compose:
+            cols.add(child.produces[0])  # Compose steps are reused under their produces name
+        cols |= referenced_columns(child)
+    return cols
+
+
+def feature_dependencies(features: List["Feature"]) -> List[Set[int]]:
+    """
+    Positions of the features each feature depends on, when the features run in the given order with their outputs
+    cached in the working DataFrame (see :meth:`afmlkit.feature.kit.FeatureKit.build`).
+
+    Feature ``i`` depends on an earlier feature ``j`` if ``j`` caches a column that ``i`` reads (a raw input of its
+    transforms, the output of one of its child transforms, or its own output, which is reused when cached). Only
+    earlier features are considered, since only their outputs are cached when ``i`` runs sequentially.
+
+    :param features: Features in execution order.
+    :returns: For each feature, the set of positions of the features it depends on.
+    """
+    producers: Dict[str, List[int]] = {}
+    deps: List[Set[int]] = []
+    for i, f in enumerate(features):
+        referenced = referenced_columns(f.transform) | set(output_columns(f.transform))
+        deps.append({j for col in referenced for j in producers.get(col, [])})
+        for col in output_columns(f.transform):
+            producers.setdefault(col, []).append(i)
+    return deps
+
+
+# --- Fingerprints ---------------------------------------------------------------
+
+_UNKNOWN = object()  # Marker of values without a stable fingerprint
+_CHILD_ATTRS = ("left", "right", "transform", "transforms")
+
+
+def _code_fingerprint(code: types.CodeType) -> str:
+    h = hashlib.sha256(code.co_code)
+    for const in code.co_consts:
+        h.update(_code_fingerprint(const).encode() if isinstance(const, types.CodeType) else repr(const).encode())
+    h.update(repr(code.co_names).encode())
+    return h.hexdigest()
+
+
+def _global_names(code: types.CodeType) -> List[str]:
+    """Names a code object (and the functions defined in it) may read from the module globals."""
+    names = list(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names += _global_names(const)
+    return names
+
+
+def _value_fingerprint(val: Any, depth: int = 0) -> Any:
+    """JSON-serializable fingerprint of a transform attribute, or _UNKNOWN."""
+    if depth > 8:
+        return _UNKNOWN
+    if isinstance(val, np.generic):
+        val = val.item()
+    if isinstance(val, (str, int, float, bool)) or val is None:
+        return val
+    if isinstance(val, (list, tuple)):
+        items = [_value_fingerprint(v, depth + 1) for v in val]
+        return _UNKNOWN if any(v is _UNKNOWN for v in items) else items
+    if isinstance(val, dict):
+        items = {str(k): _value_fingerprint(v, depth + 1) for k, v in val.items()}
+        return _UNKNOWN if any(v is _UNKNOWN for v in items.values()) else items
+    if isinstance(val, np.ndarray) and val.dtype != object:
+        data = np.ascontiguousarray(val)
+        return {"array": hashlib.sha256(data.view(np.uint8).ravel()).hexdigest(), "dtype": str(val.dtype),
+                "shape": list(val.shape)}
+    if isinstance(val, types.ModuleType):
+        return {"module": val.__name__}
+    if isinstance(val, types.FunctionType):
+        # Same code with the same defaults, closure values (e.g., the window of Feature.rolling_mean) and values of
+        # the module globals it reads (e.g., a constant of a notebook, or the functions it calls)
+        closure = [c.cell_contents for c in (val.__closure__ or ())]
+        global_values = {name: val.__globals__[name] for name in sorted(set(_global_names(val.__code__)))
+                         if name in val.__globals__ and val.__globals__[name] is not val}
+        state = _value_fingerprint([list(val.__defaults__ or ()), val.__kwdefaults__ or {}, closure, global_values],
+                                   depth + 1)
+        if state is _UNKNOWN:
+            return _UNKNOWN
+        return {"function": f"{val.__module__}.{val.__qualname__}", "code": _code_fingerprint(val.__code__),
+                "state": state}
+    if callable(val):
+        # Builtins, ufuncs, numba dispatchers...: identified by name
+        module = getattr(val, "__module__", None)
+        name = getattr(val, "__qualname__", None) or getattr(val, "__name__", None)
+        return {"callable": f"{module}.{name}"} if module and name else _UNKNOWN
+    try:
+        import pandas as pd
+    except Exception:  # pragma: no cover
+        pd = None
+    if pd is not None and isinstance(val, (pd.Timedelta, pd.Timestamp)):
+        return {val.__class__.__name__: str(val)}
+    return _UNKNOWN
+
+
+def _transform_state(t: BaseTransform) -> Any:
+    """Fingerprint of the attributes of a transform node (its parameters, whatever their attribute names, and the
+    functions of operation transforms), or _UNKNOWN."""
+    state = {}
+    for name, val in vars(t).items():
+        if name in ("requires", "produces") + _CHILD_ATTRS or (name.startswith("_") and name != "_callable"):
+            continue
+        state[name] = _value_fingerprint(val)
+        if state[name] is _UNKNOWN:
+            logger.debug(f"Attribute {name} of {t.__class__.__name__} has no stable fingerprint.")
+            return _UNKNOWN
+    return state
+
+
+def _transform_nodes(t: BaseTransform) -> List[BaseTransform]:
+    nodes = [t]
+    for child in _transform_children(t):
+        nodes.extend(_transform_nodes(child))
+    return nodes
+
+
+def canonical_config(t: BaseTransform) -> Optional[Dict[str, Any]]:
+    """
+    Canonical description of the computation of a transform: its serialized config (see :func:`transform_to_config`)
+    and the attributes of every node of its tree, including the functions wrapped by operation transforms (code and
+    closure values), which the config only identifies by name.
+
+    :param t: The transform.
+    :returns: JSON-serializable dict, or None if some attribute has no stable fingerprint (e.g., arbitrary objects
+        captured by a function passed to :meth:`afmlkit.feature.kit.Feature.apply`).
+    """
+    states = [_transform_state(node) for node in _transform_nodes(t)]
+    if any(state is _UNKNOWN for state in states):
+        return None
+    return {"config": transform_to_config(t), "state": states}
+
+
+def transform_fingerprint(t: BaseTransform) -> Optional[str]:
+    """
+    :param t: The transform.
+    :returns: SHA-256 hex digest of :func:`canonical_config`, or None if the transform has no stable fingerprint.
+    """
+    cfg = canonical_config(t)
+    if cfg is None:
+        return None
+    return hashlib.sha256(json.dumps(cfg, sort_keys=True, default=str).encode()).hexdigest()
+
+
+# --- Common subexpressions ------------------------------------------------------
+
+def _subexpressions(t: BaseTransform, nodes: List[tuple], blocked: Set[str]) -> List[str]:
+    """
+    Collect the nodes of a transform tree that read their cached output from the working DataFrame, in post-order,
+    as (names looked up for the node, transform computing it, names looked up in its subtree) tuples.
+
+    :returns: The names looked up in the tree.
+    """
+    if hasattr(t, "transforms") and isinstance(getattr(t, "transforms", None), (list, tuple)):
+        # Compose: each step reuses a column named after its ``produces``, holding the output of the pipeline prefix
+        from afmlkit.feature.kit import Compose  # lazy import to avoid circular dependency at import-time
+        steps = list(t.transforms)
+        names = []
+        for k, step in enumerate(steps):
+            names.append(step.produces[0])
+            if k > 0:
+                blocked.add(step.requires[0])  # Read instead of the previous step's output if present
+            if k < len(steps) - 1:
+                prefix = step if k == 0 else Compose(*steps[:k + 1])
+                nodes.append(([step.produces[0]], prefix, names + ([prefix.output_name] if k > 0 else [])))
+        names.append(t.output_name)
+        nodes.append(([steps[-1].produces[0], t.output_name], t, list(names)))
+        return names
+
+    names = []
+    for child in _transform_children(t):
+        names += _subexpressions(child, nodes, blocked)
+    if isinstance(t.output_name, str):
+        names.append(t.output_name)
+        nodes.append(([t.output_name], t, list(names)))
+    return names
+
+
+def plan_common_subexpressions(features: List["Feature"], columns) -> List[tuple]:
+    """
+    Find the subtrees computed more than once by a list of features (e.g., a return z-score used by several ratios,
+    or a feature which is also the operand of another one), identified by their canonical config
+    (see :func:`transform_fingerprint`) across features, operation transforms and Compose pipelines.
+
+    Transforms reuse a child output found in the working DataFrame under the child's output name, so each shared
+    subtree can be computed once and inserted under its names. Subtrees are only planned when this leaves the results
+    unchanged: their raw inputs are in ``columns``, and every name looked up in them (and inserted) belongs to this
+    computation only across the features.
+
+    :param features: The features to compute.
+    :param columns: Columns of the input DataFrame.
+    :returns: List of (transform, names) tuples: compute the transform on the working DataFrame and insert the result
+        under the names, in order (shared children come before their parents).
+    """
+    columns = set(columns)
+    nodes, blocked = [], set()
+    for f in features:
+        _subexpressions(f.transform, nodes, blocked)
+
+    fingerprints = [transform_fingerprint(t) for _, t, _ in nodes]
+    by_name: Dict[str, Set[Optional[str]]] = {}
+    for (names, _, _), fp in zip(nodes, fingerprints):
+        for name in names:
+            by_name.setdefault(name, set()).add(fp)
+
+    groups: Dict[str, List[tuple]] = {}
+    for node, fp in zip(nodes, fingerprints):
+        if fp is not None:
+            groups.setdefault(fp, []).append(node)
+
+    plan = []
+    for fp, group in groups.items():
+        if len(group) < 2:
+            continue
+        t = group[0][1]
+        looked_up = {name for _, _, names in group for name in names}
+        if not set(_flatten_requires(t)) <= columns or any(len(by_name.get(n, {fp})) > 1 for n in looked_up):
+            continue
+        names = list(dict.fromkeys(n for names, _, _ in group for n in names if n not in columns and n not in blocked))
+        if names:
+            plan.append((t, names))
+    return plan
@@ -0,0 +1,92 @@
+"""
+Trades storage benchmark
+对比 HDF5 (save_h5 / load_trades_h5) 与 Parquet (save_parquet / load_parquet) 在相同数据上的读写耗时与磁盘占用。
+
+用法: python scripts/util_bench_trades_storage.py [n_trades]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from afmlkit.bar.data_model import TradesData
+from afmlkit.bar.kit import DollarBarKit
+
+
+def make_trades(n: int, seed: int = 0) -> TradesData:
+    """生成跨越约三个月的合成逐笔成交数据。"""
+    rng = np.random.default_rng(seed)
+    t0 = pd.Timestamp('2024-01-01').value
+    step = int(90 * 86_400 * 1e9 / n)
+    ts = t0 + np.cumsum(rng.integers(0, 2 * step, n))
+    px = 40_000.0 + np.round(np.cumsum(rng.normal(0, 2.0, n)), 2)
+    qty = rng.exponential(0.05, n)
+    side = np.where(rng.random(n) > 0.5, 1, -1).astype(np.int8)
+    return TradesData(ts.astype(np.int64), px, qty, np.arange(n, dtype=np.int64), side=side, timestamp_unit='ns')
+
+
+def timed(fn, *args, **kwargs):
+    t = time.perf_counter()
+    out = fn(*args, **kwargs)
+    return out, time.perf_counter() - t
+
+
+def dir_size(path: str) -> int:
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(r, f)) for r, _, files in os.walk(path) for f in files)
+
+
+def main(n: int = 5_000_000):
+    import pyarrow.dataset  # noqa: F401  (预先导入，避免把导入耗时计入 Parquet)
+
+    trades = make_trades(n)
+    months = trades.data.index.to_period('M')
+    start, end = pd.Timestamp('2024-02-10'), pd.Timestamp('2024-02-20')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        h5_path, pq_path = os.path.join(tmp, 'trades.h5'), os.path.join(tmp, 'trades_parquet')
+
+        def save_h5():
+            for month in months.unique():
+                trades.data[np.asarray(months == month)].pipe(
+                    lambda df: TradesData(
+                        df['timestamp'].values, df['price'].values, df['amount'].values, df['id'].values,
+                        side=df['side'].values, timestamp_unit='ns'
+                    )
+                ).save_h5(h5_path, month_key=str(month))
+
+        rows = []
+        _, t = timed(save_h5)
+        _, t_pq = timed(trades.save_parquet, pq_path)
+        rows.append(('save', t, t_pq))
+
+        _, t = timed(TradesData.load_trades_h5, h5_path)
+        _, t_pq = timed(TradesData.load_parquet, pq_path)
+        rows.append(('load (all)', t, t_pq))
+
+        _, t = timed(TradesData.load_trades_h5, h5_path, start_time=start, end_time=end)
+        _, t_pq = timed(TradesData.load_parquet, pq_path, start_time=start, end_time=end, columns=[])
+        rows.append(('load (10 days)', t, t_pq))
+
+        def load_and_build(loader, *args, **kwargs):
+            return DollarBarKit(loader(*args, **kwargs), 5e6).build_ohlcv()
+
+        load_and_build(TradesData.load_parquet, pq_path, start_time=start, end_time=end)  # JIT warm-up
+        _, t = timed(load_and_build, TradesData.load_trades_h5, h5_path)
+        _, t_pq = timed(load_and_build, TradesData.load_parquet, pq_path, columns=[])
+        rows.append(('load + dollar bars', t, t_pq))
+
+        print(f"\n{n:,} trades | disk: HDF5 {dir_size(h5_path) / 2**20:.1f} MiB, "
+              f"Parquet {dir_size(pq_path) / 2**20:.1f} MiB")
+        print(f"{'step':<20}{'HDF5 [s]':>12}{'Parquet [s]':>14}")
+        for name, t, t_pq in rows:
+            print(f"{name:<20}{t:>12.3f}{t_pq:>14.3f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000)
@@ -0,0 +1,69 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from afmlkit.bar.io import AddTimeBarH5
+from tests.utils import random_trades, build_trades_h5
+
+
+def _build_trades_h5(path: str) -> None:
+    # Two hours of trades in each of three months
+    months = [random_trades(3000, seed=11 + m, start=f'{month}-10', min_step=1, max_step=4800)
+              for m, month in enumerate(['2021-01', '2021-02', '2021-03'])]
+    ts, px, qty, _ = (np.concatenate(cols) for cols in zip(*months))
+    build_trades_h5(path, ts, px, qty)
+
+
+def _klines(path: str) -> dict:
+    with pd.HDFStore(path, mode='r') as store:
+        return {k: store[k] for k in store.keys() if k.startswith('/klines')}
+
+
+def test_parallel_process_all_matches_sequential(tmp_path):
+    seq_path, par_path = str(tmp_path / 'seq.h5'), str(tmp_path / 'par.h5')
+    _build_trades_h5(seq_path)
+    _build_trades_h5(par_path)
+
+    seq = AddTimeBarH5(seq_path, levels=['1min', '1h']).process_all()
+    par = AddTimeBarH5(par_path, levels=['1min', '1h']).process_all(n_workers=2)
+
+    assert seq == par == {'/trades/2021-01': True, '/trades/2021-02': True, '/trades/2021-03': True}
+    expected, result = _klines(seq_path), _klines(par_path)
+    assert sorted(result) == sorted(expected)
+    for key in expected:
+        if '_meta/' in key:
+            pd.testing.assert_series_equal(result[key], expected[key])
+        else:
+            pd.testing.assert_frame_equal(result[key], expected[key])
+    assert not os.path.exists(par_path + '.klines_checkpoint.json')
+
+
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_process_all_resumes_from_checkpoint(tmp_path, monkeypatch, n_workers):
+    path = str(tmp_path / 'trades.h5')
+    _build_trades_h5(path)
+    processor = AddTimeBarH5(path)
+
+    # Interrupt the run when writing February
+    write_key = AddTimeBarH5._write_key
+
+    def failing_write(self, key, *args):
+        if key == '/trades/2021-02':
+            raise IOError("Interrupted")
+        write_key(self, key, *args)
+
+    monkeypatch.setattr(AddTimeBarH5, '_write_key', failing_write)
+    results = processor.process_all(overwrite=True, n_workers=n_workers)
+    assert results == {'/trades/2021-01': True, '/trades/2021-02': False, '/trades/2021-03': True}
+    assert os.path.exists(processor.checkpoint_path)
+
+    # The resumed run only rebuilds the unfinished month
+    built = []
+    monkeypatch.setattr(AddTimeBarH5, '_write_key', lambda self, key, *args: (built.append(key), write_key(self, key, *args)))
+    results = processor.process_all(overwrite=True, n_workers=n_workers)
+    assert built == ['/trades/2021-02']
+    assert all(results.values())
+    assert not os.path.exists(processor.checkpoint_path)
+    assert '/klines/2021-02' in _klines(path)
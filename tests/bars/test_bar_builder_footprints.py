@@ -106,5 +106,80 @@ def test_footprint_data_slicing_preserves_new_metrics():
     assert len(sliced_data.vp_gini) == 1, "Sliced vp_gini should have length 1"
 
 
+def test_build_footprints_compressed_layout():
+    """Test the compressed (CSR) footprint layout against the per-bar layout."""
+    trades = create_test_trades()
+    footprint = MockBarBuilder(trades).build_footprints(price_tick_size=0.5)
+    compressed = MockBarBuilder(trades).build_footprints(price_tick_size=0.5, compressed=True)
+
+    assert compressed.is_compressed and not footprint.is_compressed
+    assert compressed.is_valid()
+    np.testing.assert_array_equal(compressed.offsets, [0, 5, 10])
+    for i in range(len(footprint)):
+        a, b = compressed.offsets[i], compressed.offsets[i + 1]
+        np.testing.assert_array_equal(compressed.price_levels[a:b], footprint.price_levels[i])
+        np.testing.assert_array_equal(compressed.buy_volumes[a:b], footprint.buy_volumes[i])
+    pd.testing.assert_frame_equal(compressed.get_df(), footprint.get_df())
+
+    # Slicing selects whole bars as views of the flat arrays
+    sliced = compressed[1:2]
+    assert sliced.is_valid() and len(sliced) == 1
+    np.testing.assert_array_equal(sliced.price_levels, footprint.price_levels[1])
+    assert np.shares_memory(sliced.buy_volumes, compressed.buy_volumes)
+    np.testing.assert_array_equal(compressed[::-1].price_levels[:5], footprint.price_levels[1])
+
+    # Round trip between the layouts
+    compressed.cast_to_numba_list()
+    assert not compressed.is_compressed
+    np.testing.assert_array_equal(compressed.sell_ticks[1], footprint.sell_ticks[1])
+    compressed.cast_to_csr()
+    np.testing.assert_array_equal(compressed.offsets, [0, 5, 10])
+
+
+def test_footprint_npy_round_trip_is_memory_mapped(tmp_path):
+    """Test saving footprints to .npy files and loading them memory-mapped."""
+    trades = create_test_trades()
+    footprint = MockBarBuilder(trades).build_footprints(price_tick_size=0.5)
+    footprint.save_npy(str(tmp_path / "fp"))
+
+    with pytest.raises(FileExistsError):
+        footprint.save_npy(str(tmp_path / "fp"))
+    # Saving does not change the layout of the saved object
+    assert not footprint.is_compressed
+
+    loaded = FootprintData.load_npy(str(tmp_path / "fp"))
+    assert loaded.is_compressed and loaded.is_valid()
+    assert isinstance(loaded.buy_volumes, np.memmap)
+    assert loaded.price_tick == 0.5
+    np.testing.assert_array_equal(loaded.bar_timestamps, footprint.bar_timestamps)
+    np.testing.assert_array_equal(loaded.vp_gini, footprint.vp_gini)
+    pd.testing.assert_frame_equal(loaded.get_df(), footprint.get_df())
+
+    # Slices are views of the mapped file
+    sliced = loaded[1:]
+    assert np.shares_memory(sliced.sell_volumes, loaded.sell_volumes)
+    np.testing.assert_array_equal(sliced.sell_volumes, footprint.sell_volumes[1])
+
+    with pytest.raises(FileNotFoundError):
+        FootprintData.load_npy(str(tmp_path / "missing"))
+
+
+def test_footprint_npy_interrupted_overwrite_is_not_loaded(tmp_path, monkeypatch):
+    """Test that an overwrite interrupted while writing the arrays leaves no complete-looking directory."""
+    trades = create_test_trades()
+    footprint = MockBarBuilder(trades).build_footprints(price_tick_size=0.5)
+    footprint.save_npy(str(tmp_path / "fp"))
+
+    def _failing_save(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(np, "save", _failing_save)
+    with pytest.raises(OSError):
+        footprint.save_npy(str(tmp_path / "fp"), overwrite=True)
+    monkeypatch.undo()
+    with pytest.raises(FileNotFoundError):
+        FootprintData.load_npy(str(tmp_path / "fp"))
+
+
 if __name__ == "__main__":
     pytest.main()
\ No newline at end of file
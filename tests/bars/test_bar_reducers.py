@@ -0,0 +1,102 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+import numpy as np
+import pandas as pd
+import pytest
+from numba import config, njit
+
+from afmlkit.bar.kit import TickBarKit, TimeBarKit
+from afmlkit.bar.reducers import kyle_lambda, vwap_dispersion, trade_size_quartiles, _make_bar_kernel, \
+    KERNEL_CACHE_SIZE
+from tests.utils import random_trades_data
+
+
+@njit(nogil=True)
+def _price_range(timestamps, prices, volumes, sides, out):
+    out[0] = prices.max() - prices.min()
+    out[1] = len(prices)
+
+
+def test_reducers_match_groupby():
+    trades = random_trades_data(3000, seed=13, max_step=2500)
+    kit = (TickBarKit(trades, 40)
+           .register_reducer(_price_range, ['price_range', 'n_trades'])
+           .register_reducer(vwap_dispersion, ['vwap_std'])
+           .register_reducer(trade_size_quartiles, ['size_q25', 'size_q50', 'size_q75'])
+           .register_reducer(kyle_lambda, ['kyle_lambda']))
+    features = kit.build_reducer_features()
+
+    df = trades.data.reset_index(drop=True)
+    bar_id = np.searchsorted(kit._close_indices, np.arange(len(df)), side='left') - 1
+    groups = df[bar_id >= 0].groupby(bar_id[bar_id >= 0])
+
+    assert list(features.columns) == ['price_range', 'n_trades', 'vwap_std', 'size_q25', 'size_q50', 'size_q75', 'kyle_lambda']
+    np.testing.assert_allclose(features['price_range'], groups['price'].agg(lambda p: p.max() - p.min()))
+    np.testing.assert_array_equal(features['n_trades'], groups.size())
+    np.testing.assert_allclose(features['size_q75'], groups['amount'].quantile(0.75))
+
+    def _vwap_std(g):
+        vwap = np.average(g['price'], weights=g['amount'])
+        return np.sqrt(np.average((g['price'] - vwap) ** 2, weights=g['amount']))
+    np.testing.assert_allclose(features['vwap_std'], groups.apply(_vwap_std, include_groups=False))
+
+    def _kyle(g):
+        return np.polyfit((g['side'] * g['amount']).values[1:], np.diff(g['price'].values), 1)[0]
+    np.testing.assert_allclose(features['kyle_lambda'], groups.apply(_kyle, include_groups=False), atol=1e-9)
+
+
+def test_reducers_empty_bars_are_nan():
+    trades = random_trades_data(300, seed=13, max_step=2500)
+    kit = TimeBarKit(trades, pd.Timedelta(seconds=1)).register_reducer(_price_range, ['price_range', 'n_trades'])
+    features = kit.build_reducer_features()
+    ohlcv = kit.build_ohlcv()
+
+    empty = (ohlcv['trades'] == 0).values
+    assert empty.any()
+    assert features['n_trades'][empty].isna().all()
+    np.testing.assert_array_equal(features['n_trades'][~empty], ohlcv['trades'][~empty])
+
+
+def test_reducer_registration_errors():
+    kit = TickBarKit(random_trades_data(100, seed=13, max_step=2500), 10)
+    with pytest.raises(ValueError):
+        kit.build_reducer_features()
+    if not config.DISABLE_JIT:
+        # Rejected when registered, not when the features are built
+        with pytest.raises(TypeError):
+            kit.register_reducer(lambda *args: None, ['x'])
+        assert kit._reducers == []
+    with pytest.raises(TypeError):
+        kit.register_reducer(None, ['x'])
+    with pytest.raises(ValueError):
+        kit.register_reducer(vwap_dispersion, ['x']).register_reducer(vwap_dispersion, ['x'])
+    assert _make_bar_kernel.cache_info().maxsize == KERNEL_CACHE_SIZE
+
+
+def test_plain_python_reducers_with_jit_disabled():
+    script = textwrap.dedent("""
+        import numpy as np
+        from afmlkit.bar.data_model import TradesData
+        from afmlkit.bar.kit import TickBarKit
+        from afmlkit.bar.reducers import vwap_dispersion
+
+        def n_trades(timestamps, prices, volumes, sides, out):
+            out[0] = len(prices)
+
+        rng = np.random.default_rng(0)
+        ts = 1_600_000_000_000_000_000 + np.cumsum(rng.integers(0, 2500, 500)) * 1_000_000
+        px = 100.0 + np.cumsum(rng.normal(0, 0.05, 500))
+        trades = TradesData(ts.astype(np.int64), px, rng.exponential(1.0, 500), timestamp_unit='ns')
+        kit = TickBarKit(trades, 40).register_reducer(n_trades, ['n']).register_reducer(vwap_dispersion, ['std'])
+        features = kit.build_reducer_features()
+        assert (features['n'] == kit.build_ohlcv()['trades']).all()
+        assert features['std'].notna().all()
+        print("ok")
+    """)
+    env = dict(os.environ, NUMBA_DISABLE_JIT="1")
+    proc = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, timeout=300)
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    assert proc.stdout.strip().endswith("ok")
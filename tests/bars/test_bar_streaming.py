@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from afmlkit.bar.data_model import TradesData
+from afmlkit.bar.kit import TimeBarKit, TickBarKit, VolumeBarKit, DollarBarKit, CUSUMBarKit, DynamicDollarBarKit
+from tests.utils import random_trades
+
+
+def _chunks(ts, px, qty, side, bounds):
+    for a, b in zip(bounds[:-1], bounds[1:]):
+        yield TradesData(ts[a:b], px[a:b], qty[a:b], side=side[a:b], timestamp_unit='ns')
+
+
+def _stream(kit, ts, px, qty, side, bounds, close_partial=False):
+    ohlcv, directional = [], []
+    for chunk in _chunks(ts, px, qty, side, bounds):
+        if kit.feed(chunk):
+            ohlcv.append(kit.build_ohlcv())
+            directional.append(kit.build_directional_features())
+    if kit.flush(close_partial=close_partial):
+        ohlcv.append(kit.build_ohlcv())
+        directional.append(kit.build_directional_features())
+    return pd.concat(ohlcv), pd.concat(directional)
+
+
+BOUNDS = [0, 1, 777, 1500, 1501, 3333, 5000]
+
+
+@pytest.mark.parametrize("make_kit", [
+    lambda td: TickBarKit(td, 37),
+    lambda td: VolumeBarKit(td, 25.0),
+    lambda td: DollarBarKit(td, 3000.0),
+])
+def test_stream_matches_batch_threshold_bars(make_kit):
+    ts, px, qty, side = random_trades()
+    batch_kit = make_kit(TradesData(ts, px, qty, side=side, timestamp_unit='ns'))
+    expected_ohlcv = batch_kit.build_ohlcv()
+    expected_dir = batch_kit.build_directional_features()
+
+    ohlcv, directional = _stream(make_kit(None), ts, px, qty, side, BOUNDS)
+
+    pd.testing.assert_frame_equal(ohlcv, expected_ohlcv)
+    pd.testing.assert_frame_equal(directional, expected_dir)
+
+
+def test_stream_matches_batch_time_bars():
+    ts, px, qty, side = random_trades()
+    batch_kit = TimeBarKit(TradesData(ts, px, qty, side=side, timestamp_unit='ns'), pd.Timedelta(seconds=10))
+    expected = batch_kit.build_ohlcv()
+
+    ohlcv, _ = _stream(TimeBarKit(None, pd.Timedelta(seconds=10)), ts, px, qty, side, BOUNDS, close_partial=True)
+
+    # The batch clock may end with an extra empty bar after the bar of the last trade
+    pd.testing.assert_frame_equal(ohlcv, expected.iloc[:len(ohlcv)], check_freq=False)
+    assert (expected.iloc[len(ohlcv):]['trades'] == 0).all()
+
+
+def test_stream_matches_batch_time_bars_with_trades_at_the_grid_start():
+    ts, px, qty, side = random_trades()
+    ts = ts - ts[0] + 1_600_000_000_000_000_000  # First trades at a bar boundary
+    ts[:3] = ts[0]
+    batch_kit = TimeBarKit(TradesData(ts, px, qty, side=side, timestamp_unit='ns'), pd.Timedelta(seconds=10))
+    expected = batch_kit.build_ohlcv()
+
+    ohlcv, _ = _stream(TimeBarKit(None, pd.Timedelta(seconds=10)), ts, px, qty, side, [0, 500, 5000],
+                       close_partial=True)
+
+    assert ohlcv['open'].iloc[0] == px[3]
+    pd.testing.assert_frame_equal(ohlcv, expected.iloc[:len(ohlcv)], check_freq=False)
+
+
+def test_stream_matches_batch_cusum_bars():
+    ts, px, qty, side = random_trades()
+    sigma = np.full(len(ts), 1e-3)
+    sigma[:10] = np.nan
+    batch_kit = CUSUMBarKit(TradesData(ts, px, qty, side=side, timestamp_unit='ns'), sigma.copy(), sigma_floor=1e-4)
+    expected = batch_kit.build_ohlcv()
+
+    ohlcv, _ = _stream(CUSUMBarKit(None, sigma.copy(), sigma_floor=1e-4), ts, px, qty, side, BOUNDS)
+
+    pd.testing.assert_frame_equal(ohlcv, expected)
+
+
+def test_stream_flush_closes_partial_bar_and_resets():
+    ts, px, qty, side = random_trades(n=100)
+    kit = TickBarKit(None, 30)
+    assert kit.feed(TradesData(ts, px, qty, side=side, timestamp_unit='ns')) == 3
+    assert kit.flush() == 1
+    assert kit.build_ohlcv()['trades'].iloc[-1] == 100 - 1 - 3 * 30 + 1
+    # Nothing left in the stream
+    assert kit.flush() == 0
+
+
+def test_stream_step_without_bars_clears_previous_bars():
+    ts, px, qty, side = random_trades(n=100)
+    kit = TickBarKit(None, 30)
+    chunks = list(_chunks(ts, px, qty, side, [0, 50, 55, 55]))
+    assert kit.feed(chunks[0]) == 1
+    assert len(kit.build_ohlcv()) == 1
+
+    # Neither a chunk finishing no bars nor an empty chunk repeats the bars of the previous step
+    for chunk in chunks[1:]:
+        assert kit.feed(chunk) == 0
+        assert len(kit.build_ohlcv()) == 0
+        assert len(kit.build_directional_features()) == 0
+        assert len(kit.build_all()) == 0
+        assert len(kit.build_footprints().bar_timestamps) == 0
+    assert kit.flush() == 1
+    assert kit.flush() == 0
+    assert len(kit.build_ohlcv()) == 0
+
+
+def test_stream_not_supported():
+    ts, px, qty, side = random_trades(n=100)
+    kit = DynamicDollarBarKit(None)
+    with pytest.raises(NotImplementedError):
+        kit.feed(TradesData(ts, px, qty, side=side, timestamp_unit='ns'))
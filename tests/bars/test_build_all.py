@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from afmlkit.bar.kit import TimeBarKit, TickBarKit
+from tests.utils import random_trades_data
+
+
+@pytest.mark.parametrize("make_kit", [
+    lambda td: TickBarKit(td, 37),
+    lambda td: TimeBarKit(td, pd.Timedelta(seconds=1)),
+])
+def test_build_all_matches_individual_builders(make_kit):
+    # Sparse clock so that 1s time bars include empty bars
+    trades = random_trades_data(5000, seed=9, max_step=2500)
+    kit = make_kit(trades)
+    n_bars = len(kit.bar_close_indices)
+    theta = np.full(n_bars, 0.2)
+    theta[::7] = 0.0
+
+    expected = pd.concat([
+        kit.build_ohlcv(),
+        kit.build_directional_features(),
+        kit.build_trade_size_features(theta)
+    ], axis=1)
+    bars = make_kit(trades).build_all(theta)
+
+    assert (bars.dtypes == np.float64).all()
+    # float32 columns of the individual builders are rounded
+    pd.testing.assert_frame_equal(bars, expected, check_dtype=False, check_freq=False, rtol=1e-6)
+
+
+def test_build_all_without_theta_and_footprints():
+    trades = random_trades_data(500, seed=9, max_step=2500)
+    kit = TickBarKit(trades, 20)
+    bars = kit.build_all()
+
+    assert 'size_gini' not in bars.columns
+    assert len(bars.columns) == 8 + 14
+    # The bar highs and lows of the fused pass are reused by the footprints
+    footprint = kit.build_footprints(price_tick_size=0.01, compressed=True)
+    assert footprint.is_valid() and len(footprint) == len(bars)
@@ -2,7 +2,7 @@ import numpy as np
 import os
 import pytest
 from numba.typed import List as NumbaList
-from afmlkit.bar.base import comp_bar_footprints
+from afmlkit.bar.base import comp_bar_footprints, comp_bar_footprints_csr
 
 
 def test_comp_bar_footprints_basic():
@@ -299,5 +299,34 @@ def test_comp_bar_footprints_large_imbalance():
     np.testing.assert_array_equal(sell_imbalances[0], expected_sell_imbalances)
 
 
+def test_comp_bar_footprints_csr_matches_per_bar_lists():
+    """
+    Test that the flat (CSR) output holds the same per-bar footprints as the list output.
+    """
+    rng = np.random.default_rng(3)
+    n = 2000
+    prices = 100.0 + np.round(np.cumsum(rng.normal(0, 0.02, n)), 2)
+    amounts = rng.exponential(1.0, n)
+    trade_sides = np.where(rng.random(n) > 0.5, 1, -1).astype(np.int8)
+    bar_close_indices = np.arange(0, n, 50, dtype=np.int64)
+    bar_lows = np.array([prices[a + 1:b + 1].min() for a, b in zip(bar_close_indices[:-1], bar_close_indices[1:])])
+    bar_highs = np.array([prices[a + 1:b + 1].max() for a, b in zip(bar_close_indices[:-1], bar_close_indices[1:])])
+
+    args = (prices, amounts, bar_close_indices, trade_sides, 0.01, bar_lows, bar_highs, 2.0)
+    lists = comp_bar_footprints(*args)
+    csr = comp_bar_footprints_csr(*args)
+    offsets = csr[0]
+
+    n_bars = len(bar_close_indices) - 1
+    assert len(offsets) == n_bars + 1
+    assert offsets[-1] == len(csr[1])
+    for i in range(n_bars):
+        a, b = offsets[i], offsets[i + 1]
+        for k in range(7):
+            np.testing.assert_array_equal(csr[k + 1][a:b], lists[k][i])
+    for k in range(7, 13):
+        np.testing.assert_array_equal(csr[k + 1], lists[k])
+
+
 if __name__ == "__main__":
-    pytest.main([__file__])
\ No newline at end of file
+    pytest.main([__file__])
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from afmlkit.bar.data_model import TradesData, CompactTradesData
+from afmlkit.bar.kit import TimeBarKit, TickBarKit, VolumeBarKit, DollarBarKit, CUSUMBarKit
+
+
+def _trades(n=200_000, seed=3):
+    # Millisecond clock spanning several compact blocks, prices on a 0.5 tick grid,
+    # amounts exactly representable as float32
+    rng = np.random.default_rng(seed)
+    ts = pd.Timestamp('2021-01-01').value + np.cumsum(rng.integers(0, 500, n)) * 1_000_000
+    px = 20_000.0 + 0.5 * np.cumsum(rng.integers(-2, 3, n))
+    qty = rng.integers(1, 4096, n) / 1024
+    side = np.where(rng.random(n) > 0.5, 1, -1).astype(np.int8)
+    return TradesData(ts.astype(np.int64), px, qty, side=side, timestamp_unit='ns')
+
+
+def test_compact_round_trip_and_size():
+    trades = _trades()
+    compact = trades.to_compact()
+
+    assert compact.price_tick == 0.5
+    assert compact.price_ticks.dtype == np.int32 and compact.amount.dtype == np.float32
+    assert len(compact.ts_base) == int(np.ceil(len(compact) / 2 ** 16))
+    np.testing.assert_array_equal(compact.timestamps(), trades.data['timestamp'].values)
+    np.testing.assert_array_equal(compact.prices(), trades.data['price'].values)
+    pd.testing.assert_frame_equal(
+        compact.to_trades().data[['timestamp', 'price', 'amount', 'side']],
+        trades.data[['timestamp', 'price', 'amount', 'side']]
+    )
+    # uint32 + int32 + float32 + int8 per trade instead of int64 + float64 + float64 + int8
+    assert compact.nbytes == 13 * len(compact) + 8 * len(compact.ts_base)
+
+
+@pytest.mark.parametrize("make_kit", [
+    lambda td: TimeBarKit(td, pd.Timedelta(minutes=5)),
+    lambda td: TickBarKit(td, 1000),
+    lambda td: VolumeBarKit(td, 2000.0),
+    lambda td: DollarBarKit(td, 3e7),
+])
+def test_compact_bars_match_regular_bars(make_kit):
+    trades = _trades()
+    compact_kit, kit = make_kit(trades.to_compact()), make_kit(trades)
+
+    pd.testing.assert_frame_equal(compact_kit.build_ohlcv(), kit.build_ohlcv(), check_dtype=False)
+    pd.testing.assert_frame_equal(
+        compact_kit.build_directional_features(), kit.build_directional_features(), check_dtype=False
+    )
+    pd.testing.assert_frame_equal(compact_kit.build_all(), kit.build_all(), rtol=1e-6)
+
+
+def test_compact_not_representable_or_unsupported():
+    trades = _trades(n=1000)
+    with pytest.raises(ValueError):
+        CompactTradesData.from_trades(trades, price_tick=0.3)
+    with pytest.raises(NotImplementedError):
+        CUSUMBarKit(trades.to_compact(), np.full(1000, 1e-3))
+    with pytest.raises(NotImplementedError):
+        TickBarKit(trades.to_compact(), 100).build_footprints()
+
+    ts = trades.data['timestamp'].values + 1000  # Not on the millisecond grid
+    shifted = TradesData(ts, trades.data['price'].values, trades.data['amount'].values, timestamp_unit='ns')
+    with pytest.raises(ValueError):
+        shifted.to_compact(ts_unit='ms')
+    with pytest.raises(ValueError):
+        shifted.to_compact(ts_unit='ns')  # Offsets of the ~4 minute block overflow uint32 nanoseconds
+    assert len(shifted.to_compact(ts_unit='us')) == 1000
@@ -91,3 +91,29 @@ def test_preprocess_pipeline_and_rounding_and_side_inference(tmp_path):
 
     # environment detector returns a bool
     assert isinstance(_is_notebook_environment(), bool)
+
+
+def test_from_partitions_matches_single_preprocess():
+    rng = np.random.default_rng(4)
+    n = 3000
+    ids = np.arange(n, dtype=np.int64)
+    ids = ids[rng.random(n) > 0.01]  # some missing trades
+    ts = pd.Timestamp('2021-01-01').value // 1000 + np.cumsum(rng.integers(0, 50_000_000, len(ids)))  # us
+    px = 100.0 + np.round(np.cumsum(rng.normal(0, 0.05, len(ids))), 2)
+    qty = rng.exponential(1.0, len(ids))
+    bm = rng.random(len(ids)) > 0.5
+
+    # Three partitions with an overlapping (duplicated) trade between the first two
+    bounds = [(0, 1001), (1000, 2000), (2000, len(ids))]
+    partitions = [(ts[a:b], px[a:b], qty[a:b], ids[a:b], bm[a:b]) for a, b in bounds]
+
+    merged = TradesData.from_partitions(partitions, proc_res='ms', name='PARTS')
+    # Reference: the same trades shuffled into one partition
+    perm = rng.permutation(len(ids))
+    single = TradesData(ts[perm], px[perm], qty[perm], ids[perm], is_buyer_maker=bm[perm],
+                        preprocess=True, proc_res='ms', name='SINGLE')
+
+    pd.testing.assert_frame_equal(merged.data, single.data)
+    assert merged.data_ok is False  # duplicate id
+    assert merged.missing_pct == pytest.approx(single.missing_pct) and merged.missing_pct > 0
+    assert merged.discontinuities == single.discontinuities
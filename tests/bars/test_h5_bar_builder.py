@@ -0,0 +1,115 @@
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from afmlkit.bar.data_model import TradesData
+from afmlkit.bar.io import H5BarBuilder, H5TradesPrefetcher
+from afmlkit.bar.kit import TickBarKit, DollarBarKit
+from tests.utils import random_trades, build_trades_h5
+
+
+def _build_trades_h5(path: str) -> TradesData:
+    # Three months of trades, every ~10 minutes
+    ts, px, qty, side = random_trades(6000, seed=21, start='2021-01-20', min_step=1, max_step=40,
+                                      step=pd.Timedelta(seconds=30))
+    return build_trades_h5(path, ts, px, qty, side=side)
+
+
+@pytest.mark.parametrize("make_kit", [
+    lambda td: TickBarKit(td, 97),
+    lambda td: DollarBarKit(td, 2500.0),
+])
+def test_h5_bar_builder_matches_in_memory_bars(tmp_path, make_kit):
+    trades_path, bars_path = str(tmp_path / 'trades.h5'), str(tmp_path / 'bars.h5')
+    trades = _build_trades_h5(trades_path)
+    expected = make_kit(trades).build_ohlcv()
+
+    builder = H5BarBuilder(trades_path, make_kit(None))
+    assert len(builder.keys) >= 3
+    n_bars = builder.run(bars_path, 'bars', close_partial=False)
+
+    bars = pd.read_hdf(bars_path, 'bars')
+    assert n_bars == len(bars) == len(expected)
+    pd.testing.assert_frame_equal(bars, expected, check_freq=False)
+
+    with pytest.raises(ValueError):
+        H5BarBuilder(trades_path, make_kit(None)).run(bars_path, 'bars')
+
+
+def test_h5_bar_builder_time_range_and_errors(tmp_path):
+    trades_path = str(tmp_path / 'trades.h5')
+    trades = _build_trades_h5(trades_path)
+
+    builder = H5BarBuilder(trades_path, TickBarKit(None, 50), start_time='2021-02-10', end_time='2021-03-05')
+    assert builder.keys == ['/trades/2021-02', '/trades/2021-03']
+    months = list(builder.iter_months())
+    loaded = pd.concat([t.data for _, t in months])
+    assert loaded.index.min() >= pd.Timestamp('2021-02-10')
+    assert loaded.index.max() <= pd.Timestamp('2021-03-05')
+    assert len(loaded) == ((trades.data.index >= '2021-02-10') & (trades.data.index <= '2021-03-05')).sum()
+
+    with pytest.raises(KeyError):
+        H5BarBuilder(trades_path, TickBarKit(None, 50), keys=['1999-01'])
+
+
+def test_prefetcher_bounds_the_months_in_flight(tmp_path):
+    trades_path = str(tmp_path / 'trades.h5')
+    _build_trades_h5(trades_path)
+
+    prefetcher = H5TradesPrefetcher(trades_path, prefetch=2, n_threads=2)
+    loaded, consumed = [], []
+    load = prefetcher.load
+
+    def _recording_load(key):
+        loaded.append(key)
+        return load(key)
+
+    prefetcher.load = _recording_load
+    for key, trades in prefetcher:
+        # At most `prefetch` months are requested beyond the one being processed
+        assert len(loaded) <= len(consumed) + 1 + prefetcher.prefetch
+        expected = TradesData.load_trades_h5(trades_path, key=key.split('/')[-1], enable_multiprocessing=False)
+        pd.testing.assert_frame_equal(trades.data, expected.data)
+        consumed.append(key)
+    assert consumed == loaded == prefetcher.keys
+    assert [key for key, _ in H5TradesPrefetcher(trades_path, prefetch=0)] == consumed
+
+    # Loader errors are raised in the consumer when their month is reached
+    def _failing_load(key):
+        if key == prefetcher.keys[1]:
+            raise OSError('unreadable')
+        return load(key)
+
+    prefetcher.load = _failing_load
+    months = iter(prefetcher)
+    assert next(months)[0] == prefetcher.keys[0]
+    with pytest.raises(OSError):
+        next(months)
+
+
+@pytest.mark.parametrize("prefetch", [1, 2])
+def test_prefetcher_loads_next_months_while_the_consumer_works(tmp_path, prefetch):
+    trades_path = str(tmp_path / 'trades.h5')
+    _build_trades_h5(trades_path)
+
+    prefetcher = H5TradesPrefetcher(trades_path, prefetch=prefetch)
+    started = {key: threading.Event() for key in prefetcher.keys}
+    load = prefetcher.load
+
+    def _slow_load(key):
+        started[key].set()
+        time.sleep(0.3)
+        return load(key)
+
+    prefetcher.load = _slow_load
+    t0 = time.perf_counter()
+    for i, (key, _) in enumerate(prefetcher):
+        # The next month is being loaded while this one is processed
+        if i + 1 < len(prefetcher.keys):
+            assert started[prefetcher.keys[i + 1]].wait(timeout=5)
+        time.sleep(0.3)
+    # Serial loading and processing would take 2 * 3 * 0.3s, overlapped about 4 * 0.3s
+    assert len(prefetcher.keys) == 3
+    assert time.perf_counter() - t0 < 5 * 0.3
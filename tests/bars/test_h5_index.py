@@ -0,0 +1,146 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from afmlkit.bar.data_model import TradesData
+from afmlkit.bar.h5_index import TradesH5Index
+from afmlkit.bar.io import H5Inspector, H5TradesPrefetcher
+from tests.utils import random_trades, build_trades_h5
+
+
+# Mostly sub-minute spacing with a few multi-minute gaps
+GAPPY = dict(max_step=20, step=pd.Timedelta(seconds=1), gap_prob=0.01)
+
+
+def _build_trades_h5(path: str) -> TradesData:
+    months = [random_trades(20_000, seed=i, start=f'{month}-05', **GAPPY)
+              for i, month in enumerate(['2021-01', '2021-02', '2021-03'])]
+    ts, px, qty, _ = (np.concatenate(cols) for cols in zip(*months))
+    return build_trades_h5(path, ts, px, qty)
+
+
+def test_index_answers_inspection_like_the_store(tmp_path):
+    path = str(tmp_path / 'trades.h5')
+    _build_trades_h5(path)
+    inspector = H5Inspector(path)
+
+    indexed_keys = inspector.list_keys()
+    indexed_stats = {key: inspector.get_statistics(key) for key in indexed_keys}
+    indexed_gaps = inspector.inspect_gaps(max_gap=pd.Timedelta(minutes=2), processes=1)
+    assert any(indexed_gaps.values())
+
+    # Same answers from the store itself
+    os.remove(TradesH5Index.path_for(path))
+    assert inspector.list_keys() == indexed_keys == ['/trades/2021-01', '/trades/2021-02', '/trades/2021-03']
+    for key in indexed_keys:
+        stats = inspector.get_statistics(key)
+        assert stats['record_count'] == indexed_stats[key]['record_count']
+        assert stats['first_timestamp'] == indexed_stats[key]['first_timestamp']
+        assert stats['last_timestamp'] == indexed_stats[key]['last_timestamp']
+        assert stats['price_range'] == indexed_stats[key]['price_range']
+        assert stats['amount_range'] == indexed_stats[key]['amount_range']
+    assert inspector.inspect_gaps(max_gap=pd.Timedelta(minutes=2), processes=1) == indexed_gaps
+
+    # Rebuilding the index from the store gives the same entries as the incremental updates
+    _build_trades_h5(str(tmp_path / 'again.h5'))
+    rebuilt = inspector.build_index()
+    assert rebuilt.entries == TradesH5Index.load(str(tmp_path / 'again.h5')).entries
+
+
+def test_time_range_load_seeks_to_day_offsets(tmp_path):
+    path = str(tmp_path / 'trades.h5')
+    full = _build_trades_h5(path).data
+
+    start, end = pd.Timestamp('2021-02-06 13:30'), pd.Timestamp('2021-03-06 02:00')
+    index = TradesH5Index.load(path)
+    assert index.keys_for_timerange(start, end) == ['/trades/2021-02', '/trades/2021-03']
+    start_row, stop_row = index.row_range('/trades/2021-02', start, end)
+    assert 0 < start_row < stop_row == index.entries['/trades/2021-02']['record_count']
+
+    for kwargs in [dict(enable_multiprocessing=False), dict(n_workers=2), dict(n_workers=2, use_shared_memory=False)]:
+        loaded = TradesData.load_trades_h5(path, start_time=start, end_time=end, **kwargs)
+        expected = full[(full.index >= start) & (full.index <= end)]
+        np.testing.assert_array_equal(loaded.data['timestamp'].values, expected['timestamp'].values)
+        np.testing.assert_array_equal(loaded.data['price'].values, expected['price'].values)
+
+
+def test_index_tracks_appends_and_unindexed_groups(tmp_path):
+    path = str(tmp_path / 'trades.h5')
+    ts, px, qty, _ = random_trades(20_000, seed=3, start='2021-01-05', **GAPPY)
+    ids = np.arange(20_000, dtype=np.int64)
+    half = 12_345
+    TradesData(ts[:half], px[:half], qty[:half], ids[:half], timestamp_unit='ns').save_h5(path, month_key='2021-01')
+    TradesData(ts[half:], px[half:], qty[half:], ids[half:], timestamp_unit='ns').save_h5(
+        path, month_key='2021-01', overwrite_month=False
+    )
+    appended = TradesH5Index.load(path).entries['/trades/2021-01']
+    assert appended['record_count'] == len(ts)
+    assert appended == TradesH5Index.rebuild(path).entries['/trades/2021-01']
+
+    # A new index on a store with other groups is incomplete: readers fall back to the store until it is rebuilt
+    os.remove(TradesH5Index.path_for(path))
+    ts, px, qty, _ = random_trades(1000, seed=4, start='2021-02-05', **GAPPY)
+    ids = np.arange(20_000, 21_000, dtype=np.int64)
+    TradesData(ts, px, qty, ids, timestamp_unit='ns').save_h5(path, month_key='2021-02')
+    assert not TradesH5Index.load(path).complete
+    assert TradesH5Index.load_complete(path) is None
+    inspector = H5Inspector(path)
+    assert inspector.list_keys() == ['/trades/2021-01', '/trades/2021-02']
+    assert inspector.build_index().complete
+    assert TradesH5Index.load_complete(path).keys() == ['/trades/2021-01', '/trades/2021-02']
+
+
+def test_stale_index_entries_fall_back_to_the_time_filter(tmp_path):
+    path = str(tmp_path / 'trades.h5')
+    ts, px, qty, _ = random_trades(20_000, seed=5, start='2021-01-05', **GAPPY)
+    ids = np.arange(20_000, dtype=np.int64)
+    half = 12_345
+    TradesData(ts[:half], px[:half], qty[:half], ids[:half], timestamp_unit='ns').save_h5(path, month_key='2021-01')
+    with open(TradesH5Index.path_for(path)) as f:
+        stale = f.read()
+    TradesData(ts[half:], px[half:], qty[half:], ids[half:], timestamp_unit='ns').save_h5(
+        path, month_key='2021-01', overwrite_month=False
+    )
+    # As if the writer was interrupted before updating the index
+    with open(TradesH5Index.path_for(path), 'w') as f:
+        f.write(stale)
+
+    start, end = pd.Timestamp(ts[half // 2]), pd.Timestamp(ts[-100])
+    expected = ts[(ts >= start.value) & (ts <= end.value)]
+    for kwargs in [dict(enable_multiprocessing=False), dict(n_workers=2)]:
+        loaded = TradesData.load_trades_h5(path, start_time=start, end_time=end, **kwargs)
+        np.testing.assert_array_equal(loaded.data['timestamp'].values, expected)
+    (_, month), = H5TradesPrefetcher(path, start_time=start, end_time=end, prefetch=0)
+    np.testing.assert_array_equal(month.data['timestamp'].values, expected)
+
+
+def test_index_of_groups_changed_by_other_tools_is_ignored(tmp_path):
+    path = str(tmp_path / 'trades.h5')
+    written = _build_trades_h5(path)
+    ts, px, qty, _ = random_trades(1000, seed=6, start='2021-05-05', **GAPPY)
+    ids = np.arange(60_000, 61_000, dtype=np.int64)
+    added = TradesData(ts, px, qty, ids, timestamp_unit='ns').data
+    inspector = H5Inspector(path)
+
+    # A group added without updating the index
+    with pd.HDFStore(path, mode='a') as store:
+        store.put('/trades/2021-05', added, format='table')
+    expected = np.concatenate([written.data['timestamp'].values, added['timestamp'].values])
+    assert TradesH5Index.load_complete(path) is None
+    assert inspector.list_keys() == ['/trades/2021-01', '/trades/2021-02', '/trades/2021-03', '/trades/2021-05']
+    assert '/trades/2021-05' in inspector.inspect_gaps(max_gap=pd.Timedelta(minutes=2), processes=1)
+    loaded = TradesData.load_trades_h5(path, start_time='2021-01-01', end_time='2021-12-31',
+                                       enable_multiprocessing=False)
+    np.testing.assert_array_equal(loaded.data['timestamp'].values, expected)
+
+    # A group removed without updating the index
+    inspector.build_index()
+    with pd.HDFStore(path, mode='a') as store:
+        store.remove('/trades/2021-02')
+    expected = expected[pd.to_datetime(expected).to_period('M') != '2021-02']
+    assert TradesH5Index.load_complete(path) is None
+    assert inspector.list_keys() == ['/trades/2021-01', '/trades/2021-03', '/trades/2021-05']
+    for kwargs in [dict(enable_multiprocessing=False), dict(n_workers=2)]:
+        loaded = TradesData.load_trades_h5(path, start_time='2021-01-01', end_time='2021-12-31', **kwargs)
+        np.testing.assert_array_equal(loaded.data['timestamp'].values, expected)
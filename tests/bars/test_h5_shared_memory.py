@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from afmlkit.bar.data_model import TradesData
+from tests.utils import random_trades, build_trades_h5
+
+
+def _build_trades_h5(path: str) -> TradesData:
+    # Three months of trades, every ~10 minutes
+    ts, px, qty, side = random_trades(6000, seed=8, start='2021-01-20', min_step=1, max_step=40,
+                                      step=pd.Timedelta(seconds=30))
+    return build_trades_h5(path, ts, px, qty, side=side)
+
+
+@pytest.mark.parametrize("start_time, end_time", [
+    (None, None),
+    ('2021-02-10 03:00', '2021-03-01 12:00'),
+])
+def test_shared_memory_load_matches_sequential(tmp_path, start_time, end_time):
+    path = str(tmp_path / 'trades.h5')
+    _build_trades_h5(path)
+
+    shared = TradesData.load_trades_h5(path, start_time=start_time, end_time=end_time, n_workers=2)
+    sequential = TradesData.load_trades_h5(path, start_time=start_time, end_time=end_time,
+                                           enable_multiprocessing=False)
+
+    assert len(shared._shared_memory) == 6  # One block per column: index, timestamp, price, amount, id, side
+    pd.testing.assert_frame_equal(shared.data, sequential.data, check_freq=False)
+    # The frame wraps the shared buffers
+    assert any(np.shares_memory(shared.data['price'].values, np.asarray(shm.buf))
+               for shm in shared._shared_memory)
+
+
+def test_shared_memory_load_with_stale_metadata_falls_back(tmp_path):
+    path = str(tmp_path / 'trades.h5')
+    expected = _build_trades_h5(path)
+    with pd.HDFStore(path) as store:
+        meta = store['/meta/2021-02']
+        meta['record_count'] = 10  # Fewer rows than stored: the worker refuses to overflow its slice
+        store.put('/meta/2021-02', meta)
+
+    loaded = TradesData.load_trades_h5(path, n_workers=2)
+    assert not hasattr(loaded, '_shared_memory')
+    pd.testing.assert_frame_equal(loaded.data, expected.data, check_freq=False)
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from afmlkit.bar.data_model import TradesData
+from afmlkit.bar.kit import ImbalanceBarKit
+from afmlkit.bar.logic import _imbalance_bar_indexer, TICK_BAR, VOLUME_BAR, DOLLAR_BAR
+from tests.utils import random_trades
+
+
+def _reference_imbalance_bars(sides, prices, volumes, bar_type, e_t0, ticks_span, imb_span, t_min, t_max):
+    """Plain python reference of the imbalance bar rule."""
+    a_t, a_b = 2 / (ticks_span + 1), 2 / (imb_span + 1)
+    e_t = min(max(e_t0, t_min), t_max)
+    t_num = t_den = b_num = b_den = theta = 0.0
+    ticks = 0
+    closes = [0]
+    for i in range(1, len(sides)):
+        v = [1.0, volumes[i], prices[i] * volumes[i]][bar_type]
+        bv = sides[i] * v
+        theta += bv
+        ticks += 1
+        b_num = (1 - a_b) * b_num + bv
+        b_den = (1 - a_b) * b_den + 1
+        if abs(theta) >= e_t * abs(b_num / b_den):
+            closes.append(i)
+            t_num = (1 - a_t) * t_num + ticks
+            t_den = (1 - a_t) * t_den + 1
+            e_t = min(max(t_num / t_den, t_min), t_max)
+            theta, ticks = 0.0, 0
+    return closes
+
+
+@pytest.mark.parametrize("bar_type", [TICK_BAR, VOLUME_BAR, DOLLAR_BAR])
+def test_imbalance_indexer_matches_reference(bar_type):
+    _, px, qty, side = random_trades(seed=7, min_step=1, buy_prob=0.55)
+    params = (50.0, 20.0, 500.0, 5.0, 500.0)
+    closes, thresholds = _imbalance_bar_indexer(side, px, qty, bar_type, *params)
+
+    expected = _reference_imbalance_bars(side, px, qty, bar_type, *params)
+    assert list(closes) == expected
+    assert len(thresholds) == len(closes)
+    assert np.isnan(thresholds[0])
+    assert np.all(np.array(list(thresholds)[1:]) > 0)
+
+
+def test_imbalance_indexer_respects_expected_ticks_bounds():
+    _, px, qty, side = random_trades(seed=7, min_step=1, buy_prob=0.9)
+    closes, _ = _imbalance_bar_indexer(side, px, qty, TICK_BAR, 100.0, 5.0, 100.0, 20.0, 40.0)
+    # A strongly one-sided flow closes each bar in at most ~max_expected_ticks trades
+    bar_lengths = np.diff(np.array(list(closes)))
+    assert bar_lengths.min() >= 1
+    assert bar_lengths.max() <= 60
+
+
+def test_imbalance_bar_kit_builds_bars():
+    ts, px, qty, side = random_trades(seed=7, min_step=1, buy_prob=0.55)
+    kit = ImbalanceBarKit(TradesData(ts, px, qty, side=side, timestamp_unit='ns'), 'volume',
+                          expected_ticks_init=50, imbalance_span=500)
+    ohlcv = kit.build_ohlcv()
+
+    closes, _ = _imbalance_bar_indexer(side, px, qty, VOLUME_BAR, 50.0, 20.0, 500.0, 1.0, np.inf)
+    assert len(ohlcv) == len(closes) - 1
+    assert ohlcv['trades'].sum() == closes[-1]
+    assert len(kit.get_thresholds()) == len(ohlcv)
+
+
+def test_imbalance_bar_kit_invalid_type():
+    ts, px, qty, side = random_trades(10, seed=7, min_step=1, buy_prob=0.55)
+    with pytest.raises(ValueError):
+        ImbalanceBarKit(TradesData(ts, px, qty, side=side, timestamp_unit='ns'), 'range')
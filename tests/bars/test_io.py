@@ -123,3 +123,39 @@ def test_timebarreader_list_and_range_and_resample(tmp_path):
     assert g2['trades'] == 2 + 3 + 1
     assert pytest.approx(g2['vwap'], rel=1e-6) == (13.5*4 + 14.5*5 + 15.5*6) / 15
     assert pytest.approx(g2['median_trade_size'], rel=1e-6) == 5
+
+
+def test_timebarreader_resample_matches_pandas_groupby():
+    rng = np.random.default_rng(7)
+    n = 5000
+    idx = pd.date_range('2021-01-01', periods=n, freq='s')
+    close = 100 + np.cumsum(rng.normal(0, 0.1, n))
+    trades = rng.integers(0, 4, n).astype(np.int64)
+    df = pd.DataFrame({
+        'open': close, 'high': close + 1, 'low': close - 1, 'close': close + 0.5,
+        'volume': (rng.random(n) * trades).astype(np.float32),
+        'trades': trades,
+        'vwap': close + 0.2,
+        'median_trade_size': rng.integers(1, 10, n).astype(np.float64),
+    }, index=idx)
+    df.iloc[10:12, :4] = np.nan
+    df.iloc[120:180, df.columns.get_loc('trades')] = 0
+    df.iloc[120:180, df.columns.get_loc('volume')] = 0
+
+    # Reference: pandas groupby aggregation with the trade-count weighted median
+    grouper = df.index.floor('1min')
+    expected = df.groupby(grouper).agg({'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last',
+                                        'volume': 'sum', 'trades': 'sum'})
+    expected['vwap'] = ((df['vwap'] * df['volume']).groupby(grouper).sum()
+                        / df['volume'].groupby(grouper).sum()).astype('float32')
+
+    def w_median(sub):
+        order = np.argsort(sub['median_trade_size'].values)
+        cum_w = np.cumsum(sub['trades'].values[order].astype(np.float64))
+        return sub['median_trade_size'].values[order][np.searchsorted(cum_w, cum_w[-1] * 0.5)]
+
+    expected['median_trade_size'] = df.groupby(grouper).apply(w_median).astype('float32')
+
+    out = TimeBarReader._resample(df.iloc[rng.permutation(n)], '1min')
+    pd.testing.assert_frame_equal(out, expected, check_freq=False, check_names=False)
+    assert np.isnan(out['vwap'].iloc[2])
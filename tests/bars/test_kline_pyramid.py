@@ -0,0 +1,75 @@
+import pandas as pd
+import pytest
+
+from afmlkit.bar.io import AddTimeBarH5, TimeBarReader, KLINE_LEVELS
+from tests.utils import random_trades, build_trades_h5
+
+
+def _build_trades_h5(path: str) -> None:
+    # About 40 hours of trades across a month boundary
+    ts, px, qty, _ = random_trades(100_000, seed=5, start='2021-01-31 06:00', min_step=1, max_step=3000)
+    build_trades_h5(path, ts, px, qty)
+
+
+@pytest.fixture(scope='module')
+def pyramid_h5(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('pyramid') / 'trades.h5')
+    _build_trades_h5(path)
+    results = AddTimeBarH5(path, levels=list(KLINE_LEVELS)).process_all()
+    assert all(results.values())
+    return path
+
+
+@pytest.mark.parametrize("timeframe, start_time, end_time, level", [
+    ('5min', None, None, '5min'),
+    ('2h', None, None, '1h'),
+    ('1D', '2021-01-31', '2021-02-01 23:59:59', '1D'),
+    ('15min', '2021-01-31 18:00', '2021-02-01 06:59:59', '5min'),
+    ('1h', '2021-01-31 18:00:30', None, None),  # Start cuts a level bar -> 1-second bars
+    ('90s', None, None, None),
+])
+def test_read_from_level_matches_1s_resampling(pyramid_h5, monkeypatch, timeframe, start_time, end_time, level):
+    reader = TimeBarReader(pyramid_h5)
+    with pd.HDFStore(pyramid_h5, mode='r') as store:
+        keys = reader._find_relevant_keys()
+        start = pd.Timestamp(start_time) if start_time else None
+        end = pd.Timestamp(end_time) if end_time else None
+        assert reader._select_level(store, keys, timeframe, start, end) == level
+
+    out = reader.read(start_time, end_time, timeframe=timeframe)
+    monkeypatch.setattr(reader, '_select_level', lambda *args: None)
+    expected = reader.read(start_time, end_time, timeframe=timeframe)
+
+    assert len(out) > 0
+    columns = list(expected.columns.drop('median_trade_size'))
+    pd.testing.assert_frame_equal(out[columns], expected[columns], check_freq=False, rtol=1e-5)
+    # Bucket medians are only re-aggregated exactly when the timeframe is the level itself, and the first bucket of
+    # a month also holds the last bar (closing at midnight) of the previous month's partition
+    if level in (None, timeframe):
+        exact = out.index != pd.Timestamp('2021-02-01')
+        pd.testing.assert_series_equal(out['median_trade_size'][exact], expected['median_trade_size'][exact])
+
+
+def test_list_levels_and_add_missing_levels(tmp_path):
+    path = str(tmp_path / 'trades.h5')
+    _build_trades_h5(path)
+    assert all(AddTimeBarH5(path).process_all().values())
+    reader = TimeBarReader(path)
+    assert reader.list_levels() == []
+
+    # Levels are added from the stored 1-second bars, without rebuilding them
+    builder = AddTimeBarH5(path, keys=['/trades/2021-02'], levels=['1h', '5min'])
+    assert builder.levels == ['5min', '1h']
+    assert builder.process_key('/trades/2021-02')
+    assert not builder.process_key('/trades/2021-02')
+    assert reader.list_levels() == ['5min', '1h']
+    assert reader.list_keys() == ['/klines/2021-01', '/klines/2021-02']
+
+    # The January partition lacks the levels: reads spanning it fall back to the 1-second bars
+    with pd.HDFStore(path, mode='r') as store:
+        assert reader._select_level(store, reader._find_relevant_keys(), '1h', None, None) is None
+        start = pd.Timestamp('2021-02-01 01:00')
+        assert reader._select_level(store, reader._find_relevant_keys(start, None), '1h', start, None) == '1h'
+
+    with pytest.raises(ValueError):
+        AddTimeBarH5(path, levels=['1W'])
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from afmlkit.bar.kit import MultiBarKit, TimeBarKit, TickBarKit, VolumeBarKit, DollarBarKit
+from tests.utils import random_trades_data
+
+
+SPECS = [
+    ('time', pd.Timedelta(seconds=10)),
+    ('time', pd.Timedelta(minutes=1)),
+    ('tick', 50),
+    ('tick', 3),
+    ('volume', 25.0),
+    ('dollar', 3000.0),
+    ('dollar', 1e7),
+]
+
+
+def _single_kit(bar_type, threshold, trades):
+    kit_classes = {'time': TimeBarKit, 'tick': TickBarKit, 'volume': VolumeBarKit, 'dollar': DollarBarKit}
+    return kit_classes[bar_type](trades, threshold)
+
+
+def test_multi_bar_closes_match_single_kits():
+    trades = random_trades_data(20_000, seed=5)
+    closes = MultiBarKit(trades, SPECS).comp_bar_closes()
+
+    assert len(closes) == len(SPECS)
+    for (bar_type, threshold), (close_ts, close_indices) in zip(SPECS, closes):
+        expected_ts, expected_indices = _single_kit(bar_type, threshold, trades)._comp_bar_close()
+        np.testing.assert_array_equal(close_indices, expected_indices)
+        np.testing.assert_array_equal(close_ts, expected_ts)
+
+
+def test_multi_bar_kits_build_bars():
+    trades = random_trades_data(5000, seed=5)
+    kits = MultiBarKit(trades, SPECS[1:4]).build_kits()
+
+    assert [type(kit) for kit in kits] == [TimeBarKit, TickBarKit, TickBarKit]
+    for (bar_type, threshold), kit in zip(SPECS[1:4], kits):
+        expected = _single_kit(bar_type, threshold, trades).build_ohlcv()
+        pd.testing.assert_frame_equal(kit.build_ohlcv(), expected)
+
+
+def test_multi_bar_kit_invalid_specs():
+    trades = random_trades_data(10, seed=5)
+    with pytest.raises(ValueError):
+        MultiBarKit(trades, [('range', 1.0)])
+    with pytest.raises(ValueError):
+        MultiBarKit(trades, [('time', 60)])
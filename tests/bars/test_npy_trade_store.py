@@ -0,0 +1,67 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from afmlkit.bar.data_model import TradesData
+from afmlkit.bar.kit import TimeBarKit, DollarBarKit
+
+
+def _trades(n=6000, seed=9):
+    # Three months of trades, every ~10 minutes
+    rng = np.random.default_rng(seed)
+    t0 = pd.Timestamp('2021-01-20').value
+    ts = t0 + np.cumsum(rng.integers(1, 40, n)) * 30 * 1_000_000_000
+    px = 100.0 + np.round(np.cumsum(rng.normal(0, 0.05, n)), 2)
+    qty = rng.exponential(1.0, n)
+    side = np.where(rng.random(n) > 0.5, 1, -1).astype(np.int8)
+    ids = np.arange(n, dtype=np.int64)
+    return TradesData(ts.astype(np.int64), px, qty, ids, side=side, timestamp_unit='ns')
+
+
+def test_npy_store_round_trip(tmp_path):
+    trades = _trades()
+    assert trades.save_npy(str(tmp_path)) == ['2021-01', '2021-02', '2021-03']
+    assert (tmp_path / '2021-02' / 'side.npy').exists()
+
+    loaded = TradesData.load_npy(str(tmp_path))
+    pd.testing.assert_frame_equal(loaded.data, trades.data, check_freq=False)
+    pd.testing.assert_frame_equal(
+        DollarBarKit(loaded, 2500.0).build_ohlcv(), DollarBarKit(trades, 2500.0).build_ohlcv()
+    )
+
+
+def test_npy_store_single_month_is_memory_mapped(tmp_path):
+    trades = _trades()
+    trades.save_npy(str(tmp_path))
+    start, end = pd.Timestamp('2021-02-03 10:00'), pd.Timestamp('2021-02-20')
+
+    loaded = TradesData.load_npy(str(tmp_path), start_time=start, end_time=end, columns=['side'])
+    expected = trades.data.loc[start:end, ['timestamp', 'price', 'amount', 'side']]
+    pd.testing.assert_frame_equal(loaded.data[expected.columns], expected, check_freq=False)
+
+    prices = loaded.data['price'].values
+    assert isinstance(prices, np.memmap) and not prices.flags.writeable
+    assert os.path.samefile(prices.filename, tmp_path / '2021-02' / 'price.npy')
+    # Bars are built straight from the mapped arrays
+    bars = TimeBarKit(loaded, pd.Timedelta(hours=6)).build_ohlcv()
+    assert bars['volume'].sum() == pytest.approx(expected['amount'].sum())
+
+
+def test_npy_store_month_overwrite(tmp_path):
+    trades = _trades()
+    trades.save_npy(str(tmp_path))
+    with pytest.raises(FileExistsError):
+        trades.save_npy(str(tmp_path), overwrite_month=False)
+    with pytest.raises(ValueError):
+        TradesData.load_npy(str(tmp_path), start_time='2022-01-01')
+
+
+def test_npy_store_unsorted_trades_keep_every_month(tmp_path):
+    ts = pd.to_datetime(['2021-01-05', '2021-02-05', '2021-01-06']).values.astype(np.int64)
+    trades = TradesData(ts, np.array([1.0, 2.0, 3.0]), np.ones(3), timestamp_unit='ns')
+
+    assert trades.save_npy(str(tmp_path)) == ['2021-01', '2021-02']
+    loaded = TradesData.load_npy(str(tmp_path))
+    assert loaded.data['price'].tolist() == [1.0, 3.0, 2.0]
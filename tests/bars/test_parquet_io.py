@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from afmlkit.bar.data_model import TradesData
+from afmlkit.bar.kit import TickBarKit
+
+
+def _trades(n=6000, seed=5):
+    # Three months of trades, every ~10 minutes
+    rng = np.random.default_rng(seed)
+    t0 = pd.Timestamp('2021-01-20').value
+    ts = t0 + np.cumsum(rng.integers(1, 40, n)) * 30 * 1_000_000_000
+    px = 100.0 + np.round(np.cumsum(rng.normal(0, 0.05, n)), 2)
+    qty = rng.exponential(1.0, n)
+    side = np.where(rng.random(n) > 0.5, 1, -1).astype(np.int8)
+    ids = np.arange(n, dtype=np.int64)
+    return TradesData(ts.astype(np.int64), px, qty, ids, side=side, timestamp_unit='ns')
+
+
+def test_parquet_round_trip_partitioned_by_month(tmp_path):
+    trades = _trades()
+    months = trades.save_parquet(str(tmp_path), row_group_size=500)
+
+    assert months == ['2021-01', '2021-02', '2021-03']
+    assert (tmp_path / 'month=2021-02' / 'trades.parquet').exists()
+
+    loaded = TradesData.load_parquet(str(tmp_path))
+    pd.testing.assert_frame_equal(loaded.data, trades.data, check_freq=False)
+    pd.testing.assert_frame_equal(
+        TickBarKit(loaded, 100).build_ohlcv(), TickBarKit(trades, 100).build_ohlcv()
+    )
+
+
+def test_parquet_time_range_and_columns(tmp_path):
+    trades = _trades()
+    trades.save_parquet(str(tmp_path), row_group_size=500)
+    start, end = pd.Timestamp('2021-02-10 03:00'), pd.Timestamp('2021-03-01 12:00')
+
+    loaded = TradesData.load_parquet(str(tmp_path), start_time=start, end_time=end, columns=['side'])
+    expected = trades.data.loc[start:end, ['timestamp', 'price', 'amount', 'side']]
+
+    assert 'id' not in loaded.data.columns or loaded.data['id'].isna().all()
+    pd.testing.assert_frame_equal(loaded.data[expected.columns], expected, check_freq=False)
+
+
+def test_trades_data_wraps_arrays_without_copy():
+    ts = pd.Timestamp('2021-01-01').value + np.arange(100, dtype=np.int64) * 1_000_000_000
+    px, qty = np.linspace(100, 101, 100), np.ones(100)
+
+    wrapped = TradesData(ts, px, qty, timestamp_unit='ns', copy=False)
+    copied = TradesData(ts, px, qty, timestamp_unit='ns')
+
+    for col, arr in (('timestamp', ts), ('price', px), ('amount', qty)):
+        assert np.shares_memory(wrapped.data[col].values, arr)
+        assert not np.shares_memory(copied.data[col].values, arr)
+
+
+def test_parquet_empty_slice_raises(tmp_path):
+    _trades().save_parquet(str(tmp_path))
+    with pytest.raises(ValueError):
+        TradesData.load_parquet(str(tmp_path), start_time='2022-01-01')
+
+
+def test_parquet_unsorted_trades_keep_every_month(tmp_path):
+    ts = pd.to_datetime(['2021-01-05', '2021-02-05', '2021-01-06']).values.astype(np.int64)
+    trades = TradesData(ts, np.array([1.0, 2.0, 3.0]), np.ones(3), timestamp_unit='ns')
+
+    assert trades.save_parquet(str(tmp_path)) == ['2021-01', '2021-02']
+    loaded = TradesData.load_parquet(str(tmp_path))
+    assert loaded.data['price'].tolist() == [1.0, 3.0, 2.0]
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from afmlkit.bar.cache import PARTITION_CACHE, PartitionCache
+from afmlkit.bar.data_model import TradesData
+from afmlkit.bar.io import AddTimeBarH5, TimeBarReader
+
+
+def _save_month(path: str, month: str, n: int, seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    ts = pd.Timestamp(f'{month}-03').value + np.cumsum(rng.integers(1, 150_000, n)) * 1_000_000
+    px = 100.0 + np.round(np.cumsum(rng.normal(0, 0.05, n)), 2)
+    ids = np.arange(seed * n, (seed + 1) * n, dtype=np.int64)
+    TradesData(ts, px, rng.exponential(1.0, n), ids, timestamp_unit='ns').save_h5(path, month_key=month)
+
+
+@pytest.fixture
+def partition_cache():
+    PARTITION_CACHE.clear()
+    PARTITION_CACHE.set_budget(256 * 2**20)
+    yield PARTITION_CACHE
+    PARTITION_CACHE.set_budget(0)
+    PARTITION_CACHE.clear()
+
+
+def test_lru_eviction_and_invalidation(tmp_path):
+    path = tmp_path / 'file.h5'
+    path.write_bytes(b'')
+    frame = pd.DataFrame({'a': np.arange(100, dtype=np.float64)}, index=pd.date_range('2021', periods=100, freq='s'))
+    nbytes = 2 * 100 * 8
+
+    cache = PartitionCache(max_bytes=2 * nbytes)
+    for key in ['/x/1', '/x/2']:
+        cache.put(str(path), key, frame)
+    assert cache.get(str(path), '/x/1') is not None  # /x/2 becomes the least recently used
+    cache.put(str(path), '/x/3', frame)
+    assert cache.get(str(path), '/x/2') is None
+    cached = cache.get(str(path), '/x/3')
+    pd.testing.assert_frame_equal(cached, frame, check_freq=False)
+    with pytest.raises(ValueError):
+        cached['a'].values[0] = 1.0
+    assert cache.stats() == dict(hits=2, misses=1, evictions=1, entries=2, nbytes=2 * nbytes, max_bytes=2 * nbytes)
+
+    # Rewriting the file invalidates its groups
+    path.write_bytes(b'rewritten')
+    assert cache.get(str(path), '/x/3') is None
+    cache.put(str(path), '/x/3', frame)
+    assert cache.stats()['entries'] == 2
+
+
+def test_readers_serve_cached_partitions(tmp_path, partition_cache):
+    path = str(tmp_path / 'trades.h5')
+    for i, month in enumerate(['2021-01', '2021-02', '2021-03']):
+        _save_month(path, month, 30_000, seed=i)
+
+    ranges = [('2021-01-20', '2021-02-10'), ('2021-02-05', '2021-03-04 12:00'), (None, None)]
+    partition_cache.set_budget(0)
+    expected = [TradesData.load_trades_h5(path, start_time=s, end_time=e, n_workers=2).data for s, e in ranges]
+    partition_cache.set_budget(256 * 2**20)
+
+    for (start, end), frame in zip(ranges, expected):
+        for kwargs in [dict(n_workers=2), dict(enable_multiprocessing=False)]:
+            loaded = TradesData.load_trades_h5(path, start_time=start, end_time=end, **kwargs).data
+            pd.testing.assert_frame_equal(loaded, frame)
+    # Each trade group was decoded once
+    assert partition_cache.stats()['misses'] == 3
+    assert partition_cache.stats()['entries'] == 3
+
+    # Rewriting a month is picked up by the next read
+    _save_month(path, '2021-02', 1000, seed=7)
+    assert partition_cache.get(path, '/trades/2021-02') is None
+    loaded = TradesData.load_trades_h5(path, key='2021-02', enable_multiprocessing=False)
+    assert len(loaded.data) == 1000
+
+    # Klines are built last: the worker pools above are forked
+    assert all(AddTimeBarH5(path).process_all().values())
+    reader = TimeBarReader(path)
+    partition_cache.set_budget(0)
+    expected_bars = reader.read('2021-01-20', '2021-02-10', timeframe='1h')
+    partition_cache.set_budget(256 * 2**20)
+    partition_cache.clear()
+    for _ in range(2):
+        pd.testing.assert_frame_equal(reader.read('2021-01-20', '2021-02-10', timeframe='1h'), expected_bars)
+    assert partition_cache.stats()['hits'] == partition_cache.stats()['misses'] == 2
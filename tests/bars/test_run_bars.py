@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from afmlkit.bar.data_model import TradesData
+from afmlkit.bar.kit import RunBarKit
+from afmlkit.bar.logic import _run_bar_indexer, TICK_BAR, VOLUME_BAR, DOLLAR_BAR
+from afmlkit.bar.utils import comp_trade_side_vector
+from tests.utils import random_trades
+
+
+def _reference_run_bars(sides, prices, volumes, bar_type, e_t0, ticks_span, run_span, t_min, t_max):
+    """Plain python reference of the run bar rule."""
+    a_t, a_r = 2 / (ticks_span + 1), 2 / (run_span + 1)
+    e_t = min(max(e_t0, t_min), t_max)
+    t_num = t_den = p_num = p_den = bv_num = bv_den = sv_num = sv_den = 0.0
+    buy_run = sell_run = 0.0
+    ticks = 0
+    closes = [0]
+    for i in range(1, len(sides)):
+        v = [1.0, volumes[i], prices[i] * volumes[i]][bar_type]
+        ticks += 1
+        p_num = (1 - a_r) * p_num + (sides[i] > 0)
+        p_den = (1 - a_r) * p_den + 1
+        if sides[i] > 0:
+            buy_run += v
+            bv_num, bv_den = (1 - a_r) * bv_num + v, (1 - a_r) * bv_den + 1
+        else:
+            sell_run += v
+            sv_num, sv_den = (1 - a_r) * sv_num + v, (1 - a_r) * sv_den + 1
+        p = p_num / p_den
+        e_b = bv_num / bv_den if bv_den else 0.0
+        e_s = sv_num / sv_den if sv_den else 0.0
+        if max(buy_run, sell_run) >= e_t * max(p * e_b, (1 - p) * e_s):
+            closes.append(i)
+            t_num = (1 - a_t) * t_num + ticks
+            t_den = (1 - a_t) * t_den + 1
+            e_t = min(max(t_num / t_den, t_min), t_max)
+            buy_run = sell_run = 0.0
+            ticks = 0
+    return closes
+
+
+@pytest.mark.parametrize("bar_type", [TICK_BAR, VOLUME_BAR, DOLLAR_BAR])
+def test_run_indexer_matches_reference(bar_type):
+    _, px, qty, side = random_trades(seed=11, min_step=1)
+    params = (40.0, 20.0, 300.0, 5.0, 400.0)
+    closes, thresholds = _run_bar_indexer(side, px, qty, bar_type, *params)
+
+    expected = _reference_run_bars(side, px, qty, bar_type, *params)
+    assert list(closes) == expected
+    assert len(thresholds) == len(closes)
+    assert np.isnan(thresholds[0])
+
+
+def test_run_bar_kit_infers_sides_with_tick_rule():
+    ts, px, qty, _ = random_trades(seed=11, min_step=1)
+    kit = RunBarKit(TradesData(ts, px, qty, timestamp_unit='ns'), 'dollar', expected_ticks_init=30, run_span=300)
+    ohlcv = kit.build_ohlcv()
+
+    sides = comp_trade_side_vector(px)
+    closes, _ = _run_bar_indexer(sides, px, qty, DOLLAR_BAR, 30.0, 20.0, 300.0, 1.0, np.inf)
+    assert len(ohlcv) == len(closes) - 1
+    assert ohlcv['trades'].sum() == closes[-1]
+    assert len(kit.get_thresholds()) == len(ohlcv)
@@ -12,6 +12,7 @@ from afmlkit.bar.utils import (
     footprint_to_dataframe,
     fast_sort_trades,
     merge_split_trades,
+    merge_trade_partitions,
 )
 
 
@@ -130,6 +131,21 @@ def test_fast_sort_trades_and_merge_split_trades():
     assert isinstance(m2_side, np.ndarray) and m2_side.size == 0
 
 
+def test_merge_trade_partitions_dedup_and_gaps():
+    # Two id sorted partitions overlapping on id 5, with a duplicate inside the first one
+    ids = np.array([1, 2, 2, 5, 3, 4, 5, 9], dtype=np.int64)
+    ts = ids * 10
+    ts[4] = 5  # id 3 is older than id 2
+
+    order, start_ids, end_ids, pre_ts, post_ts, n_dup, ts_sorted = merge_trade_partitions(
+        ids, ts, np.array([0, 4, 8], dtype=np.int64)
+    )
+    assert ids[order].tolist() == [1, 2, 3, 4, 5, 9]
+    assert order.tolist() == [0, 1, 4, 5, 3, 7]  # first occurrence kept
+    assert n_dup == 2 and not ts_sorted
+    assert start_ids.tolist() == [5] and end_ids.tolist() == [9]
+    assert pre_ts.tolist() == [50] and post_ts.tolist() == [90]
+
 
 if __name__ == "__main__":
-    pytest.main([__file__])
\ No newline at end of file
+    pytest.main([__file__])
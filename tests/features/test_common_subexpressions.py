@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from afmlkit.feature.kit import Feature, Compose, FeatureKit
+from afmlkit.feature.transforms import SMA, EWMA, Return, ZScore
+from afmlkit.feature.utils import plan_common_subexpressions
+
+
+class CountingSMA(SMA):
+    calls = 0
+
+    def __call__(self, x, *, backend="nb"):
+        CountingSMA.calls += 1
+        return super().__call__(x, backend=backend)
+
+
+class CountingZScore(ZScore):
+    calls = 0
+
+    def __call__(self, x, *, backend="nb"):
+        CountingZScore.calls += 1
+        return super().__call__(x, backend=backend)
+
+
+def make_df(n=400):
+    idx = pd.date_range("2024-01-01", periods=n, freq="h")
+    rng = np.random.default_rng(3)
+    close = 100 + rng.normal(0, 1, n).cumsum()
+    return pd.DataFrame({"close": close, "volume": rng.exponential(1.0, n)}, index=idx)
+
+
+def make_kit():
+    f_sma = Feature(CountingSMA(5, input_col="close"))
+    f_ewma = Feature(EWMA(10, input_col="close"))
+    f_z = Feature(Compose(Return(1, input_col="close"), CountingZScore(20, input_col="ret")))
+    return FeatureKit([
+        f_sma / f_ewma,
+        f_sma - f_ewma,
+        Feature.max(f_sma, f_ewma),
+        f_sma.rolling_std(10),
+        f_z.lag(1),
+        f_z.abs(),
+        Feature(Compose(Return(1, input_col="close"), CountingZScore(30, input_col="ret"))),
+        Feature(CountingSMA(5, input_col="volume")) / Feature(EWMA(10, input_col="volume")),
+        f_sma,
+    ], retain=["close"])
+
+
+@pytest.mark.parametrize("backend", ["nb", "pd"])
+@pytest.mark.parametrize("n_jobs", [1, 3])
+def test_shared_subtrees_are_computed_once(backend, n_jobs):
+    df = make_df()
+    CountingSMA.calls = CountingZScore.calls = 0
+    expected = make_kit().build(df, backend=backend, cse=False)
+    assert (CountingSMA.calls, CountingZScore.calls) == (6, 3)
+
+    CountingSMA.calls = CountingZScore.calls = 0
+    out = make_kit().build(df, backend=backend, n_jobs=n_jobs)
+    pd.testing.assert_frame_equal(out, expected)
+    assert (CountingSMA.calls, CountingZScore.calls) == (2, 2)
+
+
+def test_plan_skips_ambiguous_names():
+    f_sma = Feature(SMA(5, input_col="close"))
+    plan = plan_common_subexpressions([f_sma / 2, f_sma * 2], ["close"])
+    assert [names for _, names in plan] == [[f_sma.transform.output_name]]
+    assert plan_common_subexpressions([f_sma / 2, f_sma * 2], ["close", f_sma.transform.output_name]) == []
+
+    # The ZScore steps read a "ret1" column rather than the previous step's output if present: it is not inserted
+    z1 = Feature(Compose(Return(1, input_col="close"), ZScore(20, input_col="ret1")))
+    plan = plan_common_subexpressions([z1.lag(1), z1.abs()], ["close"])
+    assert [(type(t), names) for t, names in plan] == [(Compose, ["z20", z1.name])]
+
+    # Pipelines with the same step names but other parameters are not merged
+    z2 = Feature(Compose(Return(2, input_col="close"), ZScore(20, input_col="ret2")))
+    assert plan_common_subexpressions([z1.lag(1), z2.lag(1), z1.abs()], ["close"]) == []
@@ -0,0 +1,120 @@
+import io
+
+import numpy as np
+import pandas as pd
+
+import afmlkit.feature.cache as cache_module
+from afmlkit.feature.cache import FeatureCache
+from afmlkit.feature.kit import Feature, FeatureKit
+from afmlkit.feature.transforms import SMA, EWMA, TimeCues
+
+
+SCALE = 2.0
+
+
+def scaled(x):
+    return x * SCALE
+
+
+def make_df(n=300):
+    idx = pd.date_range("2024-01-01", periods=n, freq="h")
+    rng = np.random.default_rng(2)
+    return pd.DataFrame({"close": 100 + rng.normal(0, 1, n).cumsum()}, index=idx)
+
+
+def make_kit(sma_window=5, adjust=True):
+    f_sma = Feature(SMA(sma_window, input_col="close"))
+    f_ewma = Feature(EWMA(10, input_col="close"))
+    return FeatureKit([
+        f_sma,
+        f_ewma,
+        f_sma / f_ewma,
+        Feature(EWMA(3, input_col=f_sma.transform.output_name)),
+        f_ewma.ema(4, adjust=adjust),
+        Feature(TimeCues(input_col="close")),
+    ], retain=["close"])
+
+
+def test_builds_reuse_unchanged_features(tmp_path):
+    df = make_df()
+    cache = FeatureCache(str(tmp_path / "features"))
+    expected = make_kit().build(df, backend="nb")
+
+    pd.testing.assert_frame_equal(make_kit().build(df, cache=cache), expected)
+    assert cache.stats()["misses"] == cache.stats()["writes"] == cache.stats()["entries"] == 6
+    pd.testing.assert_frame_equal(make_kit().build(df, cache=cache), expected)
+    assert cache.stats()["hits"] == 6
+    pd.testing.assert_frame_equal(make_kit().build(df, cache=cache, n_jobs=3), expected)
+    assert cache.stats()["hits"] == 12
+
+    # Changing a transform recomputes it and the features reading its output
+    before = cache.stats()
+    pd.testing.assert_frame_equal(make_kit(sma_window=6).build(df, cache=cache), make_kit(sma_window=6).build(df))
+    assert cache.stats()["hits"] - before["hits"] == 3 and cache.stats()["misses"] - before["misses"] == 3
+    # Parameters captured by the functions of Feature.apply are part of the key
+    before = cache.stats()
+    pd.testing.assert_frame_equal(make_kit(adjust=False).build(df, cache=cache), make_kit(adjust=False).build(df))
+    assert cache.stats()["hits"] - before["hits"] == 5 and cache.stats()["misses"] - before["misses"] == 1
+
+    # Other input values or time range: nothing is reused
+    cache.clear()
+    changed = df.copy()
+    changed.iloc[-1, 0] += 1.0
+    make_kit().build(changed, cache=cache)
+    make_kit().build(df.iloc[1:], cache=cache)
+    assert cache.stats()["hits"] == 0
+
+    # The entries are found by a new cache on the directory
+    reopened = FeatureCache(str(tmp_path / "features"))
+    assert reopened.stats()["entries"] == 12
+    assert "12 entries" in reopened.report()
+
+
+def test_lru_eviction_and_unfingerprintable_features(tmp_path):
+    df = make_df()
+    buffer = io.BytesIO()
+    np.save(buffer, df["close"].to_numpy())
+    column_bytes = buffer.tell()
+    cache = FeatureCache(str(tmp_path / "features"), max_bytes=3 * column_bytes)
+    kit = FeatureKit([Feature(SMA(w, input_col="close")) for w in (2, 3, 4, 5)])
+    kit.build(df, cache=cache)
+    assert cache.stats()["evictions"] == 1 and cache.stats()["entries"] == 3
+    assert len(list((tmp_path / "features").glob("*.npy"))) == 3
+
+    # SMA(2) was evicted, SMA(3) is now the most recently used entry
+    FeatureKit([Feature(SMA(w, input_col="close")) for w in (3, 2)]).build(df, cache=cache)
+    assert cache.stats()["hits"] == 1 and cache.stats()["evictions"] == 2
+    FeatureKit([Feature(SMA(3, input_col="close"))]).build(df, cache=cache)
+    assert cache.stats()["hits"] == 2
+
+    # A function capturing an arbitrary object has no stable key: the feature is computed, not cached
+    weights = object()
+    f = Feature(SMA(5, input_col="close")).apply(lambda x: x * (weights is not None), suffix="w")
+    entries = cache.stats()["entries"]
+    out = FeatureKit([f]).build(df, cache=cache)
+    assert out[f.name].notna().any()
+    assert cache.stats()["entries"] == entries
+
+
+def test_function_globals_and_code_version_are_part_of_the_key(tmp_path, monkeypatch):
+    global SCALE
+    df = make_df()
+    cache = FeatureCache(str(tmp_path / "features"))
+    f = Feature(SMA(5, input_col="close")).apply(scaled)
+    out = FeatureKit([f]).build(df, cache=cache)
+
+    # The module global read by the function changed: the feature is recomputed
+    SCALE = 10.0
+    try:
+        rescaled = FeatureKit([f]).build(df, cache=cache)
+    finally:
+        SCALE = 2.0
+    pd.testing.assert_series_equal(rescaled[f.name], out[f.name] * 5)
+    assert cache.stats()["hits"] == 0
+
+    FeatureKit([f]).build(df, cache=cache)
+    assert cache.stats()["hits"] == 1
+    # Another version of the code does not reuse the cached columns
+    monkeypatch.setattr(cache_module, "code_version", lambda: "other")
+    FeatureKit([f]).build(df, cache=cache)
+    assert cache.stats()["hits"] == 1
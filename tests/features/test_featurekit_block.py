@@ -0,0 +1,54 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from afmlkit.feature.kit import Feature, FeatureKit
+from afmlkit.feature.transforms import SMA, EWMA, TimeCues
+
+
+def make_df(n=200):
+    idx = pd.date_range("2024-01-01", periods=n, freq="h")
+    close = 100 + np.random.default_rng(6).normal(0, 1, n).cumsum()
+    return pd.DataFrame({"close": close, "flag": close > 100}, index=idx)
+
+
+def test_output_is_one_block():
+    df = make_df()
+    kit = FeatureKit([Feature(SMA(w, input_col="close")) for w in range(2, 200)], retain=["close"])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", pd.errors.PerformanceWarning)
+        out = kit.build(df)
+    assert out._mgr.nblocks == 1
+    assert list(out.columns) == ["close"] + [f"close_sma{w}" for w in range(2, 200)]
+    pd.testing.assert_series_equal(out["close_sma20"], Feature(SMA(20, input_col="close"))(df))
+
+
+def test_mixed_dtypes_and_replaced_columns():
+    df = make_df()
+    f_sma = Feature(SMA(5, input_col="close"))
+    f_double = f_sma.apply(lambda x: x * 2, suffix="x2")
+    kit = FeatureKit([
+        f_sma,
+        Feature(TimeCues(input_col="close")),
+        f_double,
+        Feature(EWMA(3, input_col=f_double.name)),  # reads the cached output
+        f_sma,  # replaces the first column in place
+    ], retain=["flag", "close"])
+    out = kit.build(df)
+    pd.testing.assert_frame_equal(kit.build(df, n_jobs=2), out)
+
+    cues = Feature(TimeCues(input_col="close"))(df)
+    assert list(out.columns) == ["flag", "close", f_sma.name] + [item.name for item in cues] + \
+        [f_double.name, f"{f_double.name}_ewma3"]
+    assert [out[item.name].dtype for item in cues] == [item.dtype for item in cues]
+    assert out["flag"].dtype == bool
+    pd.testing.assert_series_equal(out[f"{f_double.name}_ewma3"], EWMA(3, input_col=f_double.name)(out),
+                                   check_names=False)
+
+    out32 = kit.build(df, dtype=np.float32)
+    assert out32["close"].dtype == np.float32 and out32["flag"].dtype == bool
+    np.testing.assert_allclose(out32[f_sma.name], out[f_sma.name], rtol=1e-6)
+    with pytest.raises(ValueError, match="dtype"):
+        kit.build(df, dtype=np.int64)
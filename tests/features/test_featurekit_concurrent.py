@@ -0,0 +1,100 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from afmlkit.feature.base import SISOTransform
+from afmlkit.feature.kit import Feature, Compose, FeatureKit
+from afmlkit.feature.transforms import SMA, EWMA, ReturnT, ZScore, TimeCues, ATR
+from afmlkit.feature.utils import feature_dependencies
+
+
+class FailingTransform(SISOTransform):
+    def __init__(self, input_col):
+        super().__init__(input_col, "boom")
+
+    def _pd(self, x: pd.DataFrame):
+        raise RuntimeError("boom")
+
+    def _nb(self, x: pd.DataFrame):
+        raise RuntimeError("boom")
+
+
+def make_df(n=500):
+    idx = pd.date_range("2024-01-01", periods=n, freq="h")
+    rng = np.random.default_rng(1)
+    close = 100 + rng.normal(0, 1, n).cumsum()
+    return pd.DataFrame({
+        "high": close + rng.uniform(0, 1, n),
+        "low": close - rng.uniform(0, 1, n),
+        "close": close,
+    }, index=idx)
+
+
+def make_features():
+    f_sma = Feature(SMA(5, input_col="close"))
+    f_ewma = Feature(EWMA(10, input_col="close"))
+    f_smooth = Feature(EWMA(3, input_col=f_sma.transform.output_name))  # reads the cached SMA output
+    return [
+        f_sma,
+        f_ewma,
+        f_sma / f_ewma,
+        f_smooth,
+        Feature(Compose(ReturnT(input_col="close"), ZScore(20, input_col="ret"))),
+        f_sma.rolling_std(10).lag(2),
+        Feature(TimeCues(input_col="close")),
+        Feature(ATR(14, input_cols=["high", "low", "close"])),
+        Feature(SMA(5, input_col="close")),  # Duplicate of the first feature
+    ]
+
+
+def test_feature_dependencies():
+    f_sma, f_ewma, f_ratio, f_smooth, f_compose = make_features()[:5]
+    f_dup = Feature(SMA(5, input_col="close"))
+    deps = feature_dependencies([f_ratio, f_sma, f_ewma, f_smooth, f_compose, f_dup, f_ratio])
+    assert deps == [set(), set(), set(), {1}, set(), {1}, {0, 1, 2, 5}]
+
+
+@pytest.mark.parametrize("backend", ["nb", "pd"])
+@pytest.mark.parametrize("order", ["defined", "topo"])
+def test_concurrent_build_matches_sequential(backend, order):
+    kit = FeatureKit(make_features(), retain=["close"])
+    df = make_df()
+    expected = kit.build(df.copy(), backend=backend, order=order)
+    out = kit.build(df.copy(), backend=backend, order=order, n_jobs=4)
+    pd.testing.assert_frame_equal(out, expected)
+
+    # The input DataFrame is left untouched
+    df_in = df.copy()
+    kit.build(df_in, backend=backend, order=order, n_jobs=-1)
+    pd.testing.assert_frame_equal(df_in, df)
+
+
+def test_concurrent_build_raises_feature_errors():
+    kit = FeatureKit(make_features() + [Feature(FailingTransform("close"))], retain=["close"])
+    with pytest.raises(RuntimeError, match="boom"):
+        kit.build(make_df(), n_jobs=3)
+
+
+def test_concurrent_build_is_sequential_without_thread_safe_numba_layer():
+    # The workqueue layer aborts the interpreter when parallel kernels are launched from several threads
+    script = textwrap.dedent("""
+        import numpy as np, pandas as pd
+        from afmlkit.feature.kit import Feature, FeatureKit
+        from afmlkit.feature.transforms import SMA
+        df = pd.DataFrame({"close": np.random.default_rng(0).normal(size=200_000).cumsum()},
+                          index=pd.date_range("2024-01-01", periods=200_000, freq="s"))
+        kit = FeatureKit([Feature(SMA(w, input_col="close")) for w in range(2, 8)])
+        pd.testing.assert_frame_equal(kit.build(df, n_jobs=4), kit.build(df))
+        import numba
+        print(numba.threading_layer())
+    """)
+    env = dict(os.environ, NUMBA_THREADING_LAYER="workqueue")
+    proc = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, timeout=300)
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    assert proc.stdout.strip().endswith("workqueue")
+    assert "not thread-safe" in proc.stdout + proc.stderr
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from afmlkit.feature.incremental import count_states
+from afmlkit.feature.kit import Feature, Compose, FeatureKit
+from afmlkit.feature.transforms import SMA, EWMA, EWMST, RSIWilder, ATR, Return, Lag, ZScore, TimeCues
+
+
+def make_df(n=600):
+    idx = pd.date_range("2024-01-01", periods=n, freq="min")
+    idx = idx + pd.to_timedelta(np.random.default_rng(5).integers(0, 30, n), unit="s")
+    rng = np.random.default_rng(4)
+    close = 100 + rng.normal(0, 1, n).cumsum()
+    close[[20, 21, 300]] = np.nan
+    return pd.DataFrame({
+        "high": close + rng.uniform(0, 1, n),
+        "low": close - rng.uniform(0, 1, n),
+        "close": close,
+        "volume": rng.exponential(1.0, n),
+    }, index=idx)
+
+
+def make_kit():
+    f_sma = Feature(SMA(10, input_col="close"))
+    f_ewma = Feature(EWMA(20, input_col="close"))
+    f_ret = Feature(Return(1, input_col="close"))
+    return FeatureKit([
+        f_sma,
+        f_ewma,
+        f_sma / f_ewma - 1,
+        Feature.max(f_sma, f_ewma),
+        Feature(EWMA(5, input_col=f_sma.transform.output_name)),  # reads the cached SMA output
+        Feature(RSIWilder(14, input_col="close")),
+        Feature(ATR(14, input_cols=["high", "low", "close"])),
+        Feature(ATR(7, ema_based=True, normalize=True, input_cols=["high", "low", "close"])),
+        Feature(EWMST(pd.Timedelta(minutes=30), input_col="ret1")),
+        f_ret.abs().log(),
+        Feature(Lag(3, input_col="volume")),
+        Feature(Compose(Return(2, input_col="close"), SMA(5, input_col="ret2"))),
+        Feature(Compose(Return(1, input_col="close"), ZScore(30, input_col="ret"))),
+        f_ret.rolling_std(15).clip(upper=0.01),
+        Feature(TimeCues(input_col="close")),
+    ], retain=["close"])
+
+
+@pytest.mark.parametrize("backend", ["nb", "pd"])
+@pytest.mark.parametrize("chunks", [[600], [300, 1, 1, 50, 248], [200] + [1] * 40 + [360]])
+def test_updates_match_build(backend, chunks):
+    df = make_df()
+    df["ret1"] = df["close"].pct_change(fill_method=None)
+    expected = make_kit().build(df, backend=backend)
+
+    kit = make_kit()
+    bounds = np.cumsum([0] + chunks)
+    parts = [kit.update(df.iloc[start:end], backend=backend) for start, end in zip(bounds[:-1], bounds[1:])]
+    pd.testing.assert_frame_equal(pd.concat(parts), expected, check_exact=True)
+
+
+def test_update_stream_checks():
+    df = make_df()
+    df["ret1"] = df["close"].pct_change(fill_method=None)
+    kit = make_kit()
+    kit.update(df.iloc[:100])
+    # Only the ZScore, rolling std and TimeCues transforms are recomputed over the history
+    assert count_states(kit._stream["states"])["RecomputeState"] == 3
+    with pytest.raises(ValueError, match="backend"):
+        kit.update(df.iloc[100:110], backend="pd")
+    with pytest.raises(ValueError, match="follow"):
+        kit.update(df.iloc[50:110])
+    assert len(kit.update(df.iloc[100:100])) == 0
+
+    kit.reset()
+    pd.testing.assert_frame_equal(kit.update(df.iloc[:100], backend="pd"), make_kit().build(df.iloc[:100], backend="pd"))
@@ -279,6 +279,20 @@ class TestVolumePro:
             if not np.isnan(vp_pct_above_poc[i]):
                 assert 0.0 <= vp_pct_above_poc[i] <= 1.0
 
+    def test_volumepro_compute_reads_loaded_footprints_in_place(self, sample_footprint_data, sample_bars, tmp_path):
+        """Test that VolumePro.compute keeps a memory-mapped compressed footprint as it is."""
+        vp = VolumePro(window_size=pd.Timedelta(minutes=3))
+        sample_footprint_data.save_npy(str(tmp_path / 'fp'))
+        loaded = FootprintData.load_npy(str(tmp_path / 'fp'))
+
+        results = vp.compute(sample_bars, loaded)
+
+        assert loaded.is_compressed
+        assert isinstance(loaded.price_levels, np.memmap)
+        assert isinstance(loaded.buy_volumes, np.memmap)
+        for result, expected in zip(results, vp.compute(sample_bars, sample_footprint_data)):
+            np.testing.assert_array_equal(result, expected)
+
 
 if __name__ == '__main__':
-    pytest.main()
\ No newline at end of file
+    pytest.main()
@@ -3,6 +3,8 @@ import pandas as pd
 import time
 from typing import Any, Callable
 
+from afmlkit.bar.data_model import TradesData
+
 
 def measure_execution_time(func: Callable, *args, n_runs=11, **kwargs) -> float:
     """
@@ -77,4 +79,82 @@ def generate_price_series(n_points=1_000_000, inter_arrival_time=15, seed=42) ->
     # Create pandas Series
     close_series = pd.Series(S, index=timestamps)
 
-    return close_series
\ No newline at end of file
+    return close_series
+
+
+def random_trades(n=5000, seed=42, start='2020-09-13 12:26:40', min_step=0, max_step=400,
+                  step=pd.Timedelta(milliseconds=1), gap_prob=0.0, buy_prob=0.5):
+    """
+    Generate synthetic trades: random inter-trade steps (repeated timestamps for zero steps), a rounded random walk
+    price, exponential trade sizes and random trade sides.
+
+    Parameters
+    ----------
+    n
+        Number of trades
+    seed
+        Random seed
+    start
+        Timestamp the steps are counted from (the first trade is one step after it)
+    min_step, max_step
+        Range of the inter-trade steps in ``step`` units (``max_step`` exclusive)
+    step
+        Unit of the inter-trade steps
+    gap_prob
+        Probability of a step being replaced by a gap of 1 to 10 minutes
+    buy_prob
+        Probability of a trade being a market buy
+
+    Returns
+    -------
+    tuple
+        Timestamps (int64 ns), prices, amounts and sides (int8, 1 for market buy, -1 for market sell)
+    """
+    rng = np.random.default_rng(seed)
+    steps = rng.integers(min_step, max_step, n) * step.value
+    if gap_prob > 0:
+        gaps = rng.random(n) < gap_prob
+        steps[gaps] = rng.integers(61, 600, gaps.sum()) * 1_000_000_000
+    ts = pd.Timestamp(start).value + np.cumsum(steps)
+    px = 100.0 + np.round(np.cumsum(rng.normal(0, 0.05, n)), 2)
+    qty = rng.exponential(1.0, n)
+    side = np.where(rng.random(n) < buy_prob, 1, -1).astype(np.int8)
+    return ts.astype(np.int64), px, qty, side
+
+
+def random_trades_data(n=5000, seed=42, **kwargs) -> TradesData:
+    """
+    Generate synthetic trades (see :func:`random_trades`) as a TradesData object.
+    """
+    ts, px, qty, side = random_trades(n, seed, **kwargs)
+    return TradesData(ts, px, qty, side=side, timestamp_unit='ns')
+
+
+def build_trades_h5(path: str, ts, px, qty, side=None, ids=None) -> TradesData:
+    """
+    Write trades to an HDF5 store the way the downloaders do: one ``/trades/YYYY-MM`` group per calendar month.
+
+    Parameters
+    ----------
+    path
+        Path of the HDF5 store
+    ts, px, qty
+        Timestamps (int64 ns), prices and amounts, sorted by timestamp
+    side
+        Optional trade sides; the stored groups have no side column without it
+    ids
+        Trade ids, defaults to ``0..len(ts) - 1``
+
+    Returns
+    -------
+    TradesData
+        All the written trades
+    """
+    ts = np.asarray(ts, dtype=np.int64)
+    ids = np.arange(len(ts), dtype=np.int64) if ids is None else ids
+    months = pd.to_datetime(ts).to_period('M')
+    for month in months.unique():
+        mask = np.asarray(months == month)
+        TradesData(ts[mask], px[mask], qty[mask], ids[mask], side=None if side is None else side[mask],
+                   timestamp_unit='ns').save_h5(path, month_key=str(month))
+    return TradesData(ts, px, qty, ids, side=side, timestamp_unit='ns')